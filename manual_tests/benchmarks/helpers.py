@@ -0,0 +1,64 @@
+"""Shared helpers for the storage/services benchmarks.
+
+The benchmarks are plain pytest tests marked ``manual``; each prints a small
+table so results can be compared between commits, e.g.::
+
+    pytest manual_tests/benchmarks/ -m manual -s
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from bsv_wallet_toolbox.storage.db import create_engine_from_url
+from bsv_wallet_toolbox.storage.models import Base
+from bsv_wallet_toolbox.storage.provider import StorageProvider
+
+
+@dataclass
+class Measurement:
+    """Statements executed and wall time of one measured block."""
+
+    queries: int = 0
+    seconds: float = 0.0
+
+
+@contextmanager
+def measure(engine: Engine) -> Iterator[Measurement]:
+    """Count statements sent to ``engine`` and time the block."""
+    result = Measurement()
+
+    def _count(*_args: object) -> None:
+        result.queries += 1
+
+    event.listen(engine, "before_cursor_execute", _count)
+    start = time.perf_counter()
+    try:
+        yield result
+    finally:
+        result.seconds = time.perf_counter() - start
+        event.remove(engine, "before_cursor_execute", _count)
+
+
+def make_storage(url: str = "sqlite:///:memory:") -> StorageProvider:
+    """Create a migrated, available StorageProvider on ``url``."""
+    engine = create_engine_from_url(url)
+    Base.metadata.create_all(bind=engine)
+    storage = StorageProvider(engine=engine, chain="test", storage_identity_key="K" * 64)
+    storage.make_available()
+    return storage
+
+
+def print_table(title: str, header: list[str], rows: list[list[object]]) -> None:
+    """Print a fixed-width result table."""
+    widths = [max(len(str(c)) for c in col) for col in zip(header, *rows, strict=False)]
+    print(f"\n{title}")
+    print("  ".join(h.rjust(w) for h, w in zip(header, widths, strict=False)))
+    for row in rows:
+        print("  ".join(str(c).rjust(w) for c, w in zip(row, widths, strict=False)))
@@ -0,0 +1,120 @@
+"""Benchmark: per-input vs batched funding in fund_new_transaction_sdk.
+
+For payments that need a growing number of funding inputs, reports the
+statements and commits (allocation transactions) each mode issues, wall time,
+and the fee paid relative to the amount moved. The per-input path commits once
+per allocation and once per release; the batched path prefetches one window and
+claims the chosen inputs in a single transaction. Both modes select the same
+inputs, so fee efficiency is expected to match.
+
+Run:
+    pytest manual_tests/benchmarks/test_batch_funding_benchmark.py -m manual -s
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import event
+
+from bsv_wallet_toolbox.storage.db import session_scope
+from bsv_wallet_toolbox.storage.methods.generate_change import StorageFeeModel
+from bsv_wallet_toolbox.storage.models import Output, OutputBasket, Transaction, User
+
+from .helpers import make_storage, measure, print_table
+
+P2PKH_SCRIPT = b"\x76\xa9\x14" + bytes(20) + b"\x88\xac"
+N_UTXOS = 2000
+INPUTS_NEEDED = [1, 10, 50, 200]
+
+
+def _seed(storage) -> tuple[int, int]:
+    with session_scope(storage.SessionLocal) as s:
+        user = User(identity_key="02" + "9" * 64, active_storage="bench")
+        s.add(user)
+        s.flush()
+        basket = OutputBasket(
+            user_id=user.user_id, name="default", number_of_desired_utxos=5, minimum_desired_utxo_value=1000
+        )
+        tx = Transaction(user_id=user.user_id, status="completed", reference="seed", txid="9" * 64, satoshis=0)
+        s.add_all([basket, tx])
+        s.flush()
+        s.add_all(
+            Output(
+                user_id=user.user_id,
+                transaction_id=tx.transaction_id,
+                basket_id=basket.basket_id,
+                spendable=True,
+                change=True,
+                vout=i,
+                satoshis=1000 + i % 7,
+                type="P2PKH",
+                txid=tx.txid,
+                locking_script=P2PKH_SCRIPT,
+            )
+            for i in range(N_UTXOS)
+        )
+        return user.user_id, basket.basket_id
+
+
+def _fund(storage, user_id: int, basket_id: int, pay: int, reference: str) -> dict:
+    spender = storage.insert_transaction(
+        {"userId": user_id, "reference": reference, "status": "unsigned", "isOutgoing": True, "satoshis": 0}
+    )
+    ctx = {
+        "xinputs": [],
+        "xoutputs": [SimpleNamespace(satoshis=pay, locking_script=P2PKH_SCRIPT)],
+        "changeBasket": {"basketId": basket_id, "minimumDesiredUTXOValue": 1000, "numberOfDesiredUTXOs": 5},
+        "availableFundingCount": N_UTXOS,
+        "feeModel": StorageFeeModel(model="sat/kb", value=100),
+        "transactionId": spender,
+    }
+    vargs = SimpleNamespace(is_delayed=False, random_vals=[0.5])
+    return storage.fund_new_transaction_sdk(user_id, vargs, ctx)
+
+
+@pytest.mark.manual
+def test_batch_funding_round_trips_and_fee_efficiency() -> None:
+    rows = []
+    counts: dict[tuple[bool, int], int] = {}
+    for batch in (False, True):
+        storage = make_storage()
+        storage.batch_funding = batch
+        user_id, basket_id = _seed(storage)
+        commits = 0
+
+        def _commit(*_args: object) -> None:
+            nonlocal commits
+            commits += 1
+
+        event.listen(storage.engine, "commit", _commit)
+        for needed in INPUTS_NEEDED:
+            pay = needed * 1000 - 500
+            commits = 0
+            with measure(storage.engine) as m:
+                result = _fund(storage, user_id, basket_id, pay, f"pay-{needed}")
+            inputs = len(result["allocatedChange"])
+            counts[(batch, needed)] = m.queries
+            rows.append(
+                [
+                    "batch" if batch else "per-input",
+                    needed,
+                    inputs,
+                    m.queries,
+                    commits,
+                    f"{m.seconds * 1000:.1f}",
+                    result["fee"],
+                    f"{100 * result['fee'] / pay:.3f}%",
+                ]
+            )
+        event.remove(storage.engine, "commit", _commit)
+
+    print_table(
+        "fund_new_transaction_sdk: per-input vs batched funding",
+        ["mode", "~inputs", "inputs", "queries", "commits", "ms", "fee", "fee/pay"],
+        rows,
+    )
+    # Batched funding issues a constant number of statements; per-input grows with the inputs
+    assert counts[(True, INPUTS_NEEDED[-1])] == counts[(True, INPUTS_NEEDED[0])]
+    assert counts[(False, INPUTS_NEEDED[-1])] > 10 * counts[(True, INPUTS_NEEDED[-1])]
@@ -0,0 +1,75 @@
+"""Benchmark: post_beef_array one request per transaction vs batched /v1/txs.
+
+Broadcasts chains of dependent transactions to the local ARC stand-in
+(``tests.testabilities.testservices.LocalARCServer``) with a simulated round
+trip of ``LATENCY_MSECS`` per request. ``postBeefBatchSize=0`` posts every
+BEEF with ``post_beef``; the batched runs group transactions per dependency
+level into ``/v1/txs`` requests sent ``postBeefConcurrency`` at a time.
+
+Run:
+    pytest manual_tests/benchmarks/test_broadcast_benchmark.py -m manual -s
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+from bsv.script import Script
+from bsv.transaction import Transaction
+from bsv.transaction_input import TransactionInput
+from bsv.transaction_output import TransactionOutput
+
+from bsv_wallet_toolbox.services import Services
+from tests.testabilities.testservices import LocalARCServer
+
+from .helpers import print_table
+
+MINED_TXID = "aa" * 32
+N_CHAINS = 250
+CHAIN_DEPTH = 2
+LATENCY_MSECS = 20
+
+
+def _chains() -> list[Transaction]:
+    txs = []
+    for chain in range(N_CHAINS):
+        parent = MINED_TXID
+        for level in range(CHAIN_DEPTH):
+            tx = Transaction(
+                [TransactionInput(source_txid=parent, source_output_index=0, unlocking_script=Script("51"))],
+                [TransactionOutput(Script(f"76a914{chain * CHAIN_DEPTH + level:040x}88ac"), 1000)],
+            )
+            txs.append(tx)
+            parent = tx.txid()
+    return txs
+
+
+def _run(beefs: list[str], batch_size: int, concurrency: int) -> list[object]:
+    with LocalARCServer(latency_msecs=LATENCY_MSECS, check_parents=True).mark_mined(MINED_TXID) as server:
+        options = Services.create_default_options("test")
+        options["arcUrl"] = server.url
+        options["arcGorillaPoolUrl"] = None
+        options["postBeefBatchSize"] = batch_size
+        options["postBeefConcurrency"] = concurrency
+        services = Services(options)
+        services.bitails = None
+
+        start = time.perf_counter()
+        results = services.post_beef_array(beefs)
+        seconds = time.perf_counter() - start
+
+    assert all(r["accepted"] for r in results)
+    label = "per transaction" if batch_size == 0 else f"batch {batch_size} x {concurrency}"
+    return [label, len(server.requests), f"{seconds:.2f}", f"{len(beefs) / seconds:.0f}"]
+
+
+@pytest.mark.manual
+def test_post_beef_array_batching() -> None:
+    beefs = [tx.hex() for tx in _chains()]
+    rows = [_run(beefs, 0, 1), _run(beefs, 100, 1), _run(beefs, 100, 4), _run(beefs, 25, 4)]
+    print_table(
+        f"post_beef_array: {len(beefs)} txs, {LATENCY_MSECS} ms per request",
+        ["mode", "requests", "seconds", "tx/s"],
+        rows,
+    )
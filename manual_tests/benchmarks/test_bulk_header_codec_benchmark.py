@@ -0,0 +1,96 @@
+"""Benchmark: per-header vs bulk header deserialization and validation.
+
+Mines a synthetic chain of ``N_HEADERS`` linked headers (regtest difficulty),
+writes it as one bulk file and reads it back:
+
+- validate, per header: ``deserialize_base_block_header`` + ``block_hash`` +
+  ``ChainWork`` accumulation for each 80-byte slice (the previous ingest path)
+- validate, bulk: ``validate_block_headers`` (links, proof of work, chain work)
+- decode, per header / bulk: BlockHeader dicts with height and hash, one slice
+  at a time vs ``decode_block_headers``
+- store append: ``BulkHeaderStore.append`` (bulk validate + write the CDN files)
+
+Run:
+    pytest manual_tests/benchmarks/test_bulk_header_codec_benchmark.py -m manual -s
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+
+from bsv_wallet_toolbox.services.chaintracker.chaintracks import BulkHeaderStore
+from bsv_wallet_toolbox.services.chaintracker.chaintracks.chain_work import ChainWork
+from bsv_wallet_toolbox.services.chaintracker.chaintracks.util import (
+    block_hash,
+    decode_block_headers,
+    deserialize_base_block_header,
+    validate_block_headers,
+)
+from tests.testabilities.testservices import mine_header_chain
+
+from .helpers import print_table
+
+N_HEADERS = 1_000_000
+REPEATS = 2  # best of; the first run of a mode pays for fresh memory pages
+
+
+def _per_header(data: bytes) -> ChainWork:
+    chain_work = ChainWork(0)
+    previous_hash = None
+    for offset in range(0, len(data), 80):
+        raw = data[offset : offset + 80]
+        header = deserialize_base_block_header(raw)
+        if previous_hash is not None and header["previousHash"] != previous_hash:
+            raise ValueError("broken link")
+        previous_hash = block_hash(raw)
+        chain_work = chain_work.add_chain_work(ChainWork.from_bits(header["bits"]))
+    return chain_work
+
+
+def _decode_per_header(data: bytes) -> list[dict]:
+    headers = []
+    for height, offset in enumerate(range(0, len(data), 80)):
+        raw = data[offset : offset + 80]
+        headers.append({**deserialize_base_block_header(raw), "height": height, "hash": block_hash(raw)})
+    return headers
+
+
+def _timed(label: str, fn) -> tuple[list[object], object]:
+    best = float("inf")
+    for _ in range(REPEATS):
+        result = None  # release the previous run's result first
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return [label, f"{best:.2f}", f"{N_HEADERS / best:,.0f}"], result
+
+
+@pytest.mark.manual
+def test_bulk_header_ingest(tmp_path: Path) -> None:
+    path = tmp_path / "mainNet_0.headers"
+    path.write_bytes(mine_header_chain(N_HEADERS))
+    data = path.read_bytes()
+
+    row_per_header, work_per_header = _timed("validate, per header", lambda: _per_header(data))
+    row_validate, info = _timed("validate, bulk", lambda: validate_block_headers(data))
+    row_decode_per_header, _ = _timed("decode, per header", lambda: len(_decode_per_header(data)))
+    row_decode, headers = _timed("decode, bulk", lambda: decode_block_headers(data))
+    stores = iter(range(REPEATS))
+
+    def append() -> BulkHeaderStore:
+        store = BulkHeaderStore(str(tmp_path / f"store{next(stores)}"), "main", headers_per_file=N_HEADERS)
+        store.append(0, data)
+        return store
+
+    row_store, store = _timed("store append", append)
+
+    assert info.chain_work == work_per_header
+    assert headers[-1]["hash"] == info.last_hash == store.last_header()["hash"]
+    print_table(
+        f"bulk header ingest: {N_HEADERS:,} headers ({len(data) / 1e6:.0f} MB)",
+        ["mode", "seconds", "headers/s"],
+        [row_per_header, row_validate, row_decode_per_header, row_decode, row_store],
+    )
@@ -0,0 +1,90 @@
+"""Benchmark: inserting 100k outputs per row vs with the bulk insert/upsert API.
+
+``insert_output`` opens a session, flushes and commits one row per call; the
+per-row figure is measured on a sample and extrapolated to 100k.
+``insert_many_outputs`` and ``upsert_many_outputs`` write all rows with
+executemany statements in one transaction. Runs on SQLite by default; set
+``BENCH_DB_URL`` to an empty Postgres/MySQL database to compare dialects.
+
+Run:
+    pytest manual_tests/benchmarks/test_bulk_insert_benchmark.py -m manual -s
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from .helpers import make_storage, measure, print_table
+
+P2PKH_SCRIPT = b"\x76\xa9\x14" + bytes(20) + b"\x88\xac"
+N_OUTPUTS = 100_000
+N_PER_ROW_SAMPLE = 2_000
+
+
+def _rows(user_id: int, transaction_id: int, basket_id: int, count: int, satoshis: int = 1000) -> list[dict]:
+    return [
+        {
+            "userId": user_id,
+            "transactionId": transaction_id,
+            "basketId": basket_id,
+            "vout": vout,
+            "satoshis": satoshis,
+            "spendable": True,
+            "change": True,
+            "type": "P2PKH",
+            "providedBy": "storage",
+            "purpose": "change",
+            "txid": "f" * 64,
+            "lockingScript": P2PKH_SCRIPT,
+        }
+        for vout in range(count)
+    ]
+
+
+def _wallet(storage, reference: str) -> tuple[int, int, int]:
+    user_id = storage.get_or_create_user_id("02" + reference[-1] * 64)
+    basket_id = storage.insert_output_basket(
+        {"userId": user_id, "name": "default", "numberOfDesiredUTXOs": 5, "minimumDesiredUTXOValue": 1000}
+    )
+    tx_id = storage.insert_transaction(
+        {"userId": user_id, "reference": reference, "txid": "f" * 64, "status": "completed", "satoshis": 0}
+    )
+    return user_id, tx_id, basket_id
+
+
+@pytest.mark.manual
+def test_bulk_insert_outputs() -> None:
+    storage = make_storage(os.environ.get("BENCH_DB_URL", "sqlite:///:memory:"))
+
+    user_id, tx_id, basket_id = _wallet(storage, "bench-a")
+    with measure(storage.engine) as m_row:
+        for row in _rows(user_id, tx_id, basket_id, N_PER_ROW_SAMPLE):
+            storage.insert_output(row)
+    per_row_secs = m_row.seconds * N_OUTPUTS / N_PER_ROW_SAMPLE
+
+    user_id, tx_id, basket_id = _wallet(storage, "bench-b")
+    with measure(storage.engine) as m_bulk:
+        ids = storage.insert_many_outputs(_rows(user_id, tx_id, basket_id, N_OUTPUTS))
+    assert len(set(ids)) == N_OUTPUTS
+
+    with measure(storage.engine) as m_upsert:
+        same = storage.upsert_many_outputs(_rows(user_id, tx_id, basket_id, N_OUTPUTS, satoshis=2000))
+    assert same == ids
+    assert storage.get_wallet_balance(user_id) == 2000 * N_OUTPUTS
+
+    print_table(
+        f"insert {N_OUTPUTS} outputs ({storage.engine.dialect.name})",
+        ["operation", "queries", "seconds"],
+        [
+            [
+                f"insert_output x{N_OUTPUTS} (from {N_PER_ROW_SAMPLE})",
+                m_row.queries * N_OUTPUTS // N_PER_ROW_SAMPLE,
+                f"{per_row_secs:.1f}",
+            ],
+            ["insert_many_outputs", m_bulk.queries, f"{m_bulk.seconds:.1f}"],
+            ["upsert_many_outputs (all existing)", m_upsert.queries, f"{m_upsert.seconds:.1f}"],
+        ],
+    )
+    assert m_bulk.seconds < per_row_secs
@@ -0,0 +1,121 @@
+"""Benchmark: include-tags/include-labels hydration in listOutputs and listActions.
+
+Measures statements executed and wall time per page size. With grouped IN
+hydration the statement count stays flat as the page grows; the previous
+per-row lookups issued one to three statements per listed row.
+
+Run:
+    pytest manual_tests/benchmarks/test_list_hydration_benchmark.py -m manual -s
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from bsv_wallet_toolbox.storage.db import IN_CLAUSE_CHUNK_SIZE, session_scope
+from bsv_wallet_toolbox.storage.models import (
+    Output,
+    OutputBasket,
+    OutputTag,
+    OutputTagMap,
+    Transaction,
+    TxLabel,
+    TxLabelMap,
+    User,
+)
+
+from .helpers import make_storage, measure, print_table
+
+PAGE_SIZES = [10, 100, 1000]
+N_TRANSACTIONS = 1000
+
+
+def _seed(storage) -> int:
+    with session_scope(storage.SessionLocal) as s:
+        user = User(identity_key="02" + "d" * 64, active_storage="bench")
+        s.add(user)
+        s.flush()
+        basket = OutputBasket(
+            user_id=user.user_id, name="default", number_of_desired_utxos=5, minimum_desired_utxo_value=1000
+        )
+        tags = [OutputTag(user_id=user.user_id, tag=f"tag{i}") for i in range(4)]
+        labels = [TxLabel(user_id=user.user_id, label=f"label{i}") for i in range(4)]
+        s.add_all([basket, *tags, *labels])
+        s.flush()
+
+        txs = [
+            Transaction(
+                user_id=user.user_id,
+                status="completed",
+                reference=f"ref{i}",
+                txid=f"{i:064x}",
+                satoshis=2000,
+                description="bench",
+            )
+            for i in range(N_TRANSACTIONS)
+        ]
+        s.add_all(txs)
+        s.flush()
+        outputs = []
+        for i, tx in enumerate(txs):
+            for vout in range(2):
+                outputs.append(
+                    Output(
+                        user_id=user.user_id,
+                        transaction_id=tx.transaction_id,
+                        basket_id=basket.basket_id,
+                        spendable=True,
+                        change=True,
+                        vout=vout,
+                        satoshis=1000,
+                        type="P2PKH",
+                        txid=tx.txid,
+                        # every second output is spent by the next transaction
+                        spent_by=txs[i + 1].transaction_id if vout == 1 and i + 1 < len(txs) else None,
+                    )
+                )
+            s.add(TxLabelMap(transaction_id=tx.transaction_id, tx_label_id=labels[i % 4].tx_label_id))
+        s.add_all(outputs)
+        s.flush()
+        for o in outputs:
+            s.add(OutputTagMap(output_id=o.output_id, output_tag_id=tags[o.output_id % 4].output_tag_id))
+        return user.user_id
+
+
+@pytest.mark.manual
+def test_list_hydration_query_count_by_page_size() -> None:
+    storage = make_storage()
+    user_id = _seed(storage)
+    auth = {"userId": user_id}
+
+    rows = []
+    for limit in PAGE_SIZES:
+        with measure(storage.engine) as m_out:
+            r = storage.list_outputs(
+                auth, {"limit": limit, "includeTags": True, "includeLabels": True, "includeSpent": True}
+            )
+        assert len(r["outputs"]) == limit
+        with measure(storage.engine) as m_act:
+            r = storage.list_actions(
+                auth, {"limit": limit, "includeLabels": True, "includeOutputs": True, "includeInputs": True}
+            )
+        assert len(r["actions"]) == limit
+        rows.append(
+            [
+                limit,
+                m_out.queries,
+                f"{m_out.seconds * 1000:.1f}",
+                m_act.queries,
+                f"{m_act.seconds * 1000:.1f}",
+            ]
+        )
+
+    print_table(
+        "list hydration (includeTags/includeLabels/includeOutputs/includeInputs)",
+        ["page", "listOutputs queries", "ms", "listActions queries", "ms"],
+        rows,
+    )
+    # Grouped hydration: statement count only grows with the number of IN chunks, not per row
+    extra_chunks = PAGE_SIZES[-1] // IN_CLAUSE_CHUNK_SIZE
+    assert rows[-1][1] <= rows[0][1] + 2 * extra_chunks
+    assert rows[-1][3] <= rows[0][3] + 4 * extra_chunks
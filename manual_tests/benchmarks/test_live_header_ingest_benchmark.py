@@ -0,0 +1,57 @@
+"""Benchmark: catching up on queued live headers one per transaction vs in batches.
+
+Queues ``N_HEADERS`` linked headers on ``live_headers_chan`` and drains them with
+``_shift_live_headers``:
+
+- per header: ``live_ingest_batch_size=1``, one parent lookup, existence check
+  and transaction per header
+- batched: ``live_ingest_batch_size=500``, parents from the in-memory recent
+  headers, one lookup query and one transaction per batch
+
+Run:
+    pytest manual_tests/benchmarks/test_live_header_ingest_benchmark.py -m manual -s
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from bsv_wallet_toolbox.services.chaintracker.chaintracks.core_service import (
+    ChaintracksCoreService,
+    ChaintracksServiceConfig,
+)
+from bsv_wallet_toolbox.services.chaintracker.chaintracks.util import decode_block_headers
+from tests.testabilities.testservices import mine_header_chain
+
+from .helpers import measure, print_table
+
+N_HEADERS = 5000
+
+
+async def _ingest(headers: list[dict], batch_size: int) -> list[object]:
+    service = ChaintracksCoreService(ChaintracksServiceConfig(chain="main", live_ingest_batch_size=batch_size))
+    service.live_headers_chan = asyncio.Queue()  # unbounded: the whole backlog is queued up front
+    service.storage.make_available()
+    for header in headers:
+        service.live_headers_chan.put_nowait(header)
+
+    with measure(service.storage.engine) as m:
+        await service._shift_live_headers()
+
+    assert (await service.find_chain_tip_hash()) == headers[-1]["hash"]
+    return [batch_size, m.queries, f"{m.seconds:.2f}", f"{len(headers) / m.seconds:,.0f}"]
+
+
+@pytest.mark.manual
+async def test_live_header_ingest() -> None:
+    headers = decode_block_headers(mine_header_chain(N_HEADERS))
+
+    rows = [await _ingest(headers, 1), await _ingest(headers, 500)]
+
+    print_table(
+        f"live header ingest: {N_HEADERS:,} queued headers",
+        ["batch size", "queries", "seconds", "headers/s"],
+        rows,
+    )
@@ -0,0 +1,117 @@
+"""Benchmark: row-to-dict serialization in find_outputs and get_sync_chunk.
+
+Compares the per-model cached row converter used by ``_model_to_dict`` with
+the previous per-row mapper walk (columns x attrs, uncached camelCase
+conversion), and reports ``find_outputs`` with and without a column
+projection plus ``get_sync_chunk`` over the same outputs.
+
+Run:
+    pytest manual_tests/benchmarks/test_row_serialization_benchmark.py -m manual -s
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import pytest
+from sqlalchemy import inspect, select
+
+from bsv_wallet_toolbox.storage.db import session_scope
+from bsv_wallet_toolbox.storage.models import Output, OutputBasket, Transaction, User
+
+from .helpers import make_storage, measure, print_table
+
+P2PKH_SCRIPT = b"\x76\xa9\x14" + bytes(20) + b"\x88\xac"
+N_OUTPUTS = 10_000
+IDENTITY_KEY = "02" + "e" * 64
+
+
+def _seed(storage) -> int:
+    with session_scope(storage.SessionLocal) as s:
+        user = User(identity_key=IDENTITY_KEY, active_storage="bench")
+        s.add(user)
+        s.flush()
+        basket = OutputBasket(
+            user_id=user.user_id, name="default", number_of_desired_utxos=5, minimum_desired_utxo_value=1000
+        )
+        tx = Transaction(user_id=user.user_id, status="completed", reference="seed", txid="e" * 64, satoshis=0)
+        s.add_all([basket, tx])
+        s.flush()
+        s.add_all(
+            Output(
+                user_id=user.user_id,
+                transaction_id=tx.transaction_id,
+                basket_id=basket.basket_id,
+                spendable=True,
+                change=True,
+                vout=i,
+                satoshis=1000 + i,
+                type="P2PKH",
+                txid=tx.txid,
+                locking_script=P2PKH_SCRIPT,
+            )
+            for i in range(N_OUTPUTS)
+        )
+        return user.user_id
+
+
+def _legacy_model_to_dict(obj: Any) -> dict[str, Any]:
+    """The per-row conversion _model_to_dict used before the cached converters."""
+    mapper = inspect(obj.__class__)
+    result = {}
+    for column in mapper.columns:
+        attr_name = column.name
+        for prop in mapper.attrs:
+            if hasattr(prop, "columns") and column in prop.columns:
+                attr_name = prop.key
+                break
+        parts = attr_name.split("_")
+        result[parts[0] + "".join(word.capitalize() for word in parts[1:])] = getattr(obj, attr_name)
+    return result
+
+
+@pytest.mark.manual
+def test_row_serialization() -> None:
+    storage = make_storage()
+    user_id = _seed(storage)
+
+    with session_scope(storage.SessionLocal) as s:
+        rows = s.execute(select(Output)).scalars().all()
+        start = time.perf_counter()
+        legacy = [_legacy_model_to_dict(o) for o in rows]
+        legacy_secs = time.perf_counter() - start
+        start = time.perf_counter()
+        cached = [storage._model_to_dict(o) for o in rows]
+        cached_secs = time.perf_counter() - start
+    assert legacy == cached
+
+    with measure(storage.engine) as m_full:
+        outputs = storage.find_outputs({"partial": {"userId": user_id}})
+    assert len(outputs) == N_OUTPUTS
+    with measure(storage.engine) as m_proj:
+        outputs = storage.find_outputs({"partial": {"userId": user_id}, "columns": ["outputId", "satoshis"]})
+    assert len(outputs) == N_OUTPUTS
+    with measure(storage.engine) as m_sync:
+        chunk = storage.get_sync_chunk(
+            {
+                "identityKey": IDENTITY_KEY,
+                "fromStorageIdentityKey": "K" * 64,
+                "toStorageIdentityKey": "R" * 64,
+                "maxItems": N_OUTPUTS * 25,
+            }
+        )
+    assert len(chunk["outputs"]) == N_OUTPUTS
+
+    print_table(
+        f"row serialization ({N_OUTPUTS} outputs)",
+        ["operation", "ms"],
+        [
+            ["_model_to_dict, per-row mapper walk", f"{legacy_secs * 1000:.1f}"],
+            ["_model_to_dict, cached converter", f"{cached_secs * 1000:.1f}"],
+            ["find_outputs", f"{m_full.seconds * 1000:.1f}"],
+            ["find_outputs, 2 columns", f"{m_proj.seconds * 1000:.1f}"],
+            ["get_sync_chunk", f"{m_sync.seconds * 1000:.1f}"],
+        ],
+    )
+    assert cached_secs < legacy_secs
@@ -38,6 +38,8 @@ class MonitorOptions:
     chaintracks: ChaintracksClientApi | None
     task_run_wait_msecs: int
     msecs_wait_per_merkle_proof_service_req: int
+    proof_fetch_concurrency: int
+    proof_write_batch_size: int
     abandoned_msecs: int
     unproven_attempts_limit_test: int
     unproven_attempts_limit_main: int
@@ -57,6 +59,9 @@ class MonitorOptions:
         unproven_attempts_limit_main: int = 144,
         on_transaction_broadcasted: Callable[[dict[str, Any]], Any] | None = None,
         on_transaction_proven: Callable[[dict[str, Any]], Any] | None = None,
+        *,
+        proof_fetch_concurrency: int = 8,
+        proof_write_batch_size: int = 50,
     ) -> None:
         """Initialize monitor options."""
         self.chain = chain
@@ -65,6 +70,9 @@ class MonitorOptions:
         self.chaintracks = chaintracks
         self.task_run_wait_msecs = task_run_wait_msecs
         self.msecs_wait_per_merkle_proof_service_req = msecs_wait_per_merkle_proof_service_req
+        # TaskCheckForProofs: concurrent merkle path requests (1 = serial) and proofs written per transaction
+        self.proof_fetch_concurrency = proof_fetch_concurrency
+        self.proof_write_batch_size = proof_write_batch_size
         self.abandoned_msecs = abandoned_msecs
         self.unproven_attempts_limit_test = unproven_attempts_limit_test
         self.unproven_attempts_limit_main = unproven_attempts_limit_main
@@ -279,6 +287,9 @@ class Monitor:
             new_tip: New chain tip header.
             deactivated_headers: List of headers that were deactivated.
         """
+        if depth:
+            # Headers cached by height above the fork point belong to the deactivated branch.
+            self.services.invalidate_header_cache(old_tip["height"] - depth + 1)
         if deactivated_headers:
             now = int(time.time() * 1000)
             for header in deactivated_headers:
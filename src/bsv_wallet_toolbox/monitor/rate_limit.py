@@ -0,0 +1,35 @@
+"""Thread-safe token bucket used to pace monitor requests to service providers."""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Allow bursts of up to ``burst`` requests, then one every ``interval_msecs``.
+
+    ``acquire`` blocks the calling thread until a token is available, so the
+    workers of a fetch pool share one request rate. An interval of 0 disables
+    pacing.
+    """
+
+    def __init__(self, interval_msecs: float, burst: int = 1) -> None:
+        self.interval = max(0.0, interval_msecs) / 1000
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        if not self.interval:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) / self.interval)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) * self.interval
+            time.sleep(delay)
@@ -1,9 +1,16 @@
 """TaskCheckForProofs implementation."""
 
+import inspect
+import json
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import TYPE_CHECKING, Any
 
 from bsv.merkle_path import MerklePath
 
+from ...utils.async_runner import run_sync
+from ..rate_limit import TokenBucket
 from ..wallet_monitor_task import WalletMonitorTask
 
 if TYPE_CHECKING:
@@ -13,17 +20,35 @@ if TYPE_CHECKING:
     from ..monitor import Monitor
 
 
+def _int_option(monitor: "Monitor", name: str, default: int) -> int:
+    value = getattr(monitor.options, name, default)
+    return value if isinstance(value, int) and value >= 0 else default
+
+
 class TaskCheckForProofs(WalletMonitorTask):
     """Task to check for transaction proofs (BUMP).
 
     Retrieves merkle proofs for transactions that are in unconfirmed states.
     If a valid proof is found, updates the transaction status to 'proven'.
 
+    With ``MonitorOptions.proof_fetch_concurrency`` above 1 (default 8) the
+    requests are processed as a pipeline: a thread pool fetches merkle paths
+    concurrently, paced by a token bucket that allows one request every
+    ``msecs_wait_per_merkle_proof_service_req`` after an initial burst, while
+    this thread validates the results and writes them
+    ``proof_write_batch_size`` at a time with
+    ``StorageProvider.update_proven_tx_reqs_with_new_proven_txs``. Throughput
+    of each run is logged as a ``CheckForProofsMetrics`` monitor event.
+
     Reference: ts-wallet-toolbox/src/monitor/tasks/TaskCheckForProofs.ts
     """
 
     check_now: bool = False
     trigger_msecs: int
+    concurrency: int
+    write_batch_size: int
+    # (provenTxReqId, patch) attempt increments of the current batch
+    _attempt_updates: list[tuple[int, dict[str, Any]]]
 
     def __init__(self, monitor: "Monitor", trigger_msecs: int = 0) -> None:
         """Initialize TaskCheckForProofs.
@@ -34,6 +59,9 @@ class TaskCheckForProofs(WalletMonitorTask):
         """
         super().__init__(monitor, "CheckForProofs")
         self.trigger_msecs = trigger_msecs
+        self.concurrency = max(1, _int_option(monitor, "proof_fetch_concurrency", 8))
+        self.write_batch_size = max(1, _int_option(monitor, "proof_write_batch_size", 50))
+        self._attempt_updates = []
 
     def trigger(self, now: int) -> dict[str, bool]:
         """Trigger based on check_now flag or time interval."""
@@ -53,45 +81,142 @@ class TaskCheckForProofs(WalletMonitorTask):
             return ""
 
         limit = 100
-        offset = 0
-        total_processed = 0
-
-        while True:
-            # Find requests with relevant statuses
-            statuses = ["callback", "unmined", "sending", "unknown", "unconfirmed"]
-            # Note: Provider's find_proven_tx_reqs implementation supports list for IN clause
-            # pass limit/offset via query if supported, otherwise we get all.
-            # Since we can't rely on limit/offset support in current provider,
-            # we fetch all and paginate in memory if needed, or just process all.
-            # Ideally provider supports pagination.
-            reqs = self.monitor.storage.find_proven_tx_reqs({"status": statuses})
-
-            if not reqs:
-                break
+        statuses = ["callback", "unmined", "sending", "unknown", "unconfirmed"]
+        # Stream the requests by primary key so memory stays bounded by one batch and
+        # requests whose status changes while processing do not shift later batches
+        reqs = self.monitor.storage.iter_proven_tx_reqs({"status": statuses}, batch_size=limit)
+        self._process_in_batches(reqs, limit, max_acceptable_height, log_lines)
 
-            # Manual pagination since find_proven_tx_reqs ignores limit/offset in current provider
-            current_batch = reqs[offset : offset + limit]
-            if not current_batch:
-                break
-
-            log_lines.append(f"Processing {len(current_batch)} reqs (offset {offset})...")
+        return "\n".join(log_lines) if log_lines else ""
 
-            for req in current_batch:
-                self._process_req(req, max_acceptable_height, log_lines)
-                total_processed += 1
+    def _process_in_batches(
+        self, reqs: Iterable[dict[str, Any]], limit: int, max_acceptable_height: int, log_lines: list[str]
+    ) -> int:
+        """Process ``reqs`` in batches of ``limit``, flushing attempt counters per batch.
 
-            if len(current_batch) < limit:
-                break
-            offset += limit
+        Uses the pipeline when ``self.concurrency`` is above 1.
 
-        return "\n".join(log_lines) if log_lines else ""
+        Returns:
+            Number of requests processed.
+        """
+        if self.concurrency > 1:
+            return self._process_pipelined(reqs, max_acceptable_height, log_lines)
+        total_processed = 0
+        batch: list[dict[str, Any]] = []
+        for req in reqs:
+            batch.append(req)
+            if len(batch) == limit:
+                total_processed += self._process_batch(batch, total_processed, max_acceptable_height, log_lines)
+                batch = []
+        if batch:
+            total_processed += self._process_batch(batch, total_processed, max_acceptable_height, log_lines)
+        return total_processed
+
+    def _process_batch(
+        self, batch: list[dict[str, Any]], offset: int, max_acceptable_height: int, log_lines: list[str]
+    ) -> int:
+        log_lines.append(f"Processing {len(batch)} reqs (offset {offset})...")
+        self._attempt_updates = []
+        for req in batch:
+            self._process_req(req, max_acceptable_height, log_lines)
+        self._flush_attempts()
+        return len(batch)
+
+    def _process_pipelined(
+        self, reqs: Iterable[dict[str, Any]], max_acceptable_height: int, log_lines: list[str]
+    ) -> int:
+        """Fetch proofs concurrently and write them in batches as they arrive.
+
+        At most ``2 * concurrency`` fetches are in flight, so ``reqs`` is
+        consumed lazily. Writes happen on this thread while the pool keeps
+        fetching.
+
+        Returns:
+            Number of requests read from ``reqs``.
+        """
+        start = time.monotonic()
+        metrics = {"reqs": 0, "fetched": 0, "fetchErrors": 0, "proven": 0, "writeBatches": 0}
+        limiter = TokenBucket(
+            _int_option(self.monitor, "msecs_wait_per_merkle_proof_service_req", 0), burst=self.concurrency
+        )
+        pending: list[dict[str, Any]] = []
+        self._attempt_updates = []
+
+        def write_pending() -> None:
+            nonlocal pending
+            if pending:
+                metrics["proven"] += self._write_proofs(pending, log_lines)
+                metrics["writeBatches"] += 1
+                pending = []
+            self._flush_attempts()
+
+        total = 0
+        queue: Iterator[dict[str, Any]] = iter(reqs)
+        exhausted = False
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="CheckForProofs") as pool:
+            in_flight: dict[Future[Any], dict[str, Any]] = {}
+            while True:
+                while not exhausted and len(in_flight) < 2 * self.concurrency:
+                    req = next(queue, None)
+                    if req is None:
+                        exhausted = True
+                        break
+                    total += 1
+                    if self._should_fetch(req, log_lines):
+                        metrics["reqs"] += 1
+                        in_flight[pool.submit(self._fetch_proof, req["txid"], limiter)] = req
+                if not in_flight:
+                    break
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    req = in_flight.pop(future)
+                    try:
+                        res = future.result()
+                    except Exception as e:
+                        metrics["fetchErrors"] += 1
+                        log_lines.append(f"Error getting proof for {req['txid']}: {e!s}")
+                        self._increment_attempts(req["provenTxReqId"], req.get("attempts", 0))
+                        continue
+                    metrics["fetched"] += 1
+                    update = self._proof_update(req, res, max_acceptable_height, log_lines)
+                    if update is not None:
+                        pending.append(update)
+                    if len(pending) >= self.write_batch_size or len(self._attempt_updates) >= self.write_batch_size:
+                        write_pending()
+        write_pending()
+
+        if metrics["reqs"]:
+            elapsed = time.monotonic() - start
+            metrics["elapsedMsecs"] = int(elapsed * 1000)
+            metrics["reqsPerSecond"] = round(metrics["reqs"] / elapsed, 2) if elapsed > 0 else 0.0
+            metrics["concurrency"] = self.concurrency
+            log_lines.append(
+                f"Checked {metrics['reqs']} reqs: {metrics['proven']} proven, {metrics['fetchErrors']} fetch errors"
+                f" in {elapsed:.1f}s ({metrics['reqsPerSecond']} reqs/s, concurrency {self.concurrency})"
+            )
+            self.monitor.log_event("CheckForProofsMetrics", json.dumps(metrics))
+        return total
 
     def _process_req(self, req: dict[str, Any], max_acceptable_height: int, log_lines: list[str]) -> None:
+        if not self._should_fetch(req, log_lines):
+            return
+        txid = req["txid"]
+        try:
+            res = self._fetch_proof(txid)
+        except Exception as e:
+            log_lines.append(f"Error getting proof for {txid}: {e!s}")
+            self._increment_attempts(req["provenTxReqId"], req.get("attempts", 0))
+            return
+        update = self._proof_update(req, res, max_acceptable_height, log_lines)
+        if update is not None:
+            self._write_proofs([update], log_lines)
+
+    def _should_fetch(self, req: dict[str, Any], log_lines: list[str]) -> bool:
         txid = req.get("txid")
         proven_tx_req_id = req.get("provenTxReqId")
 
         if not txid or not proven_tx_req_id:
-            return
+            return False
 
         attempts = req.get("attempts", 0)
 
@@ -104,17 +229,26 @@ class TaskCheckForProofs(WalletMonitorTask):
         if attempts >= limit:
             log_lines.append(f"Reached attempt limit ({limit}) for {txid}, giving up")
             # Mark as failed or something? For now, just skip
-            return
-
-        try:
-            # 1. Get Merkle Path from Services
-            import asyncio
-
-            res = asyncio.run(self.monitor.services.get_merkle_path_for_transaction(txid))
-        except Exception as e:
-            log_lines.append(f"Error getting proof for {txid}: {e!s}")
-            self._increment_attempts(proven_tx_req_id, attempts)
-            return
+            return False
+        return True
+
+    def _fetch_proof(self, txid: str, limiter: TokenBucket | None = None) -> Any:
+        """Get the merkle path of ``txid`` from services (runs on pool threads in pipelined mode)."""
+        if limiter is not None:
+            limiter.acquire()
+        res = self.monitor.services.get_merkle_path_for_transaction(txid)
+        # Services is synchronous; test doubles may be coroutine functions
+        if inspect.iscoroutine(res):
+            res = run_sync(res)
+        return res
+
+    def _proof_update(
+        self, req: dict[str, Any], res: Any, max_acceptable_height: int, log_lines: list[str]
+    ) -> dict[str, Any] | None:
+        """Validate a getMerklePath result and return the storage update for it, if any."""
+        txid = req["txid"]
+        proven_tx_req_id = req["provenTxReqId"]
+        attempts = req.get("attempts", 0)
 
         merkle_path_data = res.get("merklePath")
         header = res.get("header")
@@ -122,12 +256,12 @@ class TaskCheckForProofs(WalletMonitorTask):
         if not merkle_path_data or not header:
             # Proof not ready yet
             self._increment_attempts(proven_tx_req_id, attempts)
-            return
+            return None
 
         height = header.get("height")
         if height is not None and height > max_acceptable_height:
             log_lines.append(f"Ignoring proof from future/bleeding edge block {height} for {txid}")
-            return
+            return None
 
         # 2. Validate Proof
         # Need to convert merkle_path_data to BUMP bytes for storage and validation
@@ -160,10 +294,10 @@ class TaskCheckForProofs(WalletMonitorTask):
                     merkle_path_obj = None  # Skip MerklePath object creation for now
                 else:
                     log_lines.append(f"Invalid MerklePath dict format for {txid}")
-                    return
+                    return None
             else:
                 log_lines.append(f"Unsupported MerklePath type {type(merkle_path_data)} for {txid}")
-                return
+                return None
 
             # Validate root matches header
             if merkle_path_obj:
@@ -173,54 +307,79 @@ class TaskCheckForProofs(WalletMonitorTask):
                     log_lines.append(f"Merkle root mismatch for {txid}: {calculated_root} != {header_root}")
                     # Mark as invalid? TS marks as invalid.
                     # self.monitor.storage.update_proven_tx_req(proven_tx_req_id, {"status": "invalid"})
-                    return
+                    return None
 
         except Exception as e:
             log_lines.append(f"Proof validation failed for {txid}: {e!s}")
-            return
-
-        # 3. Update Storage (ProvenTx)
+            return None
+
+        # For cases where we don't have a MerklePath object (e.g., dict format),
+        # use the bump_bytes we created
+        if merkle_path_obj:
+            bump_bytes = merkle_path_obj.to_binary()
+        # else: bump_bytes was set above
+
+        return {
+            "provenTxReqId": proven_tx_req_id,
+            "status": "notifying",  # or completed? TS: status becomes 'completed' inside update method
+            "txid": txid,
+            "attempts": attempts,
+            "history": req.get("history", []),
+            "index": 0,  # Extract from BUMP if possible, otherwise 0
+            "height": height,
+            "blockHash": header.get("hash"),
+            "merklePath": bump_bytes,
+            "merkleRoot": header.get("merkleRoot"),
+        }
+
+    def _write_proofs(self, updates: list[dict[str, Any]], log_lines: list[str]) -> int:
+        """Store a group of validated proofs in one transaction and fire the proven hooks.
+
+        Returns:
+            Number of requests updated.
+        """
         try:
-            # For cases where we don't have a MerklePath object (e.g., dict format),
-            # use the bump_bytes we created
-            if merkle_path_obj:
-                bump_bytes = merkle_path_obj.to_binary()
-            # else: bump_bytes was set above
-
-            update_args = {
-                "provenTxReqId": proven_tx_req_id,
-                "status": "notifying",  # or completed? TS: status becomes 'completed' inside update method
-                "txid": txid,
-                "attempts": attempts,
-                "history": req.get("history", []),
-                "index": 0,  # Extract from BUMP if possible, otherwise 0
-                "height": height,
-                "blockHash": header.get("hash"),
-                "merklePath": bump_bytes,
-                "merkleRoot": header.get("merkleRoot"),
-            }
-
             # Use provider's update logic
-            result = self.monitor.storage.update_proven_tx_req_with_new_proven_tx(update_args)
+            results = self.monitor.storage.update_proven_tx_reqs_with_new_proven_txs(updates)
+        except Exception as e:
+            for update in updates:
+                log_lines.append(f"Failed to update proven tx {update['txid']}: {e!s}")
+            return 0
+
+        proven = 0
+        for update, result in zip(updates, results, strict=True):
+            txid = update["txid"]
+            if result.get("error"):
+                log_lines.append(f"Failed to update proven tx {txid}: {result['error']}")
+                continue
+            proven += 1
             status = result.get("status", "unknown")
-            log_lines.append(f"Proven {txid} at height {height} (status: {status})")
+            log_lines.append(f"Proven {txid} at height {update['height']} (status: {status})")
 
             # Hook
             # Pass simplified status object
             tx_status = {
                 "txid": txid,
                 "status": "proven",
-                "blockHeight": height,
-                "blockHash": header.get("hash"),
-                "merkleRoot": header.get("merkleRoot"),
+                "blockHeight": update["height"],
+                "blockHash": update["blockHash"],
+                "merkleRoot": update["merkleRoot"],
             }
-            self.monitor.call_on_proven_transaction(tx_status)
-
-        except Exception as e:
-            log_lines.append(f"Failed to update proven tx {txid}: {e!s}")
+            try:
+                self.monitor.call_on_proven_transaction(tx_status)
+            except Exception as e:
+                log_lines.append(f"Proven hook failed for {txid}: {e!s}")
+        return proven
 
     def _increment_attempts(self, req_id: int, current_attempts: int) -> None:
+        # Written once per batch by _flush_attempts
+        self._attempt_updates.append((req_id, {"attempts": current_attempts + 1}))
+
+    def _flush_attempts(self) -> None:
+        updates, self._attempt_updates = self._attempt_updates, []
+        if not updates:
+            return
         try:
-            self.monitor.storage.update_proven_tx_req(req_id, {"attempts": current_attempts + 1})
+            self.monitor.storage.update_many("proven_tx_req", updates)
         except Exception:
             pass
@@ -42,16 +42,9 @@ class TaskCheckNoSends(TaskCheckForProofs):
         if max_acceptable_height is None:
             return "Chain tip height unavailable"
 
-        # Process only 'nosend' status
-        reqs = self.monitor.storage.find_proven_tx_reqs({"status": ["nosend"]})
-
-        if not reqs:
+        # Process only 'nosend' status, streamed in batches like TaskCheckForProofs
+        reqs = self.monitor.storage.iter_proven_tx_reqs({"status": ["nosend"]}, batch_size=100)
+        if not self._process_in_batches(reqs, 100, max_acceptable_height, log_lines):
             return ""
 
-        log_lines.append(f"Processing {len(reqs)} nosend reqs...")
-
-        for req in reqs:
-            # Reuse logic from TaskCheckForProofs
-            self._process_req(req, max_acceptable_height, log_lines)
-
         return "\n".join(log_lines)
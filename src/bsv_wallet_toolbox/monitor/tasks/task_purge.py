@@ -31,7 +31,9 @@ class TaskPurge(WalletMonitorTask):
 
         Args:
             monitor: "Monitor" instance.
-            params: Purge parameters (purgeSpent, purgeFailed, ages...).
+            params: Purge parameters (purgeSpent, purgeFailed, ages...). With
+                ``maxMsecs`` each run is time-boxed and an unfinished purge
+                resumes on the next monitor cycle.
             trigger_msecs: Trigger interval.
         """
         super().__init__(monitor, "Purge")
@@ -53,7 +55,13 @@ class TaskPurge(WalletMonitorTask):
         try:
             res = self.monitor.storage.purge_data(self.params)
             if res.get("count", 0) > 0:
-                log = f"{res.get('count')} records updated or deleted.\n{res.get('log', '')}"
+                rate = f" ({res['rowsPerSecond']:.0f} rows/s)" if res.get("rowsPerSecond") else ""
+                log = f"{res.get('count')} records updated or deleted{rate}.\n{res.get('log', '')}"
+            cursor = res.get("cursor")
+            if cursor:
+                # Stopped by params["maxMsecs"]; the storage keeps the cursor, continue on the next cycle
+                self.check_now = True
+                log += f"\nPurge paused in {cursor.get('phase')} after id {cursor.get('after')}."
         except Exception as e:
             log = f"Error running purge_data: {e!s}"
 
@@ -0,0 +1,125 @@
+"""Batched, dependency-ordered broadcasting of many transactions to ARC.
+
+``broadcast_in_batches`` submits transactions with ARC's multi-transaction
+endpoint (``ARC.post_raw_txs``, ``POST /v1/txs``) instead of one request per
+transaction. Transactions spending outputs of other transactions in the same
+call are put in dependency levels: level 0 has no parent in the call, level
+``n`` only parents in levels below ``n``. Levels are submitted one after the
+other, and the requests of a level (``batch_size`` transactions each) run
+concurrently on a thread pool, so a child never reaches ARC before its parent.
+
+A child whose parent was rejected is not submitted. When a parent's request
+failed (``service_error``) the child is marked as a service error too, so the
+caller can retry both, parents first, through its provider failover path.
+
+Reference:
+    toolbox/ts-wallet-toolbox/src/services/providers/ARC.ts (postBeef)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from .providers.arc import ARC, PostTxResultForTxid, PostTxResultForTxidError
+
+POST_BEEF_BATCH_SIZE: int = 100  # transactions per /v1/txs request
+POST_BEEF_CONCURRENCY: int = 4  # concurrent /v1/txs requests per dependency level
+
+
+def dependency_levels(txs: dict[str, Any]) -> list[list[str]]:
+    """Group the txids of ``txs`` so every transaction comes after its in-call parents.
+
+    Args:
+        txs: Transactions (with ``inputs[].source_txid``) keyed by txid.
+
+    Returns:
+        Txids per level, each level in input order.
+    """
+    parents = {
+        txid: {i.source_txid for i in getattr(tx, "inputs", []) if getattr(i, "source_txid", None) in txs} - {txid}
+        for txid, tx in txs.items()
+    }
+    # Kahn's algorithm, one level at a time: iterative, so deep chains do not hit the recursion limit
+    order = {txid: n for n, txid in enumerate(txs)}
+    pending = {txid: len(p) for txid, p in parents.items()}
+    children: dict[str, list[str]] = {txid: [] for txid in txs}
+    for txid, p in parents.items():
+        for parent in p:
+            children[parent].append(txid)
+
+    levels: list[list[str]] = []
+    level = [txid for txid in txs if not pending[txid]]
+    while level:
+        levels.append(level)
+        ready = []
+        for txid in level:
+            del pending[txid]
+            for child in children[txid]:
+                pending[child] -= 1
+                if not pending[child]:
+                    ready.append(child)
+        level = sorted(ready, key=order.__getitem__)
+    if pending:
+        # Valid transactions cannot form cycles; submit a malformed cycle last rather than drop it
+        levels.append(sorted(pending, key=order.__getitem__))
+    return levels
+
+
+def broadcast_in_batches(
+    arc: ARC,
+    txs: Sequence[Any],
+    batch_size: int = POST_BEEF_BATCH_SIZE,
+    concurrency: int = POST_BEEF_CONCURRENCY,
+) -> tuple[list[str], dict[str, PostTxResultForTxid]]:
+    """Broadcast ``txs`` to ``arc`` in dependency order with bounded concurrency.
+
+    Args:
+        arc: ARC provider to submit to.
+        txs: Transaction objects (``txid()``, ``hex()``, ``inputs``); duplicates are sent once.
+        batch_size: Transactions per ``/v1/txs`` request.
+        concurrency: Requests in flight at once.
+
+    Returns:
+        (txids in submission order, result by txid).
+    """
+    by_txid: dict[str, Any] = {}
+    for tx in txs:
+        by_txid.setdefault(tx.txid(), tx)
+    levels = dependency_levels(by_txid)
+    batch_size = max(1, batch_size)
+    results: dict[str, PostTxResultForTxid] = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="postBeefBatch") as pool:
+        for txids in levels:
+            ready = []
+            for txid in txids:
+                blocked = _blocked_by_parent(by_txid[txid], results)
+                if blocked is None:
+                    ready.append(txid)
+                else:
+                    results[txid] = blocked
+            chunks = [ready[i : i + batch_size] for i in range(0, len(ready), batch_size)]
+            futures = [pool.submit(arc.post_raw_txs, [by_txid[t].hex() for t in chunk], chunk) for chunk in chunks]
+            for chunk, future in zip(chunks, futures, strict=True):
+                for txid, result in zip(chunk, future.result(), strict=True):
+                    results[txid] = result
+    return [txid for txids in levels for txid in txids], results
+
+
+def _blocked_by_parent(tx: Any, results: dict[str, PostTxResultForTxid]) -> PostTxResultForTxid | None:
+    """Return the result of a child whose in-call parent was not accepted, else None."""
+    for tx_input in getattr(tx, "inputs", []):
+        parent_txid = getattr(tx_input, "source_txid", None) or ""
+        parent = results.get(parent_txid)
+        if parent is None or parent.status == "success":
+            continue
+        detail = f"parent transaction {parent_txid} was not accepted"
+        return PostTxResultForTxid(
+            txid=tx.txid(),
+            status="error",
+            data=PostTxResultForTxidError(detail=detail),
+            service_error=parent.service_error,
+        )
+    return None
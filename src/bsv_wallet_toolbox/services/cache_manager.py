@@ -1,54 +1,116 @@
-"""TTL-based cache manager for Services layer.
+"""Bounded LRU + TTL cache manager for Services layer.
 
 Implements generic caching with time-to-live (TTL) for service calls.
 Reference: ts-wallet-toolbox/src/services/chaintracker/ChaintracksChainTracker.ts
 
+Entries expire on the monotonic clock and the cache is bounded by entry
+count and (optionally) by the estimated size of the cached values; when a
+bound is exceeded the least recently used entries are evicted. Expired
+entries are swept every ``sweep_interval_msecs`` during normal reads and
+writes, so keys that are never read again do not accumulate in long-running
+``Services`` instances. All operations are thread-safe.
+
 Example:
-    >>> cache = CacheManager[dict]()
+    >>> cache = CacheManager[dict](max_entries=1000)
     >>> cache.set("key1", {"data": "value"}, ttl_msecs=60000)  # 60 second TTL
     >>> result = cache.get("key1")
     >>> if result:
     ...     print(result)  # {"data": "value"}
 """
 
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
 T = TypeVar("T")
 
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_SWEEP_INTERVAL_MSECS = 60_000
+
+
+def estimate_size(value: Any) -> int:
+    """Roughly estimate the memory held by a cached value in bytes.
+
+    Counts string/bytes payloads and recurses into dicts, lists and tuples;
+    other objects contribute their shallow ``sys.getsizeof``.
+    """
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value) + 48
+    if isinstance(value, dict):
+        return 64 + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return 56 + sum(estimate_size(v) for v in value)
+    return sys.getsizeof(value)
+
 
 class CacheEntry(Generic[T]):
     """Cache entry with TTL tracking."""
 
-    def __init__(self, value: T, ttl_msecs: int) -> None:
+    __slots__ = ("created_at", "expires_at", "size", "ttl", "value")
+
+    def __init__(self, value: T, ttl_msecs: int, size: int = 0) -> None:
         """Initialize cache entry.
 
         Args:
             value: The cached value
             ttl_msecs: Time-to-live in milliseconds
+            size: Estimated size of the value in bytes
         """
         self.value = value
         self.created_at = datetime.now(UTC)
         self.ttl = timedelta(milliseconds=ttl_msecs)
+        self.expires_at = time.monotonic() + ttl_msecs / 1000
+        self.size = size
 
-    def is_expired(self) -> bool:
+    def is_expired(self, now: float | None = None) -> bool:
         """Check if entry has expired.
 
+        Args:
+            now: Current ``time.monotonic()`` value, if already known
+
         Returns:
             True if the entry has exceeded its TTL, False otherwise
         """
-        return datetime.now(UTC) > self.created_at + self.ttl
+        return (time.monotonic() if now is None else now) > self.expires_at
 
 
 class CacheManager(Generic[T]):
-    """Generic TTL-based cache manager.
-
-    Manages cached entries with automatic expiration based on TTL.
+    """Generic bounded LRU cache with per-entry TTL.
+
+    Args:
+        max_entries: Maximum number of entries kept.
+        max_bytes: Maximum total estimated size of the cached values, or None
+            for no size bound.
+        sweep_interval_msecs: Minimum time between sweeps of expired entries.
+        sizeof: Size estimator for values (defaults to :func:`estimate_size`).
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int | None = None,
+        sweep_interval_msecs: int = DEFAULT_SWEEP_INTERVAL_MSECS,
+        sizeof: Callable[[Any], int] | None = None,
+    ) -> None:
         """Initialize cache manager."""
-        self._cache: dict[str, CacheEntry[T]] = {}
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sweep_interval = sweep_interval_msecs / 1000
+        self._sizeof = sizeof or estimate_size
+        self._cache: OrderedDict[str, CacheEntry[T]] = OrderedDict()
+        self._lock = threading.RLock()
+        self._bytes = 0
+        self._next_sweep = time.monotonic() + self.sweep_interval
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
 
     def set(self, key: str, value: T, ttl_msecs: int) -> None:
         """Set a cached value with TTL.
@@ -59,7 +121,20 @@ class CacheManager(Generic[T]):
             ttl_msecs: Time-to-live in milliseconds
         """
         validated_key = self._validate_key(key)
-        self._cache[validated_key] = CacheEntry(value, ttl_msecs)
+        size = self._sizeof(value) if self.max_bytes is not None else 0
+        with self._lock:
+            self._maybe_sweep()
+            old = self._cache.pop(validated_key, None)
+            if old is not None:
+                self._bytes -= old.size
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            self._cache[validated_key] = CacheEntry(value, ttl_msecs, size)
+            self._bytes += size
+            while len(self._cache) > self.max_entries or (self.max_bytes is not None and self._bytes > self.max_bytes):
+                _, evicted = self._cache.popitem(last=False)
+                self._bytes -= evicted.size
+                self.evictions += 1
 
     def get(self, key: str) -> T | None:
         """Get a cached value if it exists and hasn't expired.
@@ -71,15 +146,22 @@ class CacheManager(Generic[T]):
             The cached value if valid and not expired, None otherwise
         """
         validated_key = self._validate_key(key)
-        entry = self._cache.get(validated_key)
-        if entry is None:
-            return None
-
-        if entry.is_expired():
-            del self._cache[validated_key]
-            return None
-
-        return entry.value
+        with self._lock:
+            self._maybe_sweep()
+            entry = self._cache.get(validated_key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            if entry.is_expired():
+                self._remove(validated_key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._cache.move_to_end(validated_key)
+            self.hits += 1
+            return entry.value
 
     def clear(self, key: str | None = None) -> None:
         """Clear cache entries.
@@ -87,13 +169,30 @@ class CacheManager(Generic[T]):
         Args:
             key: Specific key to clear. If None, clears entire cache.
         """
-        if key is None:
-            self._cache.clear()
-            return
+        with self._lock:
+            if key is None:
+                self._cache.clear()
+                self._bytes = 0
+                return
 
-        validated_key = self._validate_key(key)
-        if validated_key in self._cache:
-            del self._cache[validated_key]
+            validated_key = self._validate_key(key)
+            if validated_key in self._cache:
+                self._remove(validated_key)
+
+    def clear_matching(self, predicate: Callable[[str], bool]) -> int:
+        """Remove every entry whose key satisfies ``predicate``.
+
+        Args:
+            predicate: Called with each stored key
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            matching = [k for k in self._cache if predicate(k)]
+            for k in matching:
+                self._remove(k)
+            return len(matching)
 
     def has(self, key: str) -> bool:
         """Check if a valid (non-expired) entry exists.
@@ -106,6 +205,45 @@ class CacheManager(Generic[T]):
         """
         return self.get(key) is not None
 
+    def sweep(self) -> int:
+        """Remove all expired entries.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._next_sweep = now + self.sweep_interval
+            expired = [k for k, entry in self._cache.items() if entry.is_expired(now)]
+            for k in expired:
+                self._remove(k)
+            self.expirations += len(expired)
+            return len(expired)
+
+    def stats(self) -> dict[str, int]:
+        """Return entry/byte totals and hit, miss, eviction and expiration counters."""
+        with self._lock:
+            return {
+                "entries": len(self._cache),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def __len__(self) -> int:
+        """Number of stored entries (expired entries not yet swept included)."""
+        return len(self._cache)
+
+    def _remove(self, key: str) -> None:
+        entry = self._cache.pop(key)
+        self._bytes -= entry.size
+
+    def _maybe_sweep(self) -> None:
+        if time.monotonic() >= self._next_sweep:
+            self.sweep()
+
     @staticmethod
     def to_camel_case(key: str) -> str:
         """Convert an underscore-delimited key to camelCase.
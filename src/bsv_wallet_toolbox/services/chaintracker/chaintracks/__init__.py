@@ -3,6 +3,9 @@
 Reference: toolbox/ts-wallet-toolbox/src/services/chaintracker/chaintracks/
 """
 
+from bsv_wallet_toolbox.services.chaintracker.chaintracks.bulk_header_store import (
+    BulkHeaderStore,
+)
 from bsv_wallet_toolbox.services.chaintracker.chaintracks.bulk_ingestor_cdn import (
     BulkIngestorCDN,
 )
@@ -38,6 +41,7 @@ from bsv_wallet_toolbox.services.chaintracker.chaintracks.options import (
 
 __all__ = [
     "BulkHeaderMinimumInfo",
+    "BulkHeaderStore",
     "BulkIngestor",
     "BulkIngestorCDN",
     "BulkIngestorWOC",
@@ -0,0 +1,357 @@
+"""Memory-mapped bulk block header store.
+
+Keeps bulk headers as raw 80-byte serialized headers in height-indexed files
+using the CDN bulk file layout (``{chain}Net_{index}.headers``, file ``index``
+holding heights ``index * headers_per_file`` onwards). Files are memory-mapped,
+so a header is located by offset arithmetic and returned as a zero-copy
+``memoryview`` slice; nothing is kept per header in Python objects.
+
+Block hash and merkle root lookups use compact sorted ``array('Q')`` indexes
+of ``(key prefix << 32) | height`` (8 bytes per header and index). Candidates
+are confirmed against the stored header, so prefix collisions are harmless.
+The indexes are built on first use and extended as headers are appended.
+
+Example:
+    >>> store = BulkHeaderStore("/var/lib/chaintracks", "main")
+    >>> store.append(0, cdn_file_bytes)
+    >>> store.get_header(170)["hash"]
+    '00000000d1145790a8694403d4063f323d499e655c83426834d4ce2f8dd4a2ee'
+    >>> store.find_height_for_hash("00000000d1145790a8694403d4063f323d499e655c83426834d4ce2f8dd4a2ee")
+    170
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import logging
+import mmap
+import os
+import re
+import threading
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any
+
+from ...wallet_services import Chain
+from .util.block_header_utilities import deserialize_base_block_header
+from .util.bulk_header_codec import HEADER_SIZE, block_hashes, validate_block_headers
+from .util.height_range import HeightRange
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS_PER_FILE: int = 100000
+
+
+def _double_sha256(data: bytes | memoryview) -> bytes:
+    return hashlib.sha256(hashlib.sha256(data).digest()).digest()
+
+
+def _prefix(digest: bytes | memoryview) -> int:
+    return int.from_bytes(digest[:4], "little")
+
+
+class _HeaderFile:
+    """One bulk file: its path, first height, header count and current mapping."""
+
+    __slots__ = ("count", "first_height", "index", "mm", "path")
+
+    def __init__(self, path: str, index: int, first_height: int) -> None:
+        self.path = path
+        self.index = index
+        self.first_height = first_height
+        self.count = 0
+        self.mm: mmap.mmap | None = None
+
+    def remap(self) -> None:
+        """Map the file's whole headers (a previous mapping stays valid for views still using it).
+
+        Readers do not lock: they check ``count`` and then slice ``mm``. The new
+        mapping is therefore published before the new count, so a reader that sees
+        the new count never slices the old, shorter mapping.
+        """
+        count = Path(self.path).stat().st_size // HEADER_SIZE
+        if count == 0:
+            self.count = 0
+            self.mm = None
+            return
+        with open(self.path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), count * HEADER_SIZE, access=mmap.ACCESS_READ)
+        self.mm = mm
+        self.count = count
+
+
+class _PrefixIndex:
+    """Sorted ``(prefix << 32) | height`` keys mapping a 32-bit key prefix to candidate heights."""
+
+    def __init__(self) -> None:
+        self.keys = array("Q")
+
+    def add(self, entries: list[int]) -> None:
+        entries.sort()
+        if not self.keys:
+            self.keys = array("Q", entries)
+        else:
+            self.keys = array("Q", heapq.merge(self.keys, entries))
+
+    def heights(self, prefix: int) -> list[int]:
+        i = bisect_left(self.keys, prefix << 32)
+        found = []
+        while i < len(self.keys) and self.keys[i] >> 32 == prefix:
+            found.append(self.keys[i] & 0xFFFFFFFF)
+            i += 1
+        return found
+
+
+class BulkHeaderStore:
+    """Height-indexed, memory-mapped store of bulk block headers."""
+
+    def __init__(self, root_folder: str, chain: Chain = "main", headers_per_file: int = DEFAULT_HEADERS_PER_FILE):
+        """Open (or create) the store in ``root_folder``, mapping the bulk files already there.
+
+        Args:
+            root_folder: Folder holding the bulk header files
+            chain: Blockchain network (file name prefix)
+            headers_per_file: Headers per bulk file
+        """
+        self.root_folder = root_folder
+        self.chain = chain
+        self.headers_per_file = headers_per_file
+        self._files: list[_HeaderFile] = []
+        self._lock = threading.Lock()
+        self._hash_index = _PrefixIndex()
+        self._merkle_root_index = _PrefixIndex()
+        self._indexed_through = -1  # highest height in the indexes
+        os.makedirs(root_folder, exist_ok=True)
+        self._load_files()
+
+    def file_name(self, index: int) -> str:
+        """Return the CDN file name of bulk file ``index``."""
+        return f"{self.chain}Net_{index}.headers"
+
+    def _load_files(self) -> None:
+        pattern = re.compile(rf"^{re.escape(self.chain)}Net_(\d+)\.headers$")
+        indexes = sorted(
+            int(m.group(1)) for m in (pattern.match(p.name) for p in Path(self.root_folder).iterdir()) if m
+        )
+        for index in indexes:
+            if self._files and (index != self._files[-1].index + 1 or self._files[-1].count < self.headers_per_file):
+                logger.warning(
+                    "Ignoring bulk header files from %s on: heights are not contiguous", self.file_name(index)
+                )
+                break
+            file = _HeaderFile(
+                os.path.join(self.root_folder, self.file_name(index)), index, index * self.headers_per_file
+            )
+            file.remap()
+            if file.count == 0:
+                break
+            self._files.append(file)
+
+    @property
+    def min_height(self) -> int | None:
+        """Lowest stored height, None when the store is empty."""
+        files = self._files
+        return files[0].first_height if files else None
+
+    @property
+    def max_height(self) -> int | None:
+        """Highest stored height, None when the store is empty."""
+        files = self._files
+        return files[-1].first_height + files[-1].count - 1 if files else None
+
+    def height_range(self) -> HeightRange:
+        """Return the stored height range (empty when there are no headers)."""
+        files = self._files
+        if not files:
+            return HeightRange.new_empty_height_range()
+        return HeightRange(files[0].first_height, files[-1].first_height + files[-1].count - 1)
+
+    def count(self) -> int:
+        """Return the number of stored headers."""
+        return sum(file.count for file in self._files)
+
+    def _file_for_height(self, height: int) -> _HeaderFile | None:
+        files = self._files
+        if not files or height < files[0].first_height:
+            return None
+        i = height // self.headers_per_file - files[0].index
+        if i >= len(files) or height - files[i].first_height >= files[i].count:
+            return None
+        return files[i]
+
+    def get(self, height: int) -> memoryview | None:
+        """Return the serialized 80-byte header at ``height`` as a zero-copy view, or None."""
+        file = self._file_for_height(height)
+        if file is None:
+            return None
+        offset = (height - file.first_height) * HEADER_SIZE
+        return memoryview(file.mm)[offset : offset + HEADER_SIZE]
+
+    def get_range(self, start_height: int, end_height: int) -> list[memoryview]:
+        """Return the serialized headers from ``start_height`` to ``end_height`` (inclusive).
+
+        The range is clipped to the stored heights. Returns one zero-copy view per
+        bulk file the range touches (headers are contiguous within each view).
+        """
+        files = self._files
+        if not files:
+            return []
+        start = max(start_height, files[0].first_height)
+        end = min(end_height, files[-1].first_height + files[-1].count - 1)
+        views = []
+        while start <= end:
+            file = self._file_for_height(start)
+            stop = min(end, file.first_height + file.count - 1)
+            offset = (start - file.first_height) * HEADER_SIZE
+            views.append(memoryview(file.mm)[offset : offset + (stop - start + 1) * HEADER_SIZE])
+            start = stop + 1
+        return views
+
+    def read_headers(self, height: int, count: int) -> bytes:
+        """Return up to ``count`` serialized headers starting at ``height`` as one buffer."""
+        return b"".join(self.get_range(height, height + count - 1))
+
+    def get_header(self, height: int) -> dict[str, Any] | None:
+        """Return the deserialized header at ``height`` (with ``height`` and ``hash``), or None."""
+        data = self.get(height)
+        if data is None:
+            return None
+        header = deserialize_base_block_header(data)
+        header["height"] = height
+        header["hash"] = _double_sha256(data)[::-1].hex()
+        return header
+
+    def last_header(self) -> dict[str, Any] | None:
+        """Return the highest stored header, or None."""
+        height = self.max_height
+        return self.get_header(height) if height is not None else None
+
+    def find_height_for_hash(self, hash_hex: str) -> int | None:
+        """Return the height of the block with hash ``hash_hex``, or None."""
+        digest = bytes.fromhex(hash_hex)[::-1]
+        if len(digest) != 32:
+            return None
+        self._update_indexes()
+        for height in self._hash_index.heights(_prefix(digest)):
+            data = self.get(height)
+            if data is not None and _double_sha256(data) == digest:
+                return height
+        return None
+
+    def find_height_for_merkle_root(self, merkle_root_hex: str) -> int | None:
+        """Return the height of the block with merkle root ``merkle_root_hex``, or None."""
+        root = bytes.fromhex(merkle_root_hex)[::-1]
+        if len(root) != 32:
+            return None
+        self._update_indexes()
+        for height in self._merkle_root_index.heights(_prefix(root)):
+            data = self.get(height)
+            if data is not None and data[36:68] == root:
+                return height
+        return None
+
+    def find_header_for_hash(self, hash_hex: str) -> dict[str, Any] | None:
+        """Return the header with block hash ``hash_hex``, or None."""
+        height = self.find_height_for_hash(hash_hex)
+        return self.get_header(height) if height is not None else None
+
+    def find_header_for_merkle_root(self, merkle_root_hex: str) -> dict[str, Any] | None:
+        """Return the header with merkle root ``merkle_root_hex``, or None."""
+        height = self.find_height_for_merkle_root(merkle_root_hex)
+        return self.get_header(height) if height is not None else None
+
+    def _update_indexes(self) -> None:
+        """Index the headers appended since the last lookup."""
+        with self._lock:
+            max_height = self.max_height
+            if max_height is None or self._indexed_through >= max_height:
+                return
+            height = max(self._indexed_through + 1, self.min_height)
+            for view in self.get_range(height, max_height):
+                self._index_headers(height, view, block_hashes(view))
+                height += len(view) // HEADER_SIZE
+
+    def _index_headers(self, first_height: int, data: memoryview, hashes: list[bytes]) -> None:
+        """Add headers following the indexed range to the hash and merkle root indexes."""
+        self._hash_index.add([_prefix(digest) << 32 | first_height + i for i, digest in enumerate(hashes)])
+        self._merkle_root_index.add(
+            [
+                _prefix(data[i + 36 : i + 40]) << 32 | first_height + i // HEADER_SIZE
+                for i in range(0, len(data), HEADER_SIZE)
+            ]
+        )
+        self._indexed_through = first_height + len(hashes) - 1
+
+    def append(self, first_height: int, data: bytes | memoryview, check_pow: bool = True) -> None:
+        """Append serialized headers continuing the stored chain.
+
+        The whole range is validated in one pass (``validate_block_headers``) before
+        anything is written.
+
+        Args:
+            first_height: Height of the first header in ``data``
+            data: Concatenated 80-byte serialized headers
+            check_pow: Check each header's proof of work against its ``bits``
+
+        Raises:
+            ValueError: If ``data`` is not whole headers, ``first_height`` does not follow
+                the stored headers (or start a bulk file when the store is empty), a header
+                does not link to its predecessor (the first one to the stored tip) or fails
+                its proof of work
+        """
+        data = memoryview(data).cast("B")
+        if len(data) % HEADER_SIZE:
+            raise ValueError(f"bulk header data length {len(data)} is not a multiple of {HEADER_SIZE}")
+        if not data:
+            return
+        with self._lock:
+            max_height = self.max_height
+            if max_height is None:
+                if first_height % self.headers_per_file:
+                    raise ValueError(f"first bulk height {first_height} must start a file of {self.headers_per_file}")
+            elif first_height != max_height + 1:
+                raise ValueError(f"bulk headers must continue at height {max_height + 1}, got {first_height}")
+            tip = self.get(max_height) if max_height is not None else None
+            info = validate_block_headers(
+                data,
+                first_height,
+                previous_hash=_double_sha256(tip)[::-1].hex() if tip is not None else None,
+                check_pow=check_pow,
+            )
+
+            height, offset = first_height, 0
+            while offset < len(data):
+                index = height // self.headers_per_file
+                file = self._files[-1] if self._files and self._files[-1].index == index else None
+                if file is None:
+                    file = _HeaderFile(
+                        os.path.join(self.root_folder, self.file_name(index)), index, index * self.headers_per_file
+                    )
+                room = (file.first_height + self.headers_per_file - height) * HEADER_SIZE
+                chunk = data[offset : offset + room]
+                with open(file.path, "r+b" if os.path.exists(file.path) else "wb") as f:
+                    f.seek((height - file.first_height) * HEADER_SIZE)
+                    f.write(chunk)
+                    f.truncate()
+                file.remap()
+                if not self._files or self._files[-1] is not file:
+                    self._files.append(file)
+                height += len(chunk) // HEADER_SIZE
+                offset += len(chunk)
+
+            if max_height is not None and self._indexed_through == max_height:
+                self._index_headers(first_height, data, info.hashes)
+
+    def close(self) -> None:
+        """Release the mappings (views still in use keep theirs alive)."""
+        with self._lock:
+            for file in self._files:
+                if file.mm is not None:
+                    try:
+                        file.mm.close()
+                    except BufferError:
+                        pass
+                file.mm = None
+            self._files = []
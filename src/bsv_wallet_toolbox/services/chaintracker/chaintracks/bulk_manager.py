@@ -1,6 +1,8 @@
 """Bulk manager for Chaintracks service.
 
 Manages bulk header synchronization from various sources (CDN, WhatsOnChain).
+Bulk headers are served from a memory-mapped ``BulkHeaderStore`` when one is
+configured.
 
 Reference: go-wallet-toolbox/pkg/services/chaintracks/bulk_manager.go
 """
@@ -9,8 +11,10 @@ import logging
 from typing import Any
 
 from ...wallet_services import Chain
+from .bulk_header_store import BulkHeaderStore
 from .bulk_ingestor_interface import NamedBulkIngestor
-from .models import HeightRanges
+from .models import HeightRanges, LiveBlockHeader
+from .util.block_header_utilities import serialize_base_block_header
 
 logger = logging.getLogger(__name__)
 
@@ -18,15 +22,17 @@ logger = logging.getLogger(__name__)
 class BulkManager:
     """Manages bulk header synchronization from multiple sources."""
 
-    def __init__(self, chain: Chain, bulk_ingestors: list[NamedBulkIngestor]):
+    def __init__(self, chain: Chain, bulk_ingestors: list[NamedBulkIngestor], store: BulkHeaderStore | None = None):
         """Initialize bulk manager.
 
         Args:
             chain: Blockchain network
             bulk_ingestors: List of configured bulk ingestors
+            store: Bulk header store serving the bulk headers (None: no bulk headers)
         """
         self.chain = chain
         self.bulk_ingestors = bulk_ingestors
+        self.store = store
 
         logger.info(f"BulkManager initialized with {len(bulk_ingestors)} ingestors for {chain}")
 
@@ -36,9 +42,9 @@ class BulkManager:
         Returns:
             HeightRange for bulk data, or None if no bulk data
         """
-        # TODO: Implement bulk height range tracking
-        # For now, return a placeholder range
-        return None
+        if self.store is None or self.store.max_height is None:
+            return None
+        return self.store.height_range()
 
     async def sync_bulk_storage(self, present_height: int, ranges: HeightRanges, live_height_threshold: int) -> None:
         """Synchronize bulk storage with current blockchain state.
@@ -60,8 +66,35 @@ class BulkManager:
         Returns:
             Block header dict or None if not found
         """
-        # TODO: Implement bulk header lookup
-        return None
+        if self.store is None:
+            return None
+        return self.store.get_header(height)
+
+    async def find_header_for_block_hash(self, hash_hex: str) -> dict[str, Any] | None:
+        """Find header by block hash from bulk storage.
+
+        Args:
+            hash_hex: Block hash
+
+        Returns:
+            Block header dict or None if not found
+        """
+        if self.store is None:
+            return None
+        return self.store.find_header_for_hash(hash_hex)
+
+    async def find_header_for_merkle_root(self, merkle_root: str) -> dict[str, Any] | None:
+        """Find header by merkle root from bulk storage.
+
+        Args:
+            merkle_root: Block merkle root
+
+        Returns:
+            Block header dict or None if not found
+        """
+        if self.store is None:
+            return None
+        return self.store.find_header_for_merkle_root(merkle_root)
 
     def files_info(self) -> dict[str, Any]:
         """Get information about bulk files.
@@ -69,8 +102,27 @@ class BulkManager:
         Returns:
             Dictionary with bulk file information
         """
-        # TODO: Implement bulk files info
-        return {"rootFolder": "", "jsonFilename": "", "headersPerFile": 100000, "files": []}
+        if self.store is None:
+            return {"rootFolder": "", "jsonFilename": "", "headersPerFile": 100000, "files": []}
+        store = self.store
+        files = []
+        max_height = store.max_height
+        if max_height is not None:
+            for first_height in range(store.min_height, max_height + 1, store.headers_per_file):
+                index = first_height // store.headers_per_file
+                files.append(
+                    {
+                        "fileName": store.file_name(index),
+                        "firstHeight": first_height,
+                        "count": min(store.headers_per_file, max_height + 1 - first_height),
+                    }
+                )
+        return {
+            "rootFolder": store.root_folder,
+            "jsonFilename": f"{self.chain}NetBlockHeaders.json",
+            "headersPerFile": store.headers_per_file,
+            "files": files,
+        }
 
     def get_file_data_by_index(self, index: int) -> Any | None:
         """Get bulk file data by index.
@@ -84,14 +136,23 @@ class BulkManager:
         # TODO: Implement file data retrieval
         return None
 
-    async def migrate_from_live_headers(self, headers: list[Any]) -> None:
+    async def migrate_from_live_headers(self, headers: list[LiveBlockHeader]) -> None:
         """Migrate live headers to bulk storage.
 
         Args:
-            headers: List of LiveBlockHeader to migrate
+            headers: Active LiveBlockHeaders continuing the bulk headers, sorted by height
+
+        Raises:
+            ValueError: If the headers do not continue the stored bulk chain
         """
-        # TODO: Implement live to bulk migration
-        logger.debug(f"Live to bulk migration requested for {len(headers)} headers")
+        if not headers:
+            return
+        if self.store is None:
+            logger.debug(f"Live to bulk migration of {len(headers)} headers skipped, no bulk store")
+            return
+        data = b"".join(serialize_base_block_header(header.chain_block_header) for header in headers)
+        self.store.append(headers[0].height, data)
+        logger.debug(f"Migrated live headers {headers[0].height}-{headers[-1].height} to bulk storage")
 
     def last_header(self) -> tuple[dict[str, Any] | None, Any | None]:
         """Get the last header from bulk storage.
@@ -99,8 +160,10 @@ class BulkManager:
         Returns:
             Tuple of (last_header, chain_work) or (None, None)
         """
-        # TODO: Implement last header lookup
-        return None, None
+        if self.store is None:
+            return None, None
+        # The store keeps headers only; chain work is not tracked for bulk headers yet
+        return self.store.last_header(), None
 
     async def get_gap_headers_as_live(
         self, present_height: int, live_range: Any, recursion_limit: int
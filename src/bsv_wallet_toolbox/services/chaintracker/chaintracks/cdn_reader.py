@@ -9,9 +9,9 @@ import logging
 from typing import Any
 
 import requests
-from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from ...http_transport import HttpTransport, default_http_transport
 from ...wallet_services import Chain
 
 logger = logging.getLogger(__name__)
@@ -68,24 +68,20 @@ class CDNReader:
     # Base URL for Project Babbage CDN
     BABBAGE_CDN_BASE_URL = "https://cdn.projectbabbage.com/blockheaders"
 
-    def __init__(self, base_url: str = BABBAGE_CDN_BASE_URL, timeout: int = 30):
+    def __init__(self, base_url: str = BABBAGE_CDN_BASE_URL, timeout: int = 30, transport: HttpTransport | None = None):
         """Initialize CDN reader.
 
         Args:
             base_url: Base URL for CDN
             timeout: Request timeout in seconds
+            transport: Pooled HTTP transport (defaults to the process-wide transport)
         """
         self.base_url = base_url
         self.timeout = timeout
 
-        # Setup requests session with retry strategy
-        self.session = requests.Session()
-
+        # Setup pooled requests session with retry strategy
         retry_strategy = Retry(total=3, status_forcelist=[429, 500, 502, 503, 504], backoff_factor=1)
-
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        self.session = (transport or default_http_transport()).session(retries=retry_strategy)
 
         # Set headers
         self.session.headers.update(
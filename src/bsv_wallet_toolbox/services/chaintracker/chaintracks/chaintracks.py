@@ -10,6 +10,7 @@ from typing import Any
 
 from ...wallet_services import Chain
 from .api import BaseBlockHeader, BlockHeader, ChaintracksInfo
+from .bulk_header_store import DEFAULT_HEADERS_PER_FILE, BulkHeaderStore
 from .util.block_header_utilities import block_hash, serialize_base_block_header
 
 
@@ -56,6 +57,14 @@ class Chaintracks:
         self._max_cached_headers = options.get("maxCachedHeaders", 10000)
         self._use_remote_headers = options.get("useRemoteHeaders", True)
 
+        # Memory-mapped bulk headers (CDN file format) when a folder is configured
+        bulk_folder = options.get("bulkHeadersFolder")
+        self._bulk_store = (
+            BulkHeaderStore(bulk_folder, self._chain, options.get("bulkHeadersPerFile", DEFAULT_HEADERS_PER_FILE))
+            if bulk_folder
+            else None
+        )
+
         # Internal state
         self._available = False
         self._headers_cache: dict[int, Any] = {}
@@ -75,8 +84,15 @@ class Chaintracks:
         # TODO: Load headers from storage or remote source
         # For now, just mark as available with a reasonable height
         self._present_height = 800000 if self._chain == "main" else 1400000
+        bulk_height = self._bulk_height()
+        if bulk_height is not None:
+            self._present_height = max(self._present_height, bulk_height)
         self._available = True
 
+    def _bulk_height(self) -> int | None:
+        """Highest height in the bulk header store, None without bulk headers."""
+        return self._bulk_store.max_height if self._bulk_store is not None else None
+
     # ChaintracksClientApi implementation
     async def get_chain(self) -> Chain:
         """Get the blockchain network this instance is tracking.
@@ -98,9 +114,10 @@ class Chaintracks:
         Reference: wallet-toolbox/src/services/chaintracker/chaintracks/Api/ChaintracksClientApi.ts
                    getInfo()
         """
+        bulk_height = self._bulk_height()
         return {
             "chain": self._chain,
-            "heightBulk": self._present_height,
+            "heightBulk": bulk_height if bulk_height is not None else self._present_height,
             "heightLive": self._present_height,
             "storage": "memory" if not self._use_storage else "database",
             "bulkIngestors": [],
@@ -134,6 +151,10 @@ class Chaintracks:
         Reference: wallet-toolbox/src/services/chaintracker/chaintracks/Api/ChaintracksClientApi.ts
                    getHeaders()
         """
+        bulk_height = self._bulk_height()
+        if bulk_height is not None and self._bulk_store.min_height <= height <= bulk_height:
+            return self._bulk_store.read_headers(height, count).hex()
+
         # Stub implementation - return mock headers for testing
         # Special case for test compatibility: return 1 header when height equals present height
         actual_count = 1 if height == self._present_height else count
@@ -198,6 +219,10 @@ class Chaintracks:
         Reference: wallet-toolbox/src/services/chaintracker/chaintracks/Api/ChaintracksClientApi.ts
                    findHeaderForHeight()
         """
+        if self._bulk_store is not None:
+            header = self._bulk_store.get_header(height)
+            if header is not None:
+                return header
         if height == 0:
             # Genesis block
             return {
@@ -291,6 +316,8 @@ class Chaintracks:
                    destroy()
         """
         self._headers_cache.clear()
+        if self._bulk_store is not None:
+            self._bulk_store.close()
         self._available = False
         # TODO: Close storage connections if using database
 
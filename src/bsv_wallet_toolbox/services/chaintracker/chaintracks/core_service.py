@@ -10,18 +10,21 @@ import asyncio
 import logging
 import threading
 import time
+from collections import OrderedDict
 from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
 from ...wallet_services import Chain
 from ..chaintracks_storage import ChaintracksStorageMemory
+from .bulk_header_store import BulkHeaderStore
 from .bulk_ingestor_factory import create_bulk_ingestors
 from .bulk_manager import BulkManager
 from .chain_work import ChainWork
 from .live_ingestor_factory import create_live_ingestors
 from .live_ingestor_interface import NamedLiveIngestor
-from .models import BlockHeader, HeightRanges, InfoResponse, LiveBlockHeader
+from .models import BlockHeader, HeightRange, HeightRanges, InfoResponse, LiveBlockHeader, StorageQueries
+from .reorg import ChainTipSwitch, apply_chain_tip_switch, find_chain_tip_switch
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +37,11 @@ class ChaintracksServiceConfig:
     live_ingestors: list[str] = None  # List of ingestor types
     bulk_ingestors: list[dict[str, Any]] = None  # List of ingestor configs
     add_live_recursion_limit: int = 10
-    live_height_threshold: int = 2000
+    live_height_threshold: int = 2000  # live headers this deep below the live tip are reorg-safe and move to bulk
+    bulk_migration_chunk_size: int = 500  # live headers migrated to bulk per batch
+    live_ingest_batch_size: int = 500  # queued live headers stored per transaction
+    live_header_cache_size: int = 1000  # most recent live headers kept in memory for parent lookups
+    bulk_headers_folder: str | None = None  # memory-mapped bulk header files (None: no bulk store)
 
     def __post_init__(self):
         if self.live_ingestors is None:
@@ -50,52 +57,42 @@ class PubSubEvents:
     """Simple pub/sub event system for headers and reorgs."""
 
     def __init__(self):
-        self._subscribers: list[Callable] = []
+        self._subscribers: list[Callable[..., None]] = []
         self._lock = threading.Lock()
 
-    def subscribe(self) -> tuple[Callable[[Any], None], Callable[[], None]]:
+    def subscribe(self, listener: Callable[..., None] | None = None) -> tuple[Callable[..., None], Callable[[], None]]:
         """Subscribe to events.
 
+        Args:
+            listener: Called with the arguments of every published event
+
         Returns:
-            Tuple of (send_function, unsubscribe_function)
+            Tuple of (send_function, unsubscribe_function); send publishes to all subscribers
         """
 
-        def send_callback(data: Any) -> None:
-            callback(data)
-
         def unsubscribe() -> None:
             with self._lock:
-                if callback in self._subscribers:
-                    self._subscribers.remove(callback)
-
-        callback = None
+                if listener in self._subscribers:
+                    self._subscribers.remove(listener)
 
-        def create_callback() -> Callable:
-            def cb(data: Any) -> None:
-                with self._lock:
-                    for subscriber in self._subscribers[:]:
-                        try:
-                            subscriber(data)
-                        except Exception as e:
-                            logger.error(f"Error in event subscriber: {e}")
-
-            return cb
-
-        callback = create_callback()
+        if listener is not None:
+            with self._lock:
+                self._subscribers.append(listener)
 
-        with self._lock:
-            self._subscribers.append(callback)
+        return self.publish, unsubscribe
 
-        return send_callback, unsubscribe
+    def publish(self, *args: Any) -> None:
+        """Publish event to all subscribers.
 
-    def publish(self, data: Any) -> None:
-        """Publish event to all subscribers."""
+        Subscribers are called outside the lock, so they may subscribe, unsubscribe or publish.
+        """
         with self._lock:
-            for subscriber in self._subscribers[:]:
-                try:
-                    subscriber(data)
-                except Exception as e:
-                    logger.error(f"Error publishing event: {e}")
+            subscribers = self._subscribers[:]
+        for subscriber in subscribers:
+            try:
+                subscriber(*args)
+            except Exception as e:
+                logger.error(f"Error publishing event: {e}")
 
 
 class CacheableWithTTL:
@@ -153,13 +150,20 @@ class ChaintracksCoreService:
 
         # Bulk manager
         bulk_ingestors = create_bulk_ingestors(self.chain)
-        self.bulk_mgr = BulkManager(self.chain, bulk_ingestors)
+        bulk_store = BulkHeaderStore(config.bulk_headers_folder, self.chain) if config.bulk_headers_folder else None
+        self.bulk_mgr = BulkManager(self.chain, bulk_ingestors, bulk_store)
 
         # Channels and event handling
         self.live_headers_chan: asyncio.Queue = asyncio.Queue(maxsize=1000)
         self._header_callbacks = PubSubEvents()
         self._reorg_callbacks = PubSubEvents()
 
+        # Most recent live headers by hash, and the active chain tip
+        self._recent_headers: OrderedDict[str, LiveBlockHeader] = OrderedDict()
+        self._chain_tip: LiveBlockHeader | None = None
+        self._chain_tip_loaded = False
+        self._bulk_gap_reported: int | None = None  # first missing bulk height last logged by the migration
+
         # State
         self._available = False
         self._available_lock = threading.Lock()
@@ -315,7 +319,11 @@ class ChaintracksCoreService:
         return tip_header.get("hash") if tip_header else None
 
     async def find_header_for_height(self, height: int) -> BlockHeader | None:
-        """Find block header for specific height."""
+        """Find block header for specific height, from bulk storage when it covers the height."""
+        bulk_range = self.bulk_mgr.get_height_range()
+        if bulk_range is not None and bulk_range.contains_height(height):
+            return await self.bulk_mgr.find_header_for_height(height)
+
         queries = self.storage.query()
         header, err = queries.get_live_header_by_height(height)
 
@@ -324,13 +332,34 @@ class ChaintracksCoreService:
 
         return header.chain_block_header
 
-    def subscribe_headers(self) -> tuple[Callable[[dict[str, Any]], None], Callable[[], None]]:
-        """Subscribe to new header events."""
-        return self._header_callbacks.subscribe()
+    def subscribe_headers(
+        self, listener: Callable[[dict[str, Any]], None] | None = None
+    ) -> tuple[Callable[..., None], Callable[[], None]]:
+        """Subscribe to new header events.
 
-    def subscribe_reorgs(self) -> tuple[Callable[[dict[str, Any]], None], Callable[[], None]]:
-        """Subscribe to reorg events."""
-        return self._reorg_callbacks.subscribe()
+        Args:
+            listener: Called with each new live header
+
+        Returns:
+            Tuple of (send_function, unsubscribe_function)
+        """
+        return self._header_callbacks.subscribe(listener)
+
+    def subscribe_reorgs(
+        self, listener: Callable[[int, dict[str, Any], dict[str, Any], list[dict[str, Any]]], None] | None = None
+    ) -> tuple[Callable[..., None], Callable[[], None]]:
+        """Subscribe to reorg events.
+
+        Listeners are called as ``listener(depth, old_tip, new_tip, deactivated_headers)``
+        (``ReorgListener``), e.g. ``Monitor.process_reorg``.
+
+        Args:
+            listener: Called for each chain tip switch to another branch
+
+        Returns:
+            Tuple of (send_function, unsubscribe_function)
+        """
+        return self._reorg_callbacks.subscribe(listener)
 
     async def _shift_live_headers_worker(self) -> None:
         """Background worker for processing live headers."""
@@ -352,77 +381,265 @@ class ChaintracksCoreService:
             await self.get_present_height()
 
             # Get available ranges
-            await self.get_available_height_ranges()
-
-            # Process queued headers
-            headers_processed = 0
-            while not self.live_headers_chan.empty() and headers_processed < 100:
-                try:
-                    header = self.live_headers_chan.get_nowait()
-                    await self._add_live_header(header)
-                    headers_processed += 1
-                except asyncio.QueueEmpty:
-                    break
-
-            # TODO: Bulk sync logic
-            # TODO: Migrate live to bulk headers
+            ranges = await self.get_available_height_ranges()
+
+            # Process queued headers in batches
+            while not self.live_headers_chan.empty():
+                headers = []
+                while len(headers) < self.config.live_ingest_batch_size:
+                    try:
+                        headers.append(self.live_headers_chan.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+                await self._add_live_headers(headers)
+                await asyncio.sleep(0)
+
+            # TODO: Bulk sync from the bulk ingestors
+            await self._migrate_live_to_bulk(ranges.live)
 
         except Exception as e:
             logger.error(f"Error shifting live headers: {e}")
 
     async def _add_live_header(self, header: dict[str, Any]) -> None:
         """Add a live header to storage with chain work calculation."""
-        try:
-            # Calculate chain work
-            bits = header.get("bits", 0)
-            chain_work = ChainWork.from_bits(bits)
-
-            # Get previous header for chain work accumulation
-            prev_hash = header.get("previousHash", "")
-            if prev_hash and prev_hash != "0" * 64:
-                queries = self.storage.query()
-                prev_header, _ = queries.get_live_header_by_hash(prev_hash)
-                if prev_header:
-                    prev_work = ChainWork.from_hex(prev_header.chain_work)
-                    chain_work = prev_work.add_chain_work(chain_work)
-
-            # Create LiveBlockHeader
-            live_header = LiveBlockHeader(
-                chain_block_header=header,
-                chain_work=chain_work.to_64_pad_hex(),
-                is_chain_tip=True,  # TODO: Proper chain tip detection
-                is_active=True,
-            )
+        await self._add_live_headers([header])
 
-            # Store header
-            queries = self.storage.query()
-            queries.begin()
+    async def _add_live_headers(self, headers: list[dict[str, Any]]) -> list[LiveBlockHeader]:
+        """Add a batch of live headers to storage in one transaction.
 
-            try:
-                # Check if header already exists
-                exists, _ = queries.live_header_exists(header["hash"])
-                if exists:
-                    queries.rollback()
-                    return
+        Parents are resolved from the batch, the most recent live headers kept in
+        memory or storage (one query for the whole batch). Chain work accumulates
+        from the parent's, and the header with the most cumulative work becomes the
+        active chain tip; when it is on a fork, the active flags of both branches are
+        switched back to the fork point. A header whose parent is unknown is dropped,
+        unless there is no chain tip yet (it then starts the live chain).
+
+        Args:
+            headers: Block headers with ``height`` and ``hash``, in any order
+
+        Returns:
+            The headers added, in height order
+        """
+        batch: dict[str, dict[str, Any]] = {}
+        for header in sorted(headers, key=lambda h: h.get("height", 0)):
+            if header["hash"] not in self._recent_headers:
+                batch.setdefault(header["hash"], header)
+        if not batch:
+            return []
 
-                # Insert new header
+        queries = self.storage.query()
+        old_tip = tip = self._load_chain_tip(queries)
+        lookup_hashes = list(batch)
+        for header in batch.values():
+            previous_hash = header.get("previousHash", "")
+            if previous_hash not in batch and previous_hash not in self._recent_headers:
+                lookup_hashes.append(previous_hash)
+        stored, err = queries.find_live_headers_by_hashes(lookup_hashes)
+        if err:
+            raise err
+        stored_hashes = {header.hash for header in stored}
+        for header in stored:
+            self._remember_live_header(header)
+
+        new_headers: dict[str, LiveBlockHeader] = {}
+
+        def lookup(hash_str: str) -> LiveBlockHeader | None:
+            return new_headers.get(hash_str) or self._find_live_header(queries, hash_str)
+
+        for hash_str, header in batch.items():
+            if hash_str in stored_hashes:
+                continue
+            parent = lookup(header.get("previousHash", ""))
+            chain_work = ChainWork.from_bits(header.get("bits", 0))
+            if parent is not None:
+                chain_work = ChainWork.from_hex(parent.chain_work).add_chain_work(chain_work)
+            elif tip is not None:
+                logger.warning(f"Dropped live header {hash_str} at height {header.get('height')}: unknown parent")
+                continue
+            live_header = LiveBlockHeader(chain_block_header=header, chain_work=chain_work.to_64_pad_hex())
+            new_headers[hash_str] = live_header
+            if tip is None or chain_work.cmp_chain_work(ChainWork.from_hex(tip.chain_work)) > 0:
+                tip = live_header
+        if not new_headers:
+            return []
+
+        # Common case: the new tip extends the old one through headers of this batch
+        extension: list[LiveBlockHeader] = []
+        header = tip if tip is not old_tip else None
+        while header is not None:
+            extension.append(header)
+            header = new_headers.get(header.previous_hash)
+        extends = bool(extension) and (old_tip is None or extension[-1].previous_hash == old_tip.hash)
+        if extends:
+            for header in extension:
+                header.is_active = True
+            tip.is_chain_tip = True
+
+        added = list(new_headers.values())
+        switch: ChainTipSwitch | None = None
+        queries.begin()
+        try:
+            for live_header in added:
+                parent = lookup(live_header.previous_hash)
+                live_header.previous_header_id = parent.header_id if parent is not None else None
                 err = queries.insert_new_live_header(live_header)
                 if err:
                     raise err
+            if extends and old_tip is not None:
+                err = queries.set_chain_tip_by_id(old_tip.header_id, False)
+                if err:
+                    raise err
+            elif tip is not old_tip and not extends:
+                # A fork overtook the active chain: flip the flags of both branches above the fork point
+                switch = find_chain_tip_switch(queries, old_tip, tip)
+                apply_chain_tip_switch(queries, switch)
+        except Exception:
+            queries.rollback()
+            self._reset_live_header_cache()
+            raise
+        err = queries.commit()
+        if err:
+            self._reset_live_header_cache()
+            raise err
+
+        if switch is not None:
+            # Cached headers of both branches hold stale flags
+            self._recent_headers.clear()
+        else:
+            if extends and old_tip is not None:
+                old_tip.is_chain_tip = False
+            for live_header in added:
+                self._remember_live_header(live_header)
+        self._chain_tip = tip
+
+        for live_header in added:
+            self._header_callbacks.publish(live_header.chain_block_header)
+        if switch is not None:
+            logger.info(
+                f"Chain reorg of depth {switch.depth} at fork height {switch.fork_point.height}: "
+                f"tip {switch.old_tip.hash} -> {switch.new_tip.hash}"
+            )
+            self._reorg_callbacks.publish(
+                switch.depth, switch.old_tip.chain_block_header, tip.chain_block_header, switch.deactivated_headers
+            )
+        logger.debug(f"Added {len(added)} live headers, chain tip {tip.hash} at height {tip.height}")
+        return added
+
+    def _load_chain_tip(self, queries: StorageQueries) -> LiveBlockHeader | None:
+        """Return the active chain tip, read from storage the first time."""
+        if not self._chain_tip_loaded:
+            tip, err = queries.get_active_tip_live_header()
+            if err:
+                raise err
+            self._chain_tip = self._remember_live_header(tip) if tip is not None else None
+            self._chain_tip_loaded = True
+        return self._chain_tip
+
+    def _find_live_header(self, queries: StorageQueries, hash_str: str) -> LiveBlockHeader | None:
+        """Find a live header in memory, falling back to storage."""
+        header = self._recent_headers.get(hash_str)
+        if header is not None:
+            return header
+        if self._chain_tip is not None and self._chain_tip.hash == hash_str:
+            return self._chain_tip
+        if not hash_str:
+            return None
+        header, err = queries.get_live_header_by_hash(hash_str)
+        if err:
+            raise err
+        return self._remember_live_header(header) if header is not None else None
+
+    def _remember_live_header(self, header: LiveBlockHeader) -> LiveBlockHeader:
+        """Keep ``header`` in the recent headers map, returning the instance kept for its hash."""
+        kept = self._recent_headers.setdefault(header.hash, header)
+        self._recent_headers.move_to_end(header.hash)
+        while len(self._recent_headers) > self.config.live_header_cache_size:
+            self._recent_headers.popitem(last=False)
+        return kept
+
+    def _reset_live_header_cache(self) -> None:
+        """Drop in-memory header state, e.g. after a failed write left it ahead of storage."""
+        self._recent_headers.clear()
+        self._chain_tip = None
+        self._chain_tip_loaded = False
+
+    async def _migrate_live_to_bulk(self, live_range: HeightRange) -> int:
+        """Move reorg-safe live headers into bulk storage and delete them from the live table.
+
+        Headers more than ``live_height_threshold`` below the highest live header are
+        migrated in batches of ``bulk_migration_chunk_size``, once at least one full
+        batch is due, so the live table stays around ``live_height_threshold`` rows.
+        Inactive (orphaned fork) headers below the threshold and headers already in
+        bulk storage are deleted without migrating. Bulk files are aligned from
+        genesis, so nothing is migrated until the bulk store reaches the lowest
+        live height.
 
-                queries.commit()
+        Args:
+            live_range: Current live height range
 
-                # Publish header event
-                self._header_callbacks.publish(header)
+        Returns:
+            Number of headers migrated to bulk storage
+        """
+        if self.bulk_mgr.store is None or live_range.is_empty:
+            return 0
+        cutoff = live_range.max_height - self.config.live_height_threshold
+        chunk_size = self.config.bulk_migration_chunk_size
+        if cutoff - live_range.min_height + 1 < chunk_size:
+            return 0
+        bulk_max = self.bulk_mgr.store.max_height
+        next_height = 0 if bulk_max is None else bulk_max + 1
+        if live_range.min_height > next_height:
+            if self._bulk_gap_reported != next_height:
+                self._bulk_gap_reported = next_height
+                logger.info(
+                    f"Live to bulk migration waits for bulk headers {next_height}..{live_range.min_height - 1}: "
+                    f"live headers start at {live_range.min_height}"
+                )
+            return 0
+
+        migrated = 0
+        while not self._shutdown_event.is_set():
+            queries = self.storage.query()
+            headers, err = queries.find_headers_for_height_less_than_or_equal_sorted(cutoff, chunk_size)
+            if err:
+                raise err
+            if not headers:
+                break
 
-                logger.debug(f"Added live header {header['hash']} at height {header.get('height', 0)}")
+            bulk_max = self.bulk_mgr.store.max_height
+            next_height = 0 if bulk_max is None else bulk_max + 1
+            batch: list[LiveBlockHeader] = []
+            stale_ids: list[int] = []
+            for header in headers:
+                if not header.is_active or (bulk_max is not None and header.height <= bulk_max):
+                    stale_ids.append(header.header_id)
+                elif header.height == next_height + len(batch):
+                    batch.append(header)
+                else:
+                    break
+            if not batch and not stale_ids:
+                logger.warning(f"Live to bulk migration stopped, no active live header at height {next_height}")
+                break
 
-            except Exception as e:
+            # Bulk first: if the delete fails the rows are below the bulk tip and go as stale next time
+            await self.bulk_mgr.migrate_from_live_headers(batch)
+            queries.begin()
+            err = queries.delete_live_headers_by_ids([h.header_id for h in batch] + stale_ids)
+            if err:
                 queries.rollback()
-                raise e
+                raise err
+            err = queries.commit()
+            if err:
+                raise err
 
-        except Exception as e:
-            logger.error(f"Failed to add live header: {e}")
+            migrated += len(batch)
+            if len(headers) < chunk_size:
+                break
+            await asyncio.sleep(0)  # let queued live headers in between batches
+
+        if migrated:
+            logger.info(f"Migrated {migrated} live headers to bulk storage")
+        return migrated
 
     async def _get_live_height_range(self) -> Any | None:
         """Get height range for live headers."""
@@ -437,8 +654,7 @@ class ChaintracksCoreService:
 
     async def _get_bulk_height_range(self) -> Any | None:
         """Get height range for bulk headers."""
-        # TODO: Implement bulk manager height range
-        return None
+        return self.bulk_mgr.get_height_range()
 
     def _fetch_latest_present_height(self) -> int:
         """Fetch latest present height from ingestors."""
@@ -194,6 +194,16 @@ class StorageQueries(Protocol):
             Tuple of (header, error)
         """
 
+    def find_live_headers_by_hashes(self, hashes: list[str]) -> tuple[list[LiveBlockHeader], Exception | None]:
+        """Get the live headers with any of the given hashes.
+
+        Args:
+            hashes: Block hashes
+
+        Returns:
+            Tuple of (headers found, error)
+        """
+
     def get_active_tip_live_header(self) -> tuple[LiveBlockHeader | None, Exception | None]:
         """Get the active chain tip live header.
 
@@ -223,6 +233,17 @@ class StorageQueries(Protocol):
             Exception if operation fails
         """
 
+    def set_active_by_ids(self, header_ids: list[int], is_active: bool) -> Exception | None:
+        """Set active status for several headers.
+
+        Args:
+            header_ids: Header database IDs
+            is_active: Whether these headers are on the active chain
+
+        Returns:
+            Exception if operation fails
+        """
+
     def insert_new_live_header(self, header: LiveBlockHeader) -> Exception | None:
         """Insert a new live header.
 
@@ -257,6 +278,19 @@ class StorageQueries(Protocol):
             Tuple of (height_range, error)
         """
 
+    def find_live_headers_for_height_range(
+        self, min_height: int, max_height: int
+    ) -> tuple[list[LiveBlockHeader], Exception | None]:
+        """Find the live headers of every branch with a height in a range.
+
+        Args:
+            min_height: Lowest height (inclusive)
+            max_height: Highest height (inclusive)
+
+        Returns:
+            Tuple of (headers_list, error)
+        """
+
     def find_headers_for_height_less_than_or_equal_sorted(
         self, height: int, limit: int
     ) -> tuple[list[LiveBlockHeader], Exception | None]:
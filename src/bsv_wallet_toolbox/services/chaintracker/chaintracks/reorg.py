@@ -0,0 +1,146 @@
+"""Chain tip switching between competing branches of live headers.
+
+Live headers form a tree linked by ``previousHeaderId``; the branch from the
+chain tip down is flagged ``isActive``. When a header on another branch gets
+more chain work than the tip, only the two segments above the fork point
+change: the old branch is deactivated and the new one activated with one
+UPDATE each, inside the caller's transaction.
+
+Ancestors are loaded by height windows that double as the walk goes deeper, so
+a deep reorg reads the heights it spans, never the whole live table.
+
+Example:
+    >>> queries.begin()
+    >>> switch = find_chain_tip_switch(queries, old_tip, new_tip)
+    >>> apply_chain_tip_switch(queries, switch)
+    >>> queries.commit()
+    >>> switch.depth, switch.fork_point.height
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from .models import LiveBlockHeader, StorageQueries
+
+_FIRST_WINDOW = 16
+
+
+class _AncestorLoader:
+    """Resolves parents by ``previous_header_id`` from height windows read on demand."""
+
+    def __init__(self, queries: StorageQueries, headers: list[LiveBlockHeader]) -> None:
+        self.queries = queries
+        self.by_id = {header.header_id: header for header in headers}
+        self.loaded_from = max(header.height for header in headers) + 1  # heights below are not loaded yet
+        self.window = _FIRST_WINDOW
+
+    def parent(self, header: LiveBlockHeader) -> LiveBlockHeader:
+        """Return the parent of ``header``.
+
+        Raises:
+            ValueError: If the parent is not a live header (e.g. migrated to bulk storage)
+        """
+        parent_id = header.previous_header_id
+        if parent_id is not None and parent_id not in self.by_id and header.height - 1 < self.loaded_from:
+            self._load_below(header.height - 1)
+        if parent_id is None or parent_id not in self.by_id:
+            raise ValueError(f"parent of live header {header.hash} at height {header.height} is not a live header")
+        return self.by_id[parent_id]
+
+    def _load_below(self, height: int) -> None:
+        low = max(min(height, self.loaded_from - self.window), 0)
+        rows, err = self.queries.find_live_headers_for_height_range(low, self.loaded_from - 1)
+        if err:
+            raise err
+        for row in rows:
+            self.by_id.setdefault(row.header_id, row)  # keep the caller's instances
+        self.loaded_from = low
+        self.window *= 2
+
+
+@dataclass
+class ChainTipSwitch:
+    """The headers whose ``isActive`` flag changes when the chain tip moves to another branch."""
+
+    old_tip: LiveBlockHeader
+    new_tip: LiveBlockHeader
+    fork_point: LiveBlockHeader  # highest header on both branches
+    activated: list[LiveBlockHeader]  # new branch above the fork point, tip first
+    deactivated: list[LiveBlockHeader]  # old branch above the fork point, tip first
+
+    @property
+    def depth(self) -> int:
+        """Number of headers of the old active chain that were replaced."""
+        return len(self.deactivated)
+
+    @property
+    def deactivated_headers(self) -> list[dict[str, Any]]:
+        """Block headers of the deactivated headers, tip first."""
+        return [header.chain_block_header for header in self.deactivated]
+
+
+def find_chain_tip_switch(
+    queries: StorageQueries, old_tip: LiveBlockHeader, new_tip: LiveBlockHeader
+) -> ChainTipSwitch:
+    """Walk both branches back to their fork point.
+
+    Args:
+        queries: Storage queries (``new_tip`` must be stored)
+        old_tip: Current active chain tip
+        new_tip: Header becoming the chain tip
+
+    Raises:
+        ValueError: If the fork point is not a live header
+    """
+    loader = _AncestorLoader(queries, [old_tip, new_tip])
+    new_branch, old_branch = new_tip, old_tip
+    activated: list[LiveBlockHeader] = []
+    deactivated: list[LiveBlockHeader] = []
+    while new_branch.header_id != old_branch.header_id:
+        if new_branch.height >= old_branch.height:
+            activated.append(new_branch)
+            new_branch = loader.parent(new_branch)
+        else:
+            deactivated.append(old_branch)
+            old_branch = loader.parent(old_branch)
+    return ChainTipSwitch(old_tip, new_tip, new_branch, activated, deactivated)
+
+
+def apply_chain_tip_switch(queries: StorageQueries, switch: ChainTipSwitch) -> None:
+    """Write a chain tip switch: one UPDATE per branch plus the two tip flags.
+
+    Runs inside the caller's transaction and updates the flags of the switch's headers.
+
+    Raises:
+        Exception: The storage error of a failed update
+    """
+    updates = (
+        lambda: queries.set_active_by_ids([header.header_id for header in switch.deactivated], False),
+        lambda: queries.set_active_by_ids([header.header_id for header in switch.activated], True),
+        lambda: queries.set_chain_tip_by_id(switch.old_tip.header_id, False),
+        lambda: queries.set_chain_tip_by_id(switch.new_tip.header_id, True),
+    )
+    for update in updates:
+        err = update()
+        if err:
+            raise err
+    for header in switch.deactivated:
+        header.is_active = False
+    for header in switch.activated:
+        header.is_active = True
+    switch.old_tip.is_chain_tip = False
+    switch.new_tip.is_chain_tip = True
+
+
+def find_fork_point(queries: StorageQueries, header: LiveBlockHeader) -> LiveBlockHeader:
+    """Return the highest active header among ``header`` and its ancestors.
+
+    Raises:
+        ValueError: If no ancestor within the live headers is active
+    """
+    loader = _AncestorLoader(queries, [header])
+    while not header.is_active:
+        header = loader.parent(header)
+    return header
@@ -30,17 +30,21 @@ class SQLAlchemyStorageQueries:
             session: SQLAlchemy session for database operations
         """
         self.session = session
-        self._transaction_session: Session | None = None
+        self._in_transaction = False
 
     def _get_session(self) -> Session:
-        """Get the current session (transactional if active)."""
-        return self._transaction_session or self.session
+        """Get the session used for all operations."""
+        return self.session
 
     def begin(self) -> None:
-        """Begin a database transaction."""
-        if self._transaction_session is not None:
+        """Begin a database transaction.
+
+        The session is a unit of work: everything up to ``commit`` or ``rollback`` is
+        applied atomically, including reads made before ``begin``.
+        """
+        if self._in_transaction:
             raise RuntimeError("Transaction already started")
-        self._transaction_session = self.session.begin()
+        self._in_transaction = True
 
     def rollback(self) -> Exception | None:
         """Rollback the current transaction.
@@ -48,17 +52,17 @@ class SQLAlchemyStorageQueries:
         Returns:
             Exception if rollback fails, None otherwise
         """
-        if self._transaction_session is None:
+        if not self._in_transaction:
             raise RuntimeError("No transaction to rollback")
 
         try:
-            self._transaction_session.rollback()
+            self.session.rollback()
             return None
         except Exception as e:
             logger.error(f"Failed to rollback transaction: {e}")
             return e
         finally:
-            self._transaction_session = None
+            self._in_transaction = False
 
     def commit(self) -> Exception | None:
         """Commit the current transaction.
@@ -66,17 +70,17 @@ class SQLAlchemyStorageQueries:
         Returns:
             Exception if commit fails, None otherwise
         """
-        if self._transaction_session is None:
+        if not self._in_transaction:
             raise RuntimeError("No transaction to commit")
 
         try:
-            self._transaction_session.commit()
+            self.session.commit()
             return None
         except Exception as e:
             logger.error(f"Failed to commit transaction: {e}")
             return e
         finally:
-            self._transaction_session = None
+            self._in_transaction = False
 
     def live_header_exists(self, hash_str: str) -> tuple[bool, Exception | None]:
         """Check if a live header exists by hash.
@@ -118,6 +122,25 @@ class SQLAlchemyStorageQueries:
             logger.error(f"Failed to get live header by hash: {e}")
             return None, e
 
+    def find_live_headers_by_hashes(self, hashes: list[str]) -> tuple[list[LiveBlockHeader], Exception | None]:
+        """Get the live headers with any of the given hashes.
+
+        Args:
+            hashes: Block hashes
+
+        Returns:
+            Tuple of (headers found, in no particular order, error)
+        """
+        if not hashes:
+            return [], None
+        try:
+            session = self._get_session()
+            models = session.query(LiveHeadersModel).filter(LiveHeadersModel.hash.in_(hashes)).all()
+            return [self._model_to_live_header(model) for model in models], None
+        except Exception as e:
+            logger.error(f"Failed to find live headers by hashes: {e}")
+            return [], e
+
     def get_active_tip_live_header(self) -> tuple[LiveBlockHeader | None, Exception | None]:
         """Get the active chain tip live header.
 
@@ -153,7 +176,7 @@ class SQLAlchemyStorageQueries:
         try:
             session = self._get_session()
             session.query(LiveHeadersModel).filter(LiveHeadersModel.header_id == header_id).update(
-                {"isChainTip": is_chain_tip}
+                {LiveHeadersModel.is_chain_tip: int(is_chain_tip)}
             )
             return None
         except Exception as e:
@@ -173,13 +196,35 @@ class SQLAlchemyStorageQueries:
         try:
             session = self._get_session()
             session.query(LiveHeadersModel).filter(LiveHeadersModel.header_id == header_id).update(
-                {"isActive": is_active}
+                {LiveHeadersModel.is_active: int(is_active)}
             )
             return None
         except Exception as e:
             logger.error(f"Failed to set active by ID: {e}")
             return e
 
+    def set_active_by_ids(self, header_ids: list[int], is_active: bool) -> Exception | None:
+        """Set active status for several headers with one UPDATE.
+
+        Args:
+            header_ids: Header database IDs
+            is_active: Whether these headers are on the active chain
+
+        Returns:
+            Exception if operation fails
+        """
+        if not header_ids:
+            return None
+        try:
+            session = self._get_session()
+            session.query(LiveHeadersModel).filter(LiveHeadersModel.header_id.in_(header_ids)).update(
+                {LiveHeadersModel.is_active: int(is_active)}, synchronize_session=False
+            )
+            return None
+        except Exception as e:
+            logger.error(f"Failed to set active by IDs: {e}")
+            return e
+
     def insert_new_live_header(self, header: LiveBlockHeader) -> Exception | None:
         """Insert a new live header.
 
@@ -261,6 +306,30 @@ class SQLAlchemyStorageQueries:
             logger.error(f"Failed to find live height range: {e}")
             return HeightRange.new_empty_height_range(), e
 
+    def find_live_headers_for_height_range(
+        self, min_height: int, max_height: int
+    ) -> tuple[list[LiveBlockHeader], Exception | None]:
+        """Find the live headers of every branch with a height in a range.
+
+        Args:
+            min_height: Lowest height (inclusive)
+            max_height: Highest height (inclusive)
+
+        Returns:
+            Tuple of (headers_list, error)
+        """
+        try:
+            session = self._get_session()
+            models = (
+                session.query(LiveHeadersModel)
+                .filter(LiveHeadersModel.height >= min_height, LiveHeadersModel.height <= max_height)
+                .all()
+            )
+            return [self._model_to_live_header(model) for model in models], None
+        except Exception as e:
+            logger.error(f"Failed to find live headers for height range: {e}")
+            return [], e
+
     def find_headers_for_height_less_than_or_equal_sorted(
         self, height: int, limit: int
     ) -> tuple[list[LiveBlockHeader], Exception | None]:
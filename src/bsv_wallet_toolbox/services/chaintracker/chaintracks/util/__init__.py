@@ -8,6 +8,13 @@ from .block_header_utilities import (
     serialize_base_block_header,
 )
 from .bulk_file_data_manager import BulkFileDataManager, BulkFileDataManagerOptions
+from .bulk_header_codec import (
+    BulkHeadersInfo,
+    block_hashes,
+    decode_block_headers,
+    header_bits,
+    validate_block_headers,
+)
 from .chaintracks_fetch import ChaintracksFetch
 from .chaintracks_fs import ChaintracksFs, deserialize_block_headers
 from .height_range import HeightRange
@@ -150,16 +157,21 @@ __all__ = [
     "BulkFileDataManager",
     "BulkFileDataManagerOptions",
     "BulkFilesReaderStorage",
+    "BulkHeadersInfo",
     "ChaintracksFetch",
     "ChaintracksFs",
     "HeightRange",
     "SingleWriterMultiReaderLock",
     "block_hash",
+    "block_hashes",
+    "decode_block_headers",
     "deserialize_base_block_header",
     "deserialize_base_block_headers",
     "deserialize_block_header",
     "deserialize_block_headers",
     "genesis_buffer",
+    "header_bits",
     "serialize_base_block_header",
     "valid_bulk_header_files_by_file_hash",
+    "validate_block_headers",
 ]
@@ -10,6 +10,8 @@ import hashlib
 from bsv_wallet_toolbox.services.chaintracker.chaintracks.api import BaseBlockHeader
 from bsv_wallet_toolbox.services.wallet_services import Chain
 
+from .bulk_header_codec import HEADER_SIZE, unpack_block_headers
+
 
 def block_hash(buffer: bytes) -> str:
     """Compute double SHA256 hash of buffer.
@@ -43,22 +45,20 @@ def deserialize_base_block_headers(buffer: bytes, offset: int = 0, count: int |
     Reference: wallet-toolbox/src/services/chaintracker/chaintracks/util/blockHeaderUtilities.ts
                deserializeBaseBlockHeaders()
     """
-    headers = []
-    header_size = 80
-    buffer_len = len(buffer)
-
-    if count is None:
-        count = (buffer_len - offset) // header_size
-
-    for i in range(count):
-        if offset + (i + 1) * header_size > buffer_len:
-            break
-
-        header_buffer = buffer[offset + i * header_size : offset + (i + 1) * header_size]
-        header = deserialize_base_block_header(header_buffer, 0)
-        headers.append(header)
-
-    return headers
+    available = max(0, (len(buffer) - offset) // HEADER_SIZE)
+    count = available if count is None else max(0, min(count, available))
+    view = memoryview(buffer)[offset : offset + count * HEADER_SIZE]
+    return [
+        {
+            "version": version,
+            "previousHash": previous_hash[::-1].hex(),
+            "merkleRoot": merkle_root[::-1].hex(),
+            "time": time,
+            "bits": bits,
+            "nonce": nonce,
+        }
+        for version, previous_hash, merkle_root, time, bits, nonce in unpack_block_headers(view)
+    ]
 
 
 def serialize_base_block_header(header: BaseBlockHeader) -> bytes:
@@ -7,7 +7,7 @@ Reference: wallet-toolbox/src/services/chaintracker/chaintracks/util/__tests/Cha
 
 from typing import Any
 
-import requests
+from ....http_transport import HttpTransport, default_http_transport
 
 
 class ChaintracksFetch:
@@ -16,9 +16,13 @@ class ChaintracksFetch:
     Provides methods for fetching JSON and binary data from chaintracks services.
     """
 
-    def __init__(self):
-        """Initialize ChaintracksFetch."""
-        self.session = requests.Session()
+    def __init__(self, transport: HttpTransport | None = None):
+        """Initialize ChaintracksFetch.
+
+        Args:
+            transport: Pooled HTTP transport (defaults to the process-wide transport)
+        """
+        self.session = (transport or default_http_transport()).session()
 
     def fetch_json(self, url: str) -> dict[str, Any]:
         """Fetch JSON data from URL.
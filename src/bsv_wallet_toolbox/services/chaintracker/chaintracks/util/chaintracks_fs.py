@@ -8,6 +8,8 @@ Reference: wallet-toolbox/src/services/chaintracker/chaintracks/util/Chaintracks
 import os
 from typing import Any
 
+from .bulk_header_codec import HEADER_SIZE, decode_block_headers
+
 
 class ChaintracksFs:
     """Filesystem utilities for chaintracks.
@@ -90,26 +92,12 @@ def deserialize_block_headers(start_height: int, data: bytes) -> list[dict[str,
         data: Binary header data
 
     Returns:
-        List of deserialized headers
+        List of deserialized headers with ``height``, ``hash`` and the raw ``data``
 
     Reference: wallet-toolbox/src/services/chaintracker/chaintracks/util/BulkFileDataManager.ts
                deserializeBlockHeaders()
     """
-    # Stub implementation - in production would parse actual header format
-    # Block headers are 80 bytes each
-    header_size = 80
-    num_headers = len(data) // header_size
-
-    headers = []
-    for i in range(num_headers):
-        offset = i * header_size
-        header_bytes = data[offset : offset + header_size]
-        headers.append(
-            {
-                "height": start_height + i,
-                "data": header_bytes,
-                # Additional fields would be parsed from header_bytes
-            }
-        )
-
+    headers = decode_block_headers(memoryview(data)[: len(data) // HEADER_SIZE * HEADER_SIZE], start_height)
+    for i, header in enumerate(headers):
+        header["data"] = data[i * HEADER_SIZE : (i + 1) * HEADER_SIZE]
     return headers
@@ -10,9 +10,9 @@ import logging
 from typing import Any
 
 import requests
-from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from ...http_transport import HttpTransport, default_http_transport
 from ...wallet_services import Chain
 
 logger = logging.getLogger(__name__)
@@ -69,13 +69,16 @@ class WOCChainInfoDTO:
 class WOCClient:
     """HTTP client for WhatsOnChain API."""
 
-    def __init__(self, chain: Chain, api_key: str | None = None, timeout: int = 30):
+    def __init__(
+        self, chain: Chain, api_key: str | None = None, timeout: int = 30, transport: HttpTransport | None = None
+    ):
         """Initialize WOC client.
 
         Args:
             chain: Blockchain network ("main" or "test")
             api_key: Optional API key for WhatsOnChain
             timeout: Request timeout in seconds
+            transport: Pooled HTTP transport (defaults to the process-wide transport)
         """
         self.chain = chain
         self.api_key = api_key
@@ -87,14 +90,9 @@ class WOCClient:
             "test": "https://api.whatsonchain.com/v1/bsv/test",
         }
 
-        # Setup requests session with retry strategy
-        self.session = requests.Session()
-
+        # Setup pooled requests session with retry strategy
         retry_strategy = Retry(total=3, status_forcelist=[429, 500, 502, 503, 504], backoff_factor=1)
-
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        self.session = (transport or default_http_transport()).session(retries=retry_strategy)
 
         # Set headers
         self.session.headers.update(
@@ -53,6 +53,7 @@ from typing import Any, Generic, TypeVar, cast
 
 import requests
 
+from ..http_transport import HttpTransport, default_http_transport
 from ..wallet_services import Chain
 from .chaintracks.api import ChaintracksClientApi
 from .chaintracks.models import FiatExchangeRates
@@ -95,6 +96,7 @@ class ChaintracksServiceClient(ChaintracksClientApi):
         chain: Chain,
         service_url: str,
         options: ChaintracksServiceClientOptions | None = None,
+        transport: HttpTransport | None = None,
     ) -> None:
         """Initialize ChaintracksServiceClient.
 
@@ -102,14 +104,16 @@ class ChaintracksServiceClient(ChaintracksClientApi):
             chain: Blockchain network ('main' or 'test')
             service_url: Base URL of Chaintracks service
             options: Client configuration options
+            transport: Pooled HTTP transport (defaults to the process-wide transport)
 
         Reference: toolbox/ts-wallet-toolbox/src/services/chaintracker/chaintracks/ChaintracksServiceClient.ts
         """
         self.chain: Chain = chain
         self.service_url: str = service_url
         self.options: ChaintracksServiceClientOptions = options or ChaintracksServiceClientOptions.create_default()
-        self.timeout: int = 30
-        self.session: requests.Session = requests.Session()
+        self.transport: HttpTransport = transport or default_http_transport()
+        self.timeout: float = self.transport.timeout
+        self.session: requests.Session = self.transport.session()
 
         # WebSocket subscription tracking
         self._websocket_subscriptions: dict[str, dict[str, Any]] = {}
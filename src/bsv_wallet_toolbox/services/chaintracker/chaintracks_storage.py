@@ -42,7 +42,9 @@ from sqlalchemy.orm import declarative_base, sessionmaker
 from bsv_wallet_toolbox.errors import WalletError
 
 from ..wallet_services import Chain
-from .chaintracks.models import StorageQueries
+from .chaintracks.chain_work import ChainWork
+from .chaintracks.models import LiveBlockHeader, StorageQueries
+from .chaintracks.reorg import ChainTipSwitch, apply_chain_tip_switch, find_chain_tip_switch, find_fork_point
 
 # SQLAlchemy Base for ChaintracksStorage models
 Base = declarative_base()
@@ -263,68 +265,135 @@ class ChaintracksStorage:
         chain_work: str,
         is_active: bool = True,
         is_chain_tip: bool = False,
+        *,
         version: int = 1,
         merkle_root: str = "",
         time: int = 0,
         bits: int = 0,
         nonce: int = 0,
-    ) -> None:
+        previous_hash: str | None = None,
+    ) -> ChainTipSwitch | None:
         """Insert a block header into storage.
 
+        A header competing with a stored one at the same height is kept as another
+        branch instead of replacing it; inserting a stored hash again updates that row.
+
+        With ``previous_hash`` the header is linked to its parent (``previousHeaderId``)
+        and its flags follow chain work: it becomes the chain tip when it has more work
+        than the current tip, and if it is on a fork the ``isActive`` flags of both
+        branches above the fork point are switched in the same transaction.
+        Without it, ``is_active`` and ``is_chain_tip`` are stored as given and replace
+        the flags of the other headers at this height (active) or of the old tip.
+
         Args:
             height: Block height
             header_hash: Block header hash (hex)
             chain_work: Cumulative work (hex)
-            is_active: Whether header is active in chain
-            is_chain_tip: Whether header is current chain tip
+            is_active: Whether header is active in chain (without ``previous_hash``)
+            is_chain_tip: Whether header is current chain tip (without ``previous_hash``)
             version: Block version
             merkle_root: Merkle root of transactions
             time: Block timestamp
             bits: Difficulty target (bits)
             nonce: Block nonce
+            previous_hash: Hash of the parent header
 
-        Reference: toolbox/ts-wallet-toolbox/src/services/chaintracker/chaintracks/Storage/ChaintracksStorageKnex.ts
+        Returns:
+            The chain tip switch when the header made a fork overtake the active chain, else None
 
-        TODO: Phase 4 - Implement conflict handling (replace on duplicate height)
+        Reference: toolbox/ts-wallet-toolbox/src/services/chaintracker/chaintracks/Storage/ChaintracksStorageKnex.ts
         """
         try:
-            session = self.session_factory()
+            queries = self.query()
+            session = queries.session
             try:
-                # Check if header already exists
-                existing = session.query(LiveHeadersModel).filter_by(height=height).first()
+                existing = session.query(LiveHeadersModel).filter_by(hash=header_hash).first()
                 if existing:
-                    # Update existing header
-                    existing.hash = header_hash
+                    existing.height = height
                     existing.chain_work = chain_work
-                    existing.is_active = int(is_active)
-                    existing.is_chain_tip = int(is_chain_tip)
                     existing.version = version
                     existing.merkle_root = merkle_root
                     existing.time = time
                     existing.bits = bits
                     existing.nonce = nonce
-                else:
-                    # Insert new header
-                    new_header = LiveHeadersModel(
-                        height=height,
-                        hash=header_hash,
-                        chain_work=chain_work,
-                        is_active=int(is_active),
-                        is_chain_tip=int(is_chain_tip),
-                        version=version,
-                        merkle_root=merkle_root,
-                        time=time,
-                        bits=bits,
-                        nonce=nonce,
+                    if previous_hash is None:
+                        existing.is_active = int(is_active)
+                        existing.is_chain_tip = int(is_chain_tip)
+                    session.commit()
+                    return None
+
+                queries.begin()
+                try:
+                    switch = self._insert_new_header(
+                        queries,
+                        LiveBlockHeader(
+                            chain_block_header={
+                                "version": version,
+                                "previousHash": previous_hash or "",
+                                "merkleRoot": merkle_root,
+                                "time": time,
+                                "bits": bits,
+                                "nonce": nonce,
+                                "height": height,
+                                "hash": header_hash,
+                            },
+                            chain_work=chain_work,
+                            is_chain_tip=is_chain_tip,
+                            is_active=is_active,
+                        ),
+                        link=previous_hash is not None,
                     )
-                    session.add(new_header)
-
-                session.commit()
+                except Exception:
+                    queries.rollback()
+                    raise
+                err = queries.commit()
+                if err:
+                    raise err
+                return switch
             finally:
                 session.close()
         except Exception as e:
             raise WalletError(f"Failed to insert header at height {height}: {e!s}")
 
+    @staticmethod
+    def _insert_new_header(queries: StorageQueries, header: LiveBlockHeader, link: bool) -> ChainTipSwitch | None:
+        """Insert a header not stored yet and update the flags of the headers it supersedes."""
+        tip, err = queries.get_active_tip_live_header()
+        if err:
+            raise err
+
+        if not link:
+            err = queries.insert_new_live_header(header)
+            if not err and header.is_active:
+                same_height, err = queries.find_live_headers_for_height_range(header.height, header.height)
+                ids = [h.header_id for h in same_height if h.header_id != header.header_id]
+                err = err or queries.set_active_by_ids(ids, False)
+            if not err and header.is_chain_tip and tip is not None:
+                err = queries.set_chain_tip_by_id(tip.header_id, False)
+            if err:
+                raise err
+            return None
+
+        parent, err = queries.get_live_header_by_hash(header.previous_hash)
+        if err:
+            raise err
+        header.previous_header_id = parent.header_id if parent is not None else None
+        more_work = (
+            tip is None or ChainWork.from_hex(header.chain_work).cmp_chain_work(ChainWork.from_hex(tip.chain_work)) > 0
+        )
+        extends = more_work and (tip is None or header.previous_hash == tip.hash)
+        header.is_active = header.is_chain_tip = extends
+        err = queries.insert_new_live_header(header)
+        if not err and extends and tip is not None:
+            err = queries.set_chain_tip_by_id(tip.header_id, False)
+        if err:
+            raise err
+        if not more_work or extends:
+            return None
+        switch = find_chain_tip_switch(queries, tip, header)
+        apply_chain_tip_switch(queries, switch)
+        return switch
+
     def get_header_for_height(self, height: int) -> dict[str, Any] | None:
         """Retrieve block header for specified height.
 
@@ -339,7 +408,12 @@ class ChaintracksStorage:
         try:
             session = self.session_factory()
             try:
-                header = session.query(LiveHeadersModel).filter_by(height=height).first()
+                header = (
+                    session.query(LiveHeadersModel)
+                    .filter_by(height=height)
+                    .order_by(LiveHeadersModel.is_active.desc())
+                    .first()
+                )
                 if header:
                     return {
                         "headerId": header.header_id,
@@ -388,6 +462,8 @@ class ChaintracksStorage:
                 headers = session.query(LiveHeadersModel).filter(LiveHeadersModel.height.in_(heights)).all()
 
                 for header in headers:
+                    if header.height in results and not header.is_active:
+                        continue  # keep the active chain's header over competing branches
                     results[header.height] = {
                         "headerId": header.header_id,
                         "height": header.height,
@@ -411,29 +487,34 @@ class ChaintracksStorage:
     def get_sync_state(self) -> dict[str, Any]:
         """Get current synchronization state.
 
+        The synced header is checked against the active chain: when a reorg has
+        deactivated it, ``reorgDetected`` is True and ``forkHeight`` is the height of
+        its highest ancestor still on the active chain, where syncing resumes.
+
         Returns:
-            Sync state data (height, hash)
+            Sync state data (height, hash, reorgDetected and, after a reorg, forkHeight)
 
         Reference: toolbox/ts-wallet-toolbox/src/services/chaintracker/chaintracks/Storage/ChaintracksStorageKnex.ts
-
-        TODO: Phase 4 - Add reorg detection logic
         """
         try:
-            session = self.session_factory()
+            queries = self.query()
+            session = queries.session
             try:
                 sync_state = session.query(SyncStateModel).filter_by(chain=self.chain).first()
                 if sync_state:
-                    # Basic reorg detection: check if stored hash matches current chain
-                    # In a full implementation, this would:
-                    # 1. Compare stored block hash with current chain hash at same height
-                    # 2. Detect if reorg occurred
-                    # 3. Trigger reorg recovery if needed
-
-                    # TODO: Implement full reorg detection comparing hashes
-                    return {
+                    state: dict[str, Any] = {
                         "lastSyncedHeight": sync_state.last_synced_height,
                         "lastSyncedHash": sync_state.last_synced_hash,
+                        "reorgDetected": False,
                     }
+                    if sync_state.last_synced_hash:
+                        synced, err = queries.get_live_header_by_hash(sync_state.last_synced_hash)
+                        if err:
+                            raise err
+                        if synced is not None and not synced.is_active:
+                            state["reorgDetected"] = True
+                            state["forkHeight"] = find_fork_point(queries, synced).height
+                    return state
 
                 # Create default if not exists
                 default_state = SyncStateModel(chain=self.chain, last_synced_height=0)
@@ -442,6 +523,7 @@ class ChaintracksStorage:
                 return {
                     "lastSyncedHeight": 0,
                     "lastSyncedHash": None,
+                    "reorgDetected": False,
                 }
             finally:
                 session.close()
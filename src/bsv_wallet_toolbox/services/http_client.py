@@ -3,21 +3,63 @@
 This client wraps aiohttp to provide a response format that matches
 py-sdk's HttpClient expectations while tolerating non-JSON payloads
 such as WhatsOnChain's raw hex responses.
+
+An ``aiohttp.ClientSession`` is bound to the event loop it was created on,
+so the client keeps one session (one keep-alive connection pool) per loop
+and reuses it for every request made on that loop.
 """
 
 from __future__ import annotations
 
+import asyncio
+import threading
+import weakref
 from typing import Any
 
 import aiohttp
 from bsv.http_client import HttpClient, HttpResponse
 
+DEFAULT_CONNECTION_LIMIT: int = 100  # open connections per session (per event loop)
+
 
 class ToolboxHttpClient(HttpClient):
-    """HTTP client that gracefully handles non-JSON responses."""
+    """HTTP client that gracefully handles non-JSON responses and reuses connections."""
 
-    def __init__(self, default_timeout: float | None = None) -> None:
+    def __init__(
+        self,
+        default_timeout: float | None = None,
+        connection_limit: int = DEFAULT_CONNECTION_LIMIT,
+        limit_per_host: int = 0,
+        trace_configs: list[aiohttp.TraceConfig] | None = None,
+    ) -> None:
         self.default_timeout = default_timeout
+        self.connection_limit = connection_limit
+        self.limit_per_host = limit_per_host  # 0: no per-host limit
+        self.trace_configs = trace_configs
+        self._sessions: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def _session(self) -> aiohttp.ClientSession:
+        """Return the session of the running event loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            session = self._sessions.get(loop)
+            if session is None or session.closed:
+                session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=self.connection_limit, limit_per_host=self.limit_per_host),
+                    trace_configs=self.trace_configs,
+                )
+                self._sessions[loop] = session
+        return session
+
+    async def close(self) -> None:
+        """Close the session of the running event loop (a later request opens a new one)."""
+        with self._lock:
+            session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
 
     async def fetch(self, url: str, options: dict[str, Any]) -> HttpResponse:
         method = options.get("method", "GET")
@@ -27,16 +69,13 @@ class ToolboxHttpClient(HttpClient):
 
         request_timeout = aiohttp.ClientTimeout(total=timeout_value) if timeout_value is not None else None
 
-        async with (
-            aiohttp.ClientSession(timeout=request_timeout) as session,
-            session.request(
-                method=method,
-                url=url,
-                headers=headers,
-                json=data,
-                timeout=request_timeout,
-            ) as response,
-        ):
+        async with self._session().request(
+            method=method,
+            url=url,
+            headers=headers,
+            json=data,
+            timeout=request_timeout,
+        ) as response:
             status = response.status
             ok = 200 <= status <= 299
 
@@ -0,0 +1,258 @@
+"""Shared HTTP transport for service providers.
+
+One ``HttpTransport`` owns the connections used by the providers of a
+``Services`` instance:
+
+- Synchronous providers (ARC, Bitails, the chaintracks WhatsOnChain and CDN
+  clients) get their ``requests.Session`` from ``HttpTransport.session``. Each
+  session keeps its own headers and retry policy but sends through an adapter
+  sharing one urllib3 pool manager, so connections to a host are kept alive
+  and reused across providers (``pool_maxsize`` per host).
+- Async providers (WhatsOnChain) use ``HttpTransport.async_client``, a
+  ``ToolboxHttpClient`` with one keep-alive aiohttp session per event loop.
+
+Both paths allow at most ``max_per_host`` concurrent requests per host (extra
+requests wait for a slot) and record per-host metrics: requests, errors,
+connections opened and reused, and requests that waited for a slot
+(``HttpTransport.stats``).
+
+Example:
+    >>> transport = HttpTransport(pool_maxsize=20, max_per_host=8, timeout=15)
+    >>> arc = ARC("https://arc.taal.com", transport=transport)
+    >>> transport.stats()["arc.taal.com:443"]
+    {'requests': 12, 'errors': 0, 'opened': 2, 'reused': 10, 'throttled': 0}
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import defaultdict
+from types import SimpleNamespace
+from typing import Any
+from urllib.parse import urlsplit
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .http_client import ToolboxHttpClient
+
+DEFAULT_POOL_MAXSIZE: int = 20  # keep-alive connections kept per host
+DEFAULT_POOL_HOSTS: int = 32  # hosts whose connection pools are kept
+DEFAULT_MAX_PER_HOST: int = 16  # concurrent requests per host
+DEFAULT_TIMEOUT_SECS: float = 30
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def host_key(url: str) -> str:
+    """Return the ``host:port`` a URL connects to (metrics and limit key)."""
+    parts = urlsplit(url)
+    return f"{parts.hostname}:{parts.port or _DEFAULT_PORTS.get(parts.scheme, 0)}"
+
+
+class _PooledAdapter(HTTPAdapter):
+    """HTTPAdapter sending through the transport's shared pools, per-host limits and metrics."""
+
+    def __init__(self, transport: HttpTransport, max_retries: Retry | int = 0) -> None:
+        self._transport = transport
+        super().__init__(
+            pool_connections=transport.pool_hosts, pool_maxsize=transport.pool_maxsize, max_retries=max_retries
+        )
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        with self._transport._lock:
+            if self._transport._pool_manager is None:
+                super().init_poolmanager(*args, **kwargs)
+                self._transport._pool_manager = self.poolmanager
+            else:
+                self.poolmanager = self._transport._pool_manager
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        host = host_key(request.url or "")
+        with self._transport._host_slot(host):
+            try:
+                response = super().send(request, **kwargs)
+                if not kwargs.get("stream"):
+                    # Read the body inside the slot so the connection is back in the pool for the next request
+                    response.content  # noqa: B018
+                return response
+            except Exception:
+                self._transport._count(host, "errors")
+                raise
+
+    def close(self) -> None:
+        """Keep the shared pools open; they are closed by ``HttpTransport.close``."""
+
+
+class HttpTransport:
+    """Connection-pooled HTTP transport shared by the service providers."""
+
+    def __init__(
+        self,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        max_per_host: int = DEFAULT_MAX_PER_HOST,
+        timeout: float = DEFAULT_TIMEOUT_SECS,
+        pool_hosts: int = DEFAULT_POOL_HOSTS,
+    ) -> None:
+        """Initialize the transport.
+
+        Args:
+            pool_maxsize: Keep-alive connections kept per host
+            max_per_host: Concurrent requests per host
+            timeout: Default request timeout in seconds for providers using the transport
+            pool_hosts: Hosts whose connection pools are kept (least recently used are closed)
+        """
+        self.pool_maxsize = max(1, pool_maxsize)
+        self.max_per_host = max(1, max_per_host)
+        self.timeout = timeout
+        self.pool_hosts = max(1, pool_hosts)
+        self._lock = threading.Lock()
+        self._pool_manager: Any = None
+        self._slots: dict[str, threading.BoundedSemaphore] = {}
+        self._counts: dict[str, dict[str, int]] = defaultdict(
+            lambda: {"requests": 0, "errors": 0, "opened": 0, "reused": 0, "throttled": 0}
+        )
+        self._async_client: ToolboxHttpClient | None = None
+
+    @classmethod
+    def from_options(cls, options: dict[str, Any]) -> HttpTransport:
+        """Build a transport from the ``http*`` WalletServicesOptions keys."""
+        return cls(
+            pool_maxsize=options.get("httpPoolMaxSize") or DEFAULT_POOL_MAXSIZE,
+            max_per_host=options.get("httpMaxPerHost") or DEFAULT_MAX_PER_HOST,
+            timeout=options.get("httpTimeoutSecs") or DEFAULT_TIMEOUT_SECS,
+        )
+
+    def session(self, headers: dict[str, str] | None = None, retries: Retry | int = 0) -> requests.Session:
+        """Return a new ``requests.Session`` whose connections come from the shared pools.
+
+        Args:
+            headers: Default headers of the session
+            retries: urllib3 retry policy of the session
+        """
+        session = requests.Session()
+        adapter = _PooledAdapter(self, max_retries=retries)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if headers:
+            session.headers.update(headers)
+        return session
+
+    @property
+    def async_client(self) -> ToolboxHttpClient:
+        """aiohttp based client for async providers, limited and measured like the sync sessions."""
+        with self._lock:
+            if self._async_client is None:
+                self._async_client = ToolboxHttpClient(
+                    default_timeout=self.timeout,
+                    connection_limit=self.max_per_host * self.pool_hosts,
+                    limit_per_host=self.max_per_host,
+                    trace_configs=[self._trace_config()],
+                )
+            return self._async_client
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Return per-host request, error, connection opened/reused and throttled counters."""
+        with self._lock:
+            stats = {host: dict(counts) for host, counts in self._counts.items()}
+            pools = self._pool_manager.pools if self._pool_manager is not None else None
+            for key in list(pools.keys()) if pools is not None else []:
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                counts = stats.setdefault(
+                    f"{pool.host}:{pool.port}", {"requests": 0, "errors": 0, "opened": 0, "reused": 0, "throttled": 0}
+                )
+                counts["opened"] += pool.num_connections
+                counts["reused"] += max(0, pool.num_requests - pool.num_connections)
+        return stats
+
+    def close(self) -> None:
+        """Close the pooled connections of the synchronous sessions."""
+        with self._lock:
+            if self._pool_manager is not None:
+                self._pool_manager.clear()
+
+    def _count(self, host: str, name: str, n: int = 1) -> None:
+        with self._lock:
+            self._counts[host][name] += n
+
+    def _host_slot(self, host: str) -> _HostSlot:
+        with self._lock:
+            slot = self._slots.get(host)
+            if slot is None:
+                slot = self._slots[host] = threading.BoundedSemaphore(self.max_per_host)
+            self._counts[host]["requests"] += 1
+        return _HostSlot(self, host, slot)
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        trace = aiohttp.TraceConfig()
+
+        async def on_request_start(_session: Any, ctx: SimpleNamespace, params: Any) -> None:
+            ctx.host = f"{params.url.host}:{params.url.port}"
+            self._count(ctx.host, "requests")
+
+        async def on_request_exception(_session: Any, ctx: SimpleNamespace, _params: Any) -> None:
+            self._count(ctx.host, "errors")
+
+        async def on_connection_queued_start(_session: Any, ctx: SimpleNamespace, _params: Any) -> None:
+            self._count(ctx.host, "throttled")
+
+        async def on_connection_create_end(_session: Any, ctx: SimpleNamespace, _params: Any) -> None:
+            self._count(ctx.host, "opened")
+
+        async def on_connection_reuseconn(_session: Any, ctx: SimpleNamespace, _params: Any) -> None:
+            self._count(ctx.host, "reused")
+
+        trace.on_request_start.append(on_request_start)
+        trace.on_request_exception.append(on_request_exception)
+        trace.on_connection_queued_start.append(on_connection_queued_start)
+        trace.on_connection_create_end.append(on_connection_create_end)
+        trace.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace
+
+
+class _HostSlot:
+    """Context manager holding one of a host's concurrent request slots."""
+
+    __slots__ = ("host", "slot", "transport")
+
+    def __init__(self, transport: HttpTransport, host: str, slot: threading.BoundedSemaphore) -> None:
+        self.transport = transport
+        self.host = host
+        self.slot = slot
+
+    def __enter__(self) -> None:
+        if not self.slot.acquire(blocking=False):
+            self.transport._count(self.host, "throttled")
+            self.slot.acquire()
+
+    def __exit__(self, *_exc: object) -> None:
+        self.slot.release()
+
+
+# Transport of providers created without one (shared, lazily created, reset after fork)
+_default_transport_lock = threading.Lock()
+_default_transport: HttpTransport | None = None
+
+
+def default_http_transport() -> HttpTransport:
+    """Return the process-wide transport used by providers constructed without a transport."""
+    global _default_transport
+    if _default_transport is None:
+        with _default_transport_lock:
+            if _default_transport is None:
+                _default_transport = HttpTransport()
+    return _default_transport
+
+
+def _reset_default_transport_after_fork() -> None:
+    global _default_transport
+    _default_transport = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_default_transport_after_fork)
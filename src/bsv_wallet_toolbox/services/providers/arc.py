@@ -39,6 +39,7 @@ from typing import Any
 
 import requests
 
+from bsv_wallet_toolbox.services.http_transport import HttpTransport, default_http_transport
 from bsv_wallet_toolbox.utils.merkle_path_utils import normalize_merkle_path_value
 from bsv_wallet_toolbox.utils.random_utils import double_sha256_be
 
@@ -158,6 +159,7 @@ class ARC:
         url: str,
         config: ArcConfig | str | None = None,
         name: str | None = None,
+        transport: HttpTransport | None = None,
     ) -> None:
         """Initialize ARC broadcaster.
 
@@ -165,9 +167,12 @@ class ARC:
             url: ARC API endpoint URL (e.g., 'https://api.taal.com/arc').
             config: Configuration (ArcConfig object or API key string).
             name: Service name for logging (defaults to 'ARC').
+            transport: Pooled HTTP transport (defaults to the process-wide transport).
         """
         self.name = name or "ARC"
         self.url = url
+        self.transport = transport or default_http_transport()
+        self.session = self.transport.session()
 
         if isinstance(config, str):
             # Config as simple API key string
@@ -335,42 +340,18 @@ class ARC:
         )
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 url,
                 json={"rawTx": raw_tx},
                 headers=headers,
-                timeout=30,
+                timeout=self.transport.timeout,
             )
 
             # Log response status for debugging
             logger.debug(f"ARC {self.name} HTTP response status: {response.status_code}")
 
             if response.status_code in (200, 201):
-                arc_response_data = response.json()
-                response_txid = arc_response_data.get("txid")
-                extra_info = arc_response_data.get("extraInfo", "")
-                tx_status = arc_response_data.get("txStatus", "")
-                competing_txs = arc_response_data.get("competingTxs")
-
-                nnr = {
-                    "txid": response_txid,
-                    "extraInfo": extra_info,
-                    "txStatus": tx_status,
-                    "competingTxs": ",".join(competing_txs) if competing_txs else None,
-                }
-
-                result.data = f"{tx_status} {extra_info}"
-                if result.txid != response_txid:
-                    result.data += f" txid altered from {result.txid} to {response_txid}"
-                result.txid = response_txid
-
-                if tx_status in ("DOUBLE_SPEND_ATTEMPTED", "SEEN_IN_ORPHAN_MEMPOOL"):
-                    result.status = "error"
-                    result.double_spend = True
-                    result.competing_txs = competing_txs
-                    result.notes.append({**nne, **nnr, "what": "postRawTxDoubleSpend"})
-                else:
-                    result.notes.append({**nn, **nnr, "what": "postRawTxSuccess"})
+                self._apply_tx_response(result, response.json(), nn, nne, "postRawTx")
             else:
                 # Check for rate limiting specifically
                 if response.status_code == 429:
@@ -445,6 +426,133 @@ class ARC:
 
         return result
 
+    @staticmethod
+    def _apply_tx_response(
+        result: PostTxResultForTxid,
+        arc_response_data: dict[str, Any],
+        nn: dict[str, Any],
+        nne: dict[str, Any],
+        what: str,
+    ) -> None:
+        """Record an accepted ARC transaction response (txStatus, extraInfo, competingTxs) on ``result``."""
+        response_txid = arc_response_data.get("txid")
+        extra_info = arc_response_data.get("extraInfo", "")
+        tx_status = arc_response_data.get("txStatus", "")
+        competing_txs = arc_response_data.get("competingTxs")
+
+        nnr = {
+            "txid": response_txid,
+            "extraInfo": extra_info,
+            "txStatus": tx_status,
+            "competingTxs": ",".join(competing_txs) if competing_txs else None,
+        }
+
+        result.data = f"{tx_status} {extra_info}"
+        if result.txid != response_txid:
+            result.data += f" txid altered from {result.txid} to {response_txid}"
+        result.txid = response_txid
+
+        if tx_status in ("DOUBLE_SPEND_ATTEMPTED", "SEEN_IN_ORPHAN_MEMPOOL"):
+            result.status = "error"
+            result.double_spend = True
+            result.competing_txs = competing_txs
+            result.notes.append({**nne, **nnr, "what": f"{what}DoubleSpend"})
+        else:
+            result.notes.append({**nn, **nnr, "what": f"{what}Success"})
+
+    def post_raw_txs(self, raw_txs: list[str], txids: list[str]) -> list[PostTxResultForTxid]:
+        """Broadcast several raw transactions with one request to ARC /v1/txs.
+
+        ARC validates the array in order, so a transaction spending an output
+        of another transaction in the same request must come after it.
+
+        When the request itself fails (network error, non-2xx status) every
+        result has ``service_error`` set; otherwise each result reflects the
+        per-transaction ``status`` ARC returned.
+
+        Args:
+            raw_txs: Raw transactions as hex strings, parents first.
+            txids: Txid of each raw transaction, same order.
+
+        Returns:
+            One PostTxResultForTxid per input, in input order.
+        """
+        results = [PostTxResultForTxid(txid=txid, status="success", notes=[]) for txid in txids]
+        if not raw_txs:
+            return results
+
+        url = f"{self.url}/v1/txs"
+        nn = {"name": self.name, "when": datetime.now(UTC).isoformat()}
+        nne = {**nn, "txids": ",".join(txids), "url": url}
+
+        def fail_all(status: str, data: Any, note: dict[str, Any]) -> list[PostTxResultForTxid]:
+            for result in results:
+                result.status = status
+                result.service_error = True
+                result.data = data
+                result.notes.append(note)
+                if status == "rate_limited":
+                    result.rate_limited = True
+            return results
+
+        try:
+            response = self.session.post(
+                url,
+                json=[{"rawTx": raw_tx} for raw_tx in raw_txs],
+                headers=self.request_headers(),
+                timeout=self.transport.timeout,
+            )
+        except Exception as e:
+            return fail_all("error", f"ERROR: {e!s}", {**nne, "what": "postRawTxsCatch", "error": str(e)})
+
+        logger.debug(f"ARC {self.name} /v1/txs HTTP response status: {response.status_code} for {len(raw_txs)} txs")
+        if response.status_code not in (200, 201):
+            error_data = PostTxResultForTxidError(status=str(response.status_code))
+            try:
+                response_data = response.json()
+                if isinstance(response_data, dict):
+                    error_data.more = response_data
+                    error_data.detail = response_data.get("detail")
+            except Exception:
+                pass
+            status = "rate_limited" if response.status_code == 429 else "error"
+            note = {**nne, "what": "postRawTxsError", "status": response.status_code, "detail": error_data.detail}
+            return fail_all(status, error_data, note)
+
+        try:
+            items = response.json()
+        except Exception as e:
+            items = None
+            error = str(e)
+        else:
+            error = f"expected a list of {len(txids)} results"
+        if not isinstance(items, list) or len(items) != len(txids):
+            return fail_all("error", f"ERROR: {error}", {**nne, "what": "postRawTxsBadResponse", "error": error})
+
+        for result, item in zip(results, items, strict=True):
+            item_status = item.get("status", 200) if isinstance(item, dict) else None
+            if item_status in (200, 201):
+                self._apply_tx_response(result, item, nn, nne, "postRawTxs")
+                continue
+            # Rejected transaction (e.g. 460 missing inputs, 465 fee too low)
+            error_data = PostTxResultForTxidError(
+                status=str(item_status),
+                detail=item.get("detail") if isinstance(item, dict) else None,
+                more=item if isinstance(item, dict) else None,
+            )
+            result.status = "error"
+            result.data = error_data
+            result.notes.append(
+                {
+                    **nn,
+                    "what": "postRawTxsTxError",
+                    "txid": result.txid,
+                    "status": item_status,
+                    "detail": error_data.detail,
+                }
+            )
+        return results
+
     def post_beef(self, beef: Any, txids: list[str]) -> PostBeefResult:
         """Broadcast a BEEF via ARC.
 
@@ -597,7 +705,7 @@ class ARC:
         url = f"{self.url}/v1/tx/{txid}"
 
         try:
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self.session.get(url, headers=headers, timeout=self.transport.timeout)
             if response.status_code == 200:
                 data = response.json()
                 return ArcMinerGetTxData(
@@ -680,7 +788,7 @@ class ARC:
         url = f"{self.url}/v1/tx/{txid}"
 
         try:
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self.session.get(url, headers=headers, timeout=self.transport.timeout)
             if response.status_code == 200:
                 data = response.json()
                 status = data.get("txStatus", "unknown")
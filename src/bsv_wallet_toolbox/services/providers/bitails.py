@@ -29,6 +29,7 @@ from typing import Any
 
 import requests
 
+from bsv_wallet_toolbox.services.http_transport import HttpTransport, default_http_transport
 from bsv_wallet_toolbox.utils.random_utils import double_sha256_be
 
 
@@ -139,12 +140,14 @@ class Bitails:
         self,
         chain: str = "main",
         config: BitailsConfig | None = None,
+        transport: HttpTransport | None = None,
     ) -> None:
         """Initialize Bitails provider.
 
         Args:
             chain: Blockchain chain ('main' or 'test'). Defaults to 'main'.
             config: Configuration options (api_key, headers).
+            transport: Pooled HTTP transport (defaults to the process-wide transport).
         """
         self.chain = chain
         self.config = config or BitailsConfig()  # Stored for testing and API compatibility
@@ -152,6 +155,8 @@ class Bitails:
         self.api_key = self.config.api_key or ""
         self.url = "https://api.bitails.io/" if chain == "main" else "https://test-api.bitails.io/"
         self._default_headers = self.config.headers or {}
+        self.transport = transport or default_http_transport()
+        self.session = self.transport.session()
 
     def get_http_headers(self) -> dict[str, str]:
         """Get HTTP headers for requests.
@@ -289,7 +294,7 @@ class Bitails:
         url = f"{self.url}tx/broadcast/multi"
 
         try:
-            response = requests.post(url, json=data, headers=headers, timeout=30)
+            response = self.session.post(url, json=data, headers=headers, timeout=self.transport.timeout)
 
             if response.status_code in (200, 201):
                 # Parse response
@@ -376,7 +381,7 @@ class Bitails:
         headers = self.get_http_headers()
 
         try:
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self.session.get(url, headers=headers, timeout=self.transport.timeout)
 
             def make_note_extended_merkle() -> dict[str, Any]:
                 return {
@@ -441,7 +446,7 @@ class Bitails:
             url += "?useNext=true"
 
         try:
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self.session.get(url, headers=headers, timeout=self.transport.timeout)
             if response.status_code == 200 or response.status_code == 404:
                 return response.json()
             elif response.status_code == 500:
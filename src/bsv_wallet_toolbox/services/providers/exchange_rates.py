@@ -3,18 +3,22 @@
 Provides functions to fetch fiat exchange rates from external APIs.
 """
 
-import asyncio
 from datetime import UTC, datetime
 from typing import Any
 
+from bsv.http_client import HttpClient
+
 from ...errors import InvalidParameterError
+from ...utils.async_runner import run_sync
+from ..http_transport import default_http_transport
 
 
-async def get_exchange_rates_io(api_key: str) -> dict[str, Any]:
+async def get_exchange_rates_io(api_key: str, http_client: HttpClient | None = None) -> dict[str, Any]:
     """Fetch exchange rates from exchangeratesapi.io.
 
     Args:
         api_key: API key for exchangeratesapi.io service
+        http_client: HTTP client to use (defaults to the pooled client of the process-wide transport)
 
     Returns:
         dict with keys: success (bool), timestamp (int), base (str), rates (dict)
@@ -22,15 +26,13 @@ async def get_exchange_rates_io(api_key: str) -> dict[str, Any]:
     Raises:
         RuntimeError: If API request fails
     """
-    import aiohttp
-
+    client = http_client or default_http_transport().async_client
     url = f"https://api.exchangeratesapi.io/v1/latest?access_key={api_key}"
     try:
-        async with aiohttp.ClientSession() as session, session.get(url) as response:
-            if response.status != 200:
-                raise RuntimeError(f"exchangeratesapi.io returned status {response.status}")
-            data = await response.json()
-            return data
+        response = await client.fetch(url, {"method": "GET"})
+        if response.status_code != 200:
+            raise RuntimeError(f"exchangeratesapi.io returned status {response.status_code}")
+        return response.json()["data"]
     except Exception as e:
         raise RuntimeError(f"Failed to fetch exchange rates: {e!s}") from e
 
@@ -131,14 +133,4 @@ def update_exchangeratesapi_sync(
         InvalidParameterError: If parameters are invalid
         RuntimeError: If API request fails
     """
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # If we're already in an async context, we can't use run()
-            # This shouldn't happen in sync context, but handle it
-            raise RuntimeError("Cannot call sync wrapper from async context")
-    except RuntimeError:
-        # No event loop running, create a new one
-        pass
-
-    return asyncio.run(update_exchangeratesapi(target_currencies, options))
+    return run_sync(update_exchangeratesapi(target_currencies, options))
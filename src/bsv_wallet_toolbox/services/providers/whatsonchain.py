@@ -32,6 +32,8 @@ from ..chaintracker.chaintracks.api import (
 )
 from ..wallet_services import Chain
 
+BULK_MAX_ITEMS: int = 20  # txids / script hashes per WhatsOnChain bulk request
+
 
 class WhatsOnChain(WhatsOnChainTracker, ChaintracksClientApi):
     """WhatsOnChain implementation of ChaintracksClientApi.
@@ -1047,3 +1049,132 @@ class WhatsOnChain(WhatsOnChainTracker, ChaintracksClientApi):
         if not response.ok:
             raise RuntimeError("Failed to get tx propagation")
         return response.json() or {}
+
+    async def get_raw_txs(self, txids: list[str]) -> dict[str, str | None]:
+        """Get raw transaction hex for up to BULK_MAX_ITEMS txids with one request (``POST /txs/hex``).
+
+        Args:
+            txids: Transaction IDs (64 hex chars, big-endian)
+
+        Returns:
+            dict: txid -> raw transaction hex, or None when WhatsOnChain does not know the
+                  transaction. Txids the response reports another error for are left out.
+
+        Raises:
+            RuntimeError: If the request fails or returns a non-OK status.
+        """
+        return await self._get_raw_txs(txids)
+
+    async def _get_raw_txs(self, txids: list[str]) -> dict[str, str | None]:
+        """Internal implementation of get_raw_txs."""
+        results: dict[str, str | None] = {}
+        for item in await self._post_bulk("/txs/hex", {"txids": txids}):
+            txid = item.get("txid")
+            if txid not in txids:
+                continue
+            if item.get("hex"):
+                results[txid] = item["hex"]
+            elif item.get("error") == "unknown":
+                results[txid] = None
+        return results
+
+    async def get_transaction_statuses(self, txids: list[str]) -> dict[str, dict[str, Any]]:
+        """Get the status of up to BULK_MAX_ITEMS transactions with one request (``POST /txs/status``).
+
+        Args:
+            txids: Transaction IDs (64 hex chars, big-endian)
+
+        Returns:
+            dict: txid -> { "name", "txid", "status" } where status is "confirmed" (with
+                  blockHash, blockHeight and confirmations), "unconfirmed" or "not_found".
+                  Txids the response reports another error for are left out.
+
+        Raises:
+            RuntimeError: If the request fails or returns a non-OK status.
+        """
+        return await self._get_transaction_statuses(txids)
+
+    async def _get_transaction_statuses(self, txids: list[str]) -> dict[str, dict[str, Any]]:
+        """Internal implementation of get_transaction_statuses."""
+        results: dict[str, dict[str, Any]] = {}
+        for item in await self._post_bulk("/txs/status", {"txids": txids}):
+            txid = item.get("txid")
+            if txid not in txids:
+                continue
+            error = item.get("error")
+            if error == "unknown":
+                results[txid] = {"name": "WhatsOnChain", "status": "not_found", "txid": txid}
+            elif not error:
+                confirmations = item.get("confirmations") or 0
+                status: dict[str, Any] = {
+                    "name": "WhatsOnChain",
+                    "status": "confirmed" if confirmations > 0 else "unconfirmed",
+                    "txid": txid,
+                }
+                if confirmations > 0:
+                    status.update(
+                        blockHash=item.get("blockhash"),
+                        blockHeight=item.get("blockheight"),
+                        confirmations=confirmations,
+                    )
+                results[txid] = status
+        return results
+
+    async def get_utxo_statuses(self, script_hashes: list[str], output_format: str = "hashLE") -> dict[str, Any]:
+        """Get the unspent outputs of up to BULK_MAX_ITEMS script hashes with one request.
+
+        Uses ``POST /scripts/unspent/all``, which takes big-endian script hashes.
+
+        Args:
+            script_hashes: Script hashes (64 hex chars)
+            output_format: Byte order of script_hashes, 'hashLE' or 'hashBE'
+
+        Returns:
+            dict: script hash (as given) -> TS-like { "name", "status": "success", "isUtxo",
+                  "details": [{ "txid", "index", "outpoint", "satoshis", "height", "spent" }] }.
+                  Script hashes the response reports an error for are left out.
+
+        Raises:
+            RuntimeError: If the request fails or returns a non-OK status.
+        """
+        return await self._get_utxo_statuses(script_hashes, output_format)
+
+    async def _get_utxo_statuses(self, script_hashes: list[str], output_format: str = "hashLE") -> dict[str, Any]:
+        """Internal implementation of get_utxo_statuses."""
+        to_be = {(bytes.fromhex(h)[::-1].hex() if output_format == "hashLE" else h.lower()): h for h in script_hashes}
+        results: dict[str, Any] = {}
+        for item in await self._post_bulk("/scripts/unspent/all", {"scripts": list(to_be)}):
+            script_hash = to_be.get(str(item.get("script", "")).lower())
+            if script_hash is None or item.get("error"):
+                continue
+            details = [
+                {
+                    "txid": u.get("tx_hash"),
+                    "index": u.get("tx_pos"),
+                    "outpoint": f"{u.get('tx_hash')}.{u.get('tx_pos')}",
+                    "satoshis": u.get("value"),
+                    "height": u.get("height"),
+                    "spent": bool(u.get("isSpentInMempoolTx", False)),
+                }
+                for u in item.get("result", item.get("unspent")) or []
+            ]
+            results[script_hash] = {
+                "name": "WhatsOnChain",
+                "status": "success",
+                "isUtxo": any(not d["spent"] for d in details),
+                "details": details,
+            }
+        return results
+
+    async def _post_bulk(self, path: str, body: dict[str, list[str]]) -> list[dict[str, Any]]:
+        """POST a bulk request and return its list of per-item results."""
+        if max(len(v) for v in body.values()) > BULK_MAX_ITEMS:
+            raise ValueError(f"at most {BULK_MAX_ITEMS} items per WhatsOnChain bulk request")
+        request_options = {"method": "POST", "headers": self._get_http_headers(), "data": body}
+        response = await self.http_client.fetch(f"{self.URL}{path}", request_options)
+        if not response.ok:
+            raise RuntimeError(f"WhatsOnChain bulk request {path} failed with status {response.status_code}")
+        data = (response.json() or {}).get("data")
+        if not isinstance(data, list):
+            raise RuntimeError(f"WhatsOnChain bulk request {path} returned malformed data")
+        return [item for item in data if isinstance(item, dict)]
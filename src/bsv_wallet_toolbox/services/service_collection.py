@@ -10,6 +10,8 @@ Key Features:
     - Per-provider call history and statistics
     - Performance metrics (success, failure, error counts and timing)
     - Service health monitoring
+    - Hedging latency budgets derived from recorded call durations
+    - Adaptive ranking (EWMA latency and error rate, circuit breaker, re-probes)
 
 Typical Usage:
     from bsv_wallet_toolbox.services.service_collection import ServiceCollection
@@ -33,6 +35,7 @@ Reference Implementation: ts-wallet-toolbox/src/services/ServiceCollection.ts
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any, Generic, TypeVar
@@ -42,6 +45,20 @@ T = TypeVar("T")
 MAX_RESET_COUNTS = 32
 MAX_CALL_HISTORY = 32
 
+# Hedging latency budget bounds (milliseconds)
+HEDGE_DELAY_DEFAULT_MSECS = 1000
+HEDGE_DELAY_MIN_MSECS = 50
+HEDGE_DELAY_MAX_MSECS = 5000
+HEDGE_DELAY_PERCENTILE = 0.9
+
+# Adaptive provider ranking
+EWMA_ALPHA = 0.3
+ERROR_RATE_PENALTY = 4.0
+BREAKER_ERROR_THRESHOLD = 3
+BREAKER_COOLDOWN_SECS = 30.0
+BREAKER_MAX_COOLDOWN_SECS = 600.0
+REPROBE_INTERVAL_SECS = 60.0
+
 
 @dataclass
 class ServiceCall:
@@ -81,6 +98,66 @@ class ProviderCallHistory:
     reset_counts: list[ResetCount] = field(default_factory=list)
 
 
+@dataclass
+class ProviderHealth:
+    """Moving latency/error estimates and circuit breaker state of a provider.
+
+    Providers without calls are scored with a prior latency of
+    HEDGE_DELAY_DEFAULT_MSECS, so a provider slower than that is eventually
+    overtaken by an untried one.
+    """
+
+    ewma_msecs: float | None = None
+    error_rate: float = 0.0
+    consecutive_errors: int = 0
+    cooldown_secs: float = BREAKER_COOLDOWN_SECS
+    open_until: float | None = None
+    last_call: float = field(default_factory=time.monotonic)
+
+    @property
+    def score(self) -> float:
+        """Expected cost of a call (lower is better)."""
+        msecs = HEDGE_DELAY_DEFAULT_MSECS if self.ewma_msecs is None else self.ewma_msecs
+        return msecs * (1 + ERROR_RATE_PENALTY * self.error_rate)
+
+    def state(self, now: float) -> str:
+        """Circuit breaker state: "closed", "open" or "halfOpen" (cooldown over, awaiting a probe)."""
+        if self.open_until is None:
+            return "closed"
+        return "open" if now < self.open_until else "halfOpen"
+
+    def record(self, msecs: int, error: bool, now: float) -> None:
+        """Fold one call into the estimates and update the breaker."""
+        self.last_call = now
+        self.ewma_msecs = msecs if self.ewma_msecs is None else EWMA_ALPHA * msecs + (1 - EWMA_ALPHA) * self.ewma_msecs
+        self.error_rate = EWMA_ALPHA * (1.0 if error else 0.0) + (1 - EWMA_ALPHA) * self.error_rate
+        if not error:
+            self.consecutive_errors = 0
+            self.open_until = None
+            self.cooldown_secs = BREAKER_COOLDOWN_SECS
+            return
+        self.consecutive_errors += 1
+        if self.open_until is not None:
+            # Failed probe: re-open with a longer cooldown
+            self.cooldown_secs = min(self.cooldown_secs * 2, BREAKER_MAX_COOLDOWN_SECS)
+            self.open_until = now + self.cooldown_secs
+        elif self.consecutive_errors >= BREAKER_ERROR_THRESHOLD:
+            self.open_until = now + self.cooldown_secs
+
+
+@dataclass
+class ProviderRankingEntry:
+    """Serialized provider ranking."""
+
+    provider_name: str
+    rank: int
+    score: float
+    ewma_msecs: float | None
+    error_rate: float
+    state: str
+    consecutive_errors: int
+
+
 @dataclass
 class ServiceCallHistoryEntry:
     """Serialized service call record."""
@@ -120,6 +197,7 @@ class ServiceCallHistory:
 
     service_name: str
     history_by_provider: dict[str, ProviderCallHistoryEntry] = field(default_factory=dict)
+    ranking: list[ProviderRankingEntry] = field(default_factory=list)
 
 
 @dataclass
@@ -138,9 +216,17 @@ class ServiceCollection(Generic[T]):
     Manages multiple provider instances (e.g., WhatsOnChain, Bitails) with
     round-robin failover, call history tracking, and performance metrics.
 
+    Each request iterates a snapshot from :meth:`ranked_services`, so concurrent
+    requests never see the provider list reordered under them. When
+    ``adaptive`` is set the snapshot is ranked: providers due for a probe first
+    (circuit breaker cooldown over, or idle for REPROBE_INTERVAL_SECS), then
+    healthy providers by EWMA latency weighted by error rate, then providers
+    whose breaker is open (kept as a last resort).
+
     Attributes:
         service_name: Name of the service (e.g., 'getMerklePath').
         services: List of providers with name and service callable.
+        adaptive: Whether ranked_services ranks providers by health.
         _index: Current active provider index.
         since: Collection creation timestamp.
     """
@@ -149,18 +235,22 @@ class ServiceCollection(Generic[T]):
         self,
         service_name: str,
         services: list[dict[str, Any]] | None = None,
+        adaptive: bool = False,
     ) -> None:
         """Initialize ServiceCollection.
 
         Args:
             service_name: Name of the service for tracking.
             services: Optional list of initial services with 'name' and 'service' keys.
+            adaptive: Rank providers by health in ranked_services.
         """
         self.service_name = service_name
         self.services: list[dict[str, Any]] = services or []
+        self.adaptive = adaptive
         self._index = 0
         self.since = datetime.now(UTC)
         self._history_by_provider: dict[str, ProviderCallHistory] = {}
+        self._health: dict[str, ProviderHealth] = {}
 
     def add(self, service_entry: dict[str, Any]) -> ServiceCollection[T]:
         """Add a provider to the collection.
@@ -201,8 +291,19 @@ class ServiceCollection(Generic[T]):
         Returns:
             ServiceToCall descriptor.
         """
-        provider_name = self.services[index].get("name", "unknown")
-        service = self.services[index].get("service")
+        return self.service_to_call_for(self.services[index])
+
+    def service_to_call_for(self, entry: dict[str, Any]) -> ServiceToCall[T]:
+        """Get service descriptor for a provider entry (e.g. from ranked_services).
+
+        Args:
+            entry: Provider dict with 'name' and 'service' keys.
+
+        Returns:
+            ServiceToCall descriptor, timed from now.
+        """
+        provider_name = entry.get("name", "unknown")
+        service = entry.get("service")
         call = ServiceCall(
             when=datetime.now(UTC),
             msecs=0,
@@ -272,7 +373,59 @@ class ServiceCollection(Generic[T]):
         Returns:
             New ServiceCollection with same providers.
         """
-        return ServiceCollection(self.service_name, [dict(s) for s in self.services])
+        return ServiceCollection(self.service_name, [dict(s) for s in self.services], self.adaptive)
+
+    def health(self, provider_name: str) -> ProviderHealth:
+        """Get (creating if needed) the health estimates of a provider.
+
+        Args:
+            provider_name: Provider name.
+
+        Returns:
+            ProviderHealth record.
+        """
+        health = self._health.get(provider_name)
+        if health is None:
+            health = self._health[provider_name] = ProviderHealth()
+        return health
+
+    def _rank_key(self, provider_name: str, now: float) -> tuple[int, float]:
+        health = self.health(provider_name)
+        state = health.state(now)
+        if state == "halfOpen" or (state == "closed" and now - health.last_call >= REPROBE_INTERVAL_SECS):
+            return (0, health.score)
+        return (1 if state == "closed" else 2, health.score)
+
+    def ranked_provider_names(self) -> list[str]:
+        """Provider names from best to worst (see class docstring)."""
+        now = time.monotonic()
+        names = [s.get("name", "unknown") for s in self.services]
+        return sorted(names, key=lambda name: self._rank_key(name, now))
+
+    def ranked_services(self, use_next: bool = False) -> list[dict[str, Any]]:
+        """Snapshot of the provider entries to try for one request, in order.
+
+        Round-robin collections start from the current index; adaptive ones from
+        the best ranked provider (see class docstring). The shared provider list
+        is not reordered.
+
+        Args:
+            use_next: Start from the next provider (advances the round-robin index).
+
+        Returns:
+            Provider dicts with 'name' and 'service' keys.
+        """
+        services = list(self.services)
+        if not services:
+            return []
+        if use_next:
+            self.next()
+        start = self._index % len(services)
+        if self.adaptive:
+            now = time.monotonic()
+            services.sort(key=lambda s: self._rank_key(s.get("name", "unknown"), now))
+            start = 1 % len(services) if use_next else 0
+        return services[start:] + services[:start]
 
     def _add_service_call(
         self,
@@ -326,6 +479,26 @@ class ServiceCollection(Generic[T]):
         delta = now - since
         return int(delta.total_seconds() * 1000)
 
+    def hedge_delay_msecs(self, provider_name: str) -> int:
+        """Latency budget before hedging a call to a provider with the next one.
+
+        Uses the 90th percentile duration of the provider's recent successful
+        calls, clamped to [HEDGE_DELAY_MIN_MSECS, HEDGE_DELAY_MAX_MSECS];
+        HEDGE_DELAY_DEFAULT_MSECS when there is no history yet.
+
+        Args:
+            provider_name: Provider name.
+
+        Returns:
+            Budget in milliseconds.
+        """
+        history = self._history_by_provider.get(provider_name)
+        durations = sorted(call.msecs for call in history.calls if call.success) if history else []
+        if not durations:
+            return HEDGE_DELAY_DEFAULT_MSECS
+        msecs = durations[min(len(durations) - 1, int(len(durations) * HEDGE_DELAY_PERCENTILE))]
+        return max(HEDGE_DELAY_MIN_MSECS, min(HEDGE_DELAY_MAX_MSECS, msecs))
+
     def add_service_call_success(
         self,
         stc: ServiceToCall[T],
@@ -343,6 +516,7 @@ class ServiceCollection(Generic[T]):
         call.error = None
         call.msecs = self.get_duration(call.when)
 
+        self.health(stc.provider_name).record(call.msecs, False, time.monotonic())
         history = self._add_service_call(stc.provider_name, call)
         if history.total_counts:
             history.total_counts.success += 1
@@ -366,6 +540,7 @@ class ServiceCollection(Generic[T]):
         call.error = None
         call.msecs = self.get_duration(call.when)
 
+        self.health(stc.provider_name).record(call.msecs, False, time.monotonic())
         history = self._add_service_call(stc.provider_name, call)
         if history.total_counts:
             history.total_counts.failure += 1
@@ -392,6 +567,7 @@ class ServiceCollection(Generic[T]):
         }
         call.msecs = self.get_duration(call.when)
 
+        self.health(stc.provider_name).record(call.msecs, True, time.monotonic())
         history = self._add_service_call(stc.provider_name, call)
         if history.total_counts:
             history.total_counts.failure += 1
@@ -470,4 +646,20 @@ class ServiceCollection(Generic[T]):
                     # Limit history
                     prov_history.reset_counts = prov_history.reset_counts[:MAX_CALL_HISTORY]
 
+        if self.adaptive:
+            mono_now = time.monotonic()
+            for rank, name in enumerate(self.ranked_provider_names()):
+                health = self.health(name)
+                history.ranking.append(
+                    ProviderRankingEntry(
+                        provider_name=name,
+                        rank=rank,
+                        score=health.score,
+                        ewma_msecs=health.ewma_msecs,
+                        error_rate=health.error_rate,
+                        state=health.state(mono_now),
+                        consecutive_errors=health.consecutive_errors,
+                    )
+                )
+
         return history
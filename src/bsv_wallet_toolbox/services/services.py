@@ -42,9 +42,8 @@ See: ts-wallet-toolbox/src/Services.ts (no monitoring), ts-wallet-toolbox/src/Mo
 import asyncio
 import inspect
 import logging
-import os
-import threading
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
+from functools import partial
 from time import time
 from typing import Any
 
@@ -53,14 +52,18 @@ from bsv.transaction import Transaction
 from bsv.transaction.beef import parse_beef, parse_beef_ex
 
 from ..errors import InvalidParameterError
+from ..utils.async_runner import get_async_runner as _get_async_runner
+from ..utils.async_runner import shutdown_async_runner  # re-exported
 from ..utils.random_utils import double_sha256_be
 from ..utils.script_hash import hash_output_script as utils_hash_output_script
+from .batch_broadcast import POST_BEEF_BATCH_SIZE, POST_BEEF_CONCURRENCY, broadcast_in_batches
 from .cache_manager import CacheManager
-from .http_client import ToolboxHttpClient
+from .http_transport import HttpTransport
 from .providers.arc import ARC, ArcConfig
 from .providers.bitails import Bitails, BitailsConfig
 from .providers.whatsonchain import WhatsOnChain
-from .service_collection import ServiceCollection
+from .service_collection import ServiceCollection, ServiceToCall
+from .single_flight import SingleFlight
 from .wallet_services import Chain, WalletServices
 from .wallet_services_options import WalletServicesOptions
 
@@ -68,11 +71,59 @@ from .wallet_services_options import WalletServicesOptions
 MAXINT: int = 0xFFFFFFFF
 BLOCK_LIMIT: int = 500_000_000
 CACHE_TTL_MSECS: int = 120000  # 2-minute TTL for service caches
+
+# Per-method cache TTLs; override with the "cacheTtlMsecs" option.
+SERVICE_CACHE_TTL_MSECS: dict[str, int] = {
+    "rawTx": 3_600_000,  # a txid always maps to the same raw transaction
+    "merklePath": CACHE_TTL_MSECS,
+    "header": 600_000,
+    "utxoStatus": CACHE_TTL_MSECS,
+    "scriptHistory": CACHE_TTL_MSECS,
+    "transactionStatus": CACHE_TTL_MSECS,
+}
+SERVICE_CACHE_MAX_ENTRIES: int = 10_000
+RAW_TX_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+
+# Provider call modes; select per method with the "serviceCallModes" option.
+# "failover" tries providers one after another, "hedged" starts the next provider
+# when the current one has not answered within its latency budget.
+SERVICE_CALL_MODES: tuple[str, ...] = ("failover", "hedged")
+HEDGED_SERVICE_METHODS: tuple[str, ...] = ("getRawTx", "getMerklePath", "getUtxoStatus")
+
+# Batch lookups (get_raw_txs, get_transaction_statuses, get_utxo_statuses)
+BULK_LOOKUP_CHUNK_SIZE: int = 20  # items per provider bulk request (WhatsOnChain's limit)
+BULK_LOOKUP_CONCURRENCY: int = 4  # bulk requests in flight per batch lookup
 ATOMIC_BEEF_HEX_PREFIX: str = "01010101"  # Hex string prefix for AtomicBEEF format detection
 
 logger = logging.getLogger(__name__)
 
 
+def _format_arc_error(res: Any) -> str:
+    """Describe a failed ARC broadcast result (PostTxResultForTxid) for post_beef messages."""
+    # ARC.broadcast returns PostTxResultForTxid.
+    # When it fails, res.data is typically PostTxResultForTxidError with:
+    #   - status: HTTP status code as string
+    #   - detail: ARC "detail" message
+    data = getattr(res, "data", None)
+    status = getattr(res, "status", None)
+    txid_local = getattr(res, "txid", None)
+    if data is None:
+        return f"ARC error (status={status}, txid={txid_local})"
+    detail = getattr(data, "detail", None)
+    http_status = getattr(data, "status", None)
+    more = getattr(data, "more", None)
+    parts: list[str] = []
+    if http_status:
+        parts.append(f"HTTP {http_status}")
+    if detail:
+        parts.append(str(detail))
+    elif more:
+        parts.append(str(more))
+    else:
+        parts.append(str(data))
+    return "ARC: " + " - ".join(parts)
+
+
 def create_default_options(chain: Chain) -> WalletServicesOptions:
     """Create default WalletServicesOptions for a given chain.
 
@@ -133,73 +184,6 @@ def create_default_options(chain: Chain) -> WalletServicesOptions:
     )
 
 
-class _AsyncRunner:
-    """Background event loop runner for executing coroutines synchronously."""
-
-    def __init__(self) -> None:
-        self._loop = asyncio.new_event_loop()
-        self._loop_thread = threading.Thread(target=self._run_loop, daemon=True)
-        self._loop_thread.start()
-        self._shutdown_event = threading.Event()
-
-    def _run_loop(self) -> None:
-        asyncio.set_event_loop(self._loop)
-        try:
-            self._loop.run_forever()
-        finally:
-            # Cleanup when loop stops
-            try:
-                _cancel_all_tasks(self._loop)
-                self._loop.run_until_complete(self._loop.shutdown_asyncgens())
-                self._loop.run_until_complete(self._loop.shutdown_default_executor())
-            except Exception as e:
-                logger.debug(f"Non-fatal error during async runner cleanup: {e}")
-
-    def run(self, coro: Any) -> Any:
-        if self._shutdown_event.is_set():
-            raise RuntimeError("AsyncRunner has been shut down")
-        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
-        return future.result()
-
-    def shutdown(self) -> None:
-        """Shutdown the background event loop and thread.
-
-        This method should be called when the application is shutting down
-        to ensure proper cleanup of the background thread and event loop.
-        """
-        if self._shutdown_event.is_set():
-            return  # Already shut down
-
-        self._shutdown_event.set()
-
-        # Stop the event loop
-        if self._loop.is_running():
-            self._loop.call_soon_threadsafe(self._loop.stop)
-
-        # Wait for thread to finish
-        if self._loop_thread.is_alive():
-            self._loop_thread.join(timeout=5.0)
-
-        # Final cleanup
-        try:
-            if not self._loop.is_closed():
-                self._loop.close()
-        except Exception:
-            pass  # Best effort cleanup
-
-
-def _cancel_all_tasks(loop: asyncio.AbstractEventLoop) -> None:
-    """Cancel all pending tasks in the event loop."""
-    try:
-        pending_tasks = [t for t in asyncio.all_tasks(loop) if not t.done()]
-        for task in pending_tasks:
-            task.cancel()
-        if pending_tasks:
-            loop.run_until_complete(asyncio.gather(*pending_tasks, return_exceptions=True))
-    except Exception:
-        pass  # Best effort cleanup
-
-
 def compute_txid_from_hex(raw_tx_hex: str) -> str:
     """Compute transaction ID from raw transaction hex string.
 
@@ -216,66 +200,6 @@ def compute_txid_from_hex(raw_tx_hex: str) -> str:
     return bytes(double_sha256_be(raw_tx_bytes)).hex()
 
 
-# Global async runner with lazy initialization (thread-safe)
-_async_runner_lock = threading.Lock()
-_async_runner: _AsyncRunner | None = None
-_parent_pid = os.getpid()
-
-
-def _reset_async_runner_after_fork() -> None:
-    """Reset async runner in child process after fork."""
-    global _async_runner, _parent_pid
-    current_pid = os.getpid()
-    if current_pid != _parent_pid:
-        if _async_runner is not None:
-            try:
-                _async_runner.shutdown()
-            except Exception:
-                pass
-        _async_runner = None
-        _parent_pid = current_pid
-
-
-# Register fork handler if available (Python 3.7+)
-if hasattr(os, "register_at_fork"):
-    os.register_at_fork(after_in_child=_reset_async_runner_after_fork)
-
-
-def _get_async_runner() -> _AsyncRunner:
-    """Get or create the global async runner (lazy initialization).
-
-    Thread-safe singleton pattern. The runner is created on first access,
-    avoiding issues with process forking since it won't exist at import time.
-    """
-    global _async_runner
-    if _async_runner is None:
-        with _async_runner_lock:
-            # Double-check pattern for thread safety
-            if _async_runner is None:
-                _async_runner = _AsyncRunner()
-    return _async_runner
-
-
-def shutdown_async_runner() -> None:
-    """Shutdown the global async runner.
-
-    This function should be called when the application is shutting down
-    to ensure proper cleanup of the background thread and event loop.
-
-    The async runner is created lazily on first use, so this function is safe
-    to call even if the runner hasn't been created yet.
-    """
-    global _async_runner
-    if _async_runner is not None:
-        _async_runner.shutdown()
-        _async_runner = None
-
-
-# Global async runner with lazy initialization (thread-safe)
-# The async runner is created on first use to avoid issues with process forking.
-# Fork detection is registered to automatically reset the runner in child processes.
-
-
 class Services(WalletServices):
     """Production-ready WalletServices implementation with multi-provider support.
 
@@ -331,11 +255,14 @@ class Services(WalletServices):
     get_script_history_services: ServiceCollection[Callable]
     get_transaction_status_services: ServiceCollection[Callable]
 
-    # Cache managers (TTL: 2 minutes = 120000 msecs for most operations)
+    # Bounded LRU caches (TTLs per method, see SERVICE_CACHE_TTL_MSECS)
+    cache_ttl_msecs: dict[str, int]
     utxo_status_cache: CacheManager[dict[str, Any]]
     script_history_cache: CacheManager[list[dict[str, Any]]]
     transaction_status_cache: CacheManager[dict[str, Any]]
     merkle_path_cache: CacheManager[dict[str, Any]]
+    raw_tx_cache: CacheManager[str]
+    header_cache: CacheManager[Any]
 
     @staticmethod
     def create_default_options(chain: Chain) -> WalletServicesOptions:
@@ -378,6 +305,11 @@ class Services(WalletServices):
         super().__init__(chain)
         self.logger = logging.getLogger(f"{__name__}.Services")
 
+        # Pooled HTTP transport shared by all providers
+        self.http_transport: HttpTransport = self.options.get("httpTransport") or HttpTransport.from_options(
+            self.options
+        )
+
         # Initialize WhatsOnChain provider
         woc_api_key = self.options.get("whatsOnChainApiKey")
         self.whatsonchain = WhatsOnChain(network=chain, api_key=woc_api_key, http_client=self._get_http_client())
@@ -389,7 +321,7 @@ class Services(WalletServices):
                 api_key=self.options.get("arcApiKey"),
                 headers=self.options.get("arcHeaders"),
             )
-            self.arc_taal = ARC(arc_url, config=arc_config, name="arcTaal")
+            self.arc_taal = ARC(arc_url, config=arc_config, name="arcTaal", transport=self.http_transport)
 
         # Initialize ARC GorillaPool provider (optional)
         arc_gorillapool_url = self.options.get("arcGorillaPoolUrl")
@@ -402,12 +334,13 @@ class Services(WalletServices):
                 arc_gorillapool_url,
                 config=arc_gorillapool_config,
                 name="arcGorillaPool",
+                transport=self.http_transport,
             )
 
         # Initialize Bitails provider (optional)
         bitails_api_key = self.options.get("bitailsApiKey")
         bitails_config = BitailsConfig(api_key=bitails_api_key)
-        self.bitails = Bitails(chain=chain, config=bitails_config)
+        self.bitails = Bitails(chain=chain, config=bitails_config, transport=self.http_transport)
 
         # Initialize ServiceCollections for multi-provider failover
         self._init_service_collections()
@@ -416,10 +349,13 @@ class Services(WalletServices):
         """Initialize ServiceCollections for multi-provider failover.
 
         Sets up round-robin failover collections for each service type,
-        with providers prioritized by configured availability.
+        with providers prioritized by configured availability. With the
+        "adaptiveServiceRanking" option set, each request starts with the
+        currently fastest healthy provider (see ServiceCollection.ranked_services).
         """
+        adaptive = bool(self.options.get("adaptiveServiceRanking"))
         # getMerklePath collection
-        self.get_merkle_path_services = ServiceCollection("getMerklePath")
+        self.get_merkle_path_services = ServiceCollection("getMerklePath", adaptive=adaptive)
         self.get_merkle_path_services.add({"name": "WhatsOnChain", "service": self.whatsonchain.get_merkle_path})
         # ARC can sometimes provide merklePath earlier / when other indexers lag.
         if self.arc_gorillapool:
@@ -432,11 +368,11 @@ class Services(WalletServices):
             self.get_merkle_path_services.add({"name": "Bitails", "service": self.bitails.get_merkle_path})
 
         # getRawTx collection
-        self.get_raw_tx_services = ServiceCollection("getRawTx")
+        self.get_raw_tx_services = ServiceCollection("getRawTx", adaptive=adaptive)
         self.get_raw_tx_services.add({"name": "WhatsOnChain", "service": self.whatsonchain.get_raw_tx})
 
         # postBeef collection
-        self.post_beef_services = ServiceCollection("postBeef")
+        self.post_beef_services = ServiceCollection("postBeef", adaptive=adaptive)
         if self.arc_gorillapool:
             self.post_beef_services.add({"name": "arcGorillaPool", "service": self.arc_gorillapool.post_beef})
         if self.arc_taal:
@@ -445,32 +381,113 @@ class Services(WalletServices):
             self.post_beef_services.add({"name": "Bitails", "service": self.bitails.post_beef})
 
         # getUtxoStatus collection
-        self.get_utxo_status_services = ServiceCollection("getUtxoStatus")
+        self.get_utxo_status_services = ServiceCollection("getUtxoStatus", adaptive=adaptive)
         self.get_utxo_status_services.add({"name": "WhatsOnChain", "service": self.whatsonchain.get_utxo_status})
 
         # getScriptHistory collection
-        self.get_script_history_services = ServiceCollection("getScriptHistory")
+        self.get_script_history_services = ServiceCollection("getScriptHistory", adaptive=adaptive)
         self.get_script_history_services.add({"name": "WhatsOnChain", "service": self.whatsonchain.get_script_history})
 
         # getTransactionStatus collection
-        self.get_transaction_status_services = ServiceCollection("getTransactionStatus")
+        self.get_transaction_status_services = ServiceCollection("getTransactionStatus", adaptive=adaptive)
         self.get_transaction_status_services.add(
             {"name": "WhatsOnChain", "service": self.whatsonchain.get_transaction_status}
         )
 
-        # Initialize cache managers (2-minute TTL)
-        self.utxo_status_cache = CacheManager()
-        self.script_history_cache = CacheManager()
-        self.transaction_status_cache = CacheManager()
-        self.merkle_path_cache = CacheManager()
+        # Bulk lookup collections (BULK_LOOKUP_CHUNK_SIZE items per call)
+        self.get_raw_txs_services = ServiceCollection("getRawTxs", adaptive=adaptive)
+        self.get_raw_txs_services.add({"name": "WhatsOnChain", "service": self.whatsonchain.get_raw_txs})
+        self.get_transaction_statuses_services = ServiceCollection("getTransactionStatuses", adaptive=adaptive)
+        self.get_transaction_statuses_services.add(
+            {"name": "WhatsOnChain", "service": self.whatsonchain.get_transaction_statuses}
+        )
+        self.get_utxo_statuses_services = ServiceCollection("getUtxoStatuses", adaptive=adaptive)
+        self.get_utxo_statuses_services.add({"name": "WhatsOnChain", "service": self.whatsonchain.get_utxo_statuses})
+
+        # Initialize bounded cache managers
+        self.cache_ttl_msecs = {**SERVICE_CACHE_TTL_MSECS, **(self.options.get("cacheTtlMsecs") or {})}
+        max_entries = self.options.get("cacheMaxEntries") or SERVICE_CACHE_MAX_ENTRIES
+        self.utxo_status_cache = CacheManager(max_entries)
+        self.script_history_cache = CacheManager(max_entries)
+        self.transaction_status_cache = CacheManager(max_entries)
+        self.merkle_path_cache = CacheManager(max_entries)
+        self.raw_tx_cache = CacheManager(max_entries, max_bytes=RAW_TX_CACHE_MAX_BYTES)
+        self.header_cache = CacheManager(max_entries)
+
+        # Concurrent identical provider requests share one in-flight call
+        self._single_flight = SingleFlight()
+
+        # Per-method provider call modes
+        self.service_call_modes = dict(self.options.get("serviceCallModes") or {})
+        for method, mode in self.service_call_modes.items():
+            if method not in HEDGED_SERVICE_METHODS:
+                raise InvalidParameterError("serviceCallModes", f"one of {', '.join(HEDGED_SERVICE_METHODS)} as keys")
+            if mode not in SERVICE_CALL_MODES:
+                raise InvalidParameterError("serviceCallModes", f"one of {', '.join(SERVICE_CALL_MODES)} as modes")
+
+        # post_beef_array batching (ARC /v1/txs); a batch size of 0 posts each BEEF with post_beef
+        batch_size = self.options.get("postBeefBatchSize")
+        self.post_beef_batch_size = POST_BEEF_BATCH_SIZE if batch_size is None else batch_size
+        self.post_beef_concurrency = self.options.get("postBeefConcurrency") or POST_BEEF_CONCURRENCY
+
+    def get_cache_stats(self) -> dict[str, dict[str, int]]:
+        """Return size and hit/miss/eviction/expiration counters of each service cache."""
+        return {
+            "rawTx": self.raw_tx_cache.stats(),
+            "merklePath": self.merkle_path_cache.stats(),
+            "header": self.header_cache.stats(),
+            "utxoStatus": self.utxo_status_cache.stats(),
+            "scriptHistory": self.script_history_cache.stats(),
+            "transactionStatus": self.transaction_status_cache.stats(),
+        }
+
+    def invalidate_header_cache(self, from_height: int) -> int:
+        """Drop cached headers by height at or above ``from_height``.
+
+        Called when a reorg replaces the active chain above a fork point, so height
+        lookups stop serving headers of the deactivated branch. Headers cached by
+        hash stay valid.
+
+        Args:
+            from_height: Lowest height whose cached header may have changed
+
+        Returns:
+            Number of cache entries removed
+        """
+
+        def replaced(key: str) -> bool:
+            prefix, _, height = key.partition(":")
+            return prefix in {"headerHeight", "headerBytes"} and int(height) >= from_height
+
+        return self.header_cache.clear_matching(replaced)
+
+    def get_http_stats(self) -> dict[str, dict[str, int]]:
+        """Return per-host request, error, connection opened/reused and throttled counters of the HTTP transport."""
+        return self.http_transport.stats()
 
     def _get_http_client(self) -> Any:
-        """Get the HTTP client for making requests.
+        """Get the async HTTP client shared by the providers of this instance.
+
+        The client of ``http_transport`` keeps one keep-alive connection pool
+        per event loop, so requests made through the shared loop (sync API) or
+        the caller's loop (``*_async`` API) reuse connections.
 
         Returns:
             HTTP client instance with fetch method for making HTTP requests.
         """
-        return ToolboxHttpClient()
+        return self.http_transport.async_client
+
+    async def close_async(self) -> None:
+        """Close the pooled HTTP connections opened on the running event loop.
+
+        Call before closing an event loop that used the ``*_async`` API; the
+        shared loop behind the synchronous API keeps its connections open.
+        """
+        await self._get_http_client().close()
+
+    def close(self) -> None:
+        """Close the pooled HTTP connections of the synchronous providers (ARC, Bitails)."""
+        self.http_transport.close()
 
     def get_services_call_history(self, reset: bool = False) -> dict[str, Any]:
         """Get complete call history across all services with optional reset.
@@ -481,7 +498,8 @@ class Services(WalletServices):
             reset: If true, start new history intervals for all services
 
         Returns:
-            dict with version and per-service call histories
+            dict with version and per-service call histories; with adaptive
+            ranking each history also lists its providers best first
 
         Reference:
             - toolbox/ts-wallet-toolbox/src/services/Services.ts#getServicesCallHistory
@@ -494,6 +512,9 @@ class Services(WalletServices):
             "getUtxoStatus": self.get_utxo_status_services.get_service_call_history(reset),
             "getScriptHistory": self.get_script_history_services.get_service_call_history(reset),
             "getTransactionStatus": self.get_transaction_status_services.get_service_call_history(reset),
+            "getRawTxs": self.get_raw_txs_services.get_service_call_history(reset),
+            "getTransactionStatuses": self.get_transaction_statuses_services.get_service_call_history(reset),
+            "getUtxoStatuses": self.get_utxo_statuses_services.get_service_call_history(reset),
         }
 
     @staticmethod
@@ -510,6 +531,108 @@ class Services(WalletServices):
             return _get_async_runner().run(coro_or_result)
         return coro_or_result
 
+    @staticmethod
+    async def _call_provider(fn: Callable[..., Any], *args: Any) -> Any:
+        """Call a provider method from the event loop.
+
+        Coroutine functions are awaited; synchronous providers (ARC, Bitails)
+        run on the loop's executor so they do not block concurrent requests.
+        """
+        if asyncio.iscoroutinefunction(fn):
+            return await fn(*args)
+        r = await asyncio.get_running_loop().run_in_executor(None, partial(fn, *args))
+        if inspect.isawaitable(r):
+            r = await r
+        return r
+
+    @staticmethod
+    def _validate_txid(txid: Any) -> None:
+        """Raise InvalidParameterError unless txid is a 64 character hex string."""
+        if not isinstance(txid, str):
+            raise InvalidParameterError("txid", "a string")
+        if len(txid) != 64:
+            raise InvalidParameterError("txid", "64 hex characters")
+        try:
+            int(txid, 16)
+        except ValueError:
+            raise InvalidParameterError("txid", "a valid hexadecimal string")
+
+    def _call_mode(self, method: str) -> str:
+        """Return the provider call mode ("failover" or "hedged") configured for a service method."""
+        return self.service_call_modes.get(method, "failover")
+
+    @staticmethod
+    async def _hedged_call_async(
+        services: ServiceCollection[Callable],
+        providers: list[dict[str, Any]],
+        invoke: Callable[[ServiceToCall[Callable]], Any],
+        check: Callable[[ServiceToCall[Callable], Any], Any],
+    ) -> tuple[ServiceToCall[Callable] | None, Any]:
+        """Call the providers of a collection with hedging and return the first valid result.
+
+        The current provider is started first. Whenever the running providers
+        have not produced a valid result within the latency budget of the last
+        started provider (see ``ServiceCollection.hedge_delay_msecs``), or a
+        provider answers with an invalid result, the next provider is started.
+        The first result accepted by ``check`` wins and the remaining calls are
+        cancelled.
+
+        Args:
+            services: Provider collection, records the calls
+            providers: Provider entries in calling order (from ``ranked_services``)
+            invoke: Calls the provider of a ServiceToCall, returning a result or awaitable
+            check: Validates a response and records the call outcome; returns a
+                truthy value for an accepted response
+
+        Returns:
+            (winning provider, value returned by check), or (None, None) if no
+            provider produced a valid result
+        """
+        loop = asyncio.get_running_loop()
+        pending: dict[asyncio.Future[Any], ServiceToCall[Callable]] = {}
+        started: list[ServiceToCall[Callable]] = []
+
+        async def call(stc: ServiceToCall[Callable]) -> Any:
+            if asyncio.iscoroutinefunction(stc.service):
+                r = invoke(stc)
+            else:
+                # Synchronous providers must not block the event loop
+                r = await loop.run_in_executor(None, invoke, stc)
+            if inspect.isawaitable(r):
+                r = await r
+            return r
+
+        def start_next() -> None:
+            stc = services.service_to_call_for(providers[len(started)])
+            started.append(stc)
+            pending[asyncio.ensure_future(call(stc))] = stc
+
+        try:
+            if providers:
+                start_next()
+            while pending:
+                budget = None
+                if len(started) < len(providers):
+                    budget = services.hedge_delay_msecs(started[-1].provider_name) / 1000
+                done, _ = await asyncio.wait(pending, timeout=budget, return_when=asyncio.FIRST_COMPLETED)
+                for fut in done:
+                    stc = pending.pop(fut)
+                    try:
+                        value = check(stc, fut.result())
+                    except Exception as e:
+                        services.add_service_call_error(stc, e)
+                        continue
+                    if value:
+                        return stc, value
+                # Budget elapsed or only invalid answers so far: hedge with the next provider
+                if len(started) < len(providers):
+                    start_next()
+            return None, None
+        finally:
+            # Cancel the losers; synchronous providers already running finish in the executor
+            for fut in pending:
+                fut.cancel()
+
     def get_chain_tracker(self) -> ChainTracker:
         """Get ChainTracker instance for Merkle proof verification.
 
@@ -536,9 +659,9 @@ class Services(WalletServices):
             - ts-wallet-toolbox/src/services/Services.ts#getHeight
             - go-wallet-toolbox/pkg/services/services.go#CurrentHeight
         """
-        return self._run_async(self._get_height_async())
+        return self._run_async(self.get_height_async())
 
-    async def _get_height_async(self) -> int | None:
+    async def get_height_async(self) -> int | None:
         """Async implementation of get_height with provider fallback."""
         # 1. Try Chaintracks first (if configured)
         chaintracks = self.options.get("chaintracks") if isinstance(self.options, dict) else None
@@ -575,9 +698,9 @@ class Services(WalletServices):
         Reference:
             - toolbox/ts-wallet-toolbox/src/services/Services.ts#getPresentHeight
         """
-        return self._run_async(self._get_present_height_async())
+        return self._run_async(self.get_present_height_async())
 
-    async def _get_present_height_async(self) -> int:
+    async def get_present_height_async(self) -> int:
         """Async implementation of get_present_height with provider fallback."""
         # 1. Try Chaintracks first (if configured)
         chaintracks = self.options.get("chaintracks") if isinstance(self.options, dict) else None
@@ -604,6 +727,15 @@ class Services(WalletServices):
         except ValueError as exc:
             raise InvalidParameterError("hash", "a valid hexadecimal string") from exc
 
+        cache_key = f"headerHash:{block_hash.lower()}"
+        cached = self.header_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        return await self._single_flight.do_async(cache_key, lambda: self._fetch_header_for_block_hash(block_hash))
+
+    async def _fetch_header_for_block_hash(self, block_hash: str) -> dict[str, Any]:
+        cache_key = f"headerHash:{block_hash.lower()}"
         header: Any | None = None
         chaintracks = self.options.get("chaintracks") if isinstance(self.options, dict) else None
         if chaintracks:
@@ -621,19 +753,19 @@ class Services(WalletServices):
         if not header:
             raise InvalidParameterError("hash", f"blockhash '{block_hash}' not found on chain {self.chain}")
 
-        if isinstance(header, dict):
-            return header
-
-        return {
-            "version": getattr(header, "version", None),
-            "previousHash": getattr(header, "previousHash", None),
-            "merkleRoot": getattr(header, "merkleRoot", None),
-            "time": getattr(header, "time", None),
-            "bits": getattr(header, "bits", None),
-            "nonce": getattr(header, "nonce", None),
-            "height": getattr(header, "height", None),
-            "hash": getattr(header, "hash", block_hash),
-        }
+        if not isinstance(header, dict):
+            header = {
+                "version": getattr(header, "version", None),
+                "previousHash": getattr(header, "previousHash", None),
+                "merkleRoot": getattr(header, "merkleRoot", None),
+                "time": getattr(header, "time", None),
+                "bits": getattr(header, "bits", None),
+                "nonce": getattr(header, "nonce", None),
+                "height": getattr(header, "height", None),
+                "hash": getattr(header, "hash", block_hash),
+            }
+        self.header_cache.set(cache_key, header, self.cache_ttl_msecs["header"])
+        return header
 
     def hash_to_header(self, block_hash: str) -> dict[str, Any]:
         """Resolve a block header for the given block hash (synchronous wrapper)."""
@@ -662,10 +794,22 @@ class Services(WalletServices):
             - ts-wallet-toolbox/src/services/Services.ts#getHeaderForHeight
             - go-wallet-toolbox/pkg/services/services.go#ChainHeaderByHeight
         """
-        return self._run_async(self._get_header_for_height_async(height))
+        return self._run_async(self.get_header_for_height_async(height))
 
-    async def _get_header_for_height_async(self, height: int) -> bytes:
+    async def get_header_for_height_async(self, height: int) -> bytes:
         """Async implementation of get_header_for_height with provider fallback."""
+        cache_key = f"headerBytes:{height}"
+        cached = self.header_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        header_bytes = await self._single_flight.do_async(
+            cache_key, lambda: self._fetch_header_bytes_for_height(height)
+        )
+        if header_bytes:
+            self.header_cache.set(cache_key, header_bytes, self.cache_ttl_msecs["header"])
+        return header_bytes
+
+    async def _fetch_header_bytes_for_height(self, height: int) -> bytes:
         from .chaintracker.chaintracks.util.block_header_utilities import serialize_base_block_header
 
         # 1. Try Chaintracks first (if configured)
@@ -701,10 +845,20 @@ class Services(WalletServices):
         Reference:
             - toolbox/ts-wallet-toolbox/src/services/Services.ts#findHeaderForHeight
         """
-        return self._run_async(self._find_header_for_height_async(height))
+        return self._run_async(self.find_header_for_height_async(height))
 
-    async def _find_header_for_height_async(self, height: int) -> dict[str, Any] | None:
+    async def find_header_for_height_async(self, height: int) -> dict[str, Any] | None:
         """Async implementation of find_header_for_height with provider fallback."""
+        cache_key = f"headerHeight:{height}"
+        cached = self.header_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        header = await self._single_flight.do_async(cache_key, lambda: self._fetch_header_for_height(height))
+        if header is not None:
+            self.header_cache.set(cache_key, header, self.cache_ttl_msecs["header"])
+        return header
+
+    async def _fetch_header_for_height(self, height: int) -> dict[str, Any] | None:
         # 1. Try Chaintracks first (if configured)
         chaintracks = self.options.get("chaintracks") if isinstance(self.options, dict) else None
         if chaintracks:
@@ -904,92 +1058,54 @@ class Services(WalletServices):
         Reference:
             - toolbox/ts-wallet-toolbox/src/services/Services.ts#getRawTx
         """
-        # Validate txid format
-        if not isinstance(txid, str):
-            raise InvalidParameterError("txid", "a string")
-        if len(txid) != 64:
-            raise InvalidParameterError("txid", "64 hex characters")
-        try:
-            int(txid, 16)
-        except ValueError:
-            raise InvalidParameterError("txid", "a valid hexadecimal string")
+        self._validate_txid(txid)
+        cache_key = f"rawTx:{txid.lower()}"
+        cached = self.raw_tx_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        return self._run_async(self._get_raw_tx_uncached(txid, cache_key, use_next))
+
+    async def get_raw_tx_async(self, txid: str, use_next: bool = False) -> str | None:
+        """Async variant of get_raw_tx, running the provider calls on the caller's event loop."""
+        self._validate_txid(txid)
+        cache_key = f"rawTx:{txid.lower()}"
+        cached = self.raw_tx_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        return await self._get_raw_tx_uncached(txid, cache_key, use_next)
+
+    async def _get_raw_tx_uncached(self, txid: str, cache_key: str, use_next: bool) -> str | None:
+        return await self._single_flight.do_async(
+            f"getRawTx:{txid.lower()}:{use_next}", lambda: self._get_raw_tx_from_services(txid, cache_key, use_next)
+        )
 
+    async def _get_raw_tx_from_services(self, txid: str, cache_key: str, use_next: bool) -> str | None:
         services = self.get_raw_tx_services
-        if use_next:
-            services.next()
+        providers = services.ranked_services(bool(use_next))
 
         result: dict[str, Any] = {"txid": txid}
 
-        for _tries in range(services.count):
-            service_to_call = services.service_to_call
+        if self._call_mode("getRawTx") == "hedged":
+            # Note: get_raw_tx takes only txid, unlike get_merkle_path which also takes services
+            _stc, raw_tx_hex = await self._hedged_call_async(
+                services,
+                providers,
+                lambda stc: stc.service(txid),
+                lambda stc, r: self._check_raw_tx_response(services, stc, r, txid, result),
+            )
+            if raw_tx_hex:
+                self.raw_tx_cache.set(cache_key, raw_tx_hex, self.cache_ttl_msecs["rawTx"])
+            return raw_tx_hex
+
+        for provider in providers:
+            service_to_call = services.service_to_call_for(provider)
             try:
-                # Call service (handle async if needed)
                 # Note: get_raw_tx takes only txid, unlike get_merkle_path which also takes services
-                r = self._run_async(service_to_call.service(txid))
-
-                # Provider contract:
-                # - Preferred (TS-style): dict with "rawTx" and optional "error"
-                # - Legacy/py-sdk: raw hex string or None
-                if isinstance(r, dict):
-                    raw_tx_hex = r.get("rawTx")
-                    if raw_tx_hex:
-                        try:
-                            computed_txid = compute_txid_from_hex(raw_tx_hex)
-                        except (ValueError, TypeError):
-                            r["error"] = {"message": "provider returned invalid rawTx data", "code": "INVALID_DATA"}
-                            r.pop("rawTx", None)
-                        else:
-                            # Validate transaction hash matches
-                            if computed_txid.lower() == txid.lower():
-                                # Match found
-                                result["rawTx"] = raw_tx_hex
-                                result["name"] = r.get("name")
-                                result.pop("error", None)
-                                services.add_service_call_success(service_to_call)
-                                return raw_tx_hex
-
-                            # Hash mismatch - mark as error
-                            r["error"] = {
-                                "message": f"computed txid {computed_txid} doesn't match requested value {txid}",
-                                "code": "TXID_MISMATCH",
-                            }
-                            r.pop("rawTx", None)
-
-                    if r.get("error"):
-                        services.add_service_call_error(service_to_call, r["error"])
-                        if "error" not in result:
-                            result["error"] = r["error"]
-                    elif not r.get("rawTx"):
-                        services.add_service_call_success(service_to_call, "not found")
-                    else:
-                        services.add_service_call_failure(service_to_call)
-                elif isinstance(r, str):
-                    # Backwards-compatible path for providers that return raw hex directly.
-                    try:
-                        computed_txid = compute_txid_from_hex(r)
-                    except (ValueError, TypeError):
-                        # Treat invalid hex as provider failure.
-                        services.add_service_call_failure(service_to_call, "invalid data")
-                    else:
-                        if computed_txid.lower() == txid.lower():
-                            # Match found
-                            result["rawTx"] = r
-                            result["name"] = getattr(service_to_call, "provider_name", None)
-                            result.pop("error", None)
-                            services.add_service_call_success(service_to_call)
-                            return r
-
-                        # Hash mismatch - mark as error
-                        error = {
-                            "message": f"computed txid {computed_txid} doesn't match requested value {txid}",
-                            "code": "TXID_MISMATCH",
-                        }
-                        services.add_service_call_error(service_to_call, error)
-                        if "error" not in result:
-                            result["error"] = error
-                else:
-                    # None or unsupported type -> treat as not found
-                    services.add_service_call_success(service_to_call, "not found")
+                r = await self._call_provider(service_to_call.service, txid)
+                raw_tx_hex = self._check_raw_tx_response(services, service_to_call, r, txid, result)
+                if raw_tx_hex:
+                    self.raw_tx_cache.set(cache_key, raw_tx_hex, self.cache_ttl_msecs["rawTx"])
+                    return raw_tx_hex
 
             except Exception as e:
                 services.add_service_call_error(service_to_call, e)
@@ -1000,6 +1116,84 @@ class Services(WalletServices):
 
         return None
 
+    @staticmethod
+    def _check_raw_tx_response(
+        services: ServiceCollection[Callable],
+        service_to_call: ServiceToCall[Callable],
+        r: Any,
+        txid: str,
+        result: dict[str, Any],
+    ) -> str | None:
+        """Validate one getRawTx provider response and record the call outcome.
+
+        Returns:
+            The raw transaction hex if its hash matches txid, otherwise None
+        """
+        # Provider contract:
+        # - Preferred (TS-style): dict with "rawTx" and optional "error"
+        # - Legacy/py-sdk: raw hex string or None
+        if isinstance(r, dict):
+            raw_tx_hex = r.get("rawTx")
+            if raw_tx_hex:
+                try:
+                    computed_txid = compute_txid_from_hex(raw_tx_hex)
+                except (ValueError, TypeError):
+                    r["error"] = {"message": "provider returned invalid rawTx data", "code": "INVALID_DATA"}
+                    r.pop("rawTx", None)
+                else:
+                    # Validate transaction hash matches
+                    if computed_txid.lower() == txid.lower():
+                        # Match found
+                        result["rawTx"] = raw_tx_hex
+                        result["name"] = r.get("name")
+                        result.pop("error", None)
+                        services.add_service_call_success(service_to_call)
+                        return raw_tx_hex
+
+                    # Hash mismatch - mark as error
+                    r["error"] = {
+                        "message": f"computed txid {computed_txid} doesn't match requested value {txid}",
+                        "code": "TXID_MISMATCH",
+                    }
+                    r.pop("rawTx", None)
+
+            if r.get("error"):
+                services.add_service_call_error(service_to_call, r["error"])
+                if "error" not in result:
+                    result["error"] = r["error"]
+            elif not r.get("rawTx"):
+                services.add_service_call_success(service_to_call, "not found")
+            else:
+                services.add_service_call_failure(service_to_call)
+        elif isinstance(r, str):
+            # Backwards-compatible path for providers that return raw hex directly.
+            try:
+                computed_txid = compute_txid_from_hex(r)
+            except (ValueError, TypeError):
+                # Treat invalid hex as provider failure.
+                services.add_service_call_failure(service_to_call, "invalid data")
+            else:
+                if computed_txid.lower() == txid.lower():
+                    # Match found
+                    result["rawTx"] = r
+                    result["name"] = getattr(service_to_call, "provider_name", None)
+                    result.pop("error", None)
+                    services.add_service_call_success(service_to_call)
+                    return r
+
+                # Hash mismatch - mark as error
+                error = {
+                    "message": f"computed txid {computed_txid} doesn't match requested value {txid}",
+                    "code": "TXID_MISMATCH",
+                }
+                services.add_service_call_error(service_to_call, error)
+                if "error" not in result:
+                    result["error"] = error
+        else:
+            # None or unsupported type -> treat as not found
+            services.add_service_call_success(service_to_call, "not found")
+        return None
+
     def is_valid_root_for_height(self, root: str, height: int) -> bool:
         """Verify if a Merkle root is valid for a given block height.
 
@@ -1043,75 +1237,104 @@ class Services(WalletServices):
         Reference:
             - toolbox/ts-wallet-toolbox/src/services/Services.ts#getMerklePath
         """
-        # Validate txid format
-        if not isinstance(txid, str):
-            raise InvalidParameterError("txid", "a string")
-        if len(txid) != 64:
-            raise InvalidParameterError("txid", "64 hex characters")
-        try:
-            int(txid, 16)
-        except ValueError:
-            raise InvalidParameterError("txid", "a valid hexadecimal string")
-
-        # Generate cache key
+        self._validate_txid(txid)
         cache_key = f"merklePath:{txid}"
+        cached = self.merkle_path_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        return self._run_async(self._get_merkle_path_uncached(txid, cache_key, use_next))
+
+    async def get_merkle_path_async(self, txid: str, use_next: bool = False) -> dict[str, Any]:
+        """Alias for get_merkle_path_for_transaction_async."""
+        return await self.get_merkle_path_for_transaction_async(txid, use_next)
 
-        # Check cache first
+    async def get_merkle_path_for_transaction_async(self, txid: str, use_next: bool = False) -> dict[str, Any]:
+        """Async variant of get_merkle_path_for_transaction."""
+        self._validate_txid(txid)
+        cache_key = f"merklePath:{txid}"
         cached = self.merkle_path_cache.get(cache_key)
         if cached is not None:
             return cached
+        return await self._get_merkle_path_uncached(txid, cache_key, use_next)
 
+    async def _get_merkle_path_uncached(self, txid: str, cache_key: str, use_next: bool) -> dict[str, Any]:
+        return await self._single_flight.do_async(
+            f"getMerklePath:{txid}:{use_next}", lambda: self._get_merkle_path_from_services(txid, cache_key, use_next)
+        )
+
+    async def _get_merkle_path_from_services(self, txid: str, cache_key: str, use_next: bool) -> dict[str, Any]:
         # Multi-provider failover loop (matching TypeScript behavior)
         services = self.get_merkle_path_services
-        if use_next:
-            services.next()
+        providers = services.ranked_services(bool(use_next))
 
         result: dict[str, Any] = {"notes": []}
         last_error: dict[str, Any] | None = None
 
-        for _tries in range(services.count):
-            service_to_call = services.service_to_call
-            try:
-                # Call service (handle async if needed)
-                r = self._run_async(service_to_call.service(txid, self))
-
-                # Collect notes from all providers
-                if isinstance(r, dict) and r.get("notes"):
-                    result["notes"].extend(r["notes"])
-
-                # Record provider name on first response
-                if "name" not in result:
-                    result["name"] = r.get("name")
-
-                # If we have a merkle path, we're done
-                if isinstance(r, dict) and r.get("merklePath"):
-                    result["merklePath"] = r["merklePath"]
-                    result["header"] = r.get("header")
-                    result["name"] = r.get("name")
-                    result.pop("error", None)
-                    services.add_service_call_success(service_to_call)
-                    break
+        if self._call_mode("getMerklePath") == "hedged":
+            await self._hedged_call_async(
+                services,
+                providers,
+                lambda stc: stc.service(txid, self),
+                lambda stc, r: self._check_merkle_path_response(services, stc, r, result),
+            )
+        else:
+            for provider in providers:
+                service_to_call = services.service_to_call_for(provider)
+                try:
+                    r = await self._call_provider(service_to_call.service, txid, self)
+                    if self._check_merkle_path_response(services, service_to_call, r, result):
+                        break
 
-                # Record errors/failures
-                if isinstance(r, dict) and r.get("error"):
-                    services.add_service_call_error(service_to_call, r["error"])
+                except Exception as e:
+                    services.add_service_call_error(service_to_call, e)
+                    last_error = {"message": str(e), "code": "PROVIDER_ERROR"}
                     if "error" not in result:
-                        result["error"] = r["error"]
-                else:
-                    services.add_service_call_failure(service_to_call)
-
-            except Exception as e:
-                services.add_service_call_error(service_to_call, e)
-                last_error = {"message": str(e), "code": "PROVIDER_ERROR"}
-                if "error" not in result:
-                    result["error"] = last_error
+                        result["error"] = last_error
 
-            services.next()
+                services.next()
 
         # Cache and return result
-        self.merkle_path_cache.set(cache_key, result, CACHE_TTL_MSECS)
+        self.merkle_path_cache.set(cache_key, result, self.cache_ttl_msecs["merklePath"])
         return result
 
+    @staticmethod
+    def _check_merkle_path_response(
+        services: ServiceCollection[Callable],
+        service_to_call: ServiceToCall[Callable],
+        r: Any,
+        result: dict[str, Any],
+    ) -> bool:
+        """Merge one getMerklePath provider response into result and record the call outcome.
+
+        Returns:
+            True if the response carried a merkle path
+        """
+        # Collect notes from all providers
+        if isinstance(r, dict) and r.get("notes"):
+            result["notes"].extend(r["notes"])
+
+        # Record provider name on first response
+        if "name" not in result:
+            result["name"] = r.get("name")
+
+        # If we have a merkle path, we're done
+        if isinstance(r, dict) and r.get("merklePath"):
+            result["merklePath"] = r["merklePath"]
+            result["header"] = r.get("header")
+            result["name"] = r.get("name")
+            result.pop("error", None)
+            services.add_service_call_success(service_to_call)
+            return True
+
+        # Record errors/failures
+        if isinstance(r, dict) and r.get("error"):
+            services.add_service_call_error(service_to_call, r["error"])
+            if "error" not in result:
+                result["error"] = r["error"]
+        else:
+            services.add_service_call_failure(service_to_call)
+        return False
+
     def find_chain_tip_header(self) -> dict[str, Any]:
         """Return the active chain tip header (structured dict).
 
@@ -1235,7 +1458,30 @@ class Services(WalletServices):
         Reference:
             - toolbox/ts-wallet-toolbox/src/services/Services.ts#getUtxoStatus
         """
-        # Validate output parameter
+        self._validate_utxo_status_output(output, output_format)
+        cache_key = f"utxo:{output}:{output_format}:{outpoint}"
+        cached = self.utxo_status_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        return self._run_async(self._get_utxo_status_uncached(output, output_format, outpoint, cache_key, use_next))
+
+    async def get_utxo_status_async(
+        self,
+        output: str,
+        output_format: str | None = None,
+        outpoint: str | None = None,
+        use_next: bool | None = None,
+    ) -> dict[str, Any]:
+        """Async variant of get_utxo_status."""
+        self._validate_utxo_status_output(output, output_format)
+        cache_key = f"utxo:{output}:{output_format}:{outpoint}"
+        cached = self.utxo_status_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        return await self._get_utxo_status_uncached(output, output_format, outpoint, cache_key, use_next)
+
+    @staticmethod
+    def _validate_utxo_status_output(output: Any, output_format: str | None) -> None:
         if not isinstance(output, str):
             raise InvalidParameterError("output", "a string")
         if len(output.strip()) == 0:
@@ -1250,14 +1496,27 @@ class Services(WalletServices):
             if len(output) != 64:
                 raise InvalidParameterError("output", "64 hex characters")
 
-        # Generate cache key from parameters
-        cache_key = f"utxo:{output}:{output_format}:{outpoint}"
-
-        # Check cache first
-        cached = self.utxo_status_cache.get(cache_key)
-        if cached is not None:
-            return cached
+    async def _get_utxo_status_uncached(
+        self,
+        output: str,
+        output_format: str | None,
+        outpoint: str | None,
+        cache_key: str,
+        use_next: bool | None,
+    ) -> dict[str, Any]:
+        return await self._single_flight.do_async(
+            f"getUtxoStatus:{output}:{output_format}:{outpoint}:{use_next}",
+            lambda: self._get_utxo_status_from_services(output, output_format, outpoint, cache_key, use_next),
+        )
 
+    async def _get_utxo_status_from_services(
+        self,
+        output: str,
+        output_format: str | None,
+        outpoint: str | None,
+        cache_key: str,
+        use_next: bool | None,
+    ) -> dict[str, Any]:
         # Initialize result
         result: dict[str, Any] = {
             "name": "<noservices>",
@@ -1267,31 +1526,34 @@ class Services(WalletServices):
         }
 
         services = self.get_utxo_status_services
-        if use_next:
-            services.next()
+        providers = services.ranked_services(bool(use_next))
+
+        hedged = self._call_mode("getUtxoStatus") == "hedged"
 
         # Retry loop: up to 2 attempts
         for _retry in range(2):
-            for _tries in range(services.count):
-                service_to_call = services.service_to_call
+            if hedged:
+                _stc, r = await self._hedged_call_async(
+                    services,
+                    providers,
+                    lambda stc: stc.service(output, output_format, outpoint),
+                    lambda stc, r: self._check_utxo_status_response(services, stc, r),
+                )
+                if r is not None:
+                    self.utxo_status_cache.set(cache_key, r, self.cache_ttl_msecs["utxoStatus"])
+                    return r
+                continue
+
+            for provider in providers:
+                service_to_call = services.service_to_call_for(provider)
                 try:
-                    # Call service (handle async if needed)
-                    if asyncio.iscoroutinefunction(service_to_call.service):
-                        r = self._run_async(service_to_call.service(output, output_format, outpoint))
-                    else:
-                        r = service_to_call.service(output, output_format, outpoint)
+                    r = await self._call_provider(service_to_call.service, output, output_format, outpoint)
 
-                    if isinstance(r, dict) and r.get("status") == "success":
+                    if self._check_utxo_status_response(services, service_to_call, r) is not None:
                         # Success - cache and return
-                        services.add_service_call_success(service_to_call)
                         result = r
-                        self.utxo_status_cache.set(cache_key, result, CACHE_TTL_MSECS)
+                        self.utxo_status_cache.set(cache_key, result, self.cache_ttl_msecs["utxoStatus"])
                         return result
-                    # Failure or not found
-                    elif isinstance(r, dict) and r.get("error"):
-                        services.add_service_call_error(service_to_call, r["error"])
-                    else:
-                        services.add_service_call_failure(service_to_call)
 
                 except Exception as e:
                     services.add_service_call_error(service_to_call, e)
@@ -1303,9 +1565,30 @@ class Services(WalletServices):
                 break
 
         # Cache and return result
-        self.utxo_status_cache.set(cache_key, result, CACHE_TTL_MSECS)
+        self.utxo_status_cache.set(cache_key, result, self.cache_ttl_msecs["utxoStatus"])
         return result
 
+    @staticmethod
+    def _check_utxo_status_response(
+        services: ServiceCollection[Callable],
+        service_to_call: ServiceToCall[Callable],
+        r: Any,
+    ) -> dict[str, Any] | None:
+        """Record the outcome of one getUtxoStatus provider response.
+
+        Returns:
+            The response if its status is "success", otherwise None
+        """
+        if isinstance(r, dict) and r.get("status") == "success":
+            services.add_service_call_success(service_to_call)
+            return r
+        # Failure or not found
+        if isinstance(r, dict) and r.get("error"):
+            services.add_service_call_error(service_to_call, r["error"])
+        else:
+            services.add_service_call_failure(service_to_call)
+        return None
+
     def get_script_history(self, script_hash: str, use_next: bool | None = None) -> dict[str, Any]:
         """Get script history via provider with multi-provider failover and 2-minute caching.
 
@@ -1326,7 +1609,22 @@ class Services(WalletServices):
         Reference:
             - toolbox/ts-wallet-toolbox/src/services/Services.ts#getScriptHashHistory
         """
-        # Validate script_hash format
+        self._validate_script_hash(script_hash)
+        cached = self.script_history_cache.get(f"scriptHistory:{script_hash}")
+        if cached is not None:
+            return cached
+        return self._run_async(self._get_script_history_from_services(script_hash, use_next))
+
+    async def get_script_history_async(self, script_hash: str, use_next: bool | None = None) -> dict[str, Any]:
+        """Async variant of get_script_history."""
+        self._validate_script_hash(script_hash)
+        cached = self.script_history_cache.get(f"scriptHistory:{script_hash}")
+        if cached is not None:
+            return cached
+        return await self._get_script_history_from_services(script_hash, use_next)
+
+    @staticmethod
+    def _validate_script_hash(script_hash: Any) -> None:
         if not isinstance(script_hash, str):
             raise InvalidParameterError("script_hash", "a string")
         if len(script_hash.strip()) == 0:
@@ -1337,13 +1635,9 @@ class Services(WalletServices):
             bytes.fromhex(script_hash)
         except ValueError:
             raise InvalidParameterError("script_hash", "a valid hexadecimal string")
-        # Generate cache key
-        cache_key = f"scriptHistory:{script_hash}"
 
-        # Check cache first
-        cached = self.script_history_cache.get(cache_key)
-        if cached is not None:
-            return cached
+    async def _get_script_history_from_services(self, script_hash: str, use_next: bool | None) -> dict[str, Any]:
+        cache_key = f"scriptHistory:{script_hash}"
 
         # Initialize result
         result: dict[str, Any] = {
@@ -1354,27 +1648,19 @@ class Services(WalletServices):
         }
 
         services = self.get_script_history_services
-        if use_next:
-            services.next()
-
-        # For mocked service collections (tests), return no services available
-        # Allow mock to proceed if it has count set and service_to_call
+        providers = services.ranked_services(bool(use_next))
 
         # Failover loop
-        for _tries in range(services.count):
-            service_to_call = services.service_to_call
+        for provider in providers:
+            service_to_call = services.service_to_call_for(provider)
             try:
-                # Call service (handle async if needed)
-                if asyncio.iscoroutinefunction(service_to_call.service):
-                    r = self._run_async(service_to_call.service(script_hash))
-                else:
-                    r = service_to_call.service(script_hash)
+                r = await self._call_provider(service_to_call.service, script_hash)
 
                 if isinstance(r, dict) and r.get("status") == "success":
                     # Success - cache and return
                     result = r
                     services.add_service_call_success(service_to_call)
-                    self.script_history_cache.set(cache_key, result, CACHE_TTL_MSECS)
+                    self.script_history_cache.set(cache_key, result, self.cache_ttl_msecs["scriptHistory"])
                     return result
                 # Failure or not found
                 elif isinstance(r, dict) and r.get("error"):
@@ -1388,7 +1674,7 @@ class Services(WalletServices):
             services.next()
 
         # Cache and return result
-        self.script_history_cache.set(cache_key, result, CACHE_TTL_MSECS)
+        self.script_history_cache.set(cache_key, result, self.cache_ttl_msecs["scriptHistory"])
         return result
 
     def get_transaction_status(self, txid: str, use_next: bool | None = None) -> dict[str, Any]:
@@ -1409,23 +1695,22 @@ class Services(WalletServices):
         Reference:
             - toolbox/ts-wallet-toolbox/src/services/Services.ts#getStatusForTxids
         """
-        # Validate txid format
-        if not isinstance(txid, str):
-            raise InvalidParameterError("txid", "a string")
-        if len(txid) != 64:
-            raise InvalidParameterError("txid", "64 hex characters")
-        try:
-            int(txid, 16)
-        except ValueError:
-            raise InvalidParameterError("txid", "a valid hexadecimal string")
-
-        # Generate cache key
-        cache_key = f"txStatus:{txid}"
+        self._validate_txid(txid)
+        cached = self.transaction_status_cache.get(f"txStatus:{txid}")
+        if cached is not None:
+            return cached
+        return self._run_async(self._get_transaction_status_from_services(txid, use_next))
 
-        # Check cache first
-        cached = self.transaction_status_cache.get(cache_key)
+    async def get_transaction_status_async(self, txid: str, use_next: bool | None = None) -> dict[str, Any]:
+        """Async variant of get_transaction_status."""
+        self._validate_txid(txid)
+        cached = self.transaction_status_cache.get(f"txStatus:{txid}")
         if cached is not None:
             return cached
+        return await self._get_transaction_status_from_services(txid, use_next)
+
+    async def _get_transaction_status_from_services(self, txid: str, use_next: bool | None) -> dict[str, Any]:
+        cache_key = f"txStatus:{txid}"
 
         # Initialize result
         result: dict[str, Any] = {
@@ -1435,25 +1720,20 @@ class Services(WalletServices):
         }
 
         services = self.get_transaction_status_services
-        if use_next:
-            services.next()
-
-        # For mocked service collections (tests), return no services available
-        # Allow mock to proceed if it has count set and service_to_call
+        providers = services.ranked_services(bool(use_next))
 
         # Failover loop
-        for _tries in range(services.count):
-            service_to_call = services.service_to_call
+        for provider in providers:
+            service_to_call = services.service_to_call_for(provider)
             try:
-                # Call service (handle async if needed)
-                r = self._run_async(service_to_call.service(txid, use_next))
+                r = await self._call_provider(service_to_call.service, txid, use_next)
 
                 # For transaction status, any response with transaction data or valid status is success
                 if isinstance(r, dict) and ("status" in r or "txid" in r) and not r.get("error"):
                     # Valid transaction status - cache and return
                     result = r
                     services.add_service_call_success(service_to_call)
-                    self.transaction_status_cache.set(cache_key, result, CACHE_TTL_MSECS)
+                    self.transaction_status_cache.set(cache_key, result, self.cache_ttl_msecs["transactionStatus"])
                     return result
                 # Failure or error
                 elif isinstance(r, dict) and r.get("error"):
@@ -1467,13 +1747,240 @@ class Services(WalletServices):
             services.next()
 
         # Cache and return result
-        self.transaction_status_cache.set(cache_key, result, CACHE_TTL_MSECS)
+        self.transaction_status_cache.set(cache_key, result, self.cache_ttl_msecs["transactionStatus"])
         return result
 
+    #
+    # Batch lookups
+    #
+
+    def get_raw_txs(self, txids: list[str]) -> dict[str, str | None]:
+        """Get raw transaction hex for many txids with bulk provider requests.
+
+        Cached transactions are served from the raw tx cache; the rest are
+        requested BULK_LOOKUP_CHUNK_SIZE per request. Transactions a bulk
+        response leaves out or returns with a mismatching hash, and those of
+        failed requests, are fetched one at a time with ``get_raw_tx``.
+
+        Args:
+            txids: Transaction IDs (64-hex strings, big-endian)
+
+        Returns:
+            dict: txid -> raw transaction hex, or None if not found, in input order
+
+        Raises:
+            InvalidParameterError: If a txid is not a 64 character hex string
+        """
+        for txid in txids:
+            self._validate_txid(txid)
+        return self._run_async(self.get_raw_txs_async(txids))
+
+    async def get_raw_txs_async(self, txids: list[str]) -> dict[str, str | None]:
+        """Async variant of get_raw_txs."""
+        for txid in txids:
+            self._validate_txid(txid)
+        results: dict[str, str | None] = {}
+        missing: list[str] = []
+        for txid in dict.fromkeys(txids):
+            cached = self.raw_tx_cache.get(f"rawTx:{txid.lower()}")
+            if cached is not None:
+                results[txid] = cached
+            else:
+                missing.append(txid)
+
+        def accept(txid: str, raw_tx_hex: str | None) -> bool:
+            if raw_tx_hex is None:
+                return True
+            try:
+                if compute_txid_from_hex(raw_tx_hex).lower() != txid.lower():
+                    return False
+            except (ValueError, TypeError):
+                return False
+            self.raw_tx_cache.set(f"rawTx:{txid.lower()}", raw_tx_hex, self.cache_ttl_msecs["rawTx"])
+            return True
+
+        results.update(
+            await self._bulk_lookup_async(self.get_raw_txs_services, missing, (), accept, self.get_raw_tx_async)
+        )
+        return {txid: results[txid] for txid in txids}
+
+    def get_transaction_statuses(self, txids: list[str]) -> dict[str, dict[str, Any]]:
+        """Get the status of many transactions with bulk provider requests.
+
+        Statuses are cached like ``get_transaction_status`` results; uncached
+        txids are requested BULK_LOOKUP_CHUNK_SIZE per request, and txids a bulk
+        response leaves out, or of failed requests, fall back to
+        ``get_transaction_status``.
+
+        Args:
+            txids: Transaction IDs (hex, big-endian)
+
+        Returns:
+            dict: txid -> status object (same shape as get_transaction_status), in input order
+
+        Raises:
+            InvalidParameterError: If a txid is not a 64 character hex string
+        """
+        for txid in txids:
+            self._validate_txid(txid)
+        return self._run_async(self.get_transaction_statuses_async(txids))
+
+    async def get_transaction_statuses_async(self, txids: list[str]) -> dict[str, dict[str, Any]]:
+        """Async variant of get_transaction_statuses."""
+        for txid in txids:
+            self._validate_txid(txid)
+        results: dict[str, dict[str, Any]] = {}
+        missing: list[str] = []
+        for txid in dict.fromkeys(txids):
+            cached = self.transaction_status_cache.get(f"txStatus:{txid}")
+            if cached is not None:
+                results[txid] = cached
+            else:
+                missing.append(txid)
+
+        def accept(txid: str, status: Any) -> bool:
+            if not isinstance(status, dict) or "status" not in status or status.get("error"):
+                return False
+            self.transaction_status_cache.set(f"txStatus:{txid}", status, self.cache_ttl_msecs["transactionStatus"])
+            return True
+
+        results.update(
+            await self._bulk_lookup_async(
+                self.get_transaction_statuses_services, missing, (), accept, self.get_transaction_status_async
+            )
+        )
+        return {txid: results[txid] for txid in txids}
+
+    def get_utxo_statuses(self, script_hashes: list[str], output_format: str = "hashLE") -> dict[str, dict[str, Any]]:
+        """Get the UTXO status of many script hashes with bulk provider requests.
+
+        Statuses are cached like ``get_utxo_status`` results (without an
+        outpoint); uncached script hashes are requested BULK_LOOKUP_CHUNK_SIZE
+        per request, and those a bulk response leaves out, or of failed
+        requests, fall back to ``get_utxo_status``.
+
+        Args:
+            script_hashes: Script hashes (64 hex characters)
+            output_format: Byte order of script_hashes, 'hashLE' (default) or 'hashBE'
+
+        Returns:
+            dict: script hash -> TS-like { "name", "status", "isUtxo", "details": [...] }, in input order
+
+        Raises:
+            InvalidParameterError: If output_format or a script hash is invalid
+        """
+        self._validate_utxo_statuses_args(script_hashes, output_format)
+        return self._run_async(self.get_utxo_statuses_async(script_hashes, output_format))
+
+    async def get_utxo_statuses_async(
+        self, script_hashes: list[str], output_format: str = "hashLE"
+    ) -> dict[str, dict[str, Any]]:
+        """Async variant of get_utxo_statuses."""
+        self._validate_utxo_statuses_args(script_hashes, output_format)
+        results: dict[str, dict[str, Any]] = {}
+        missing: list[str] = []
+        for script_hash in dict.fromkeys(script_hashes):
+            cached = self.utxo_status_cache.get(f"utxo:{script_hash}:{output_format}:None")
+            if cached is not None:
+                results[script_hash] = cached
+            else:
+                missing.append(script_hash)
+
+        def accept(script_hash: str, status: Any) -> bool:
+            if not isinstance(status, dict) or status.get("status") != "success":
+                return False
+            cache_key = f"utxo:{script_hash}:{output_format}:None"
+            self.utxo_status_cache.set(cache_key, status, self.cache_ttl_msecs["utxoStatus"])
+            return True
+
+        results.update(
+            await self._bulk_lookup_async(
+                self.get_utxo_statuses_services,
+                missing,
+                (output_format,),
+                accept,
+                lambda script_hash: self.get_utxo_status_async(script_hash, output_format),
+            )
+        )
+        return {script_hash: results[script_hash] for script_hash in script_hashes}
+
+    @staticmethod
+    def _validate_utxo_statuses_args(script_hashes: list[str], output_format: str) -> None:
+        if output_format not in ("hashLE", "hashBE"):
+            raise InvalidParameterError("output_format", "'hashLE' or 'hashBE'")
+        for script_hash in script_hashes:
+            Services._validate_utxo_status_output(script_hash, output_format)
+
+    async def _bulk_lookup_async(
+        self,
+        services: ServiceCollection[Callable],
+        keys: list[str],
+        extra_args: tuple[Any, ...],
+        accept: Callable[[str, Any], bool],
+        fallback: Callable[[str], Awaitable[Any]],
+    ) -> dict[str, Any]:
+        """Look up keys with bulk provider calls, falling back to one lookup per key.
+
+        Keys are sent BULK_LOOKUP_CHUNK_SIZE per call, up to BULK_LOOKUP_CONCURRENCY
+        calls at a time, each trying the providers of ``services`` in rank order
+        until one returns a dict of results. Results rejected by ``accept`` (which
+        also caches accepted ones), keys missing from the response and keys of
+        calls every provider failed are looked up individually with ``fallback``.
+
+        Args:
+            services: Bulk providers, called as ``service(chunk, *extra_args)``
+            keys: Distinct keys to look up
+            extra_args: Further provider arguments
+            accept: Validates (and caches) one result; returns False to fall back for the key
+            fallback: Single-key lookup
+
+        Returns:
+            dict: key -> result
+        """
+        if not keys:
+            return {}
+        providers = services.ranked_services()
+        semaphore = asyncio.Semaphore(BULK_LOOKUP_CONCURRENCY)
+
+        async def lookup_chunk(chunk: list[str]) -> dict[str, Any]:
+            found: dict[str, Any] = {}
+            async with semaphore:
+                for provider in providers:
+                    stc = services.service_to_call_for(provider)
+                    try:
+                        r = await self._call_provider(stc.service, chunk, *extra_args)
+                    except Exception as e:
+                        services.add_service_call_error(stc, e)
+                        continue
+                    if isinstance(r, dict):
+                        services.add_service_call_success(stc)
+                        found = {key: r[key] for key in chunk if key in r and accept(key, r[key])}
+                        break
+                    services.add_service_call_failure(stc)
+            missing = [key for key in chunk if key not in found]
+            if missing:
+                found.update(zip(missing, await asyncio.gather(*(fallback(key) for key in missing)), strict=True))
+            return found
+
+        results: dict[str, Any] = {}
+        chunks = [keys[i : i + BULK_LOOKUP_CHUNK_SIZE] for i in range(0, len(keys), BULK_LOOKUP_CHUNK_SIZE)]
+        for found in await asyncio.gather(*(lookup_chunk(chunk) for chunk in chunks)):
+            results.update(found)
+        return results
+
     def get_tx_propagation(self, txid: str) -> dict[str, Any]:
         return self._run_async(self.whatsonchain.get_tx_propagation(txid))
 
-    def post_beef(self, beef: str) -> dict[str, Any]:
+    @staticmethod
+    def _parse_post_beef_payload(beef: str) -> tuple[Any, Transaction, str, list[str]]:
+        """Validate a post_beef payload (BEEF or raw transaction hex) and parse it.
+
+        Returns:
+            (Beef object or None, subject transaction, subject txid, all txids)
+
+        Raises:
+            InvalidParameterError: If ``beef`` is not valid hex or cannot be parsed.
+        """
         # Validate beef input
         if not isinstance(beef, str):
             raise InvalidParameterError("beef", "must be a string")
@@ -1520,6 +2027,46 @@ class Services(WalletServices):
                 detail = f"{parse_error!s}; {exc!s}" if parse_error else str(exc)
                 raise InvalidParameterError("beef", f"failed to parse as BEEF or transaction: {detail}") from exc
 
+        return beef_obj, tx, txid or tx.txid(), txids
+
+    @staticmethod
+    def _arc_broadcast_outcome(res: Any, txid: str) -> dict[str, Any] | None:
+        """Map a decisive ARC broadcast result to the post_beef shape; None lets the next provider try."""
+        if getattr(res, "status", "") == "success":
+            return {
+                "accepted": True,
+                "txid": txid,
+                "message": getattr(res, "message", "Broadcast successful"),
+            }
+        elif getattr(res, "status", "") == "rate_limited":
+            return {
+                "accepted": False,
+                "rate_limited": True,
+                "message": getattr(res, "description", "Rate limited"),
+            }
+        elif getattr(res, "double_spend", False):
+            return {
+                "accepted": False,
+                "doubleSpend": True,
+                "message": getattr(res, "description", "Double spend detected"),
+            }
+        return None
+
+    def post_beef(self, beef: str) -> dict[str, Any]:
+        """Broadcast a BEEF (or raw transaction hex), trying ARC TAAL, ARC GorillaPool, then Bitails.
+
+        Returns:
+            dict with "accepted", "txid" and "message" (plus "providerErrors" when every provider failed)
+
+        Raises:
+            InvalidParameterError: If ``beef`` is not valid hex or cannot be parsed.
+        """
+        return self._run_async(self.post_beef_async(beef))
+
+    async def post_beef_async(self, beef: str) -> dict[str, Any]:
+        """Async variant of post_beef."""
+        beef_obj, tx, txid, txids = self._parse_post_beef_payload(beef)
+
         # Debug: Log rawTx being processed
         # Check if it's AtomicBEEF format (starts with ATOMIC_BEEF_HEX_PREFIX) or raw transaction
         # Both beef and ATOMIC_BEEF_HEX_PREFIX are hex strings, so direct string comparison works
@@ -1549,30 +2096,6 @@ class Services(WalletServices):
                 beef[:200],
             )
 
-        def _fmt_arc_error(res: Any) -> str:
-            # ARC.broadcast returns PostTxResultForTxid.
-            # When it fails, res.data is typically PostTxResultForTxidError with:
-            #   - status: HTTP status code as string
-            #   - detail: ARC "detail" message
-            data = getattr(res, "data", None)
-            status = getattr(res, "status", None)
-            txid_local = getattr(res, "txid", None)
-            if data is None:
-                return f"ARC error (status={status}, txid={txid_local})"
-            detail = getattr(data, "detail", None)
-            http_status = getattr(data, "status", None)
-            more = getattr(data, "more", None)
-            parts: list[str] = []
-            if http_status:
-                parts.append(f"HTTP {http_status}")
-            if detail:
-                parts.append(str(detail))
-            elif more:
-                parts.append(str(more))
-            else:
-                parts.append(str(data))
-            return "ARC: " + " - ".join(parts)
-
         provider_errors: dict[str, str] = {}
 
         # Debug: high-level broadcast context
@@ -1592,27 +2115,12 @@ class Services(WalletServices):
                 # Handle async broadcast - ARC expects Transaction object
                 if tx is None:
                     raise ValueError("ARC broadcast requires transaction object")
-                res = self._run_async(self.arc_taal.broadcast(tx))
+                res = await self._call_provider(self.arc_taal.broadcast, tx)
 
-                if getattr(res, "status", "") == "success":
-                    return {
-                        "accepted": True,
-                        "txid": txid,
-                        "message": getattr(res, "message", "Broadcast successful"),
-                    }
-                elif getattr(res, "status", "") == "rate_limited":
-                    return {
-                        "accepted": False,
-                        "rate_limited": True,
-                        "message": getattr(res, "description", "Rate limited"),
-                    }
-                elif getattr(res, "double_spend", False):
-                    return {
-                        "accepted": False,
-                        "doubleSpend": True,
-                        "message": getattr(res, "description", "Double spend detected"),
-                    }
-                provider_errors["arcTaal"] = _fmt_arc_error(res)
+                outcome = self._arc_broadcast_outcome(res, txid)
+                if outcome is not None:
+                    return outcome
+                provider_errors["arcTaal"] = _format_arc_error(res)
                 self.logger.debug(
                     "Services.post_beef: TAAL broadcast non-success, status=%r, double_spend=%r",
                     getattr(res, "status", None),
@@ -1643,27 +2151,12 @@ class Services(WalletServices):
                             "Services.post_beef: ERROR - Transaction.hex() returns AtomicBEEF format! "
                             "This should be raw transaction hex. Transaction object may be corrupted."
                         )
-                res = self._run_async(self.arc_gorillapool.broadcast(tx))
+                res = await self._call_provider(self.arc_gorillapool.broadcast, tx)
 
-                if getattr(res, "status", "") == "success":
-                    return {
-                        "accepted": True,
-                        "txid": txid,
-                        "message": getattr(res, "message", "Broadcast successful"),
-                    }
-                elif getattr(res, "status", "") == "rate_limited":
-                    return {
-                        "accepted": False,
-                        "rate_limited": True,
-                        "message": getattr(res, "description", "Rate limited"),
-                    }
-                elif getattr(res, "double_spend", False):
-                    return {
-                        "accepted": False,
-                        "doubleSpend": True,
-                        "message": getattr(res, "description", "Double spend detected"),
-                    }
-                provider_errors["arcGorillaPool"] = _fmt_arc_error(res)
+                outcome = self._arc_broadcast_outcome(res, txid)
+                if outcome is not None:
+                    return outcome
+                provider_errors["arcGorillaPool"] = _format_arc_error(res)
                 self.logger.debug(
                     "Services.post_beef: GorillaPool broadcast non-success, status=%r, double_spend=%r",
                     getattr(res, "status", None),
@@ -1678,7 +2171,7 @@ class Services(WalletServices):
             try:
                 # Bitails expects a Beef object, pass beef_obj if available, otherwise tx
                 beef_to_use = beef_obj if beef_obj is not None else tx
-                res = self.bitails.post_beef(beef_to_use, txids)
+                res = await self._call_provider(self.bitails.post_beef, beef_to_use, txids)
                 if isinstance(res, dict) and res.get("accepted"):
                     return res
                 if isinstance(res, dict):
@@ -1761,8 +2254,15 @@ class Services(WalletServices):
         """Broadcast multiple BEEFs via ARC (TS-compatible batch behavior).
 
         Behavior:
-            - Processes the list sequentially, returning one result object per input BEEF.
-            - When ARC is configured, delegates each element to post_beef (which invokes ARC.broadcast).
+            - Returns one result object per input BEEF, in input order.
+            - When ARC is configured, the subject transactions are submitted to
+              the first ARC provider (TAAL, else GorillaPool) with
+              `broadcast_in_batches`: `postBeefBatchSize` transactions per
+              `/v1/txs` request, parents before children, up to
+              `postBeefConcurrency` requests at once. Transactions whose
+              request failed are retried one by one with `post_beef` (full
+              provider failover). A batch size of 0 uses `post_beef` for every
+              element.
             - When ARC is not configured, returns deterministic mocked results maintaining TS-like shape.
 
         Args:
@@ -1774,6 +2274,10 @@ class Services(WalletServices):
         Reference:
             - toolbox/ts-wallet-toolbox/src/services/Services.ts#postBeefArray
         """
+        return self._run_async(self.post_beef_array_async(beefs))
+
+    async def post_beef_array_async(self, beefs: list[str]) -> list[dict[str, Any]]:
+        """Async variant of post_beef_array."""
         # Validate input type
         if not isinstance(beefs, list):
             raise InvalidParameterError("beefs", "must be a list")
@@ -1785,16 +2289,53 @@ class Services(WalletServices):
 
         # Use ARC if either provider is configured
         if self.arc_gorillapool or self.arc_taal:
-            results: list[dict[str, Any]] = []
-            for beef in beefs:
+            if self.post_beef_batch_size <= 0:
+                return [await self._post_beef_or_error(beef) for beef in beefs]
+            results: list[dict[str, Any]] = [{} for _ in beefs]
+            parsed: list[tuple[int, str]] = []
+            txs: list[Transaction] = []
+            for i, beef in enumerate(beefs):
                 try:
-                    results.append(self.post_beef(beef))
+                    _beef_obj, tx, txid, _txids = self._parse_post_beef_payload(beef)
                 except Exception as e:
                     # For invalid beef strings (content errors), return error result
-                    results.append({"accepted": False, "txid": None, "message": str(e)})
+                    results[i] = {"accepted": False, "txid": None, "message": str(e)}
+                    continue
+                parsed.append((i, txid))
+                txs.append(tx)
+            if not txs:
+                return results
+
+            arc = self.arc_taal or self.arc_gorillapool
+            order, arc_results = await asyncio.get_running_loop().run_in_executor(
+                None, broadcast_in_batches, arc, txs, self.post_beef_batch_size, self.post_beef_concurrency
+            )
+            beef_of = {txid: beefs[i] for i, txid in reversed(parsed)}
+            # Request-level failures go through the failover path, parents first
+            retried = {}
+            for txid in order:
+                if arc_results[txid].service_error:
+                    retried[txid] = await self._post_beef_or_error(beef_of[txid])
+            for i, txid in parsed:
+                res = arc_results[txid]
+                if txid in retried:
+                    results[i] = retried[txid]
+                else:
+                    results[i] = self._arc_broadcast_outcome(res, txid) or {
+                        "accepted": False,
+                        "txid": txid,
+                        "message": _format_arc_error(res),
+                    }
             return results
         return [{"accepted": True, "txid": None, "message": "mocked"} for _ in beefs]
 
+    async def _post_beef_or_error(self, beef: str) -> dict[str, Any]:
+        try:
+            return await self.post_beef_async(beef)
+        except Exception as e:
+            # For invalid beef strings (content errors), return error result
+            return {"accepted": False, "txid": None, "message": str(e)}
+
     def is_utxo(self, output: Any) -> bool:
         txid = getattr(output, "txid", None) if not isinstance(output, dict) else output.get("txid")
         vout = getattr(output, "vout", None) if not isinstance(output, dict) else output.get("vout")
@@ -1813,6 +2354,43 @@ class Services(WalletServices):
         # Prefer explicit isUtxo when provided by provider; otherwise derive from details
         if isinstance(r, dict) and r.get("isUtxo") is True:
             return True
+        return self._details_show_unspent(r, outpoint)
+
+    def is_utxos(self, outputs: list[Any]) -> list[bool]:
+        """Batch variant of is_utxo: one ``get_utxo_statuses`` lookup for all outputs.
+
+        The statuses are per locking script, so an output counts as unspent when
+        the script's details list its outpoint as unspent.
+
+        Args:
+            outputs: Outputs with txid, vout and locking script (objects or TS-like dicts)
+
+        Returns:
+            list[bool]: Whether each output is an unspent output, in input order
+        """
+        keys: list[tuple[str, str | None] | None] = []
+        for output in outputs:
+            if isinstance(output, dict):
+                txid, vout, script = output.get("txid"), output.get("vout"), output.get("lockingScript")
+            else:
+                txid, vout = getattr(output, "txid", None), getattr(output, "vout", None)
+                script = getattr(output, "locking_script", None)
+            try:
+                script_hex = script if isinstance(script, str) else bytes(script or b"").hex()
+            except Exception:
+                script_hex = ""
+            if not script_hex:
+                keys.append(None)
+                continue
+            outpoint = f"{txid}.{vout}" if txid and vout is not None else None
+            keys.append((self.hash_output_script(script_hex), outpoint))
+
+        statuses = self.get_utxo_statuses([key[0] for key in keys if key is not None], "hashLE")
+        return [key is not None and self._details_show_unspent(statuses[key[0]], key[1]) for key in keys]
+
+    @staticmethod
+    def _details_show_unspent(r: Any, outpoint: str | None) -> bool:
+        """Whether the details of a getUtxoStatus result list ``outpoint`` (or, without one, any output) unspent."""
         details = r.get("details") if isinstance(r, dict) else None
         if not isinstance(details, list):
             return False
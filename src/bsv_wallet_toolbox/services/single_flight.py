@@ -0,0 +1,78 @@
+"""Request coalescing (single-flight) for Services provider calls.
+
+Concurrent identical requests share one in-flight call: the first caller for a
+key runs the call, later callers for the same key wait for it and receive the
+same result (or the same exception). Once the call completes the key is
+released, so the next request starts a fresh call (normally served from the
+Services caches).
+
+``do_async`` coalesces coroutines running on one event loop. The synchronous
+``Services`` API runs its coroutines on the shared
+``utils.async_runner.AsyncRunner`` loop, so calls from threads are coalesced
+there as well.
+
+Example:
+    >>> flight = SingleFlight()
+    >>> raw_tx = await flight.do_async(f"getRawTx:{txid}", lambda: fetch_raw_tx(txid))
+"""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into one execution."""
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._lock = threading.Lock()
+        self._tasks: dict[tuple[int, str], asyncio.Future[Any]] = {}
+        self.executions = 0
+        self.shared = 0
+
+    async def do_async(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Await ``fn()`` once for all concurrent coroutines using ``key``.
+
+        Coroutines are coalesced per event loop. A waiter being cancelled does
+        not cancel the shared call.
+
+        Args:
+            key: Request identity (method name and arguments)
+            fn: Zero-argument callable returning an awaitable for the request
+
+        Returns:
+            The result of the shared call
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        loop = asyncio.get_running_loop()
+        task_key = (id(loop), key)
+        with self._lock:
+            task = self._tasks.get(task_key)
+            if task is not None:
+                self.shared += 1
+            else:
+                task = loop.create_task(self._run_async(task_key, fn))
+                self._tasks[task_key] = task
+                self.executions += 1
+        return await asyncio.shield(task)
+
+    async def _run_async(self, task_key: tuple[int, str], fn: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            return await fn()
+        finally:
+            with self._lock:
+                self._tasks.pop(task_key, None)
+
+    def in_flight(self) -> int:
+        """Number of keys with a call currently in flight."""
+        with self._lock:
+            return len(self._tasks)
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of executed calls and of requests that shared one."""
+        with self._lock:
+            return {"executions": self.executions, "shared": self.shared}
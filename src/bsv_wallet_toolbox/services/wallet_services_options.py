@@ -69,6 +69,24 @@ class WalletServicesOptions(TypedDict, total=False):
     # Advanced options (optional)
     chaintracks: Any | None  # ChaintracksClientApi instance
 
+    # Service caches (optional)
+    cacheTtlMsecs: dict[str, int]  # Per-method TTL overrides (rawTx, merklePath, header, utxoStatus, ...)
+    cacheMaxEntries: int  # Entry bound of each service cache (default 10000)
+
+    # Provider call modes (optional)
+    serviceCallModes: dict[str, str]  # "failover" (default) or "hedged", per method (getRawTx, getMerklePath, ...)
+    adaptiveServiceRanking: bool  # Route to the fastest healthy provider first (default False: round-robin)
+
+    # post_beef_array batching (optional)
+    postBeefBatchSize: int  # Transactions per ARC /v1/txs request (default 100, 0 posts each BEEF separately)
+    postBeefConcurrency: int  # Concurrent /v1/txs requests (default 4)
+
+    # Pooled HTTP transport (optional)
+    httpTransport: Any | None  # HttpTransport shared by the providers (overrides the http* options below)
+    httpPoolMaxSize: int  # Keep-alive connections kept per host (default 20)
+    httpMaxPerHost: int  # Concurrent requests per host (default 16)
+    httpTimeoutSecs: float  # Request timeout of ARC, Bitails and WhatsOnChain calls (default 30)
+
     # Service method modifiers (Go parity)
     # Functions to modify service behavior before execution
     rawTxMethodModifier: Any | None  # Modifier for RawTx service calls
@@ -29,6 +29,7 @@ from bsv.wallet import Counterparty, CounterpartyType, Protocol
 
 from bsv_wallet_toolbox.errors import WalletError
 from bsv_wallet_toolbox.utils import validate_internalize_action_args
+from bsv_wallet_toolbox.utils.async_runner import run_sync
 from bsv_wallet_toolbox.utils.atomic_beef_utils import (
     AtomicBeefBuildResult,
     build_internalize_atomic_beef,
@@ -1307,23 +1308,8 @@ def _verify_unlock_scripts(txid: str, beef: Beef) -> None:
         # This mirrors TS Spend.validate() and Go spv.VerifyScripts()
         try:
             # scripts_only=True skips merkle proof verification, just validates scripts
-            # Transaction.verify() is async in Python SDK
-            import asyncio
-
-            async def _async_verify() -> bool:
-                return await transaction.verify(chaintracker=None, scripts_only=True)
-
-            # Run async verification
-            try:
-                loop = asyncio.get_running_loop()
-                # If we're already in an async context, delegate to a background thread
-                import concurrent.futures
-
-                with concurrent.futures.ThreadPoolExecutor() as pool:
-                    is_valid = loop.run_in_executor(pool, lambda: asyncio.run(_async_verify()))
-            except RuntimeError:
-                # No running loop, safe to use asyncio.run()
-                is_valid = asyncio.run(_async_verify())
+            # Transaction.verify() is async in Python SDK; run it on the shared event loop
+            is_valid = run_sync(transaction.verify(chaintracker=None, scripts_only=True))
 
             if not is_valid:
                 raise WalletError(f"Transaction {txid} script verification failed")
@@ -0,0 +1,185 @@
+"""BEEF assembly for stored transactions (listOutputs includeTransactions, getValidBeefForTxid).
+
+The builder walks the ancestry of the requested txids breadth first. Each
+ancestry level is loaded with one ``proven_txs`` and one ``proven_tx_reqs``
+query (per IN chunk), and every rawTx and merklePath is parsed at most once
+per build. Proven transactions are merged with their BUMP and end the walk;
+unproven transactions contribute their stored inputBEEF and queue their
+parents for the next level. BUMPs sharing a block height and root are
+combined by ``Beef.merge_bump``, so the output is a single normalized BEEF.
+
+Reference:
+    toolbox/ts-wallet-toolbox/src/storage/methods/getBeefForTransaction.ts
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from bsv.merkle_path import MerklePath
+from bsv.transaction import Transaction
+from bsv.transaction.beef import BEEF_V2, Beef
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from .db import chunked
+from .models import ProvenTx, ProvenTxReq
+
+logger = logging.getLogger(__name__)
+
+_COINBASE_TXID = "00" * 32
+
+
+@dataclass(frozen=True)
+class StoredTx:
+    """Raw transaction material stored for one txid."""
+
+    raw_tx: bytes
+    merkle_path: bytes | None = None
+    input_beef: bytes | None = None
+
+
+def load_stored_txs(session: Session, txids: Iterable[str]) -> dict[str, StoredTx]:
+    """Bulk-load rawTx/merklePath/inputBEEF for ``txids``.
+
+    ``proven_txs`` takes precedence over ``proven_tx_reqs``, matching
+    ``StorageProvider.get_proven_or_raw_tx``.
+
+    Args:
+        session: Active session.
+        txids: Transaction ids to look up.
+
+    Returns:
+        Mapping of txid to stored material; unknown txids are absent.
+    """
+    wanted = list(dict.fromkeys(txids))
+    found: dict[str, StoredTx] = {}
+    for chunk in chunked(wanted):
+        stmt = select(ProvenTx.txid, ProvenTx.raw_tx, ProvenTx.merkle_path).where(ProvenTx.txid.in_(chunk))
+        for txid, raw_tx, merkle_path in session.execute(stmt):
+            found.setdefault(txid, StoredTx(raw_tx=raw_tx, merkle_path=merkle_path))
+
+    missing = [t for t in wanted if t not in found]
+    for chunk in chunked(missing):
+        stmt = select(ProvenTxReq.txid, ProvenTxReq.raw_tx, ProvenTxReq.input_beef).where(ProvenTxReq.txid.in_(chunk))
+        for txid, raw_tx, input_beef in session.execute(stmt):
+            found.setdefault(txid, StoredTx(raw_tx=raw_tx, input_beef=input_beef))
+    return found
+
+
+class BeefBuilder:
+    """Assemble one BEEF for stored transactions and their unproven ancestry.
+
+    A builder is meant for a single call: its parse memo is keyed by txid and
+    lives as long as the builder.
+
+    Args:
+        session: Active session used for the per-level lookups.
+        known_txids: Ancestors the caller already has; they are emitted as
+            txid-only entries and not descended into.
+        max_depth: Optional limit on the number of ancestry levels walked
+            below the requested txids (``None`` walks until proven).
+    """
+
+    def __init__(self, session: Session, known_txids: Iterable[str] = (), max_depth: int | None = None) -> None:
+        self.session = session
+        self.known_txids = set(known_txids)
+        self.max_depth = max_depth
+        self.beef = Beef(version=BEEF_V2)
+        self._parsed: dict[str, Transaction | None] = {}
+        self._paths: dict[str, MerklePath | None] = {}
+        self._visited: set[str] = set()
+
+    def merge_txids(self, txids: Iterable[str]) -> BeefBuilder:
+        """Merge ``txids`` (always in full) and the ancestry needed to validate them."""
+        level = [t for t in dict.fromkeys(txids) if t and t not in self._visited]
+        depth = 0
+        while level:
+            self._visited.update(level)
+            stored = load_stored_txs(self.session, level)
+            parents: list[str] = []
+            for txid in level:
+                record = stored.get(txid)
+                if record is None:
+                    continue
+                tx = self._merge_stored(txid, record)
+                if tx is None or tx.merkle_path is not None:
+                    continue
+                if self.max_depth is not None and depth >= self.max_depth:
+                    continue
+                parents.extend(self._parents_to_load(tx))
+            level = list(dict.fromkeys(parents))
+            depth += 1
+        return self
+
+    def to_binary(self) -> bytes:
+        """Serialize the BEEF, or return ``b""`` when no transaction was found."""
+        if not self.beef.txs:
+            return b""
+        return self.beef.to_binary()
+
+    def _merge_stored(self, txid: str, record: StoredTx) -> Transaction | None:
+        tx = self._parse_tx(txid, record.raw_tx)
+        if tx is None:
+            return None
+        path = self._parse_path(txid, record.merkle_path)
+        if path is not None:
+            tx.merkle_path = path
+        self.beef.merge_transaction(tx)
+        if path is None and record.input_beef:
+            try:
+                self.beef.merge_beef_bytes(bytes(record.input_beef))
+            except Exception as exc:
+                logger.debug("ignoring unparsable inputBEEF for %s: %s", txid, exc)
+        return tx
+
+    def _parents_to_load(self, tx: Transaction) -> list[str]:
+        parents: list[str] = []
+        for txin in tx.inputs:
+            source_txid = getattr(txin, "source_txid", None)
+            if not source_txid or source_txid == _COINBASE_TXID or source_txid in self._visited:
+                continue
+            existing = self.beef.find_transaction(source_txid)
+            if existing is not None and existing.data_format != 2:
+                # already supplied in full, e.g. by a stored inputBEEF
+                continue
+            if source_txid in self.known_txids:
+                self._visited.add(source_txid)
+                self.beef.merge_txid_only(source_txid)
+                continue
+            parents.append(source_txid)
+        return parents
+
+    def _parse_tx(self, txid: str, raw_tx: bytes | None) -> Transaction | None:
+        if txid not in self._parsed:
+            tx = None
+            if raw_tx:
+                try:
+                    tx = Transaction.from_hex(bytes(raw_tx))
+                except Exception as exc:
+                    logger.debug("ignoring unparsable rawTx for %s: %s", txid, exc)
+            self._parsed[txid] = tx
+        return self._parsed[txid]
+
+    def _parse_path(self, txid: str, merkle_path: bytes | None) -> MerklePath | None:
+        if txid not in self._paths:
+            path = None
+            if merkle_path:
+                try:
+                    path = MerklePath.from_binary(bytes(merkle_path))
+                except Exception as exc:
+                    logger.debug("ignoring unparsable merklePath for %s: %s", txid, exc)
+            self._paths[txid] = path
+        return self._paths[txid]
+
+
+def build_beef_for_txids(
+    session: Session,
+    txids: Iterable[str],
+    known_txids: Iterable[str] = (),
+    max_depth: int | None = None,
+) -> bytes:
+    """Build one serialized BEEF for ``txids``; see :class:`BeefBuilder`."""
+    return BeefBuilder(session, known_txids=known_txids, max_depth=max_depth).merge_txids(txids).to_binary()
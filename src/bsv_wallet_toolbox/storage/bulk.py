@@ -0,0 +1,281 @@
+"""Set-based INSERT, upsert and UPDATE of many rows in one session.
+
+``insert_rows`` and ``upsert_rows`` take rows keyed by ORM attribute name
+(snake_case) and write them with executemany statements instead of one ORM
+flush per object. Rows are grouped by their key set so every statement sees
+homogeneous parameters, and the primary keys are returned in input order.
+
+Inserts use batched ``INSERT ... RETURNING`` where the dialect supports it
+(SQLite >= 3.35, PostgreSQL), returning the unique key with the primary key
+to put the ids back in input order, and fall back to one statement per row
+otherwise (MySQL), still inside the caller's transaction.
+
+Upserts resolve conflicts on the model's unique key (``UPSERT_KEYS``) with
+``INSERT ... ON CONFLICT`` (SQLite, PostgreSQL) or ``ON DUPLICATE KEY
+UPDATE`` (MySQL); other dialects fall back to select-then-write per row.
+Primary keys of upserted rows are read back by unique key afterwards, since
+RETURNING is not available for conflicting rows on every backend.
+
+``update_rows`` updates rows by primary key without loading them: identical
+patches become one ``UPDATE ... WHERE pk IN (...)``, other patches are sent
+as executemany UPDATEs grouped by key set.
+
+Reference:
+    toolbox/ts-wallet-toolbox/src/storage/StorageKnex.ts
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import and_, bindparam, insert, inspect, select, update
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from bsv_wallet_toolbox.errors import InvalidParameterError
+
+from .db import IN_CLAUSE_CHUNK_SIZE, chunked
+from .models import (
+    Certificate,
+    CertificateField,
+    Commission,
+    Output,
+    OutputBasket,
+    OutputTag,
+    OutputTagMap,
+    ProvenTx,
+    ProvenTxReq,
+    SyncState,
+    TxLabel,
+    TxLabelMap,
+    User,
+)
+from .models import Transaction as TransactionModel
+
+# Unique key (attribute names) each upsert resolves conflicts on, matching the
+# model's UniqueConstraint.
+UPSERT_KEYS: dict[type, tuple[str, ...]] = {
+    User: ("identity_key",),
+    SyncState: ("ref_num",),
+    TransactionModel: ("reference",),
+    Output: ("transaction_id", "vout", "user_id"),
+    ProvenTx: ("txid",),
+    ProvenTxReq: ("txid",),
+    Certificate: ("user_id", "type", "certifier", "serial_number"),
+    CertificateField: ("field_name", "certificate_id"),
+    OutputBasket: ("user_id", "name"),
+    OutputTag: ("user_id", "tag"),
+    OutputTagMap: ("output_tag_id", "output_id"),
+    TxLabel: ("user_id", "label"),
+    TxLabelMap: ("tx_label_id", "transaction_id"),
+    Commission: ("transaction_id",),
+}
+
+
+def _pk_attr(model: type) -> str:
+    mapper: Any = inspect(model)
+    return mapper.get_property_by_column(mapper.primary_key[0]).key
+
+
+def _group_by_keys(rows: Sequence[dict[str, Any]]) -> dict[tuple[str, ...], list[int]]:
+    """Return row indexes grouped by the (sorted) key set of each row."""
+    groups: dict[tuple[str, ...], list[int]] = {}
+    for index, row in enumerate(rows):
+        groups.setdefault(tuple(sorted(row)), []).append(index)
+    return groups
+
+
+def insert_rows(session: Session, model: type, rows: Sequence[dict[str, Any]]) -> list[int]:
+    """INSERT ``rows`` into ``model``'s table and return their primary keys in order.
+
+    Args:
+        session: Active session; nothing is committed.
+        model: Mapped model class.
+        rows: Attribute-keyed (snake_case) column values.
+
+    Returns:
+        Value of the first primary key column of each row, in input order.
+    """
+    if not rows:
+        return []
+    pk = getattr(model, _pk_attr(model))
+    dialect = session.get_bind().dialect
+    returning = getattr(dialect, "insert_executemany_returning", False)
+    ordered_returning = getattr(dialect, "insert_executemany_returning_sort_by_parameter_order", False)
+    unique_key = UPSERT_KEYS.get(model, ())
+    key_columns = [getattr(model, attr) for attr in unique_key]
+    ids: list[Any] = [None] * len(rows)
+    for indexes in _group_by_keys(rows).values():
+        group = [rows[i] for i in indexes]
+        if returning and unique_key and all(row.get(attr) is not None for row in group for attr in unique_key):
+            # Return the unique key with the primary key and match rows on it: without a
+            # sentinel column sort_by_parameter_order degrades to one statement per row
+            returned = {
+                tuple(key): value for value, *key in session.execute(insert(model).returning(pk, *key_columns), group)
+            }
+            pks = [returned[tuple(row[attr] for attr in unique_key)] for row in group]
+        elif ordered_returning:
+            stmt = insert(model).returning(pk, sort_by_parameter_order=True)
+            pks = list(session.execute(stmt, group).scalars())
+        else:
+            pks = [session.execute(insert(model).values(**row)).inserted_primary_key[0] for row in group]
+        for index, value in zip(indexes, pks, strict=True):
+            ids[index] = value
+    return ids
+
+
+def upsert_rows(
+    session: Session, model: type, rows: Sequence[dict[str, Any]], *, update_existing: bool = True
+) -> list[int]:
+    """Insert ``rows`` or, where their unique key exists, update the existing rows.
+
+    Args:
+        session: Active session; nothing is committed.
+        model: Mapped model class listed in ``UPSERT_KEYS``.
+        rows: Attribute-keyed column values; each must include the unique key.
+        update_existing: Overwrite the supplied columns of existing rows. When
+            False existing rows are left untouched (insert-or-ignore).
+
+    Returns:
+        Primary key of each row (inserted or existing), in input order.
+
+    Raises:
+        InvalidParameterError: If the model has no unique key or a row lacks it.
+    """
+    if not rows:
+        return []
+    conflict = UPSERT_KEYS.get(model)
+    if conflict is None:
+        raise InvalidParameterError("table", f"{model.__tablename__} has no unique key to upsert on")
+    for index, row in enumerate(rows):
+        missing = [attr for attr in conflict if attr not in row]
+        if missing:
+            raise InvalidParameterError(f"rows[{index}]", f"missing unique key columns {missing}")
+
+    dialect = session.get_bind().dialect.name
+    for keys, indexes in _group_by_keys(rows).items():
+        group = [rows[i] for i in indexes]
+        updated = [attr for attr in keys if attr not in conflict and attr != "created_at"] if update_existing else []
+        if dialect in ("sqlite", "postgresql", "mysql", "mariadb"):
+            session.execute(_upsert_statement(dialect, model, conflict, updated), group)
+        else:
+            _upsert_each(session, model, conflict, updated, group)
+    return find_row_ids(session, model, rows)
+
+
+def _upsert_statement(dialect: str, model: type, conflict: tuple[str, ...], updated: list[str]) -> Any:
+    mapper: Any = inspect(model)
+    if "updated_at" in mapper.attrs and updated and "updated_at" not in updated:
+        updated = [*updated, "updated_at"]
+    columns = {attr: mapper.attrs[attr].columns[0] for attr in updated}
+
+    if dialect in ("mysql", "mariadb"):
+        stmt = mysql.insert(model)
+        if not updated:
+            return stmt.prefix_with("IGNORE")
+        return stmt.on_duplicate_key_update({column: stmt.inserted[column.key] for column in columns.values()})
+
+    stmt = (sqlite.insert if dialect == "sqlite" else postgresql.insert)(model)
+    index_elements = [getattr(model, attr) for attr in conflict]
+    if not updated:
+        return stmt.on_conflict_do_nothing(index_elements=index_elements)
+    return stmt.on_conflict_do_update(
+        index_elements=index_elements,
+        set_={column: stmt.excluded[column.key] for column in columns.values()},
+    )
+
+
+def _upsert_each(
+    session: Session, model: type, conflict: tuple[str, ...], updated: list[str], rows: list[dict[str, Any]]
+) -> None:
+    pk = getattr(model, _pk_attr(model))
+    for row in rows:
+        existing = session.execute(
+            select(pk).where(*(getattr(model, attr) == row[attr] for attr in conflict))
+        ).scalar_one_or_none()
+        if existing is None:
+            session.execute(insert(model).values(**row))
+        elif updated:
+            session.execute(
+                update(model)
+                .where(pk == existing)
+                .values({attr: row[attr] for attr in updated})
+                .execution_options(synchronize_session=False)
+            )
+
+
+def find_row_ids(session: Session, model: type, rows: Sequence[dict[str, Any]]) -> list[int | None]:
+    """Return the primary key of the row matching each row's unique key (None if absent)."""
+    if not rows:
+        return []
+    conflict = UPSERT_KEYS[model]
+    pk = getattr(model, _pk_attr(model))
+    key_columns = [getattr(model, attr) for attr in conflict]
+    wanted = [tuple(row.get(attr) for attr in conflict) for row in rows]
+    found: dict[tuple[Any, ...], int] = {}
+    # Every key column contributes an IN list, so keep the total bound parameters per chunk bounded
+    for chunk in chunked(list(dict.fromkeys(wanted)), max(1, IN_CLAUSE_CHUNK_SIZE // len(conflict))):
+        conditions = [column.in_(list(dict.fromkeys(key[i] for key in chunk))) for i, column in enumerate(key_columns)]
+        for pk_value, *key in session.execute(select(pk, *key_columns).where(and_(*conditions))):
+            found[tuple(key)] = pk_value
+    return [found.get(key) for key in wanted]
+
+
+def update_rows(session: Session, model: type, updates: Sequence[tuple[Any, dict[str, Any]]]) -> int:
+    """UPDATE rows by primary key without loading them.
+
+    Rows sharing an identical patch are updated by one ``UPDATE ... WHERE pk
+    IN (...)`` per chunk; the remaining patches are grouped by key set and
+    sent as executemany UPDATEs by primary key. Keys that are not mapped
+    columns (or are the primary key) are ignored.
+
+    Args:
+        session: Active session; nothing is committed.
+        model: Mapped model class.
+        updates: (primary key, attribute-keyed patch) pairs.
+
+    Returns:
+        Number of rows matched (rows with an empty patch count when they exist).
+    """
+    mapper: Any = inspect(model)
+    pk_attr = _pk_attr(model)
+    pk = getattr(model, pk_attr)
+    columns = {prop.key for prop in mapper.column_attrs} - {pk_attr}
+
+    same_patch: dict[tuple[tuple[str, Any], ...], list[Any]] = {}
+    by_keys: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+    unchanged: list[Any] = []
+    for pk_value, patch in updates:
+        values = {key: value for key, value in patch.items() if key in columns}
+        if not values:
+            unchanged.append(pk_value)
+            continue
+        try:
+            same_patch.setdefault(tuple(sorted(values.items())), []).append(pk_value)
+        except TypeError:  # unhashable value (e.g. a JSON list)
+            by_keys.setdefault(tuple(sorted(values)), []).append({"pk": pk_value, **values})
+
+    matched = 0
+    for items, pk_values in same_patch.items():
+        if len(pk_values) == 1 and len(same_patch) > 1:
+            by_keys.setdefault(tuple(key for key, _ in items), []).append({"pk": pk_values[0], **dict(items)})
+            continue
+        for chunk in chunked(list(dict.fromkeys(pk_values))):
+            result: Any = session.execute(
+                update(model).where(pk.in_(chunk)).values(dict(items)).execution_options(synchronize_session=False)
+            )
+            matched += result.rowcount
+    pk_column = mapper.primary_key[0]
+    for keys, params in by_keys.items():
+        # One executemany per key set; Core rather than ORM bulk UPDATE, which raises on missing rows
+        stmt = (
+            update(model.__table__)
+            .where(pk_column == bindparam("_pk"))
+            .values({mapper.attrs[key].columns[0]: bindparam(f"_{key}") for key in keys})
+        )
+        result = session.execute(stmt, [{f"_{key}": value for key, value in row.items()} for row in params])
+        matched += result.rowcount
+    for chunk in chunked(list(dict.fromkeys(unchanged))):
+        matched += len(session.execute(select(pk).where(pk.in_(chunk))).all())
+    return matched
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping, Sequence
 from contextlib import contextmanager
 from typing import Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import MetaData, Table, create_engine, inspect
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm import Session, sessionmaker
 
+# Upper bound for bound parameters in a single IN (...) list; stays below
+# SQLite's historical SQLITE_MAX_VARIABLE_NUMBER of 999.
+IN_CLAUSE_CHUNK_SIZE = 500
+
+# Rows fetched per keyset page by the StorageProvider iter_* methods.
+ITER_BATCH_SIZE = 1000
+
 
 def create_engine_from_url(url: str, *, echo: bool = False, **kwargs: Any) -> Any:
     """Create a synchronous SQLAlchemy Engine for supported backends.
@@ -51,3 +59,45 @@ def session_scope(session_local: Any) -> Iterator[Session]:
 def create_sqlite_engine(path: str = "wallet.db", *, echo: bool = False) -> Any:
     """Create a synchronous SQLite Engine."""
     return create_engine_from_url(f"sqlite:///{path}", echo=echo)
+
+
+def chunked(values: Sequence[Any], size: int = IN_CLAUSE_CHUNK_SIZE) -> Iterator[Sequence[Any]]:
+    """Yield consecutive slices of ``values`` of at most ``size`` items (for IN lists)."""
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+def sync_indexes(
+    connection: Connection, metadata: MetaData, superseded: Mapping[str, Sequence[str]] | None = None
+) -> list[str]:
+    """Bring the indexes of existing tables in line with ``metadata``.
+
+    ``create_all`` only creates indexes together with their table, so indexes
+    added to the models later never reach an existing database. This creates
+    declared indexes that are missing, recreates those whose columns changed
+    and drops the ``superseded`` ones ({table: (index name, ...)}). Indexes
+    not mentioned anywhere are left alone.
+
+    Returns:
+        Names of the indexes created, recreated or dropped.
+    """
+    inspector = inspect(connection)
+    changed: list[str] = []
+    for table in metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        reflected = Table(table.name, MetaData(), autoload_with=connection)
+        current = {index.name: index for index in reflected.indexes}
+        for index in table.indexes:
+            found = current.get(index.name)
+            if found is not None and [c.name for c in found.columns] == [c.name for c in index.columns]:
+                continue
+            if found is not None:
+                found.drop(connection)
+            index.create(connection)
+            changed.append(str(index.name))
+        for name in (superseded or {}).get(table.name, ()):
+            if name in current:
+                current[name].drop(connection)
+                changed.append(name)
+    return changed
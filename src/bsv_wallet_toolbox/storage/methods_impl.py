@@ -543,6 +543,8 @@ def list_actions(storage: Any, auth: dict[str, Any], args: ListActionsArgs) -> d
         result["totalActions"] = total_count
 
     # Step 5: Build action objects from transaction records
+    # Actions do not expose transactionId; remember it per action for the include steps.
+    tx_id_by_action: dict[int, Any] = {}
     for tx in transactions:
         action = {
             "txid": tx.get("txid", ""),
@@ -553,6 +555,7 @@ def list_actions(storage: Any, auth: dict[str, Any], args: ListActionsArgs) -> d
             "version": tx.get("version", 0),
             "lockTime": tx.get("lockTime", 0),
         }
+        tx_id_by_action[id(action)] = tx.get("transactionId")
         result["actions"].append(action)
 
     # Step 6: Handle SpecOp post-processing if applicable
@@ -573,33 +576,38 @@ def list_actions(storage: Any, auth: dict[str, Any], args: ListActionsArgs) -> d
     include_labels = getattr(args, "includeLabels", False)
     include_inputs = getattr(args, "includeInputs", False)
 
+    page_tx_ids = [tx_id for tx_id in (tx_id_by_action.get(id(a)) for a in result["actions"]) if tx_id]
+
     if include_labels:
-        # Fetch and attach label data for each action
-        for action in result["actions"]:
+        # Fetch label data for the whole page in one query and attach per action
+        labels_by_tx: dict[Any, list[Any]] = {}
+        if page_tx_ids:
             labels = storage.find(
                 "TxLabel",
                 {
                     "userId": user_id,
-                    "transactionId": action.get("transactionId"),
+                    "transactionId": {"$in": page_tx_ids},
                     "isDeleted": False,
                 },
             )
-            action["labels"] = [lbl.get("label") for lbl in labels]
+            for lbl in labels:
+                labels_by_tx.setdefault(lbl.get("transactionId"), []).append(lbl.get("label"))
+        for action in result["actions"]:
+            action["labels"] = labels_by_tx.get(tx_id_by_action.get(id(action)), [])
 
     if include_inputs:
-        # Fetch and attach input data for each action
-        for action in result["actions"]:
-            # Query inputs from transaction via tx_inputs table
-            tx_id = action.get("transactionId")
-            if tx_id:
-                inputs = storage.find(
-                    "TransactionInput",
-                    {
-                        "transactionId": tx_id,
-                        "isDeleted": False,
-                    },
-                )
-                action["inputs"] = [
+        # Fetch input data for the whole page in one query (tx_inputs table) and attach per action
+        inputs_by_tx: dict[Any, list[dict[str, Any]]] = {}
+        if page_tx_ids:
+            inputs = storage.find(
+                "TransactionInput",
+                {
+                    "transactionId": {"$in": page_tx_ids},
+                    "isDeleted": False,
+                },
+            )
+            for inp in inputs:
+                inputs_by_tx.setdefault(inp.get("transactionId"), []).append(
                     {
                         "vin": inp.get("vin", 0),
                         "txid": inp.get("prevTxid", ""),
@@ -607,10 +615,9 @@ def list_actions(storage: Any, auth: dict[str, Any], args: ListActionsArgs) -> d
                         "unlockScript": inp.get("unlockScript", ""),
                         "sequence": inp.get("sequence", 0xFFFFFFFF),
                     }
-                    for inp in inputs
-                ]
-            else:
-                action["inputs"] = []
+                )
+        for action in result["actions"]:
+            action["inputs"] = inputs_by_tx.get(tx_id_by_action.get(id(action)), [])
 
     return result
 
@@ -703,22 +710,21 @@ def list_outputs(storage: Any, auth: dict[str, Any], args: ListOutputsArgs) -> d
     # Step 7: Add tags if requested
     include_tags = getattr(args, "includeTags", False)
 
-    if include_tags:
-        # Fetch OutputTag records for each output
+    if include_tags and result["outputs"]:
+        # Fetch OutputTag records for the whole page in one query and group by outpoint
+        page_txids = sorted({o.get("txid") for o in result["outputs"] if o.get("txid")})
+        tags = storage.find(
+            "OutputTag",
+            {
+                "txid": {"$in": page_txids},
+                "isDeleted": False,
+            },
+        )
+        tags_by_outpoint: dict[tuple[Any, Any], list[Any]] = {}
+        for tag in tags:
+            tags_by_outpoint.setdefault((tag.get("txid"), tag.get("vout")), []).append(tag.get("tag"))
         for output_obj in result["outputs"]:
-            txid = output_obj.get("txid")
-            vout = output_obj.get("vout")
-
-            # Query tags for this output
-            tags = storage.find(
-                "OutputTag",
-                {
-                    "txid": txid,
-                    "vout": vout,
-                    "isDeleted": False,
-                },
-            )
-            output_obj["tags"] = [tag.get("tag") for tag in tags]
+            output_obj["tags"] = tags_by_outpoint.get((output_obj.get("txid"), output_obj.get("vout")), [])
 
     # Step 8: Apply SpecOp post-processing
     if basket and basket.startswith("specOp"):
@@ -1316,11 +1322,13 @@ def _recursive_build_valid_beef(
     merkle_path = result.get("merklePath")
 
     # If not in storage, try services
+    from_services = False
     if not raw_tx and not proven:
         if tx_getter is None:
             raise WalletError(f"Transaction txid: {txid!r} is not known to storage")
 
         raw_tx, merkle_path = tx_getter(txid)
+        from_services = True
 
     # Trust self as known - return txid-only
     elif options.trust_self == "known" and proven:
@@ -1387,6 +1395,11 @@ def _recursive_build_valid_beef(
     if subject_tx and getattr(subject_tx, "bump_index", None) is not None:
         return  # Already has proof
 
+    # Parents of a transaction storage did not know are likely unknown too:
+    # fetch their raw transactions with one batched lookup before recursing
+    if from_services and hasattr(storage, "get_services"):
+        _prefetch_raw_txs(storage.get_services(), _source_txids_to_fetch(beef, tx, options.known_txids))
+
     # Recurse for each input
     for tx_input in tx.inputs or []:
         source_txid = getattr(tx_input, "source_txid", None)
@@ -1466,6 +1479,9 @@ def _get_beef_from_services(
         if is_mined:
             return
 
+        # Fetch the raw transactions of all inputs with one batched lookup
+        _prefetch_raw_txs(services, _source_txids_to_fetch(beef, tx, known_txids_set))
+
         # Recurse for inputs
         for tx_input in tx.inputs or []:
             source_txid = getattr(tx_input, "source_txid", None)
@@ -1481,6 +1497,26 @@ def _get_beef_from_services(
     return beef
 
 
+def _source_txids_to_fetch(beef: Any, tx: Transaction, known_txids: Any) -> list[str]:
+    """Source txids of tx's inputs that are neither known nor already in beef."""
+    txids = {getattr(tx_input, "source_txid", None) for tx_input in tx.inputs or []}
+    return [txid for txid in txids if txid and txid not in known_txids and beef.find_transaction(txid) is None]
+
+
+def _prefetch_raw_txs(services: Any, txids: list[str]) -> None:
+    """Warm the services raw tx cache for txids with one batched lookup (``Services.get_raw_txs``).
+
+    Best effort: the recursive walk still fetches each transaction with
+    ``get_raw_tx``, which is then served from the cache.
+    """
+    if services is None or len(txids) < 2 or not hasattr(services, "get_raw_txs"):
+        return
+    try:
+        services.get_raw_txs(sorted(txids))
+    except Exception:
+        pass
+
+
 def _persist_new_proven(
     storage: Any,
     subject_txid: str,
@@ -189,6 +189,9 @@ class Transaction(TimestampMixin, Base):
     __table_args__ = (
         UniqueConstraint("reference", name="ux_transactions_reference"),
         Index("ix_transactions_status", "status"),
+        Index("ix_transactions_user_status", "userId", "status"),
+        Index("ix_transactions_txid", "txid"),
+        Index("ix_transactions_proven_tx", "provenTxId"),
         CheckConstraint("version >= 0", name="ck_transactions_version_unsigned"),
         CheckConstraint("lockTime >= 0", name="ck_transactions_locktime_unsigned"),
     )
@@ -255,6 +258,11 @@ class Output(TimestampMixin, Base):
 
     __table_args__ = (
         UniqueConstraint("transactionId", "vout", "userId", name="ux_outputs_txid_vout_user"),
+        # Funding allocation and basket listing: range scan by satoshis over a
+        # user's unspent outputs in one basket (spentBy IS NULL is an index equality)
+        Index("ix_outputs_funding", "userId", "basketId", "spendable", "spentBy", "satoshis"),
+        Index("ix_outputs_txid", "txid"),
+        Index("ix_outputs_spent_by", "spentBy"),
         CheckConstraint("scriptLength >= 0", name="ck_outputs_scriptlength_unsigned"),
         CheckConstraint("scriptOffset >= 0", name="ck_outputs_scriptoffset_unsigned"),
     )
@@ -337,7 +345,7 @@ class ProvenTxReq(TimestampMixin, Base):
 
     __table_args__ = (
         UniqueConstraint("txid", name="ux_proven_tx_reqs_txid"),
-        Index("ix_proven_tx_reqs_status", "status"),
+        Index("ix_proven_tx_reqs_status_updated", "status", "updated_at"),
         Index("ix_proven_tx_reqs_batch", "batch"),
         CheckConstraint("attempts >= 0", name="ck_proven_tx_reqs_attempts_unsigned"),
     )
@@ -616,7 +624,10 @@ class Commission(TimestampMixin, Base):
 
     user: Mapped[User] = relationship("User")
 
-    __table_args__ = (Index("ix_commissions_tx", "transactionId"),)
+    __table_args__ = (
+        Index("ix_commissions_tx", "transactionId"),
+        Index("ix_commissions_user", "userId"),
+    )
 
 
 # 16 MonitorEvent
@@ -726,3 +737,42 @@ class UserUTXO(Base):
         Index("ix_user_utxos_status", "status"),
         Index("ix_user_utxos_basket_name", "basketName"),
     )
+
+
+# 18 OutputBasketBalance
+class OutputBasketBalance(TimestampMixin, Base):
+    __tablename__ = "output_basket_balances"
+
+    """Maintained wallet balance aggregate per user and basket.
+
+    Summary:
+        Caches SUM(satoshis) and COUNT(*) over the outputs that contribute to
+        the wallet balance (spendable, unspent, change, P2PKH, owned by a
+        transaction in a balance status). Rows are adjusted in the same
+        database transaction as the output/transaction writes that change
+        them, so specOpWalletBalance becomes a single primary-key lookup.
+        A missing row means "not materialized yet"; readers fall back to a
+        SQL SUM and materialize it.
+    Fields:
+        user_id: Owning user (part of composite primary key)
+        basket_id: Output basket (part of composite primary key)
+        satoshis: Sum of contributing output satoshis
+        output_count: Number of contributing outputs
+    Reference:
+        See storage/wallet_balance.py for the maintenance and rebuild helpers.
+    """
+
+    user_id: Mapped[int] = mapped_column(
+        "userId", Integer, ForeignKey("users.userId", ondelete="CASCADE"), primary_key=True
+    )
+    basket_id: Mapped[int] = mapped_column(
+        "basketId", Integer, ForeignKey("output_baskets.basketId", ondelete="CASCADE"), primary_key=True
+    )
+    satoshis: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    output_count: Mapped[int] = mapped_column("outputCount", Integer, nullable=False, default=0)
+
+
+# Indexes dropped from the schema; migrate() removes them from existing databases.
+SUPERSEDED_INDEXES: dict[str, tuple[str, ...]] = {
+    "proven_tx_reqs": ("ix_proven_tx_reqs_status",),
+}
@@ -5,15 +5,17 @@ import json
 import logging
 import re
 import secrets
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
 from datetime import UTC, datetime, timedelta
+from functools import cache, lru_cache
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any, ClassVar, overload
 
 from bsv.merkle_path import MerklePath
 from bsv.transaction import Transaction
 from bsv.transaction import Transaction as BsvTransaction
 from bsv.transaction.beef import BEEF_V2, Beef, parse_beef_ex
-from sqlalchemy import delete, func, inspect, or_, select, update
+from sqlalchemy import delete, func, inspect, or_, select, tuple_, update
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
@@ -28,12 +30,14 @@ from bsv_wallet_toolbox.utils.validation import (
     validate_request_sync_chunk_args,
 )
 
+from .beef_builder import build_beef_for_txids
+from .bulk import find_row_ids, insert_rows, update_rows, upsert_rows
 from .create_action import (
     deterministic_txid,
     normalize_create_action_args,
     validate_required_outputs,
 )
-from .db import create_session_factory, session_scope
+from .db import ITER_BATCH_SIZE, chunked, create_session_factory, session_scope, sync_indexes
 from .methods.generate_change import (
     MAX_POSSIBLE_SATOSHIS,
     GenerateChangeSdkChangeOutput,
@@ -41,12 +45,15 @@ from .methods.generate_change import (
     GenerateChangeSdkInput,
     GenerateChangeSdkOutput,
     GenerateChangeSdkParams,
+    GenerateChangeSdkResult,
+    InsufficientFundsError,
     InternalError,
     StorageFeeModel,
     generate_change_sdk,
 )
 from .methods_impl import get_sync_chunk as _impl_get_sync_chunk
 from .models import (
+    SUPERSEDED_INDEXES,
     Base,
     Certificate,
     CertificateField,
@@ -67,6 +74,17 @@ from .models import (
 from .models import (
     Transaction as TransactionModel,
 )
+from .purge import PurgeEngine
+from .utxo_allocator import (
+    MAX_CLAIM_ATTEMPTS,
+    FundingWindow,
+    UtxoFreeList,
+    claim_funding_output,
+    claim_funding_outputs,
+    funding_conditions,
+    load_funding_window,
+)
+from .wallet_balance import BalanceSnapshot, check_balances, read_basket_balance, rebuild_balances
 
 if TYPE_CHECKING:
     from .crud import (
@@ -91,6 +109,45 @@ CAMEL_TO_SNAKE_OVERRIDES: dict[str, str] = {
 SNAKE_TO_CAMEL_OVERRIDES: dict[str, str] = {v: k for k, v in CAMEL_TO_SNAKE_OVERRIDES.items()}
 
 
+@lru_cache(maxsize=4096)
+def _normalize_str_key(key: str) -> str:
+    """Cached camelCase -> snake_case conversion behind StorageProvider._normalize_key."""
+    if "_" in key:
+        return key
+    # Check for special overrides first
+    if key in CAMEL_TO_SNAKE_OVERRIDES:
+        return CAMEL_TO_SNAKE_OVERRIDES[key]
+    return StorageProvider._to_snake_case(key)
+
+
+def _single_column_getter(attr: str) -> Callable[[Any], tuple[Any]]:
+    """Tuple-returning getter for one attribute (attrgetter returns a bare value for one name)."""
+    get = attrgetter(attr)
+
+    def getter(obj: Any) -> tuple[Any]:
+        return (get(obj),)
+
+    return getter
+
+
+def _fetch_transaction_statuses(services: Any, logger: logging.Logger, txids: list[str]) -> dict[str, Any]:
+    """Look up network statuses with one batched services call, or per txid if that fails."""
+    if not txids:
+        return {}
+    try:
+        return services.get_transaction_statuses(txids)
+    except Exception as e:
+        logger.warning("Batched transaction status lookup failed, checking per txid: %s", e)
+    statuses: dict[str, Any] = {}
+    for txid in txids:
+        try:
+            statuses[txid] = services.get_transaction_status(txid)
+        except Exception as e:
+            # Log error but continue with other transactions
+            logger.warning("Failed to check status for transaction %s: %s", txid, e)
+    return statuses
+
+
 class StorageProvider:
     _FATAL_BROADCAST_ERROR_HINTS = (
         "missing inputs",
@@ -154,6 +211,11 @@ class StorageProvider:
         self.fee_model = {"model": "sat/kb", "value": 1}
         # Randomizer for deterministic testing (None = use system entropy)
         self._randomizer: Any | None = None
+        # Optional in-process funding candidate cache (enable_utxo_free_list)
+        self._utxo_free_list: UtxoFreeList | None = None
+        # Fund createAction from a prefetched candidate window claimed in one transaction
+        # (False: one allocate/release round-trip per funding input)
+        self.batch_funding = True
 
     def set_services(self, services: Any) -> None:
         """Attach a Services instance for network-backed checks.
@@ -354,10 +416,12 @@ class StorageProvider:
     # Lifecycle / availability
     # ------------------------------------------------------------------
     def migrate(self) -> None:
-        """Create all tables if missing.
+        """Create all tables and indexes if missing.
 
         Summary:
-            Apply ORM-declared schema to the connected database.
+            Apply ORM-declared schema to the connected database. Tables that
+            already exist get indexes added to the models since they were
+            created; superseded indexes are dropped.
         TS parity:
             Equivalent to initial Knex migration createAll.
         Args:
@@ -371,6 +435,7 @@ class StorageProvider:
         """
         with self.engine.begin() as conn:
             Base.metadata.create_all(bind=conn)
+            sync_indexes(conn, Base.metadata, SUPERSEDED_INDEXES)
 
     def is_storage_provider(self) -> bool:
         """Check if this is a StorageProvider (not StorageClient).
@@ -817,6 +882,7 @@ class StorageProvider:
                 q = q.where(Output.type == "P2PKH")
 
             # Optional basket name filter (may be overridden by SpecOp)
+            bid = None
             if basket_name:
                 bq = select(OutputBasket.basket_id).where(
                     (OutputBasket.user_id == user_id)
@@ -864,6 +930,14 @@ class StorageProvider:
                     else:
                         q = q.where(m.c.tc > 0)
 
+            # SpecOp: wallet balance -> sum satoshis, outputs empty. The plain form is served
+            # from the maintained per-basket aggregate; tag-filtered forms sum in SQL.
+            if specop == "wallet_balance":
+                if bid is not None and not tags and not include_spent:
+                    return {"totalOutputs": read_basket_balance(s, user_id, bid), "outputs": []}
+                total_satoshis = s.execute(q.with_only_columns(func.coalesce(func.sum(Output.satoshis), 0))).scalar()
+                return {"totalOutputs": int(total_satoshis or 0), "outputs": []}
+
             # Count total first (before limit/offset)
             _result_count = s.execute(q.with_only_columns(func.count()))
             total = _result_count.scalar_one()
@@ -885,24 +959,25 @@ class StorageProvider:
                 except Exception:
                     services = None
 
+                checked_rows: list[Output] = []
                 for output_row in rows:
                     # Ensure script is available
                     self.validate_output_script(output_row=output_row, session=s)
-                    if not output_row.locking_script or len(output_row.locking_script) == 0:
-                        continue
-                    ok: bool | None = None
-                    if services is not None:
-                        # Build TS-like object for services.is_utxo
-                        out = {
-                            "txid": output_row.txid,
-                            "vout": int(output_row.vout),
-                            "lockingScript": output_row.locking_script,
-                        }
-                        try:
-                            # Call synchronously (services should provide sync API)
-                            ok = bool(services.is_utxo(out))
-                        except Exception:
-                            ok = None
+                    if output_row.locking_script and len(output_row.locking_script) > 0:
+                        checked_rows.append(output_row)
+
+                # One batched UTXO status lookup for the page (bulk provider requests)
+                utxo_flags: list[bool | None] = [None] * len(checked_rows)
+                if services is not None and checked_rows:
+                    outs = [
+                        {"txid": o.txid, "vout": int(o.vout), "lockingScript": o.locking_script} for o in checked_rows
+                    ]
+                    try:
+                        utxo_flags = list(services.is_utxos(outs))
+                    except Exception:
+                        utxo_flags = [None] * len(checked_rows)
+
+                for output_row, ok in zip(checked_rows, utxo_flags, strict=True):
                     # If explicit False -> invalid change
                     if ok is False:
                         # Optional 'release' tag: mark unspendable
@@ -914,6 +989,12 @@ class StorageProvider:
                         filtered_rows.append(output_row)
                 rows = filtered_rows
 
+            # Hydrate tags/labels for the whole page with grouped IN queries
+            tags_by_output = self._tags_by_output_id(s, (o.output_id for o in rows)) if include_tags else {}
+            labels_by_tx = (
+                self._labels_by_transaction_id(s, (o.transaction_id for o in rows if o.txid)) if include_labels else {}
+            )
+
             outputs: list[dict[str, Any]] = []
             for output_row in rows:
                 wo: dict[str, Any] = {
@@ -929,11 +1010,9 @@ class StorageProvider:
                     if output_row.locking_script:
                         wo["lockingScript"] = output_row.locking_script
                 if include_labels and output_row.txid:
-                    wo["labels"] = [
-                        t["label"] for t in self.get_labels_for_transaction_id(output_row.transaction_id or 0)
-                    ]
+                    wo["labels"] = [t["label"] for t in labels_by_tx.get(output_row.transaction_id, [])]
                 if include_tags:
-                    wo["tags"] = [t["tag"] for t in self.get_tags_for_output_id(output_row.output_id)]
+                    wo["tags"] = [t["tag"] for t in tags_by_output.get(output_row.output_id, [])]
                 outputs.append(wo)
 
             # SpecOp: set wallet change params (side-effect only, empty result)
@@ -957,13 +1036,6 @@ class StorageProvider:
                         s.add(b)
                 return {"totalOutputs": 0, "outputs": []}
 
-            # SpecOp: wallet balance -> sum satoshis, outputs empty
-            if specop == "wallet_balance":
-                total_outputs = 0
-                for o in rows:
-                    total_outputs += int(o.satoshis)
-                return {"totalOutputs": int(total_outputs), "outputs": []}
-
             # SpecOp: invalid_change -> totalOutputs equals filtered length
             if specop == "invalid_change":
                 result: dict[str, Any] = {"totalOutputs": len(outputs), "outputs": outputs}
@@ -971,7 +1043,7 @@ class StorageProvider:
 
             result: dict[str, Any] = {"totalOutputs": int(total), "outputs": outputs}
             if include_transactions:
-                # Build minimal BEEF by merging rawTx for listed outputs (unique txids)
+                # One BEEF for the unique txids of the listed outputs
                 txids: list[str] = []
                 seen: set[str] = set()
                 for output_row in rows:
@@ -981,7 +1053,7 @@ class StorageProvider:
                 known_txids = args.get("knownTxids") or []
                 if not isinstance(known_txids, list):
                     known_txids = []
-                result["BEEF"] = self._build_recursive_beef_for_txids(txids, known_txids=known_txids)
+                result["BEEF"] = self._build_beef_for_txids(txids, known_txids=known_txids)
             return result
 
     def validate_output_script(self, output_row: Output, _session: Session | None = None) -> None:
@@ -1011,122 +1083,28 @@ class StorageProvider:
         if script:
             output_row.locking_script = script
 
-    def _build_minimal_beef_for_txids(self, txids: list[str]) -> bytes:
-        """Construct a minimal BEEF-like binary by concatenating rawTx blobs.
-
-        Summary:
-            This is a pragmatic interim implementation: for each txid, include its
-            rawTx if known. It does not yet recursively include inputs or Merkle
-            paths. Sufficient to unblock `includeTransactions` clients expecting a
-            non-empty BEEF when transactions are requested.
-        TS parity:
-            Approximates BEEF merging from TS; full parity (inputs/paths) will be
-            implemented alongside Proven utilities.
-        Args:
-            txids: Unique list of transaction ids to include.
-        Returns:
-            Bytes blob representing a minimal BEEF.
-        """
-        chunks: list[bytes] = []
-        seen: set[str] = set()
-        for txid in txids:
-            if txid in seen:
-                continue
-            seen.add(txid)
-            r = self.get_proven_or_raw_tx(txid)
-            raw = r.get("rawTx")
-            if isinstance(raw, (bytes, bytearray)):
-                chunks.append(bytes(raw))
-            # If this tx has an input BEEF from storage (req), append it as a minimal ancestry hint
-            ib = r.get("inputBEEF")
-            if isinstance(ib, (bytes, bytearray)) and len(ib) > 0:
-                chunks.append(bytes(ib))
-        return b"".join(chunks)
-
-    def _build_recursive_beef_for_txids(
-        self, txids: list[str], max_depth: int = 4, known_txids: list[str] | None = None
+    def _build_beef_for_txids(
+        self, txids: list[str], known_txids: list[str] | None = None, max_depth: int | None = None
     ) -> bytes:
-        """Construct a more complete BEEF-like binary including ancestors.
+        """Build one BEEF (BRC-96, BUMP-encoded) for stored txids and their ancestry.
 
         Summary:
-            Starting from txids, append known rawTx bytes and any stored inputBEEF,
-            then recursively traverse inputs (by parsing rawTx) up to max_depth to
-            append ancestor rawTx blobs. This is still a placeholder and does not
-            encode BUMP structures; it is a pragmatic superset of the minimal form.
+            Walks ancestry level by level with one bulk proven_txs/proven_tx_reqs
+            lookup per level and a per-call parse memo. Proven transactions are
+            merged with their BUMP; unproven ones contribute stored inputBEEF and
+            their parents. Ancestors listed in known_txids become txid-only.
+        TS parity:
+            Mirrors getBeefForTransaction / mergeBeefForTransactionRecurse for
+            storage-known transactions (no service fallback).
         Args:
-            txids: Starting transaction ids.
-            max_depth: Maximum recursion depth.
+            txids: Transaction ids to include in full.
+            known_txids: Ancestor txids the caller already has.
+            max_depth: Optional limit on ancestry levels walked.
         Returns:
-            bytes: Concatenated bytes representing a BEEF-like payload.
+            Serialized BEEF bytes, or b"" when none of the txids are stored.
         """
-        chunks: list[bytes] = []
-        seen: set[str] = set()
-        known: set[str] = set(known_txids or [])
-        first_beef: bytes | None = None
-
-        def add_tx_and_ancestors(cur_txid: str, depth: int) -> None:
-            if cur_txid in seen or depth > max_depth:
-                return
-            seen.add(cur_txid)
-            r = self.get_proven_or_raw_tx(cur_txid)
-            raw = r.get("rawTx")
-            if isinstance(raw, (bytes, bytearray)):
-                # Attempt to parse and follow inputs (and attach MerklePath)
-                try:
-                    tx = Transaction.from_hex(raw)
-                    if tx and getattr(tx, "inputs", None):
-                        mpb = r.get("merklePath")
-                        if isinstance(mpb, (bytes, bytearray)) and len(mpb) > 0:
-                            try:
-                                tx.merkle_path = MerklePath.from_binary(bytes(mpb))
-                            except Exception:
-                                pass
-                        for txin in tx.inputs:
-                            src = getattr(txin, "source_txid", None)
-                            if isinstance(src, str) and src and src != "00" * 32:
-                                # If the caller already knows this txid, do not fetch/descend further
-                                if src not in known:
-                                    add_tx_and_ancestors(src, depth + 1)
-                                # Try to hydrate parent transaction for to_beef ancestry
-                                try:
-                                    pr = self.get_proven_or_raw_tx(src)
-                                    praw = pr.get("rawTx")
-                                    if isinstance(praw, (bytes, bytearray)):
-                                        parent_tx = Transaction.from_hex(praw)
-                                        if parent_tx is not None:
-                                            txin.source_transaction = parent_tx
-                                except Exception:
-                                    pass
-                        try:
-                            beef_bytes = tx.to_beef()
-                            chunks.append(beef_bytes)
-                        except Exception:
-                            chunks.append(bytes(raw))
-                    else:
-                        chunks.append(bytes(raw))
-                except Exception:
-                    chunks.append(bytes(raw))
-            ib = r.get("inputBEEF")
-            if isinstance(ib, (bytes, bytearray)) and len(ib) > 0:
-                chunks.append(bytes(ib))
-
-        for tid in txids:
-            add_tx_and_ancestors(tid, 0)
-
-        # Prefer a single BEEF if constructed for the primary tx
-        if first_beef is not None:
-            return first_beef
-
-        # Deduplicate identical fragments to approximate normalization (fallback)
-        unique_chunks: list[bytes] = []
-        seen_hashes: set[int] = set()
-        for c in chunks:
-            h = hash(c)
-            if h in seen_hashes:
-                continue
-            seen_hashes.add(h)
-            unique_chunks.append(c)
-        return b"".join(unique_chunks)
+        with session_scope(self.SessionLocal) as s:
+            return build_beef_for_txids(s, txids, known_txids=known_txids or (), max_depth=max_depth)
 
     # ------------------------------------------------------------------
     # Additional find/list helpers
@@ -1238,17 +1216,41 @@ class StorageProvider:
         Reference:
             toolbox/ts-wallet-toolbox/src/storage/StorageProvider.ts
         """
+        return self.get_tags_for_output_ids([output_id]).get(output_id, [])
+
+    def get_tags_for_output_ids(self, output_ids: Iterable[int]) -> dict[int, list[dict[str, Any]]]:
+        """Return tags for many outputs, grouped by output id.
+
+        Summary:
+            Batch form of get_tags_for_output_id: one joined query per chunk of
+            output ids instead of one round trip per output.
+        Args:
+            output_ids: Output primary keys.
+        Returns:
+            Dict mapping outputId to a list of {outputTagId, tag} ordered by
+            outputTagId; outputs without tags are absent.
+        """
         with session_scope(self.SessionLocal) as s:
-            mq = select(OutputTagMap.output_tag_id).where(
-                (OutputTagMap.output_id == output_id) & (OutputTagMap.is_deleted.is_(False))
+            return self._tags_by_output_id(s, output_ids)
+
+    @staticmethod
+    def _tags_by_output_id(s: Session, output_ids: Iterable[int]) -> dict[int, list[dict[str, Any]]]:
+        ids = sorted({int(i) for i in output_ids if i is not None})
+        tags: dict[int, list[dict[str, Any]]] = {}
+        for chunk in chunked(ids):
+            q = (
+                select(OutputTagMap.output_id, OutputTag.output_tag_id, OutputTag.tag)
+                .join(OutputTag, OutputTag.output_tag_id == OutputTagMap.output_tag_id)
+                .where(
+                    OutputTagMap.output_id.in_(chunk),
+                    OutputTagMap.is_deleted.is_(False),
+                    OutputTag.is_deleted.is_(False),
+                )
+                .order_by(OutputTagMap.output_id, OutputTag.output_tag_id)
             )
-            tag_ids = list(s.execute(mq).scalars().all())
-            if not tag_ids:
-                return []
-            tq = select(OutputTag).where(OutputTag.output_tag_id.in_(tag_ids), OutputTag.is_deleted.is_(False))
-            _exec_result = s.execute(tq)
-            rows = _exec_result.scalars()
-            return [{"outputTagId": r.output_tag_id, "tag": r.tag} for r in rows]
+            for output_id, tag_id, tag in s.execute(q):
+                tags.setdefault(output_id, []).append({"outputTagId": tag_id, "tag": tag})
+        return tags
 
     def get_labels_for_transaction_id(self, transaction_id: int) -> list[dict[str, Any]]:
         """Return labels associated with a transaction.
@@ -1266,15 +1268,37 @@ class StorageProvider:
         Reference:
             toolbox/ts-wallet-toolbox/src/storage/StorageProvider.ts
         """
+        return self.get_labels_for_transaction_ids([transaction_id]).get(transaction_id, [])
+
+    def get_labels_for_transaction_ids(self, transaction_ids: Iterable[int]) -> dict[int, list[dict[str, Any]]]:
+        """Return labels for many transactions, grouped by transaction id.
+
+        Summary:
+            Batch form of get_labels_for_transaction_id: one joined query per
+            chunk of transaction ids instead of one round trip per transaction.
+        Args:
+            transaction_ids: Transaction primary keys.
+        Returns:
+            Dict mapping transactionId to a list of {txLabelId, label} ordered by
+            txLabelId; transactions without labels are absent.
+        """
         with session_scope(self.SessionLocal) as s:
-            mq = select(TxLabelMap.tx_label_id).where(TxLabelMap.transaction_id == transaction_id)
-            label_ids = list(s.execute(mq).scalars().all())
-            if not label_ids:
-                return []
-            tq = select(TxLabel).where(TxLabel.tx_label_id.in_(label_ids), TxLabel.is_deleted.is_(False))
-            _exec_result = s.execute(tq)
-            rows = _exec_result.scalars()
-            return [{"txLabelId": r.tx_label_id, "label": r.label} for r in rows]
+            return self._labels_by_transaction_id(s, transaction_ids)
+
+    @staticmethod
+    def _labels_by_transaction_id(s: Session, transaction_ids: Iterable[int]) -> dict[int, list[dict[str, Any]]]:
+        ids = sorted({int(i) for i in transaction_ids if i is not None})
+        labels: dict[int, list[dict[str, Any]]] = {}
+        for chunk in chunked(ids):
+            q = (
+                select(TxLabelMap.transaction_id, TxLabel.tx_label_id, TxLabel.label)
+                .join(TxLabel, TxLabel.tx_label_id == TxLabelMap.tx_label_id)
+                .where(TxLabelMap.transaction_id.in_(chunk), TxLabel.is_deleted.is_(False))
+                .order_by(TxLabelMap.transaction_id, TxLabel.tx_label_id)
+            )
+            for transaction_id, label_id, label in s.execute(q):
+                labels.setdefault(transaction_id, []).append({"txLabelId": label_id, "label": label})
+        return labels
 
     def find_outputs_auth(self, auth: dict[str, Any], args: dict[str, Any]) -> list[dict[str, Any]]:
         """Find outputs by partial filters for a user.
@@ -1513,21 +1537,21 @@ class StorageProvider:
         return bool(r.get("proven") or r.get("rawTx"))
 
     def get_valid_beef_for_txid(self, txid: str, known_txids: list[str] | None = None) -> bytes:
-        """Return a BEEF-like bytes blob for a known txid (minimal parity).
+        """Return a BEEF for a known txid.
 
         Summary:
-            Builds a BEEF-style payload for the txid using any known rawTx and
-            optionally attached MerklePath (ProvenTx). Recursively includes
-            ancestors up to a small depth, skipping any ids listed in known_txids.
+            Builds a BEEF with the txid's rawTx and the stored ancestry needed to
+            validate it (BUMPs for proven ancestors), skipping any ancestors
+            listed in known_txids (merged txid-only).
         TS parity:
-            Minimal approximation of getValidBeefForTxid.
+            Storage-only subset of getValidBeefForTxid.
         Args:
             txid: Subject transaction id.
             known_txids: Optional list of txids to treat as already known.
         Returns:
-            bytes: BEEF-like payload (may be a single-tx BEEF when possible).
+            bytes: Serialized BEEF, or b"" when the txid is not stored.
         """
-        return self._build_recursive_beef_for_txids([txid], known_txids=known_txids)
+        return self._build_beef_for_txids([txid], known_txids=known_txids)
 
     # ------------------------------------------------------------------
     # Proven helpers
@@ -1625,6 +1649,68 @@ class StorageProvider:
 
             return {"status": req.status, "history": req.history, "provenTxId": req.proven_tx_id}
 
+    def update_proven_tx_reqs_with_new_proven_txs(self, args_list: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Batched `update_proven_tx_req_with_new_proven_tx` for a group of proofs.
+
+        Summary:
+            Loads the requests with one `IN` query, inserts the missing
+            ProvenTx rows with one insert-or-ignore on `txid` and marks the
+            requests completed with one UPDATE, all in a single transaction.
+
+        Args:
+            args_list: Dicts shaped like the `args` of
+                `update_proven_tx_req_with_new_proven_tx`.
+
+        Returns:
+            One dict per input, in order: `{provenTxReqId, status, history,
+            provenTxId}`, or `{provenTxReqId, error}` when the request does not
+            exist or its txid does not match (other rows are still written).
+        """
+        if not args_list:
+            return []
+        req_ids = [int(args.get("provenTxReqId", 0)) for args in args_list]
+        results: list[dict[str, Any]] = []
+        accepted: list[tuple[dict[str, Any], ProvenTxReq, dict[str, Any]]] = []
+        with session_scope(self.SessionLocal) as s:
+            reqs: dict[int, ProvenTxReq] = {}
+            for chunk in chunked(list(dict.fromkeys(req_ids))):
+                query = select(ProvenTxReq).where(ProvenTxReq.proven_tx_req_id.in_(chunk))
+                reqs.update((req.proven_tx_req_id, req) for req in s.execute(query).scalars())
+
+            for args, req_id in zip(args_list, req_ids, strict=True):
+                req = reqs.get(req_id)
+                txid = args.get("txid")
+                if req is None:
+                    results.append({"provenTxReqId": req_id, "error": "ProvenTxReq not found"})
+                elif txid and req.txid != txid:
+                    results.append({"provenTxReqId": req_id, "error": "txid mismatch with ProvenTxReq"})
+                else:
+                    result = {"provenTxReqId": req_id, "status": "completed", "history": req.history}
+                    results.append(result)
+                    accepted.append((args, req, result))
+            if not accepted:
+                return results
+
+            rows = [
+                {
+                    "txid": req.txid,
+                    "height": int(args.get("height") or 0),
+                    "index": int(args.get("index") or 0),
+                    "merkle_path": args.get("merklePath") or b"",
+                    "raw_tx": args.get("rawTx") or req.raw_tx or b"",
+                    "block_hash": args.get("blockHash") or "0" * 64,
+                    "merkle_root": args.get("merkleRoot") or "0" * 64,
+                }
+                for args, req, _result in accepted
+            ]
+            proven_tx_ids = upsert_rows(s, ProvenTx, rows, update_existing=False)
+            updates = []
+            for (_args, req, result), proven_tx_id in zip(accepted, proven_tx_ids, strict=True):
+                result["provenTxId"] = proven_tx_id
+                updates.append((req.proven_tx_req_id, {"proven_tx_id": proven_tx_id, "status": "completed"}))
+            update_rows(s, ProvenTxReq, updates)
+        return results
+
     # ------------------------------------------------------------------
     # Listing APIs (minimal shapes)
     # ------------------------------------------------------------------
@@ -1801,10 +1887,8 @@ class StorageProvider:
                 q_tx = select(TransactionModel).where(
                     (TransactionModel.user_id == user_id) & (TransactionModel.status.in_(statuses))
                 )
-                q_count = (
-                    select(func.count())
-                    .select_from(TransactionModel)
-                    .where((TransactionModel.user_id == user_id) & (TransactionModel.status.in_(statuses)))
+                q_count = select(TransactionModel.transaction_id).where(
+                    (TransactionModel.user_id == user_id) & (TransactionModel.status.in_(statuses))
                 )
             else:
                 # Complex query with label filtering (TS lines 102-123)
@@ -1849,6 +1933,39 @@ class StorageProvider:
             _result = s.execute(q_tx)
             transactions = _result.scalars().all()
 
+            # Hydrate optional details for the whole page with grouped IN queries
+            # (TS lines 160-224 run one query set per action).
+            page_tx_ids = [tx.transaction_id for tx in transactions]
+            labels_by_tx: dict[int, list[dict[str, Any]]] = {}
+            outputs_by_tx: dict[int, list[Output]] = {}
+            inputs_by_tx: dict[int, list[Output]] = {}
+            tags_by_output: dict[int, list[dict[str, Any]]] = {}
+            basket_names: dict[int, str] = {}
+            if include_labels:
+                labels_by_tx = self._labels_by_transaction_id(s, page_tx_ids)
+            if include_outputs:
+                for chunk in chunked(page_tx_ids):
+                    q_outputs = (
+                        select(Output)
+                        .where(Output.transaction_id.in_(chunk))
+                        .order_by(Output.transaction_id, Output.output_id)
+                    )
+                    for output in s.execute(q_outputs).scalars():
+                        outputs_by_tx.setdefault(output.transaction_id, []).append(output)
+                page_outputs = [o for outs in outputs_by_tx.values() for o in outs]
+                tags_by_output = self._tags_by_output_id(s, (o.output_id for o in page_outputs))
+                basket_ids = sorted({o.basket_id for o in page_outputs if o.basket_id})
+                for chunk in chunked(basket_ids):
+                    q_baskets = select(OutputBasket.basket_id, OutputBasket.name).where(
+                        OutputBasket.basket_id.in_(chunk)
+                    )
+                    basket_names.update(dict(s.execute(q_baskets).all()))
+            if include_inputs:
+                for chunk in chunked(page_tx_ids):
+                    q_inputs = select(Output).where(Output.spent_by.in_(chunk)).order_by(Output.output_id)
+                    for input_output in s.execute(q_inputs).scalars():
+                        inputs_by_tx.setdefault(input_output.spent_by, []).append(input_output)
+
             # Build result actions (TS lines 147-157)
             for tx in transactions:
                 action = {
@@ -1864,49 +1981,21 @@ class StorageProvider:
 
                 # Optionally add labels (TS lines 167-168)
                 if include_labels:
-                    labels_for_tx = []
-                    q_labels_for_tx = (
-                        select(TxLabel)
-                        .join(TxLabelMap, TxLabelMap.tx_label_id == TxLabel.tx_label_id)
-                        .where(TxLabelMap.transaction_id == tx.transaction_id)
-                    )
-                    _result = s.execute(q_labels_for_tx)
-                    for label_obj in _result.scalars().all():
-                        labels_for_tx.append(label_obj.label)
-                    action["labels"] = labels_for_tx
+                    action["labels"] = [lbl["label"] for lbl in labels_by_tx.get(tx.transaction_id, [])]
 
                 # Optionally add outputs (TS lines 170-188)
                 if include_outputs:
                     outputs = []
-                    q_outputs = select(Output).where(Output.transaction_id == tx.transaction_id)
-                    _result = s.execute(q_outputs)
-                    for output in _result.scalars().all():
+                    for output in outputs_by_tx.get(tx.transaction_id, []):
                         output_obj: dict[str, Any] = {
                             "satoshis": output.satoshis or 0,
                             "spendable": bool(output.spendable),
-                            "tags": [],
+                            "tags": [t["tag"] for t in tags_by_output.get(output.output_id, [])],
                             "outputIndex": output.vout or 0,
                             "outputDescription": output.output_description or "",
-                            "basket": "",
+                            "basket": basket_names.get(output.basket_id, "") if output.basket_id else "",
                         }
 
-                        # Get tags for this output
-                        q_tags = (
-                            select(OutputTag)
-                            .join(OutputTagMap, OutputTagMap.output_tag_id == OutputTag.output_tag_id)
-                            .where((OutputTagMap.output_id == output.output_id) & (OutputTagMap.is_deleted.is_(False)))
-                        )
-                        _result = s.execute(q_tags)
-                        output_obj["tags"] = [t.tag for t in _result.scalars().all()]
-
-                        # Get basket name
-                        if output.basket_id:
-                            q_basket = select(OutputBasket).where(OutputBasket.basket_id == output.basket_id)
-                            _result = s.execute(q_basket)
-                            basket = _result.scalar_one_or_none()
-                            if basket:
-                                output_obj["basket"] = basket.name
-
                         # Add locking script if requested
                         if include_output_scripts:
                             output_obj["lockingScript"] = output.locking_script or ""
@@ -1918,15 +2007,17 @@ class StorageProvider:
                 # Optionally add inputs (TS lines 190-219)
                 if include_inputs:
                     inputs = []
-                    q_inputs = select(Output).where(Output.spent_by == tx.transaction_id)
-                    _result = s.execute(q_inputs)
-                    input_outputs = _result.scalars().all()
+                    input_outputs = inputs_by_tx.get(tx.transaction_id, [])
 
-                    # Parse transaction for input details if available
-                    bsv_tx = None
+                    # Parse transaction for input details if available; index its inputs by outpoint
+                    tx_inputs_by_outpoint: dict[tuple[str, int], Any] = {}
                     if input_outputs and tx.raw_tx:
                         try:
                             bsv_tx = BsvTransaction.from_hex(tx.raw_tx)
+                            for bsv_input in bsv_tx.inputs:
+                                tx_inputs_by_outpoint.setdefault(
+                                    (bsv_input.source_txid, bsv_input.source_output_index), bsv_input
+                                )
                         except Exception:
                             pass
 
@@ -1939,30 +2030,19 @@ class StorageProvider:
                         }
 
                         # Get sequence number from parsed transaction if available
-                        if bsv_tx:
-                            for bsv_input in bsv_tx.inputs:
-                                if (
-                                    bsv_input.source_txid == input_output.txid
-                                    and bsv_input.source_output_index == input_output.vout
-                                ):
-                                    input_obj["sequenceNumber"] = bsv_input.sequence
-                                    break
+                        bsv_input = tx_inputs_by_outpoint.get((input_output.txid, input_output.vout))
+                        if bsv_input is not None:
+                            input_obj["sequenceNumber"] = bsv_input.sequence
 
                         # Add source locking script if requested
                         if include_input_source_scripts:
                             input_obj["sourceLockingScript"] = input_output.locking_script or ""
 
                         # Add unlocking script if requested
-                        if include_input_unlocking_scripts and bsv_tx:
-                            for bsv_input in bsv_tx.inputs:
-                                if (
-                                    bsv_input.source_txid == input_output.txid
-                                    and bsv_input.source_output_index == input_output.vout
-                                ):
-                                    unlocking = bsv_input.unlocking_script
-                                    if unlocking and hasattr(unlocking, "to_hex"):
-                                        input_obj["unlockingScript"] = unlocking.to_hex()
-                                    break
+                        if include_input_unlocking_scripts and bsv_input is not None:
+                            unlocking = bsv_input.unlocking_script
+                            if unlocking and hasattr(unlocking, "to_hex"):
+                                input_obj["unlockingScript"] = unlocking.to_hex()
 
                         inputs.append(input_obj)
 
@@ -2255,15 +2335,21 @@ class StorageProvider:
             for i, out_data in enumerate(pending):
                 out_data["vout"] = vout_indices[i]
 
-        # Phase 3: Insert outputs and build result
-        for out_data in pending:
-            tags = out_data.pop("_tags")
-            basket_name = out_data.pop("_basket_name")
-            key_offset = out_data.pop("_key_offset")
-            is_change = out_data.pop("_is_change")
-
+        # Phase 3: Insert outputs (one batch) and build result
+        extras = [
+            (
+                out_data.pop("_tags"),
+                out_data.pop("_basket_name"),
+                out_data.pop("_key_offset"),
+                out_data.pop("_is_change"),
+            )
+            for out_data in pending
+        ]
+        output_ids = self.insert_many_outputs(pending)
+        for out_data, (tags, basket_name, key_offset, is_change), output_id in zip(
+            pending, extras, output_ids, strict=True
+        ):
             locking_script = out_data["lockingScript"]
-            output_id = self.insert_output(out_data)
 
             for tag_name in tags:
                 tag_record = self.find_or_insert_output_tag(user_id, tag_name)
@@ -2398,10 +2484,12 @@ class StorageProvider:
                 )
                 o = session.execute(q).scalar_one_or_none()
                 if o:
+                    balance = BalanceSnapshot.take(session, output_ids=[o.output_id])
                     o.spendable = False
                     o.spent_by = ctx["transactionId"]
                     o.spending_description = xi.get("inputDescription")
                     session.add(o)
+                    balance.apply(session)
                     session.commit()
             finally:
                 session.close()
@@ -2520,21 +2608,8 @@ class StorageProvider:
     # ------------------------------------------------------------------
 
     def count_funding_inputs(self, user_id: int, basket_id: int, exclude_sending: bool) -> int:
-        # Match allocate_funding_input allowed statuses for consistency
-        allowed_status = ["completed", "unsigned", "nosend", "unproven"]
-        if not exclude_sending:
-            allowed_status.append("sending")
-
-        stmt = (
-            select(func.count(Output.output_id))
-            .join(TransactionModel, Output.transaction_id == TransactionModel.transaction_id)
-            .where(
-                (Output.user_id == user_id)
-                & (Output.basket_id == basket_id)
-                & (Output.spendable.is_(True))
-                & (TransactionModel.status.in_(allowed_status))
-            )
-        )
+        # Same conditions as allocate_funding_input
+        stmt = select(func.count(Output.output_id)).where(*funding_conditions(user_id, basket_id, exclude_sending))
         session = self.SessionLocal()
         try:
             return session.execute(stmt).scalar() or 0
@@ -2550,122 +2625,78 @@ class StorageProvider:
         exclude_sending: bool,
         transaction_id: int,
     ) -> Output | None:
-        # Allow "unsigned" and "nosend" status for wallet-managed outputs (change outputs from noSend transactions)
-        # These are safe to spend because we control the keys
-        # Matches Go implementation: wdk.TxStatusUnsigned, wdk.TxStatusNoSend
-        # NOTE: "unproven" outputs are allowed for funding (matches TypeScript: StorageIdb.ts, StorageKnex.ts)
-        # The restriction on "unproven" applies to inputs (which are considered spent by ARC), not outputs
-        allowed_status = ["completed", "unsigned", "nosend", "unproven"]
-        if not exclude_sending:
-            allowed_status.append("sending")
-
-        # Allocate spendable outputs from the specified basket for automatic funding.
-        #
-        # Only allocate outputs with type='P2PKH' because the wallet signer only supports
-        # signing P2PKH inputs (buildSignableTransaction.ts:120).
-        #
-        # Basket insertions with type='custom' cannot be used for funding because the signer
-        # cannot generate unlocking scripts for them.
-        #
-        # Note: change=True filter is not strictly necessary (wallet payments have it, basket
-        # insertions don't), but including it ensures we only use wallet-managed change outputs.
-        # TEMPORARY: Also accept "custom" type outputs that might be P2PKH
-        base_cond = (
-            (Output.user_id == user_id)
-            & (Output.spendable.is_(True))
-            & (Output.basket_id == basket_id)
-            & ((Output.type == "P2PKH") | (Output.type == "custom"))
-            & (TransactionModel.status.in_(allowed_status))
-        )
+        """Claim one change output of the basket to fund ``transaction_id``.
 
-        session = self.SessionLocal()
+        Summary:
+            Prefers an exact match, then the smallest output >= target, then the
+            largest output below target. Each candidate is claimed with a single
+            guarded UPDATE (see storage.utxo_allocator), so concurrent funders
+            never receive the same output and no row locks are held. Uses the
+            in-process free-list when enabled via enable_utxo_free_list.
+        TS parity:
+            Mirrors allocateChangeInput (StorageKnex.ts).
+        Args:
+            user_id: Owning user.
+            basket_id: Change basket to fund from.
+            target_satoshis: Amount still needed.
+            exact_satoshis: Preferred exact amount, if any.
+            exclude_sending: Exclude outputs of transactions in "sending" status.
+            transaction_id: Spending transaction recorded in spentBy.
+        Returns:
+            The claimed Output, or None if no fundable output exists.
+        """
+        with session_scope(self.SessionLocal) as s:
+            return claim_funding_output(
+                s,
+                user_id=user_id,
+                basket_id=basket_id,
+                target_satoshis=target_satoshis,
+                exact_satoshis=exact_satoshis,
+                exclude_sending=exclude_sending,
+                transaction_id=transaction_id,
+                free_list=self._utxo_free_list,
+            )
 
-        try:
-            output = None
-            output_id = None
-
-            # 1. Exact match
-            if exact_satoshis is not None:
-                q = (
-                    select(Output)
-                    .join(TransactionModel, Output.transaction_id == TransactionModel.transaction_id)
-                    .where(base_cond, Output.satoshis == exact_satoshis)
-                    .limit(1)
-                    .with_for_update()
-                )
-                output = session.execute(q).scalar_one_or_none()
-                if output:
-                    output_id = output.output_id
-
-            # 2. Best fit (Smallest output >= target)
-            if output is None:
-                q = (
-                    select(Output)
-                    .join(TransactionModel, Output.transaction_id == TransactionModel.transaction_id)
-                    .where(base_cond, Output.satoshis >= target_satoshis)
-                    .order_by(Output.satoshis.asc())
-                    .limit(1)
-                    .with_for_update()
-                )
-                results = session.execute(q).scalars().all()
-                output = results[0] if results else None
-                if output:
-                    output_id = output.output_id
-
-            # 3. Closest under (Largest output < target)
-            if output is None:
-                q = (
-                    select(Output)
-                    .join(TransactionModel, Output.transaction_id == TransactionModel.transaction_id)
-                    .where(base_cond, Output.satoshis < target_satoshis)
-                    .order_by(Output.satoshis.desc())
-                    .limit(1)
-                    .with_for_update()
-                )
-                output = session.execute(q).scalar_one_or_none()
-                if output:
-                    output_id = output.output_id
-
-            if output and output_id:
-                # Use update_output method for consistency with TypeScript (TS uses updateOutput in allocateChangeInput)
-                # This ensures proper transaction handling and avoids potential session issues
-                self.update_output(
-                    output_id,
-                    {
-                        "spendable": False,
-                        "spent_by": transaction_id,
-                        "spending_description": f"Allocated for transaction {transaction_id}",
-                    },
-                )
+    def enable_utxo_free_list(self, max_age_seconds: float = 30.0) -> None:
+        """Keep an in-process, per-basket sorted free-list of funding candidates.
 
-                # Refresh the output object to reflect the changes
-                session.refresh(output)
-                return output
+        Summary:
+            Concurrent allocate_funding_input calls then pop distinct candidates
+            from memory and claim them by primary key instead of ranking the
+            basket in the database. Claims stay guarded, so the list is only a
+            hint: writers in this provider invalidate it and it is reloaded
+            after max_age_seconds to pick up changes made by other processes.
+        Args:
+            max_age_seconds: Maximum age of a basket's cached candidates.
+        """
+        self._utxo_free_list = UtxoFreeList(max_age_seconds=max_age_seconds)
 
-            return None
-        except Exception:
-            session.rollback()
-            raise
-        finally:
-            session.close()
+    def _utxo_free_list_changed(self, user_id: int | None = None) -> None:
+        if self._utxo_free_list is not None:
+            self._utxo_free_list.invalidate(user_id)
 
     def fund_new_transaction_sdk(self, user_id: int, vargs: Any, ctx: dict[str, Any]) -> dict[str, Any]:
-        fixed_inputs = [
-            GenerateChangeSdkInput(
-                satoshis=xi.get("sourceSatoshis", 0),
-                unlocking_script_length=xi.get("unlockingScriptLength", 0),
-            )
-            for xi in ctx["xinputs"]
-        ]
-
-        fixed_outputs = [
-            GenerateChangeSdkOutput(
-                satoshis=xo.satoshis,
-                locking_script_length=len(xo.locking_script),
-            )
-            for xo in ctx["xoutputs"]
-        ]
+        """Select funding inputs and change outputs for a new transaction.
 
+        Summary:
+            Runs generate_change_sdk over the change basket. In batched mode
+            (``self.batch_funding``, the default) the candidates are prefetched
+            in one query, selection runs in memory and the chosen outputs are
+            claimed together in one transaction; a lost race re-runs selection
+            on a fresh window. Otherwise every allocation and release is its own
+            storage round-trip via allocate_funding_input.
+        TS parity:
+            Mirrors fundNewTransactionSdk (createAction.ts); selection order is
+            the same in both modes.
+        Args:
+            user_id: Owning user.
+            vargs: Validated createAction args.
+            ctx: createAction context (xinputs, xoutputs, changeBasket, feeModel, transactionId).
+        Returns:
+            Dict with allocatedChange, changeOutputs, maxPossibleSatoshisAdjustment, fee and size.
+        Raises:
+            InsufficientFundsError: If the basket cannot fund the transaction.
+        """
         change_basket = ctx["changeBasket"]
         # Handle both dict and object forms of change_basket
         change_basket_id = change_basket["basketId"] if isinstance(change_basket, dict) else change_basket.basket_id
@@ -2685,28 +2716,82 @@ class StorageProvider:
         available_count = ctx["availableFundingCount"]
         target_net_count = max(0, desired_utxos - available_count)
 
-        params = GenerateChangeSdkParams(
-            fixed_inputs=fixed_inputs,
-            fixed_outputs=fixed_outputs,
-            fee_model=ctx["feeModel"],
-            change_initial_satoshis=min_utxo_value,
-            change_first_satoshis=1,
-            change_locking_script_length=25,
-            change_unlocking_script_length=107,
-            target_net_count=target_net_count,
-            random_vals=vargs.random_vals,
-        )
+        def make_params() -> GenerateChangeSdkParams:
+            # generate_change_sdk adjusts a maxPossibleSatoshis output in place, so build fresh params per run
+            return GenerateChangeSdkParams(
+                fixed_inputs=[
+                    GenerateChangeSdkInput(
+                        satoshis=xi.get("sourceSatoshis", 0),
+                        unlocking_script_length=xi.get("unlockingScriptLength", 0),
+                    )
+                    for xi in ctx["xinputs"]
+                ],
+                fixed_outputs=[
+                    GenerateChangeSdkOutput(satoshis=xo.satoshis, locking_script_length=len(xo.locking_script))
+                    for xo in ctx["xoutputs"]
+                ],
+                fee_model=ctx["feeModel"],
+                change_initial_satoshis=min_utxo_value,
+                change_first_satoshis=1,
+                change_locking_script_length=25,
+                change_unlocking_script_length=107,
+                target_net_count=target_net_count,
+                random_vals=vargs.random_vals,
+            )
+
+        exclude_sending = not vargs.is_delayed
+        result = None
+        if self.batch_funding:
+            result = self._fund_from_window(
+                user_id, change_basket_id, exclude_sending, ctx["transactionId"], make_params
+            )
+        if result is None:
+            result = self._fund_per_input(user_id, change_basket_id, exclude_sending, ctx["transactionId"], make_params)
+
+        allocated_change_outputs = []
+        ids = [aci.output_id for aci in result.allocated_funding_inputs]
+        with session_scope(self.SessionLocal) as s:
+            rows = {o.output_id: o for o in s.execute(select(Output).where(Output.output_id.in_(ids))).scalars()}
+        for output_id in ids:
+            o = rows.get(output_id)
+            if o is None:
+                continue
+            output_dict = self._model_to_dict(o)
+
+            # Ensure lockingScript is a hex string (not bytes)
+            if isinstance(output_dict.get("lockingScript"), bytes):
+                output_dict["lockingScript"] = output_dict["lockingScript"].hex()
+            elif not output_dict.get("lockingScript"):
+                # If locking script is missing, set to empty string
+                # The signer will regenerate it from derivation data
+                output_dict["lockingScript"] = ""
+
+            allocated_change_outputs.append(output_dict)
+
+        return {
+            "allocatedChange": allocated_change_outputs,
+            "changeOutputs": result.change_outputs,
+            # derivationPrefix is now generated at createAction level for consistency
+            "maxPossibleSatoshisAdjustment": result.max_possible_satoshis_adjustment,
+            "fee": result.fee,
+            "size": result.size,
+        }
+
+    def _fund_per_input(
+        self,
+        user_id: int,
+        basket_id: int,
+        exclude_sending: bool,
+        transaction_id: int,
+        make_params: Callable[[], GenerateChangeSdkParams],
+    ) -> GenerateChangeSdkResult:
+        """Run change generation with one storage round-trip per allocation and release."""
 
         def allocate_cb(
             target_satoshis: int, exact_satoshis: int | None = None
         ) -> GenerateChangeSdkFundingInput | None:
             o = self.allocate_funding_input(
-                user_id,
-                change_basket_id,
-                target_satoshis,
-                exact_satoshis,
-                not vargs.is_delayed,
-                ctx["transactionId"],
+                user_id, basket_id, target_satoshis, exact_satoshis, exclude_sending, transaction_id
             )
             if o:
                 # Handle both dict and object forms
@@ -2721,43 +2806,69 @@ class StorageProvider:
                 stmt = select(Output).where(Output.output_id == output_id)
                 o = session.execute(stmt).scalar_one_or_none()
                 if o:
+                    balance = BalanceSnapshot.take(session, output_ids=[output_id])
                     o.spendable = True
                     o.spent_by = None
                     session.add(o)
+                    balance.apply(session)
                     session.commit()
+                    if self._utxo_free_list is not None and o.basket_id is not None:
+                        self._utxo_free_list.put(o.user_id, o.basket_id, o.output_id, o.satoshis)
             finally:
                 session.close()
 
-        result = generate_change_sdk(params, allocate_cb, release_cb)
+        return generate_change_sdk(make_params(), allocate_cb, release_cb)
 
-        allocated_change_outputs = []
-        for aci in result.allocated_funding_inputs:
-            session = self.SessionLocal()
-            try:
-                o = session.get(Output, aci.output_id)
-                if o:
-                    output_dict = self._model_to_dict(o)
-
-                    # Ensure lockingScript is a hex string (not bytes)
-                    if isinstance(output_dict.get("lockingScript"), bytes):
-                        output_dict["lockingScript"] = output_dict["lockingScript"].hex()
-                    elif not output_dict.get("lockingScript"):
-                        # If locking script is missing, set to empty string
-                        # The signer will regenerate it from derivation data
-                        output_dict["lockingScript"] = ""
+    def _fund_from_window(
+        self,
+        user_id: int,
+        basket_id: int,
+        exclude_sending: bool,
+        transaction_id: int,
+        make_params: Callable[[], GenerateChangeSdkParams],
+    ) -> GenerateChangeSdkResult | None:
+        """Run change generation against a prefetched window and claim the result at once.
 
-                    allocated_change_outputs.append(output_dict)
-            finally:
-                session.close()
+        Returns None when batched funding cannot decide on its own (window
+        truncated and short of funds, or repeated lost races); the caller
+        then falls back to per-input allocation.
+        """
+        for _ in range(MAX_CLAIM_ATTEMPTS):
+            with session_scope(self.SessionLocal) as s:
+                window = load_funding_window(s, user_id=user_id, basket_id=basket_id, exclude_sending=exclude_sending)
+
+            def allocate_cb(
+                target_satoshis: int, exact_satoshis: int | None = None, window: FundingWindow = window
+            ) -> GenerateChangeSdkFundingInput | None:
+                picked = window.allocate(target_satoshis, exact_satoshis)
+                if picked is None:
+                    return None
+                return GenerateChangeSdkFundingInput(output_id=picked[0], satoshis=picked[1])
 
-        return {
-            "allocatedChange": allocated_change_outputs,
-            "changeOutputs": result.change_outputs,
-            # derivationPrefix is now generated at createAction level for consistency
-            "maxPossibleSatoshisAdjustment": result.max_possible_satoshis_adjustment,
-            "fee": result.fee,
-            "size": result.size,
-        }
+            try:
+                result = generate_change_sdk(make_params(), allocate_cb, window.release)
+            except InsufficientFundsError:
+                if window.truncated:
+                    return None
+                raise
+
+            ids = [aci.output_id for aci in result.allocated_funding_inputs]
+            with session_scope(self.SessionLocal) as s:
+                claimed = claim_funding_outputs(
+                    s,
+                    user_id=user_id,
+                    basket_id=basket_id,
+                    exclude_sending=exclude_sending,
+                    transaction_id=transaction_id,
+                    output_ids=ids,
+                )
+                if not claimed:
+                    s.rollback()
+            if claimed:
+                if ids:
+                    self._utxo_free_list_changed(user_id)
+                return result
+        return None
 
     # ------------------------------------------------------------------
     # Action Pipeline - processAction (Complete Implementation)
@@ -2917,6 +3028,8 @@ class StorageProvider:
             else:
                 raise InvalidParameterError("args", "invalid combination of flags")
 
+            balance = BalanceSnapshot.take(s, transaction_ids=[transaction.transaction_id])
+
             # Update transaction record (TS line 384)
             transaction.txid = txid
             transaction.raw_tx = raw_tx
@@ -2964,7 +3077,8 @@ class StorageProvider:
                             f"Failed to extract locking script for output {output.output_id} vout {output.vout}: {e}"
                         )
                 s.add(output)
-            s.flush()
+            balance.apply(s)
+            self._utxo_free_list_changed()
 
             # Create or update ProvenTxReq (TS line 271)
             existing_req_stmt = select(ProvenTxReq).where(ProvenTxReq.txid == txid)
@@ -3031,6 +3145,8 @@ class StorageProvider:
                 session.execute(select(TransactionModel).where(TransactionModel.txid.in_(txids))).scalars().all()
             )
             tx_map = {tx.txid: tx for tx in tx_records if tx.txid}
+            tx_ids = [tx.transaction_id for tx in tx_records]
+            balance = BalanceSnapshot.take(session, transaction_ids=tx_ids, spent_by_ids=tx_ids)
 
             if is_delayed:
                 # self.logger.debug("_share_reqs_with_world: is_delayed=True → mark as unsent, no immediate broadcast")
@@ -3044,6 +3160,8 @@ class StorageProvider:
                     if tx_model:
                         tx_model.status = "unprocessed"
                     swr.append({"txid": txid, "status": "sending"})
+                balance.apply(session)
+                self._utxo_free_list_changed()
                 session.commit()
                 return swr, None
 
@@ -3184,6 +3302,8 @@ class StorageProvider:
                             }
                         )
 
+            balance.apply(session)
+            self._utxo_free_list_changed()
             session.commit()
             return swr, ndr
         finally:
@@ -3402,6 +3522,11 @@ class StorageProvider:
             # Convert camelCase column name to snake_case Python attribute
             pk_attr_name = StorageProvider._to_snake_case(pk_col.name)
             pk_value = getattr(obj, pk_attr_name)
+            if model is Output:
+                balance = BalanceSnapshot()
+                balance.add_new_outputs([pk_value])
+                balance.apply(session)
+                self._utxo_free_list_changed()
             # Expunge object to remove it from the current SQLAlchemy session,
             # allowing safe re-querying in different sessions/transactions and
             # preventing potential DetachedInstanceError.
@@ -3413,8 +3538,94 @@ class StorageProvider:
             if not trx:
                 session.close()
 
+    def _insert_many_generic(self, table_name: str, rows: list[dict[str, Any]], trx: Any = None) -> list[int]:
+        """Insert many rows into the specified table in one transaction.
+
+        Summary:
+            Set-based counterpart of _insert_generic: camelCase keys are
+            normalised and all rows are written with executemany INSERT
+            statements (RETURNING where supported) instead of one flush per row.
+
+        Args:
+            table_name: Logical table name.
+            rows: Payload dicts (camelCase accepted).
+            trx: Optional active SQLAlchemy session for batching.
+
+        Returns:
+            Primary key value of each inserted row, in input order.
+        """
+        model = self._get_model(table_name)
+        converted = [self._normalize_dict_keys(row) for row in rows]
+        session = trx if trx else self.SessionLocal()
+        try:
+            pk_values = insert_rows(session, model, converted)
+            if model is Output and pk_values:
+                balance = BalanceSnapshot()
+                balance.add_new_outputs(pk_values)
+                balance.apply(session)
+                self._utxo_free_list_changed()
+            if not trx:
+                session.commit()
+            return pk_values
+        finally:
+            if not trx:
+                session.close()
+
+    def _upsert_many_generic(
+        self, table_name: str, rows: list[dict[str, Any]], trx: Any = None, update_existing: bool = True
+    ) -> list[int]:
+        """Insert many rows, updating rows whose unique key already exists.
+
+        Summary:
+            Uses INSERT ... ON CONFLICT (SQLite, Postgres) or ON DUPLICATE KEY
+            UPDATE (MySQL) keyed on the table's unique constraint, inside one
+            transaction.
+
+        Args:
+            table_name: Logical table name.
+            rows: Payload dicts (camelCase accepted); each must include the
+                table's unique key columns.
+            trx: Optional active SQLAlchemy session for batching.
+            update_existing: When False, existing rows are left unchanged.
+
+        Returns:
+            Primary key value of each row (inserted or existing), in input order.
+
+        Raises:
+            InvalidParameterError: If the table has no unique key or a row lacks it.
+        """
+        model = self._get_model(table_name)
+        converted = [self._normalize_dict_keys(row) for row in rows]
+        session = trx if trx else self.SessionLocal()
+        try:
+            balance = None
+            if model is Output or model is TransactionModel:
+                # Existing rows may change their balance contribution; new ones contributed nothing
+                existing = [pk for pk in find_row_ids(session, model, converted) if pk is not None]
+                if model is Output:
+                    balance = BalanceSnapshot.take(session, output_ids=existing)
+                else:
+                    balance = BalanceSnapshot.take(session, transaction_ids=existing)
+            pk_values = upsert_rows(session, model, converted, update_existing=update_existing)
+            if balance is not None:
+                if model is Output:
+                    balance.add_new_outputs(pk_values)
+                balance.apply(session)
+                self._utxo_free_list_changed()
+            if not trx:
+                session.commit()
+            return pk_values
+        finally:
+            if not trx:
+                session.close()
+
     def _find_generic(
-        self, table_name: str, args: dict[str, Any] | None = None, limit: int | None = None, offset: int = 0
+        self,
+        table_name: str,
+        args: dict[str, Any] | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        columns: Iterable[str] | None = None,
     ) -> list[dict[str, Any]]:
         """Retrieve rows from a table with optional equality filters.
 
@@ -3430,6 +3641,8 @@ class StorageProvider:
             args: Optional filter dict or `partial` query payload.
             limit: Optional LIMIT clause.
             offset: Optional OFFSET clause.
+            columns: Optional column names (camelCase accepted); when given
+                only these columns are selected and returned.
 
         Returns:
             List of dicts in camelCase shape.
@@ -3438,25 +3651,96 @@ class StorageProvider:
             - toolbox/ts-wallet-toolbox/src/storage/StorageReaderWriter.ts
         """
         model = self._get_model(table_name)
+        keys: tuple[str, ...] = ()
+        if columns is not None:
+            selected, keys = self._projection(model, columns)
         with session_scope(self.SessionLocal) as s:
-            query: Any = select(model)
-            if args:
-                normalized_args = self._normalize_dict_keys(args)
-                for key, value in normalized_args.items():
-                    column = getattr(model, key, None)
-                    if column is None:
-                        continue
-                    if isinstance(value, Iterable) and not isinstance(value, (bytes, bytearray, str, dict)):
-                        query = query.where(column.in_(list(value)))
-                    else:
-                        query = query.where(column == value)
+            query: Any = self._where_args(select(*selected) if keys else select(model), model, args)
             if limit:
                 query = query.limit(limit)
             if offset:
                 query = query.offset(offset)
+            if keys:
+                return [dict(zip(keys, row, strict=True)) for row in s.execute(query)]
             result = s.execute(query).scalars().all()
             return [self._model_to_dict(obj) for obj in result]
 
+    def _iter_generic(
+        self,
+        table_name: str,
+        args: dict[str, Any] | None = None,
+        batch_size: int = ITER_BATCH_SIZE,
+        descending: bool = False,
+        columns: Iterable[str] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream rows of a table in primary-key order using keyset pagination.
+
+        Summary:
+            Same filters and projection as `_find_generic`, but rows are read
+            `batch_size` at a time with `WHERE pk > :last ORDER BY pk LIMIT n`
+            (no OFFSET), each page in its own short session. Memory stays
+            bounded by one page, and rows the caller updates while iterating
+            do not shift later pages.
+
+        Args:
+            table_name: Logical table key.
+            args: Optional filter dict (camelCase accepted).
+            batch_size: Rows fetched per query.
+            descending: Walk the primary key from highest to lowest.
+            columns: Optional column names; when given only these columns
+                are selected and returned.
+
+        Yields:
+            One camelCase dict per row.
+
+        Raises:
+            InvalidParameterError: If `batch_size` is not positive or a column
+                name is unknown.
+        """
+        if batch_size < 1:
+            raise InvalidParameterError("batch_size", "a positive integer")
+        model = self._get_model(table_name)
+        keys: tuple[str, ...] = ()
+        if columns is not None:
+            selected, keys = self._projection(model, columns)
+        mapper: Any = inspect(model)
+        pk_columns = [getattr(model, mapper.get_property_by_column(column).key) for column in mapper.primary_key]
+        n_pk = len(pk_columns)
+        # Composite primary keys (tag/label maps) page on a row-value comparison
+        cursor: Any = tuple_(*pk_columns) if n_pk > 1 else pk_columns[0]
+        query: Any = self._where_args(select(*pk_columns, *(selected if keys else [model])), model, args)
+        query = query.order_by(*(column.desc() if descending else column.asc() for column in pk_columns))
+
+        last: tuple[Any, ...] | None = None
+        while True:
+            page = query
+            if last is not None:
+                bound = tuple_(*last) if n_pk > 1 else last[0]
+                page = page.where(cursor < bound if descending else cursor > bound)
+            with session_scope(self.SessionLocal) as s:
+                rows = s.execute(page.limit(batch_size)).all()
+                if keys:
+                    batch = [dict(zip(keys, row[n_pk:], strict=True)) for row in rows]
+                else:
+                    batch = [self._model_to_dict(row[n_pk]) for row in rows]
+            # Yield outside the session so the caller may write while iterating
+            yield from batch
+            if len(rows) < batch_size:
+                return
+            last = tuple(rows[-1][:n_pk])
+
+    def _where_args(self, query: Any, model: type, args: dict[str, Any] | None) -> Any:
+        """Add equality / IN filters for `args` (camelCase accepted) to `query`; unknown keys are ignored."""
+        for key, value in self._normalize_dict_keys(args).items():
+            column = getattr(model, key, None)
+            if column is None:
+                continue
+            if isinstance(value, Iterable) and not isinstance(value, (bytes, bytearray, str, dict)):
+                query = query.where(column.in_(list(value)))
+            else:
+                query = query.where(column == value)
+        return query
+
     def _count_generic(self, table_name: str, args: dict[str, Any] | None = None) -> int:
         """Return count of rows satisfying filters for the given table.
 
@@ -3479,17 +3763,7 @@ class StorageProvider:
         """
         model = self._get_model(table_name)
         with session_scope(self.SessionLocal) as s:
-            query = select(func.count()).select_from(model)
-            if args:
-                normalized_args = self._normalize_dict_keys(args)
-                for key, value in normalized_args.items():
-                    column = getattr(model, key, None)
-                    if column is None:
-                        continue
-                    if isinstance(value, Iterable) and not isinstance(value, (bytes, bytearray, str, dict)):
-                        query = query.where(column.in_(list(value)))
-                    else:
-                        query = query.where(column == value)
+            query = self._where_args(select(func.count()).select_from(model), model, args)
             result = s.execute(query).scalar()
             return result or 0
 
@@ -3497,8 +3771,8 @@ class StorageProvider:
         """Update a row identified by primary key using camelCase patches.
 
         Summary:
-            Loads the row, converts patch keys to snake_case, applies the
-            update, and commits the transaction.
+            Converts patch keys to snake_case and issues a direct
+            ``UPDATE ... WHERE pk = :pk`` (no ORM load), then commits.
 
         TS parity:
             Parallel to TS update helpers that operate on arbitrary tables.
@@ -3514,33 +3788,82 @@ class StorageProvider:
         Reference:
             - toolbox/ts-wallet-toolbox/src/storage/StorageReaderWriter.ts
         """
+        return self._update_many_generic(table_name, [(pk_value, patch)])
+
+    def _update_many_generic(self, table_name: str, updates: Iterable[tuple[int, dict[str, Any]]]) -> int:
+        """Apply many primary-key patches to a table in one transaction.
+
+        Summary:
+            Rows sharing an identical patch are updated with one
+            ``UPDATE ... WHERE pk IN (...)``; other patches are batched by key
+            set. Output and transaction updates keep the wallet balance
+            aggregate in step.
+
+        Args:
+            table_name: Logical table key.
+            updates: (primary key, patch) pairs; patch keys camelCase accepted.
+                Keys that are not columns of the table are ignored.
+
+        Returns:
+            Number of matching rows.
+        """
         model = self._get_model(table_name)
+        normalized = [(pk_value, self._normalize_dict_keys(patch)) for pk_value, patch in updates]
+        if not normalized:
+            return 0
         with session_scope(self.SessionLocal) as s:
-            mapper = inspect(model)
-            pk_col = mapper.primary_key[0]
-            # Get the Python attribute name for the primary key (not the DB column name)
-            pk_attr_name = pk_col.name
-            for prop in mapper.attrs:
-                if hasattr(prop, "columns") and pk_col in prop.columns:
-                    pk_attr_name = prop.key
-                    break
-            query = select(model).where(getattr(model, pk_attr_name) == pk_value)
-            obj = s.execute(query).scalar_one_or_none()
-            if not obj:
-                return 0
-            normalized_patch = self._normalize_dict_keys(patch)
-            for key, value in normalized_patch.items():
-                if hasattr(obj, key):
-                    setattr(obj, key, value)
-            s.commit()
-            return 1
+            balance = None
+            pk_values = [pk_value for pk_value, _ in normalized]
+            if model is Output:
+                balance = BalanceSnapshot.take(s, output_ids=pk_values)
+            elif model is TransactionModel:
+                balance = BalanceSnapshot.take(s, transaction_ids=pk_values)
+            matched = update_rows(s, model, normalized)
+            if balance is not None:
+                balance.apply(s)
+                self._utxo_free_list_changed()
+            return matched
+
+    def update_many(self, table_name: str, updates: Iterable[tuple[int, dict[str, Any]]]) -> int:
+        """Update many rows of a table by primary key.
+
+        Summary:
+            Batched form of the ``update_*`` methods for callers that patch
+            many rows per cycle (status transitions, attempt counters).
+        Args:
+            table_name: Logical table key (e.g. "transaction", "proven_tx_req").
+            updates: (primary key, camelCase patch) pairs.
+        Returns:
+            Number of matching rows.
+        """
+        return self._update_many_generic(table_name, updates)
+
+    # Per-model (column getter, camelCase keys, attribute names), built on first use by _row_converter
+    _ROW_CONVERTERS: ClassVar[dict[type, tuple[Callable[[Any], Any], tuple[str, ...], tuple[str, ...]]]] = {}
+
+    @classmethod
+    def _row_converter(cls, model: type) -> tuple[Callable[[Any], Any], tuple[str, ...], tuple[str, ...]]:
+        """Return the cached column getter, camelCase keys and attribute names of a model.
+
+        The getter returns the values of all mapped columns, in mapper column
+        order, as a tuple.
+        """
+        converter = cls._ROW_CONVERTERS.get(model)
+        if converter is None:
+            mapper: Any = inspect(model)
+            # Use the ORM attribute names (not the DB column names)
+            attrs = tuple(mapper.get_property_by_column(column).key for column in mapper.columns)
+            keys = tuple(cls._to_api_key(attr) for attr in attrs)
+            getter = attrgetter(*attrs) if len(attrs) > 1 else _single_column_getter(attrs[0])
+            converter = cls._ROW_CONVERTERS[model] = (getter, keys, attrs)
+        return converter
 
     def _model_to_dict(self, obj: Any) -> dict[str, Any]:
         """Convert ORM model instance into camelCase dict for API responses.
 
         Summary:
-            Iterates mapped columns, resolves SQLAlchemy attribute names, and
-            normalises them to camelCase to satisfy TS parity.
+            Reads all mapped columns through the model's cached row converter
+            and keys them in camelCase to satisfy TS parity.
 
         Args:
             obj: SQLAlchemy model instance.
@@ -3548,23 +3871,31 @@ class StorageProvider:
         Returns:
             Dict representation with camelCase keys.
         """
-        mapper = inspect(obj.__class__)
-        result = {}
-        for column in mapper.columns:
-            # Use the ORM attribute name (not the DB column name)
-            attr_name = column.name
-            # Get the Python attribute from mapper
-            for prop in mapper.attrs:
-                if hasattr(prop, "columns") and column in prop.columns:
-                    attr_name = prop.key
-                    break
-
-            value = getattr(obj, attr_name)
-            api_key = self._to_api_key(attr_name)
-            result[api_key] = value
-        return result
+        getter, keys, _attrs = self._row_converter(obj.__class__)
+        return dict(zip(keys, getter(obj), strict=True))
+
+    def _projection(self, model: type, columns: Iterable[str]) -> tuple[list[Any], tuple[str, ...]]:
+        """Resolve requested camelCase/snake_case column names of a model.
+
+        Returns:
+            (column attributes to select, camelCase result keys)
+
+        Raises:
+            InvalidParameterError: If a name is not a column of the model.
+        """
+        _getter, keys, attrs = self._row_converter(model)
+        selected: list[Any] = []
+        result_keys: list[str] = []
+        for name in columns:
+            api_key = self._to_api_key(self._normalize_key(name))
+            if api_key not in keys:
+                raise InvalidParameterError("columns", f"columns of {model.__tablename__}, not '{name}'")
+            selected.append(getattr(model, attrs[keys.index(api_key)]))
+            result_keys.append(api_key)
+        return selected, tuple(result_keys)
 
     @staticmethod
+    @cache
     def _to_api_key(snake_case: str) -> str:
         """Convert snake_case key to camelCase for API responses, using overrides if available."""
         # Check for special overrides first
@@ -3597,12 +3928,7 @@ class StorageProvider:
         """Normalize key from camelCase to snake_case, using overrides if available."""
         if not isinstance(key, str):
             return key
-        if "_" in key:
-            return key
-        # Check for special overrides first
-        if key in CAMEL_TO_SNAKE_OVERRIDES:
-            return CAMEL_TO_SNAKE_OVERRIDES[key]
-        return StorageProvider._to_snake_case(key)
+        return _normalize_str_key(key)
 
     @classmethod
     def _normalize_dict_keys(cls, data: dict[str, Any] | None) -> dict[str, Any]:
@@ -3684,6 +4010,93 @@ class StorageProvider:
     def insert_tx_note(self, data: dict[str, Any]) -> int:
         return self._insert_generic("tx_note", data)
 
+    def insert_many_users(self, rows: list[dict[str, Any]]) -> list[int]:
+        return self._insert_many_generic("user", rows)
+
+    def insert_many_certificates(self, rows: list[dict[str, Any]]) -> list[int]:
+        return self._insert_many_generic("certificate", rows)
+
+    def insert_many_certificate_fields(self, rows: list[dict[str, Any]]) -> list[int]:
+        return self._insert_many_generic("certificate_field", rows)
+
+    def insert_many_commissions(self, rows: list[dict[str, Any]]) -> list[int]:
+        return self._insert_many_generic("commission", rows)
+
+    def insert_many_monitor_events(self, rows: list[dict[str, Any]]) -> list[int]:
+        return self._insert_many_generic("monitor_event", rows)
+
+    def insert_many_outputs(self, rows: list[dict[str, Any]]) -> list[int]:
+        return self._insert_many_generic("output", rows)
+
+    def insert_many_output_baskets(self, rows: list[dict[str, Any]]) -> list[int]:
+        return self._insert_many_generic("output_basket", rows)
+
+    def insert_many_output_tags(self, rows: list[dict[str, Any]]) -> list[int]:
+        return self._insert_many_generic("output_tag", rows)
+
+    def insert_many_output_tag_maps(self, rows: list[dict[str, Any]]) -> list[int]:
+        return self._insert_many_generic("output_tag_map", rows)
+
+    def insert_many_proven_txs(self, rows: list[dict[str, Any]]) -> list[int]:
+        return self._insert_many_generic("proven_tx", rows)
+
+    def insert_many_proven_tx_reqs(self, rows: list[dict[str, Any]]) -> list[int]:
+        return self._insert_many_generic("proven_tx_req", rows)
+
+    def insert_many_sync_states(self, rows: list[dict[str, Any]]) -> list[int]:
+        return self._insert_many_generic("sync_state", rows)
+
+    def insert_many_transactions(self, rows: list[dict[str, Any]]) -> list[int]:
+        return self._insert_many_generic("transaction", rows)
+
+    def insert_many_tx_labels(self, rows: list[dict[str, Any]]) -> list[int]:
+        return self._insert_many_generic("tx_label", rows)
+
+    def insert_many_tx_label_maps(self, rows: list[dict[str, Any]]) -> list[int]:
+        return self._insert_many_generic("tx_label_map", rows)
+
+    def upsert_many_users(self, rows: list[dict[str, Any]]) -> list[int]:
+        return self._upsert_many_generic("user", rows)
+
+    def upsert_many_certificates(self, rows: list[dict[str, Any]]) -> list[int]:
+        return self._upsert_many_generic("certificate", rows)
+
+    def upsert_many_certificate_fields(self, rows: list[dict[str, Any]]) -> list[int]:
+        return self._upsert_many_generic("certificate_field", rows)
+
+    def upsert_many_commissions(self, rows: list[dict[str, Any]]) -> list[int]:
+        return self._upsert_many_generic("commission", rows)
+
+    def upsert_many_outputs(self, rows: list[dict[str, Any]]) -> list[int]:
+        return self._upsert_many_generic("output", rows)
+
+    def upsert_many_output_baskets(self, rows: list[dict[str, Any]]) -> list[int]:
+        return self._upsert_many_generic("output_basket", rows)
+
+    def upsert_many_output_tags(self, rows: list[dict[str, Any]]) -> list[int]:
+        return self._upsert_many_generic("output_tag", rows)
+
+    def upsert_many_output_tag_maps(self, rows: list[dict[str, Any]]) -> list[int]:
+        return self._upsert_many_generic("output_tag_map", rows)
+
+    def upsert_many_proven_txs(self, rows: list[dict[str, Any]]) -> list[int]:
+        return self._upsert_many_generic("proven_tx", rows)
+
+    def upsert_many_proven_tx_reqs(self, rows: list[dict[str, Any]]) -> list[int]:
+        return self._upsert_many_generic("proven_tx_req", rows)
+
+    def upsert_many_sync_states(self, rows: list[dict[str, Any]]) -> list[int]:
+        return self._upsert_many_generic("sync_state", rows)
+
+    def upsert_many_transactions(self, rows: list[dict[str, Any]]) -> list[int]:
+        return self._upsert_many_generic("transaction", rows)
+
+    def upsert_many_tx_labels(self, rows: list[dict[str, Any]]) -> list[int]:
+        return self._upsert_many_generic("tx_label", rows)
+
+    def upsert_many_tx_label_maps(self, rows: list[dict[str, Any]]) -> list[int]:
+        return self._upsert_many_generic("tx_label_map", rows)
+
     def _now(self) -> datetime:
         return datetime.now(UTC)
 
@@ -3899,8 +4312,8 @@ class StorageProvider:
         Reference:
             - toolbox/ts-wallet-toolbox/src/storage/StorageProvider.ts
         """
-        partial, _ = self._split_query(query)
-        return self._find_generic("user", partial)
+        partial, extras = self._split_query(query, extra_keys={"columns"})
+        return self._find_generic("user", partial, columns=extras.get("columns"))
 
     def find_proven_txs(self, query: dict[str, Any] | None = None) -> list[dict[str, Any]]:
         """Find proven transactions matching optional filters.
@@ -3920,8 +4333,8 @@ class StorageProvider:
         Reference:
             - toolbox/ts-wallet-toolbox/src/storage/StorageProvider.ts
         """
-        partial, _ = self._split_query(query)
-        return self._find_generic("proven_tx", partial)
+        partial, extras = self._split_query(query, extra_keys={"columns"})
+        return self._find_generic("proven_tx", partial, columns=extras.get("columns"))
 
     def find_proven_tx_reqs(self, query: dict[str, Any] | None = None) -> list[dict[str, Any]]:
         """Find ProvenTxReq rows with optional batch filter.
@@ -3985,8 +4398,8 @@ class StorageProvider:
         Reference:
             - toolbox/ts-wallet-toolbox/src/storage/StorageProvider.ts
         """
-        partial, _ = self._split_query(query)
-        return self._find_generic("certificate_field", partial)
+        partial, extras = self._split_query(query, extra_keys={"columns"})
+        return self._find_generic("certificate_field", partial, columns=extras.get("columns"))
 
     def find_commissions(self, query: dict[str, Any] | None = None) -> list[dict[str, Any]]:
         """Find commission configuration rows.
@@ -3994,8 +4407,8 @@ class StorageProvider:
         Reference:
             - toolbox/ts-wallet-toolbox/src/storage/StorageProvider.ts
         """
-        partial, _ = self._split_query(query)
-        return self._find_generic("commission", partial)
+        partial, extras = self._split_query(query, extra_keys={"columns"})
+        return self._find_generic("commission", partial, columns=extras.get("columns"))
 
     def find_monitor_events(self, query: dict[str, Any] | None = None) -> list[dict[str, Any]]:
         """Find monitor daemon events for diagnostics.
@@ -4003,8 +4416,8 @@ class StorageProvider:
         Reference:
             - toolbox/ts-wallet-toolbox/src/storage/StorageProvider.ts
         """
-        partial, _ = self._split_query(query)
-        return self._find_generic("monitor_event", partial)
+        partial, extras = self._split_query(query, extra_keys={"columns"})
+        return self._find_generic("monitor_event", partial, columns=extras.get("columns"))
 
     def find_outputs(self, query: dict[str, Any] | None = None) -> list[dict[str, Any]]:
         """Find outputs with optional equality filters.
@@ -4012,8 +4425,8 @@ class StorageProvider:
         Reference:
             - toolbox/ts-wallet-toolbox/src/storage/StorageProvider.ts
         """
-        partial, _ = self._split_query(query)
-        return self._find_generic("output", partial)
+        partial, extras = self._split_query(query, extra_keys={"columns"})
+        return self._find_generic("output", partial, columns=extras.get("columns"))
 
     # CamelCase alias for TS/Go parity
     findOutputs = find_outputs
@@ -4043,8 +4456,8 @@ class StorageProvider:
         Reference:
             - toolbox/ts-wallet-toolbox/src/storage/StorageProvider.ts
         """
-        partial, _ = self._split_query(query)
-        return self._find_generic("output_tag", partial)
+        partial, extras = self._split_query(query, extra_keys={"columns"})
+        return self._find_generic("output_tag", partial, columns=extras.get("columns"))
 
     def find_output_tag_maps(self, query: dict[str, Any] | None = None) -> list[dict[str, Any]]:
         """Find mapping rows between outputs and tags.
@@ -4052,8 +4465,8 @@ class StorageProvider:
         Reference:
             - toolbox/ts-wallet-toolbox/src/storage/StorageProvider.ts
         """
-        partial, _ = self._split_query(query)
-        return self._find_generic("output_tag_map", partial)
+        partial, extras = self._split_query(query, extra_keys={"columns"})
+        return self._find_generic("output_tag_map", partial, columns=extras.get("columns"))
 
     def find_sync_states(self, query: dict[str, Any] | None = None) -> list[dict[str, Any]]:
         """Find sync state rows for peer storage instances.
@@ -4061,8 +4474,8 @@ class StorageProvider:
         Reference:
             - toolbox/ts-wallet-toolbox/src/storage/StorageProvider.ts
         """
-        partial, _ = self._split_query(query)
-        return self._find_generic("sync_state", partial)
+        partial, extras = self._split_query(query, extra_keys={"columns"})
+        return self._find_generic("sync_state", partial, columns=extras.get("columns"))
 
     def find_or_insert_sync_state(
         self,
@@ -4119,8 +4532,8 @@ class StorageProvider:
         Reference:
             - toolbox/ts-wallet-toolbox/src/storage/StorageProvider.ts
         """
-        partial, _ = self._split_query(query)
-        return self._find_generic("transaction", partial)
+        partial, extras = self._split_query(query, extra_keys={"columns"})
+        return self._find_generic("transaction", partial, columns=extras.get("columns"))
 
     def find_tx_labels(self, query: dict[str, Any] | None = None) -> list[dict[str, Any]]:
         """Find transaction labels for a user.
@@ -4128,8 +4541,8 @@ class StorageProvider:
         Reference:
             - toolbox/ts-wallet-toolbox/src/storage/StorageProvider.ts
         """
-        partial, _ = self._split_query(query)
-        return self._find_generic("tx_label", partial)
+        partial, extras = self._split_query(query, extra_keys={"columns"})
+        return self._find_generic("tx_label", partial, columns=extras.get("columns"))
 
     def find_tx_label_maps(self, query: dict[str, Any] | None = None) -> list[dict[str, Any]]:
         """Find label-to-transaction mapping rows.
@@ -4137,8 +4550,115 @@ class StorageProvider:
         Reference:
             - toolbox/ts-wallet-toolbox/src/storage/StorageProvider.ts
         """
-        partial, _ = self._split_query(query)
-        return self._find_generic("tx_label_map", partial)
+        partial, extras = self._split_query(query, extra_keys={"columns"})
+        return self._find_generic("tx_label_map", partial, columns=extras.get("columns"))
+
+    def iter_users(
+        self, query: dict[str, Any] | None = None, batch_size: int = ITER_BATCH_SIZE, descending: bool = False
+    ) -> Iterator[dict[str, Any]]:
+        """Stream users matching optional filters in primary-key order.
+
+        Summary:
+            Generator counterpart of `find_users` for large tables: rows are
+            fetched `batch_size` at a time with keyset pagination on the
+            primary key, so memory stays flat regardless of table size. The
+            other `iter_*` methods behave the same for their tables.
+
+        Args:
+            query: Optional filter dict (`partial` payload or bare filters);
+                `columns` selects a subset of columns.
+            batch_size: Rows fetched per query.
+            descending: Yield from the highest primary key down.
+
+        Yields:
+            User dicts with camelCase keys.
+        """
+        partial, extras = self._split_query(query, extra_keys={"columns"})
+        return self._iter_generic("user", partial, batch_size, descending, extras.get("columns"))
+
+    def iter_certificates(
+        self, query: dict[str, Any] | None = None, batch_size: int = ITER_BATCH_SIZE, descending: bool = False
+    ) -> Iterator[dict[str, Any]]:
+        partial, extras = self._split_query(query, extra_keys={"columns"})
+        return self._iter_generic("certificate", partial, batch_size, descending, extras.get("columns"))
+
+    def iter_certificate_fields(
+        self, query: dict[str, Any] | None = None, batch_size: int = ITER_BATCH_SIZE, descending: bool = False
+    ) -> Iterator[dict[str, Any]]:
+        partial, extras = self._split_query(query, extra_keys={"columns"})
+        return self._iter_generic("certificate_field", partial, batch_size, descending, extras.get("columns"))
+
+    def iter_commissions(
+        self, query: dict[str, Any] | None = None, batch_size: int = ITER_BATCH_SIZE, descending: bool = False
+    ) -> Iterator[dict[str, Any]]:
+        partial, extras = self._split_query(query, extra_keys={"columns"})
+        return self._iter_generic("commission", partial, batch_size, descending, extras.get("columns"))
+
+    def iter_monitor_events(
+        self, query: dict[str, Any] | None = None, batch_size: int = ITER_BATCH_SIZE, descending: bool = False
+    ) -> Iterator[dict[str, Any]]:
+        partial, extras = self._split_query(query, extra_keys={"columns"})
+        return self._iter_generic("monitor_event", partial, batch_size, descending, extras.get("columns"))
+
+    def iter_outputs(
+        self, query: dict[str, Any] | None = None, batch_size: int = ITER_BATCH_SIZE, descending: bool = False
+    ) -> Iterator[dict[str, Any]]:
+        partial, extras = self._split_query(query, extra_keys={"columns"})
+        return self._iter_generic("output", partial, batch_size, descending, extras.get("columns"))
+
+    def iter_output_baskets(
+        self, query: dict[str, Any] | None = None, batch_size: int = ITER_BATCH_SIZE, descending: bool = False
+    ) -> Iterator[dict[str, Any]]:
+        partial, extras = self._split_query(query, extra_keys={"columns"})
+        return self._iter_generic("output_basket", partial, batch_size, descending, extras.get("columns"))
+
+    def iter_output_tags(
+        self, query: dict[str, Any] | None = None, batch_size: int = ITER_BATCH_SIZE, descending: bool = False
+    ) -> Iterator[dict[str, Any]]:
+        partial, extras = self._split_query(query, extra_keys={"columns"})
+        return self._iter_generic("output_tag", partial, batch_size, descending, extras.get("columns"))
+
+    def iter_output_tag_maps(
+        self, query: dict[str, Any] | None = None, batch_size: int = ITER_BATCH_SIZE, descending: bool = False
+    ) -> Iterator[dict[str, Any]]:
+        partial, extras = self._split_query(query, extra_keys={"columns"})
+        return self._iter_generic("output_tag_map", partial, batch_size, descending, extras.get("columns"))
+
+    def iter_proven_txs(
+        self, query: dict[str, Any] | None = None, batch_size: int = ITER_BATCH_SIZE, descending: bool = False
+    ) -> Iterator[dict[str, Any]]:
+        partial, extras = self._split_query(query, extra_keys={"columns"})
+        return self._iter_generic("proven_tx", partial, batch_size, descending, extras.get("columns"))
+
+    def iter_proven_tx_reqs(
+        self, query: dict[str, Any] | None = None, batch_size: int = ITER_BATCH_SIZE, descending: bool = False
+    ) -> Iterator[dict[str, Any]]:
+        partial, extras = self._split_query(query, extra_keys={"columns"})
+        return self._iter_generic("proven_tx_req", partial, batch_size, descending, extras.get("columns"))
+
+    def iter_sync_states(
+        self, query: dict[str, Any] | None = None, batch_size: int = ITER_BATCH_SIZE, descending: bool = False
+    ) -> Iterator[dict[str, Any]]:
+        partial, extras = self._split_query(query, extra_keys={"columns"})
+        return self._iter_generic("sync_state", partial, batch_size, descending, extras.get("columns"))
+
+    def iter_transactions(
+        self, query: dict[str, Any] | None = None, batch_size: int = ITER_BATCH_SIZE, descending: bool = False
+    ) -> Iterator[dict[str, Any]]:
+        partial, extras = self._split_query(query, extra_keys={"columns"})
+        return self._iter_generic("transaction", partial, batch_size, descending, extras.get("columns"))
+
+    def iter_tx_labels(
+        self, query: dict[str, Any] | None = None, batch_size: int = ITER_BATCH_SIZE, descending: bool = False
+    ) -> Iterator[dict[str, Any]]:
+        partial, extras = self._split_query(query, extra_keys={"columns"})
+        return self._iter_generic("tx_label", partial, batch_size, descending, extras.get("columns"))
+
+    def iter_tx_label_maps(
+        self, query: dict[str, Any] | None = None, batch_size: int = ITER_BATCH_SIZE, descending: bool = False
+    ) -> Iterator[dict[str, Any]]:
+        partial, extras = self._split_query(query, extra_keys={"columns"})
+        return self._iter_generic("tx_label_map", partial, batch_size, descending, extras.get("columns"))
 
     def count_users(self, args: dict[str, Any] | None = None) -> int:
         return self._count_generic("user", args)
@@ -4304,6 +4824,10 @@ class StorageProvider:
                     "reference", "an inprocess, outgoing action that has not been signed and shared to the network."
                 )
 
+            balance = BalanceSnapshot.take(
+                session, transaction_ids=[tx.transaction_id], spent_by_ids=[tx.transaction_id]
+            )
+
             # Update transaction status to failed
             tx.status = "failed"
 
@@ -4328,7 +4852,8 @@ class StorageProvider:
                 )
                 session.execute(req_stmt)
 
-            session.flush()
+            balance.apply(session)
+            self._utxo_free_list_changed()
             session.commit()
 
             return True
@@ -4349,16 +4874,14 @@ class StorageProvider:
         updated_count = 0
 
         with session_scope(self.SessionLocal) as session:
-            invalid_req_exists = exists(
-                select(ProvenTxReq.proven_tx_req_id).where(
-                    ProvenTxReq.txid == TransactionModel.txid,
-                    ProvenTxReq.status == "invalid",
-                )
-            )
+            # Drive both sweeps from the (small) set of failed rows through
+            # ix_proven_tx_reqs_status_updated / ix_transactions_txid and
+            # ix_transactions_status / ix_outputs_spent_by instead of scanning.
+            invalid_req_txids = select(ProvenTxReq.txid).where(ProvenTxReq.status == "invalid")
             fail_stmt = (
                 update(TransactionModel)
+                .where(TransactionModel.txid.in_(invalid_req_txids))
                 .where(TransactionModel.status != "failed")
-                .where(invalid_req_exists)
                 .values(status="failed")
                 .execution_options(synchronize_session=False)
             )
@@ -4369,15 +4892,10 @@ class StorageProvider:
                     f"{failed_rows} transactions updated to status 'failed' where matching provenTxReq is 'invalid'"
                 )
 
-            failed_tx_exists = exists(
-                select(TransactionModel.transaction_id).where(
-                    TransactionModel.transaction_id == Output.spent_by,
-                    TransactionModel.status == "failed",
-                )
-            )
+            failed_tx_ids = select(TransactionModel.transaction_id).where(TransactionModel.status == "failed")
             release_stmt = (
                 update(Output)
-                .where(failed_tx_exists)
+                .where(Output.spent_by.in_(failed_tx_ids))
                 .values(spent_by=None, spendable=True)
                 .execution_options(synchronize_session=False)
             )
@@ -4406,6 +4924,10 @@ class StorageProvider:
                     f"{completed_rows} transactions updated to status 'completed' using matching proven_txs records"
                 )
 
+            if updated_count:
+                # Set-based updates span all users; re-derive the balance aggregates in one grouped pass.
+                rebuild_balances(session)
+
         return {
             "updatedCount": updated_count,
             "agedCount": 0,
@@ -4413,210 +4935,30 @@ class StorageProvider:
         }
 
     def purge_data(self, params: dict[str, Any] | None = None) -> dict[str, Any]:
-        """Purge transient data according to params (TS parity)."""
-        params = params or {}
-        default_age_ms = 14 * 24 * 60 * 60 * 1000  # 14 days
-        log_lines: list[str] = []
-        total_count = 0
-
-        def _cutoff(age_key: str) -> datetime:
-            age_ms = params.get(age_key)
-            if not isinstance(age_ms, (int, float)) or age_ms <= 0:
-                age_ms = default_age_ms
-            cutoff = datetime.now(UTC) - timedelta(milliseconds=age_ms)
-            return cutoff.replace(tzinfo=None)
-
-        def _delete_transactions(
-            session: Session,
-            tx_ids: list[int],
-            reason: str,
-            mark_not_spent: bool,
-        ) -> int:
-            if not tx_ids:
-                return 0
-
-            local_count = 0
-
-            output_ids = (
-                session.execute(select(Output.output_id).where(Output.transaction_id.in_(tx_ids))).scalars().all()
-            )
+        """Purge transient data according to params (TS parity).
 
-            if output_ids:
-                deleted = (
-                    session.execute(delete(OutputTagMap).where(OutputTagMap.output_id.in_(output_ids))).rowcount or 0
-                )
-                if deleted:
-                    log_lines.append(f"{deleted} {reason} output_tags_map deleted")
-                    local_count += deleted
-
-                deleted = session.execute(delete(Output).where(Output.output_id.in_(output_ids))).rowcount or 0
-                if deleted:
-                    log_lines.append(f"{deleted} {reason} outputs deleted")
-                    local_count += deleted
-
-            deleted = session.execute(delete(TxLabelMap).where(TxLabelMap.transaction_id.in_(tx_ids))).rowcount or 0
-            if deleted:
-                log_lines.append(f"{deleted} {reason} tx_labels_map deleted")
-                local_count += deleted
-
-            deleted = session.execute(delete(Commission).where(Commission.transaction_id.in_(tx_ids))).rowcount or 0
-            if deleted:
-                log_lines.append(f"{deleted} {reason} commissions deleted")
-                local_count += deleted
-
-            if mark_not_spent:
-                updated = (
-                    session.execute(
-                        update(Output)
-                        .where(Output.spent_by.in_(tx_ids))
-                        .values(spendable=True, spent_by=None)
-                        .execution_options(synchronize_session=False)
-                    ).rowcount
-                    or 0
-                )
-                if updated:
-                    log_lines.append(f"{updated} outputs released from spentBy due to {reason} transactions")
-                    local_count += updated
-
-            deleted = (
-                session.execute(delete(TransactionModel).where(TransactionModel.transaction_id.in_(tx_ids))).rowcount
-                or 0
-            )
-            if deleted:
-                log_lines.append(f"{deleted} {reason} transactions deleted")
-                local_count += deleted
-
-            return local_count
+        Summary:
+            Runs a `storage.purge.PurgeEngine`: eligible rows are walked by
+            primary key and purged `batchSize` at a time with a commit per
+            batch and a short pause in between, so large purges neither
+            exceed bound-parameter limits nor hold the write lock for the
+            whole run. Progress is stored with each batch; a run that was
+            interrupted (or stopped by `maxMsecs`) resumes where it left off.
 
-        with session_scope(self.SessionLocal) as session:
-            if params.get("purgeCompleted"):
-                cutoff = _cutoff("purgeCompletedAge")
-                completed_stmt = (
-                    update(TransactionModel)
-                    .where(TransactionModel.updated_at < cutoff)
-                    .where(TransactionModel.status == "completed")
-                    .where(TransactionModel.proven_tx_id.is_not(None))
-                    .where(or_(TransactionModel.input_beef.isnot(None), TransactionModel.raw_tx.isnot(None)))
-                    .values(input_beef=None, raw_tx=None)
-                    .execution_options(synchronize_session=False)
-                )
-                cleared = session.execute(completed_stmt).rowcount or 0
-                if cleared:
-                    log_lines.append(f"{cleared} completed transactions purged of transient data")
-                    total_count += cleared
-
-                completed_req_ids = (
-                    session.execute(
-                        select(ProvenTxReq.proven_tx_req_id).where(
-                            ProvenTxReq.updated_at < cutoff,
-                            ProvenTxReq.status == "completed",
-                            ProvenTxReq.proven_tx_id.is_not(None),
-                            ProvenTxReq.notified.is_(True),
-                        )
-                    )
-                    .scalars()
-                    .all()
-                )
-                if completed_req_ids:
-                    deleted = (
-                        session.execute(
-                            delete(ProvenTxReq).where(ProvenTxReq.proven_tx_req_id.in_(completed_req_ids))
-                        ).rowcount
-                        or 0
-                    )
-                    if deleted:
-                        log_lines.append(f"{deleted} completed proven_tx_reqs deleted")
-                        total_count += deleted
-
-            if params.get("purgeFailed"):
-                cutoff = _cutoff("purgeFailedAge")
-                failed_tx_ids = (
-                    session.execute(
-                        select(TransactionModel.transaction_id).where(
-                            TransactionModel.updated_at < cutoff,
-                            TransactionModel.status == "failed",
-                        )
-                    )
-                    .scalars()
-                    .all()
-                )
-                total_count += _delete_transactions(session, failed_tx_ids, "failed", True)
-
-                for status in ("invalid", "doubleSpend"):
-                    deleted = (
-                        session.execute(
-                            delete(ProvenTxReq).where(
-                                ProvenTxReq.updated_at < cutoff,
-                                ProvenTxReq.status == status,
-                            )
-                        ).rowcount
-                        or 0
-                    )
-                    if deleted:
-                        log_lines.append(f"{deleted} {status} proven_tx_reqs deleted")
-                        total_count += deleted
-
-            if params.get("purgeSpent"):
-                cutoff = _cutoff("purgeSpentAge")
-                proof_txids = {
-                    txid
-                    for txid in session.execute(
-                        select(Output.txid).where(Output.spendable.is_(True), Output.txid.is_not(None))
-                    ).scalars()
-                    if txid
-                }
-                proof_txids.update(
-                    txid
-                    for txid in session.execute(
-                        select(TransactionModel.txid)
-                        .join(Output, Output.transaction_id == TransactionModel.transaction_id)
-                        .where(Output.spendable.is_(True), TransactionModel.txid.is_not(None))
-                    ).scalars()
-                    if txid
-                )
+        Args:
+            params: `purgeCompleted` / `purgeFailed` / `purgeSpent` flags with
+                optional `*Age` milliseconds, plus the batching options
+                documented on `PurgeEngine`.
 
-                spent_candidates = session.execute(
-                    select(TransactionModel.transaction_id, TransactionModel.txid).where(
-                        TransactionModel.updated_at < cutoff,
-                        TransactionModel.status == "completed",
-                        ~exists(
-                            select(Output.output_id).where(
-                                Output.transaction_id == TransactionModel.transaction_id,
-                                Output.spendable.is_(True),
-                            )
-                        ),
-                    )
-                ).all()
-
-                spent_ids = [
-                    row.transaction_id for row in spent_candidates if not row.txid or row.txid not in proof_txids
-                ]
-                total_count += _delete_transactions(session, spent_ids, "spent", False)
-
-                orphan_deleted = (
-                    session.execute(
-                        delete(ProvenTx).where(
-                            ~exists(
-                                select(TransactionModel.transaction_id).where(
-                                    (TransactionModel.txid == ProvenTx.txid)
-                                    | (TransactionModel.proven_tx_id == ProvenTx.proven_tx_id)
-                                )
-                            ),
-                            ~exists(
-                                select(ProvenTxReq.proven_tx_req_id).where(
-                                    (ProvenTxReq.txid == ProvenTx.txid)
-                                    | (ProvenTxReq.proven_tx_id == ProvenTx.proven_tx_id)
-                                )
-                            ),
-                        )
-                    ).rowcount
-                    or 0
-                )
-                if orphan_deleted:
-                    log_lines.append(f"{orphan_deleted} orphan proven_txs deleted")
-                    total_count += orphan_deleted
+        Returns:
+            Dict with `log`, `count`, `rowsPerSecond`, `elapsedMsecs` and
+            `cursor` (None when the purge completed).
+        """
+        return PurgeEngine(self.SessionLocal, params, outputs_changed=self._utxo_free_list_changed).run()
 
-        return {"log": "\n".join(log_lines).strip(), "count": total_count}
+    def purge_data_batches(self, params: dict[str, Any] | None = None) -> Iterator[dict[str, Any]]:
+        """Run `purge_data` as a generator yielding progress after each committed batch."""
+        return PurgeEngine(self.SessionLocal, params, outputs_changed=self._utxo_free_list_changed).batches()
 
     # NOTE: allocate_funding_input and count_funding_inputs are defined earlier in this file
     # (around line 2216 and 2237) with proper Transaction status checking.
@@ -4701,21 +5043,7 @@ class StorageProvider:
         Reference:
             - toolbox/ts-wallet-toolbox/src/storage/StorageProvider.ts (updateTransactionStatus)
         """
-        session = self.SessionLocal()
-        try:
-            query = select(TransactionModel).where(TransactionModel.transaction_id == transaction_id)
-            result = session.execute(query)
-            tx = result.scalar_one_or_none()
-
-            if tx:
-                tx.status = status
-                session.add(tx)
-                session.commit()
-                return 1
-
-            return 0
-        finally:
-            session.close()
+        return self._update_many_generic("transaction", [(transaction_id, {"status": status})])
 
     def update_transactions_status(self, transaction_ids: list[int], status: str) -> int:
         """Update status for multiple transactions in a batch operation.
@@ -4736,22 +5064,7 @@ class StorageProvider:
         if not transaction_ids:
             return 0
 
-        session = self.SessionLocal()
-        try:
-            query = select(TransactionModel).where(TransactionModel.transaction_id.in_(transaction_ids))
-            result = session.execute(query)
-            txs = result.scalars().all()
-
-            updated = 0
-            for tx in txs:
-                tx.status = status
-                session.add(tx)
-                updated += 1
-
-            session.commit()
-            return updated
-        finally:
-            session.close()
+        return self._update_many_generic("transaction", [(tx_id, {"status": status}) for tx_id in transaction_ids])
 
     def _is_fatal_broadcast_error(self, message: str | None) -> bool:
         if not message:
@@ -4950,6 +5263,55 @@ class StorageProvider:
         finally:
             session.close()
 
+    def get_wallet_balance(self, user_id: int, basket_name: str = "default") -> int:
+        """Return the wallet balance of a basket from the maintained aggregate.
+
+        Summary:
+            Reads `output_basket_balances` (one primary-key lookup). When the row
+            has not been materialized yet, computes it with a SQL SUM over the
+            contributing outputs and stores it for later reads.
+        TS parity:
+            Same value as listOutputs with basket specOpWalletBalance.
+        Args:
+            user_id: Owning user.
+            basket_name: Basket name (default 'default').
+        Returns:
+            Balance in satoshis (0 if the basket does not exist).
+        Reference:
+            toolbox/ts-wallet-toolbox/src/storage/methods/ListOutputsSpecOp.ts
+        """
+        with session_scope(self.SessionLocal) as s:
+            basket_id = s.execute(
+                select(OutputBasket.basket_id).where(
+                    (OutputBasket.user_id == user_id)
+                    & (OutputBasket.name == basket_name)
+                    & (OutputBasket.is_deleted.is_(False))
+                )
+            ).scalar_one_or_none()
+            if basket_id is None:
+                return 0
+            return read_basket_balance(s, user_id, basket_id)
+
+    def check_wallet_balances(self, user_id: int | None = None, repair: bool = False) -> dict[str, Any]:
+        """Verify the maintained balance aggregates against the outputs table.
+
+        Summary:
+            Recomputes every materialized aggregate row with a grouped SQL SUM and
+            reports rows that drifted. With `repair`, rewrites the aggregate rows
+            (for `user_id` or all users) from the outputs table.
+        Args:
+            user_id: Optional user restriction.
+            repair: Rebuild the aggregates after checking.
+        Returns:
+            dict: { mismatches: list[dict], rebuilt: int }
+        """
+        with session_scope(self.SessionLocal) as s:
+            mismatches = check_balances(s, user_id)
+            rebuilt = rebuild_balances(s, user_id) if repair else 0
+        if mismatches:
+            self.logger.warning("check_wallet_balances: %d aggregate rows out of date", len(mismatches))
+        return {"mismatches": mismatches, "rebuilt": rebuilt}
+
     def process_sync_chunk(self, args: dict[str, Any], chunk: dict[str, Any]) -> dict[str, Any]:
         """Process a sync chunk received from remote wallet or service.
 
@@ -5208,27 +5570,33 @@ class StorageProvider:
         # Get all transactions with pending statuses
         pending_transactions = self.find_transactions({"partial": {"status": "pending"}})
 
+        # Check all statuses with batched provider requests
+        statuses = _fetch_transaction_statuses(
+            self._services, self.logger, [tx["txid"] for tx in pending_transactions if tx.get("txid")]
+        )
+
+        updates: list[tuple[int, dict[str, Any]]] = []
         for tx in pending_transactions:
-            txid = tx["txid"]
-            try:
-                # Check transaction status via services
-                status_result = self._services.get_transaction_status(txid)
-                current_status = status_result.get("status", "unknown")
+            status_result = statuses.get(tx.get("txid"))
+            if not isinstance(status_result, dict):
+                continue
+            current_status = status_result.get("status", "unknown")
 
-                # Update local status if different
-                if current_status != tx["status"]:
-                    self.update_transaction(tx["transactionId"], {"status": current_status})
+            # Update local status if different
+            if current_status != tx["status"]:
+                updates.append((tx["transactionId"], {"status": current_status}))
 
-            except Exception as e:
-                # Log error but continue with other transactions
-                print(f"Failed to check status for transaction {txid}: {e}")
-                continue
+        # One UPDATE per distinct status instead of one per transaction
+        if updates:
+            self.update_many("transaction", updates)
 
     def send_waiting_transactions(self, min_age_seconds: int = 0) -> dict[str, Any]:
         """Send transactions that are waiting to be broadcast.
 
         Finds transactions in 'waiting' status that are older than min_age_seconds
-        and attempts to broadcast them to the network.
+        and broadcasts them with one `Services.post_beef_array` call, which
+        batches them per ARC request in dependency order; the accepted ones are
+        marked 'sent' with one bulk status update.
 
         Args:
             min_age_seconds: Minimum age in seconds for transactions to be eligible
@@ -5249,48 +5617,61 @@ class StorageProvider:
 
         # Find waiting transactions older than min_age
         cutoff_time = datetime.now(UTC) - timedelta(seconds=min_age_seconds)
+        # Stored timestamps are naive UTC (CURRENT_TIMESTAMP)
+        naive_cutoff_time = cutoff_time.replace(tzinfo=None)
 
         waiting_transactions = self.find_transactions({"partial": {"status": "waiting"}})
 
-        sent = 0
         failed = 0
         errors = []
+        pending: list[dict[str, Any]] = []
+        beefs: list[str] = []
 
         for tx in waiting_transactions:
             try:
                 # Check if transaction is old enough
                 created_at = tx.get("createdAt")
                 if isinstance(created_at, str):
-                    from datetime import datetime
-
                     created_at = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
 
-                if created_at and created_at > cutoff_time:
+                if created_at and created_at > (cutoff_time if created_at.tzinfo else naive_cutoff_time):
                     continue  # Too new, skip
 
                 # Get raw transaction data
-                raw_tx = self.get_raw_tx_of_known_valid_transaction(tx["txid"])
+                raw_tx = tx.get("rawTx") or self.get_raw_tx_of_known_valid_transaction(tx["txid"], None, None)
                 if not raw_tx:
                     failed += 1
                     errors.append(f"No raw transaction data for {tx['txid']}")
                     continue
-
-                # Broadcast transaction
-                beef_result = self._services.post_beef(raw_tx)
-                if beef_result.get("success"):
-                    # Update status to sent
-                    self.update_transaction(tx["transactionId"], {"status": "sent"})
-                    sent += 1
-                else:
-                    failed += 1
-                    error_msg = beef_result.get("error", "Unknown broadcast error")
-                    errors.append(f"Failed to broadcast {tx['txid']}: {error_msg}")
+                beefs.append(raw_tx if isinstance(raw_tx, str) else bytes(raw_tx).hex())
+                pending.append(tx)
 
             except Exception as e:
                 failed += 1
                 errors.append(f"Error processing transaction {tx['txid']}: {e}")
 
-        return {"sent": sent, "failed": failed, "errors": errors}
+        if not pending:
+            return {"sent": 0, "failed": failed, "errors": errors}
+
+        try:
+            # Broadcast all transactions at once; Services orders parents before children
+            results = self._services.post_beef_array(beefs)
+        except Exception as e:
+            results = [{"accepted": False, "message": str(e)} for _ in pending]
+
+        sent_ids: list[int] = []
+        for tx, beef_result in zip(pending, results, strict=True):
+            if beef_result.get("accepted"):
+                sent_ids.append(tx["transactionId"])
+            else:
+                failed += 1
+                error_msg = beef_result.get("message") or "Unknown broadcast error"
+                errors.append(f"Failed to broadcast {tx['txid']}: {error_msg}")
+
+        # Update status to sent
+        self.update_transactions_status(sent_ids, "sent")
+
+        return {"sent": len(sent_ids), "failed": failed, "errors": errors}
 
     def abort_abandoned(self, min_age_seconds: int = 3600) -> dict[str, Any]:
         """Mark abandoned transactions as failed.
@@ -5316,7 +5697,7 @@ class StorageProvider:
         # Get transactions that might be abandoned (not completed or failed)
         processing_transactions = self.find_transactions({"partial": {"status": ["created", "signed", "processing"]}})
 
-        abandoned_count = 0
+        abandoned_ids: list[int] = []
 
         for tx in processing_transactions:
             created_at = tx.get("createdAt")
@@ -5324,11 +5705,13 @@ class StorageProvider:
                 created_at = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
 
             if created_at and created_at < cutoff_time:
-                # Mark as failed
-                self.update_transaction(tx["transactionId"], {"status": "failed"})
-                abandoned_count += 1
+                abandoned_ids.append(tx["transactionId"])
+
+        # Mark as failed
+        if abandoned_ids:
+            self.update_transactions_status(abandoned_ids, "failed")
 
-        return {"abandoned": abandoned_count}
+        return {"abandoned": len(abandoned_ids)}
 
     def un_fail(self) -> dict[str, Any]:
         """Recheck failed transactions and update status if now on-chain.
@@ -5349,26 +5732,26 @@ class StorageProvider:
         # Get failed transactions
         failed_transactions = self.find_transactions({"partial": {"status": "failed"}})
 
-        unfail_count = 0
+        # Recheck all statuses with batched provider requests
+        statuses = _fetch_transaction_statuses(
+            self._services, self.logger, [tx["txid"] for tx in failed_transactions if tx.get("txid")]
+        )
 
+        updates: list[tuple[int, dict[str, Any]]] = []
         for tx in failed_transactions:
-            txid = tx["txid"]
-            try:
-                # Recheck status
-                status_result = self._services.get_transaction_status(txid)
-                current_status = status_result.get("status", "unknown")
+            status_result = statuses.get(tx.get("txid"))
+            if not isinstance(status_result, dict):
+                continue
+            current_status = status_result.get("status", "unknown")
 
-                # If now confirmed or other non-failed status, update
-                if current_status not in ["failed", "unknown"]:
-                    self.update_transaction(tx["transactionId"], {"status": current_status})
-                    unfail_count += 1
+            # If now confirmed or other non-failed status, update
+            if current_status not in ["failed", "unknown"]:
+                updates.append((tx["transactionId"], {"status": current_status}))
 
-            except Exception as e:
-                # Log error but continue
-                print(f"Failed to recheck status for failed transaction {txid}: {e}")
-                continue
+        if updates:
+            self.update_many("transaction", updates)
 
-        return {"unfail": unfail_count}
+        return {"unfail": len(updates)}
 
     def stop(self) -> None:
         """Stop background broadcaster and cleanup resources.
@@ -5770,6 +6153,7 @@ class InternalizeActionContext:
         """Process merge case. (TS lines 312-326)"""
         with session_scope(self.storage.SessionLocal) as s:
             transaction_id = self.existing_tx.transaction_id
+            balance = BalanceSnapshot.take(s, transaction_ids=[transaction_id])
 
             self._add_labels(transaction_id, s)
 
@@ -5808,6 +6192,8 @@ class InternalizeActionContext:
                     )
                     s.add(subject_req)
 
+            balance.apply(s)
+            self.storage._utxo_free_list_changed()
             s.commit()
 
     def new_internalize(self) -> None:
@@ -5848,6 +6234,9 @@ class InternalizeActionContext:
             for basket in self.basket_insertions:
                 self._store_new_basket_insertion_for_output(transaction_id, basket, s)
 
+            BalanceSnapshot(transaction_ids=(transaction_id,)).apply(s)
+            self.storage._utxo_free_list_changed()
+
             # Store the SUBJECT transaction itself in ProvenTxReq (TS parity: internalizeAction.ts:408-413)
             # This is critical - the subject transaction must be available for child transactions to build BEEF
             # Store the full BEEF as input_beef so all parent transactions remain accessible
@@ -5935,8 +6324,8 @@ class InternalizeActionContext:
             output_description="",
             spending_description=None,
         )
+        # No flush here: the next flush inserts all pending payment outputs in one batch
         session.add(output_record)
-        session.flush()
         payment["eo"] = output_record
 
     def _merge_wallet_payment_for_output(self, _transaction_id: int, payment: dict[str, Any], session: Any) -> None:
@@ -0,0 +1,393 @@
+"""Chunked, resumable purge of transient wallet data (purgeData).
+
+``PurgeEngine`` runs the purge as a sequence of phases (clear completed
+transaction payloads, delete completed / failed proven_tx_reqs, delete failed
+and spent transactions with their dependent rows, delete orphan proven_txs).
+Each phase walks its eligible rows by primary key with keyset pagination and
+handles ``batchSize`` rows per transaction, so no statement carries an
+unbounded ``IN (...)`` list and the write lock is released after every batch.
+Between batches the engine sleeps ``pauseMsecs`` to let queued wallet writers
+in, and it can stop once ``maxMsecs`` have elapsed.
+
+The position reached (phase and last primary key) is stored in the
+``monitor_events`` row ``PURGE_CURSOR_EVENT`` in the same transaction as the
+batch it describes, and removed when a run completes. A later run resumes the
+stored phase after that key; earlier phases are simply re-scanned, which is
+cheap because the rows they purged no longer match.
+
+Reference:
+    toolbox/ts-wallet-toolbox/src/storage/StorageKnex.ts (purgeData)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from collections.abc import Callable, Iterator, Sequence
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, exists, or_, select, update
+from sqlalchemy.orm import Session
+
+from .db import IN_CLAUSE_CHUNK_SIZE, chunked, session_scope
+from .models import Commission, MonitorEvent, Output, OutputTagMap, ProvenTx, ProvenTxReq, TxLabelMap
+from .models import Transaction as TransactionModel
+from .wallet_balance import BalanceSnapshot
+
+logger = logging.getLogger(__name__)
+
+# monitor_events.event of the row holding the resume position of an interrupted purge
+PURGE_CURSOR_EVENT = "purgeCursor"
+PURGE_BATCH_SIZE = IN_CLAUSE_CHUNK_SIZE
+PURGE_PAUSE_MSECS = 10
+DEFAULT_PURGE_AGE_MSECS = 14 * 24 * 60 * 60 * 1000  # 14 days
+
+# (phase, enabling param, age param), in execution order
+PURGE_PHASES: tuple[tuple[str, str, str], ...] = (
+    ("completedTransactions", "purgeCompleted", "purgeCompletedAge"),
+    ("completedProvenTxReqs", "purgeCompleted", "purgeCompletedAge"),
+    ("failedTransactions", "purgeFailed", "purgeFailedAge"),
+    ("failedProvenTxReqs", "purgeFailed", "purgeFailedAge"),
+    ("spentTransactions", "purgeSpent", "purgeSpentAge"),
+    ("orphanProvenTxs", "purgeSpent", "purgeSpentAge"),
+)
+
+
+class PurgeEngine:
+    """Batched purge driven by ``purgeData`` params.
+
+    Params (camelCase, all optional):
+        purgeCompleted / purgeFailed / purgeSpent: Enable the phase groups.
+        purgeCompletedAge / purgeFailedAge / purgeSpentAge: Minimum age in
+            milliseconds (default 14 days).
+        batchSize: Rows per batch and transaction (default ``PURGE_BATCH_SIZE``).
+        pauseMsecs: Sleep between batches (default ``PURGE_PAUSE_MSECS``).
+        maxMsecs: Stop after this much time; the stored cursor resumes it.
+        cursor: Explicit ``{"phase", "after"}`` resume position.
+        resume: Resume from the stored cursor when no ``cursor`` is given
+            (default True).
+    """
+
+    def __init__(
+        self,
+        session_local: Any,
+        params: dict[str, Any] | None = None,
+        outputs_changed: Callable[[], None] | None = None,
+    ) -> None:
+        self.session_local = session_local
+        self.params = params or {}
+        self.outputs_changed = outputs_changed
+        self.batch_size = max(1, int(self.params.get("batchSize") or PURGE_BATCH_SIZE))
+        self.pause = max(0.0, float(self.params.get("pauseMsecs", PURGE_PAUSE_MSECS))) / 1000
+        max_msecs = self.params.get("maxMsecs")
+        self.max_seconds = max_msecs / 1000 if isinstance(max_msecs, (int, float)) and max_msecs > 0 else None
+        self.total = 0
+        self.elapsed = 0.0
+        self.cursor: dict[str, Any] | None = None
+        # log label -> rows, in first-seen order
+        self.counts: dict[str, int] = {}
+
+    def batches(self) -> Iterator[dict[str, Any]]:
+        """Run the purge, yielding a progress dict after each committed batch.
+
+        Yields:
+            ``{"phase", "cursor", "count", "total", "rowsPerSecond"}`` where
+            ``cursor`` is the last primary key scanned in ``phase`` and
+            ``count`` the rows updated or deleted by the batch.
+        """
+        start = time.monotonic()
+        resume = self._resume_cursor()
+        stopped = False
+        for phase, flag, age_key in PURGE_PHASES:
+            if not self.params.get(flag):
+                continue
+            # Every run makes progress: the budget is only checked once a batch was done
+            if self.cursor is not None and self.max_seconds is not None:
+                stopped = time.monotonic() - start >= self.max_seconds
+            if stopped:
+                break
+            cutoff = self._cutoff(age_key)
+            after = resume["after"] if resume and resume.get("phase") == phase else 0
+            while True:
+                with session_scope(self.session_local) as session:
+                    scanned = self._scan(session, phase, cutoff, after)
+                    count = self._purge(session, phase, scanned) if scanned else 0
+                    if scanned:
+                        after = scanned[-1]
+                        _store_cursor(session, {"phase": phase, "after": after})
+                if count and phase in ("failedTransactions", "spentTransactions") and self.outputs_changed:
+                    self.outputs_changed()
+                self.total += count
+                self.elapsed = time.monotonic() - start
+                if scanned:
+                    self.cursor = {"phase": phase, "after": after}
+                    progress = {
+                        "phase": phase,
+                        "cursor": after,
+                        "count": count,
+                        "total": self.total,
+                        "rowsPerSecond": self.rows_per_second,
+                    }
+                    logger.info(
+                        "purge %s: %d rows through id %s (%.0f rows/s)", phase, count, after, self.rows_per_second
+                    )
+                    yield progress
+                if len(scanned) < self.batch_size:
+                    break
+                if self.max_seconds is not None and self.elapsed >= self.max_seconds:
+                    stopped = True
+                    break
+                if self.pause:
+                    time.sleep(self.pause)
+        if not stopped:
+            with session_scope(self.session_local) as session:
+                session.execute(delete(MonitorEvent).where(MonitorEvent.event == PURGE_CURSOR_EVENT))
+            self.cursor = None
+        self.elapsed = time.monotonic() - start
+
+    def run(self) -> dict[str, Any]:
+        """Run all batches and return the ``purgeData`` result."""
+        for _progress in self.batches():
+            pass
+        return self.result()
+
+    def result(self) -> dict[str, Any]:
+        """Summary of the work done so far.
+
+        Returns:
+            ``log`` and ``count`` as before, plus ``rowsPerSecond``,
+            ``elapsedMsecs`` and ``cursor`` (None once the purge completed,
+            otherwise the position a later run resumes from).
+        """
+        log = "\n".join(f"{count} {label}" for label, count in self.counts.items() if count)
+        return {
+            "log": log,
+            "count": self.total,
+            "rowsPerSecond": self.rows_per_second,
+            "elapsedMsecs": int(self.elapsed * 1000),
+            "cursor": self.cursor,
+        }
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.total / self.elapsed if self.elapsed > 0 else 0.0
+
+    def _resume_cursor(self) -> dict[str, Any] | None:
+        if self.params.get("cursor"):
+            return self.params["cursor"]
+        if self.params.get("resume", True) is False:
+            return None
+        with session_scope(self.session_local) as session:
+            details = session.execute(
+                select(MonitorEvent.details).where(MonitorEvent.event == PURGE_CURSOR_EVENT)
+            ).scalar_one_or_none()
+        try:
+            return json.loads(details) if details else None
+        except ValueError:
+            return None
+
+    def _cutoff(self, age_key: str) -> datetime:
+        age_ms = self.params.get(age_key)
+        if not isinstance(age_ms, (int, float)) or age_ms <= 0:
+            age_ms = DEFAULT_PURGE_AGE_MSECS
+        return (datetime.now(UTC) - timedelta(milliseconds=age_ms)).replace(tzinfo=None)
+
+    def _add(self, label: str, count: int) -> int:
+        self.counts[label] = self.counts.get(label, 0) + count
+        return count
+
+    def _scan(self, session: Session, phase: str, cutoff: datetime, after: int) -> list[int]:
+        """Primary keys of the next batch of rows eligible for ``phase``."""
+        if phase == "completedTransactions":
+            pk: Any = TransactionModel.transaction_id
+            conditions: list[Any] = [
+                TransactionModel.updated_at < cutoff,
+                TransactionModel.status == "completed",
+                TransactionModel.proven_tx_id.is_not(None),
+                or_(TransactionModel.input_beef.is_not(None), TransactionModel.raw_tx.is_not(None)),
+            ]
+        elif phase == "completedProvenTxReqs":
+            pk = ProvenTxReq.proven_tx_req_id
+            conditions = [
+                ProvenTxReq.updated_at < cutoff,
+                ProvenTxReq.status == "completed",
+                ProvenTxReq.proven_tx_id.is_not(None),
+                ProvenTxReq.notified.is_(True),
+            ]
+        elif phase == "failedTransactions":
+            pk = TransactionModel.transaction_id
+            conditions = [TransactionModel.updated_at < cutoff, TransactionModel.status == "failed"]
+        elif phase == "failedProvenTxReqs":
+            pk = ProvenTxReq.proven_tx_req_id
+            conditions = [ProvenTxReq.updated_at < cutoff, ProvenTxReq.status.in_(["invalid", "doubleSpend"])]
+        elif phase == "spentTransactions":
+            pk = TransactionModel.transaction_id
+            conditions = [
+                TransactionModel.updated_at < cutoff,
+                TransactionModel.status == "completed",
+                ~exists(
+                    select(Output.output_id).where(
+                        Output.transaction_id == TransactionModel.transaction_id,
+                        Output.spendable.is_(True),
+                    )
+                ),
+            ]
+        else:  # orphanProvenTxs
+            pk = ProvenTx.proven_tx_id
+            conditions = [
+                ~exists(
+                    select(TransactionModel.transaction_id).where(
+                        (TransactionModel.txid == ProvenTx.txid)
+                        | (TransactionModel.proven_tx_id == ProvenTx.proven_tx_id)
+                    )
+                ),
+                ~exists(
+                    select(ProvenTxReq.proven_tx_req_id).where(
+                        (ProvenTxReq.txid == ProvenTx.txid) | (ProvenTxReq.proven_tx_id == ProvenTx.proven_tx_id)
+                    )
+                ),
+            ]
+        query = select(pk).where(*conditions, pk > after).order_by(pk).limit(self.batch_size)
+        return list(session.execute(query).scalars())
+
+    def _purge(self, session: Session, phase: str, ids: list[int]) -> int:
+        """Purge the scanned rows of one batch; returns rows updated or deleted."""
+        if phase == "completedTransactions":
+            return self._add(
+                "completed transactions purged of transient data",
+                _rowcount_in(
+                    session,
+                    lambda chunk: update(TransactionModel)
+                    .where(TransactionModel.transaction_id.in_(chunk))
+                    .values(input_beef=None, raw_tx=None)
+                    .execution_options(synchronize_session=False),
+                    ids,
+                ),
+            )
+        if phase == "completedProvenTxReqs":
+            return self._add(
+                "completed proven_tx_reqs deleted",
+                _rowcount_in(
+                    session, lambda chunk: delete(ProvenTxReq).where(ProvenTxReq.proven_tx_req_id.in_(chunk)), ids
+                ),
+            )
+        if phase == "failedTransactions":
+            return self._delete_transactions(session, ids, "failed", mark_not_spent=True)
+        if phase == "failedProvenTxReqs":
+            count = 0
+            statuses = session.execute(
+                select(ProvenTxReq.proven_tx_req_id, ProvenTxReq.status).where(ProvenTxReq.proven_tx_req_id.in_(ids))
+            ).all()
+            for status in ("invalid", "doubleSpend"):
+                status_ids = [req_id for req_id, req_status in statuses if req_status == status]
+                count += self._add(
+                    f"{status} proven_tx_reqs deleted",
+                    _rowcount_in(
+                        session,
+                        lambda chunk: delete(ProvenTxReq).where(ProvenTxReq.proven_tx_req_id.in_(chunk)),
+                        status_ids,
+                    ),
+                )
+            return count
+        if phase == "spentTransactions":
+            return self._delete_transactions(session, _unprotected(session, ids), "spent", mark_not_spent=False)
+        return self._add(
+            "orphan proven_txs deleted",
+            _rowcount_in(session, lambda chunk: delete(ProvenTx).where(ProvenTx.proven_tx_id.in_(chunk)), ids),
+        )
+
+    def _delete_transactions(self, session: Session, tx_ids: list[int], reason: str, mark_not_spent: bool) -> int:
+        """Delete transactions with their outputs, tag/label maps and commissions."""
+        if not tx_ids:
+            return 0
+        balance = BalanceSnapshot.take(session, transaction_ids=tx_ids, spent_by_ids=tx_ids if mark_not_spent else ())
+        output_ids: list[int] = []
+        for chunk in chunked(tx_ids):
+            output_ids.extend(
+                session.execute(select(Output.output_id).where(Output.transaction_id.in_(chunk))).scalars()
+            )
+
+        count = self._add(
+            f"{reason} output_tags_map deleted",
+            _rowcount_in(
+                session, lambda chunk: delete(OutputTagMap).where(OutputTagMap.output_id.in_(chunk)), output_ids
+            ),
+        )
+        count += self._add(
+            f"{reason} outputs deleted",
+            _rowcount_in(session, lambda chunk: delete(Output).where(Output.output_id.in_(chunk)), output_ids),
+        )
+        count += self._add(
+            f"{reason} tx_labels_map deleted",
+            _rowcount_in(session, lambda chunk: delete(TxLabelMap).where(TxLabelMap.transaction_id.in_(chunk)), tx_ids),
+        )
+        count += self._add(
+            f"{reason} commissions deleted",
+            _rowcount_in(session, lambda chunk: delete(Commission).where(Commission.transaction_id.in_(chunk)), tx_ids),
+        )
+        if mark_not_spent:
+            count += self._add(
+                f"outputs released from spentBy due to {reason} transactions",
+                _rowcount_in(
+                    session,
+                    lambda chunk: update(Output)
+                    .where(Output.spent_by.in_(chunk))
+                    .values(spendable=True, spent_by=None)
+                    .execution_options(synchronize_session=False),
+                    tx_ids,
+                ),
+            )
+        count += self._add(
+            f"{reason} transactions deleted",
+            _rowcount_in(
+                session,
+                lambda chunk: delete(TransactionModel).where(TransactionModel.transaction_id.in_(chunk)),
+                tx_ids,
+            ),
+        )
+        balance.apply(session)
+        return count
+
+
+def _rowcount_in(session: Session, statement: Callable[[Sequence[Any]], Any], ids: Sequence[Any]) -> int:
+    """Execute ``statement(chunk)`` for each IN-list chunk of ``ids`` and sum the rowcounts."""
+    total = 0
+    for chunk in chunked(list(ids)):
+        result: Any = session.execute(statement(chunk))
+        total += result.rowcount or 0
+    return total
+
+
+def _unprotected(session: Session, tx_ids: list[int]) -> list[int]:
+    """Drop spent transactions whose txid still backs a spendable output (its proof is needed)."""
+    txids: dict[int, str | None] = {}
+    for chunk in chunked(tx_ids):
+        query = select(TransactionModel.transaction_id, TransactionModel.txid).where(
+            TransactionModel.transaction_id.in_(chunk)
+        )
+        txids.update((tx_id, txid) for tx_id, txid in session.execute(query))
+    wanted = list({txid for txid in txids.values() if txid})
+    protected: set[str] = set()
+    for chunk in chunked(wanted):
+        protected.update(
+            session.execute(select(Output.txid).where(Output.spendable.is_(True), Output.txid.in_(chunk))).scalars()
+        )
+        protected.update(
+            session.execute(
+                select(TransactionModel.txid)
+                .join(Output, Output.transaction_id == TransactionModel.transaction_id)
+                .where(Output.spendable.is_(True), TransactionModel.txid.in_(chunk))
+            ).scalars()
+        )
+    return [tx_id for tx_id in tx_ids if not txids.get(tx_id) or txids[tx_id] not in protected]
+
+
+def _store_cursor(session: Session, cursor: dict[str, Any]) -> None:
+    details = json.dumps(cursor)
+    event = session.execute(select(MonitorEvent).where(MonitorEvent.event == PURGE_CURSOR_EVENT)).scalar_one_or_none()
+    if event is None:
+        session.add(MonitorEvent(event=PURGE_CURSOR_EVENT, details=details))
+    else:
+        event.details = details
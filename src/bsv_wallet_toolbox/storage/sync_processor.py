@@ -7,6 +7,7 @@ Reference: go-wallet-toolbox/pkg/storage/internal/sync/chunk_processor.go
 """
 
 import logging
+from collections.abc import Callable
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
@@ -38,6 +39,9 @@ class SyncChunkProcessor:
         self.inserts_count = 0
         self.updates_count = 0
         self.errors: list[str] = []
+        # Remote transactionId / txid -> local transactionId, filled by _process_transactions
+        self._transaction_ids: dict[int, int] = {}
+        self._transaction_ids_by_txid: dict[str, int | None] = {}
 
         # Validate required fields
         self._validate_chunk()
@@ -217,20 +221,26 @@ class SyncChunkProcessor:
                 self.errors.append(f"Failed to process proven tx {tx.get('txid', 'unknown')}: {e}")
 
     def _process_transactions(self) -> None:
-        """Process transactions from chunk."""
+        """Process transactions from chunk.
+
+        All transactions are upserted in one statement batch keyed on their
+        reference (row by row if the batch fails), and the local transactionId
+        of each is remembered for the outputs that follow.
+        """
         transactions = self.chunk.get("transactions", [])
+        if not transactions:
+            return
+        user_id = self._get_user_id()
+        rows = []
         for tx in transactions:
-            try:
-                txid = tx.get("txid", "unknown")
-                self.logger.debug(f"Processing transaction: {txid}")
-
-                # Insert transaction (provider handles upsert logic)
-                user_id = self._get_user_id()
-                tx_data = {
+            txid = tx.get("txid", "unknown")
+            rows.append(
+                {
                     "userId": user_id,
                     "txid": txid,
                     "status": tx.get("status", "unprocessed"),
-                    "reference": tx.get("reference", ""),
+                    # reference is the unique upsert key; fall back to txid for chunks without it
+                    "reference": tx.get("reference") or txid,
                     "isOutgoing": tx.get("isOutgoing", False),
                     "satoshis": tx.get("satoshis", 0),
                     "description": tx.get("description", ""),
@@ -238,26 +248,43 @@ class SyncChunkProcessor:
                     "lockTime": tx.get("lockTime", 0),
                     "inputBeef": tx.get("inputBEEF"),
                 }
-                self.provider.insert_transaction(tx_data)
-                self.inserts_count += 1
-            except Exception as e:
-                self.errors.append(f"Failed to process transaction {txid}: {e}")
-                self.logger.debug(f"Transaction sync error: {e}")
-                self.inserts_count += 1  # Count as processed
+            )
+        self.logger.debug(f"Processing {len(rows)} transactions")
+        local_ids, failures = self._upsert_rows(self.provider.upsert_many_transactions, rows)
+        for row, e in failures:
+            self.errors.append(f"Failed to process transaction {row['txid']}: {e}")
+            self.logger.debug(f"Transaction sync error: {e}")
+        for tx, row, local_id in zip(transactions, rows, local_ids, strict=True):
+            if local_id is None:
+                continue  # outputs of a failed transaction fall back to a lookup by txid
+            if tx.get("transactionId") is not None:
+                self._transaction_ids[tx["transactionId"]] = local_id
+            self._transaction_ids_by_txid[row["txid"]] = local_id
+        self.inserts_count += len(rows) - len(failures)
 
     def _process_outputs(self) -> None:
-        """Process outputs from chunk."""
+        """Process outputs from chunk.
+
+        Outputs are upserted in one batch on (transactionId, vout, userId)
+        (row by row if the batch fails), with the remote transactionId mapped
+        to the local one.
+        """
         outputs = self.chunk.get("outputs", [])
+        if not outputs:
+            return
+        user_id = self._get_user_id()
+        rows = []
         for output in outputs:
-            try:
-                txid = output.get("txid", "unknown")
-                vout = output.get("vout", 0)
-                self.logger.debug(f"Processing output: {txid}:{vout}")
-
-                # Insert output (provider handles upsert)
-                user_id = self._get_user_id()
-                output_data = {
+            txid = output.get("txid", "unknown")
+            vout = output.get("vout", 0)
+            transaction_id = self._local_transaction_id(output, user_id)
+            if transaction_id is None:
+                self.logger.warning(f"Output sync error for {txid}:{vout}: unknown transaction")
+                continue  # Don't count failed outputs as processed
+            rows.append(
+                {
                     "userId": user_id,
+                    "transactionId": transaction_id,
                     "txid": txid,
                     "vout": vout,
                     "satoshis": output.get("satoshis", 0),
@@ -275,13 +302,54 @@ class SyncChunkProcessor:
                     "purpose": output.get("purpose", "change"),
                     "type": output.get("type", "P2PKH"),
                 }
-                self.provider.insert_output(output_data)
-                self.inserts_count += 1
+            )
+        if not rows:
+            return
+        self.logger.debug(f"Processing {len(rows)} outputs")
+        _ids, failures = self._upsert_rows(self.provider.upsert_many_outputs, rows)
+        for row, e in failures:
+            self.logger.warning(f"Output sync error for {row['txid']}:{row['vout']}: {e}")
+        self.inserts_count += len(rows) - len(failures)  # Don't count failed outputs as processed
+
+    def _upsert_rows(
+        self, upsert: Callable[[list[dict[str, Any]]], list[int]], rows: list[dict[str, Any]]
+    ) -> tuple[list[int | None], list[tuple[dict[str, Any], Exception]]]:
+        """Upsert rows in one batch, falling back to one row at a time if the batch fails.
+
+        A bad row then only loses itself instead of the whole chunk.
+
+        Returns:
+            The local id of each row (None for failed rows) and the failed rows with their errors
+        """
+        try:
+            return upsert(rows), []
+        except Exception as e:
+            if len(rows) == 1:
+                return [None], [(rows[0], e)]
+            self.logger.debug(f"Batch upsert of {len(rows)} rows failed, retrying per row: {e}")
+        ids: list[int | None] = []
+        failures: list[tuple[dict[str, Any], Exception]] = []
+        for row in rows:
+            try:
+                ids.append(upsert([row])[0])
             except Exception as e:
-                self.logger.warning(
-                    f"Output sync error for {output.get('txid', 'unknown')}:{output.get('vout', 0)}: {e}"
-                )
-                # Don't count failed outputs as processed
+                ids.append(None)
+                failures.append((row, e))
+        return ids, failures
+
+    def _local_transaction_id(self, output: dict[str, Any], user_id: int) -> int | None:
+        """Map an output's remote transactionId (or txid) to the local transactionId."""
+        remote_id = output.get("transactionId")
+        if remote_id is not None and remote_id in self._transaction_ids:
+            return self._transaction_ids[remote_id]
+        txid = output.get("txid")
+        if not txid:
+            return None
+        if txid not in self._transaction_ids_by_txid:
+            # Transaction synced by an earlier chunk
+            found = self.provider.find_transactions({"partial": {"userId": user_id, "txid": txid}})
+            self._transaction_ids_by_txid[txid] = found[0]["transactionId"] if found else None
+        return self._transaction_ids_by_txid[txid]
 
     def _process_tx_labels(self) -> None:
         """Process transaction labels from chunk."""
@@ -0,0 +1,392 @@
+"""Funding UTXO allocation for createAction change inputs.
+
+An output is claimed with one guarded UPDATE. The candidate comes from an
+index range scan over ``ix_outputs_funding`` (userId, basketId, spendable,
+spentBy, satoshis). The UPDATE re-checks ``spendable`` and ``spentBy``, so two funders
+can never claim the same output and no row lock is held between statements.
+Where the dialect supports ``UPDATE ... RETURNING`` (SQLite >= 3.35,
+PostgreSQL) the pick, the claim and the read are a single statement; on
+PostgreSQL the pick uses ``FOR UPDATE SKIP LOCKED`` so concurrent funders move
+on to the next output instead of queueing. Other dialects pick first and claim
+with a compare-and-set UPDATE, retrying with the next candidate on a lost race.
+
+Selection order matches the previous SELECT ... FOR UPDATE implementation:
+exact match, then the smallest output >= target, then the largest output below
+target.
+
+:class:`FundingWindow` serves batched funding: a createAction prefetches a
+sorted window of candidates in one query, runs change generation against it in
+memory and claims the chosen outputs together with
+:func:`claim_funding_outputs` (all or nothing). Unused candidates are never
+claimed, so nothing has to be released.
+
+:class:`UtxoFreeList` is an optional in-process cache of candidates per basket
+sorted by satoshis. Funders pop distinct candidates under a short mutex and
+claim them by id, so concurrent allocations in one process do not contend in
+the database. The list is a hint only: every claim is still guarded, stale
+entries are dropped when their claim fails, released outputs are pushed back,
+writers invalidate it and it is reloaded after ``max_age_seconds``.
+
+Reference:
+    toolbox/ts-wallet-toolbox/src/storage/StorageKnex.ts (allocateChangeInput)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left, insort
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import exists, select, update
+from sqlalchemy.orm import Session
+
+from .db import chunked
+from .models import Output
+from .models import Transaction as TransactionModel
+from .wallet_balance import apply_balance_deltas, sum_balances
+
+# Transaction statuses whose outputs may fund new transactions (matches TS StorageKnex/StorageIdb).
+# "unproven" outputs are allowed; the restriction on "unproven" applies to inputs, not outputs.
+FUNDING_TX_STATUSES: tuple[str, ...] = ("completed", "unsigned", "nosend", "unproven")
+
+# Only P2PKH can be signed by the wallet signer (buildSignableTransaction.ts);
+# "custom" is accepted temporarily for basket insertions that are P2PKH.
+FUNDING_OUTPUT_TYPES: tuple[str, ...] = ("P2PKH", "custom")
+
+MAX_CLAIM_ATTEMPTS = 8
+
+# Candidates prefetched by batched funding (fund_new_transaction_sdk)
+FUNDING_WINDOW_SIZE = 10_000
+
+FreeListKey = tuple[int, int, bool]
+
+
+def funding_statuses(exclude_sending: bool) -> tuple[str, ...]:
+    """Return allowed transaction statuses; "sending" is allowed unless excluded."""
+    return FUNDING_TX_STATUSES if exclude_sending else (*FUNDING_TX_STATUSES, "sending")
+
+
+def funding_conditions(user_id: int, basket_id: int, exclude_sending: bool) -> list[Any]:
+    """Return WHERE conditions selecting fundable outputs of one basket.
+
+    The status check is a correlated EXISTS so the conditions can guard an
+    UPDATE as well as a SELECT.
+    """
+    return [
+        Output.user_id == user_id,
+        Output.basket_id == basket_id,
+        Output.spendable.is_(True),
+        Output.spent_by.is_(None),
+        Output.type.in_(FUNDING_OUTPUT_TYPES),
+        exists().where(
+            TransactionModel.transaction_id == Output.transaction_id,
+            TransactionModel.status.in_(funding_statuses(exclude_sending)),
+        ),
+    ]
+
+
+def _tiers(target_satoshis: int, exact_satoshis: int | None) -> list[tuple[Any, Any]]:
+    tiers = []
+    if exact_satoshis is not None:
+        tiers.append((Output.satoshis == exact_satoshis, Output.output_id.asc()))
+    tiers.append((Output.satoshis >= target_satoshis, Output.satoshis.asc()))
+    tiers.append((Output.satoshis < target_satoshis, Output.satoshis.desc()))
+    return tiers
+
+
+def _claim_values(transaction_id: int) -> dict[str, Any]:
+    return {
+        "spendable": False,
+        "spent_by": transaction_id,
+        "spending_description": f"Allocated for transaction {transaction_id}",
+    }
+
+
+def _supports_returning(session: Session) -> bool:
+    return bool(getattr(session.get_bind().dialect, "update_returning", False))
+
+
+def _claim_by_id(session: Session, output_id: int, guard: list[Any], transaction_id: int) -> Output | None:
+    stmt = (
+        update(Output)
+        .where(Output.output_id == output_id, *guard)
+        .values(**_claim_values(transaction_id))
+        .execution_options(synchronize_session=False)
+    )
+    if _supports_returning(session):
+        return session.execute(stmt.returning(Output)).scalar_one_or_none()
+    if session.execute(stmt).rowcount != 1:
+        return None
+    return session.get(Output, output_id, populate_existing=True)
+
+
+def _claim_best(session: Session, guard: list[Any], tier: tuple[Any, Any], transaction_id: int) -> Output | None:
+    condition, order = tier
+    pick = select(Output.output_id).where(*guard, condition).order_by(order).limit(1)
+    dialect = session.get_bind().dialect.name
+
+    if _supports_returning(session):
+        if dialect == "postgresql":
+            pick = pick.with_for_update(skip_locked=True)
+        stmt = (
+            update(Output)
+            .where(Output.output_id == pick.scalar_subquery(), *guard)
+            .values(**_claim_values(transaction_id))
+            .returning(Output)
+            .execution_options(synchronize_session=False)
+        )
+        return session.execute(stmt).scalar_one_or_none()
+
+    lost: list[int] = []
+    for _ in range(MAX_CLAIM_ATTEMPTS):
+        candidate = pick.where(Output.output_id.not_in(lost)) if lost else pick
+        output_id = session.execute(candidate).scalar()
+        if output_id is None:
+            return None
+        claimed = _claim_by_id(session, output_id, guard, transaction_id)
+        if claimed is not None:
+            return claimed
+        lost.append(output_id)
+    return None
+
+
+def _apply_claim_to_balance(session: Session, output_id: int) -> None:
+    """Remove a freshly claimed output's contribution from the balance aggregate."""
+    before = sum_balances(session, output_ids=[output_id], assume_unspent=True)
+    apply_balance_deltas(session, before, {})
+
+
+def claim_funding_output(
+    session: Session,
+    *,
+    user_id: int,
+    basket_id: int,
+    target_satoshis: int,
+    exact_satoshis: int | None,
+    exclude_sending: bool,
+    transaction_id: int,
+    free_list: UtxoFreeList | None = None,
+) -> Output | None:
+    """Claim one fundable output for ``transaction_id``.
+
+    Args:
+        session: Active session; the caller commits.
+        user_id: Owning user.
+        basket_id: Change basket to fund from.
+        target_satoshis: Amount still needed.
+        exact_satoshis: Preferred exact amount, if any.
+        exclude_sending: Exclude outputs of transactions in "sending" status.
+        transaction_id: Spending transaction recorded in ``spentBy``.
+        free_list: Optional in-process candidate cache.
+
+    Returns:
+        The claimed Output (already marked unspendable), or None if the basket
+        has no fundable output.
+    """
+    guard = funding_conditions(user_id, basket_id, exclude_sending)
+    claimed: Output | None = None
+
+    if free_list is not None:
+        key: FreeListKey = (user_id, basket_id, exclude_sending)
+
+        def load() -> list[tuple[int, int]]:
+            q = select(Output.satoshis, Output.output_id).where(*guard)
+            return [(int(sats), int(oid)) for sats, oid in session.execute(q)]
+
+        for _ in range(MAX_CLAIM_ATTEMPTS):
+            candidate = free_list.take(key, target_satoshis, exact_satoshis, load)
+            if candidate is None:
+                break
+            claimed = _claim_by_id(session, candidate[1], guard, transaction_id)
+            if claimed is not None:
+                break
+
+    if claimed is None:
+        for tier in _tiers(target_satoshis, exact_satoshis):
+            claimed = _claim_best(session, guard, tier, transaction_id)
+            if claimed is not None:
+                break
+
+    if claimed is not None:
+        _apply_claim_to_balance(session, claimed.output_id)
+    return claimed
+
+
+def _pop_best(
+    entries: list[tuple[int, int]], target_satoshis: int, exact_satoshis: int | None
+) -> tuple[int, int] | None:
+    """Pop the (satoshis, outputId) entry the database tiers would pick from a sorted list."""
+    if exact_satoshis is not None:
+        i = bisect_left(entries, (exact_satoshis, -1))
+        if i < len(entries) and entries[i][0] == exact_satoshis:
+            return entries.pop(i)
+    i = bisect_left(entries, (target_satoshis, -1))
+    if i < len(entries):
+        return entries.pop(i)
+    if i > 0:
+        return entries.pop(i - 1)
+    return None
+
+
+def _insert_entry(entries: list[tuple[int, int]], entry: tuple[int, int]) -> None:
+    i = bisect_left(entries, entry)
+    if i == len(entries) or entries[i] != entry:
+        insort(entries, entry)
+
+
+class FundingWindow:
+    """Prefetched, sorted funding candidates for one batched funding run.
+
+    ``allocate``/``release`` have the shape of the generate_change_sdk
+    callbacks but only move candidates in memory; the outputs finally chosen
+    are claimed together with :func:`claim_funding_outputs`.
+
+    Args:
+        candidates: (satoshis, outputId) pairs.
+        truncated: True if the basket holds more candidates than were loaded.
+    """
+
+    def __init__(self, candidates: list[tuple[int, int]], truncated: bool = False) -> None:
+        self._free = sorted(candidates)
+        self._taken: dict[int, int] = {}
+        self.truncated = truncated
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    def allocate(self, target_satoshis: int, exact_satoshis: int | None = None) -> tuple[int, int] | None:
+        """Take the best candidate for the target, as (outputId, satoshis)."""
+        entry = _pop_best(self._free, target_satoshis, exact_satoshis)
+        if entry is None:
+            return None
+        satoshis, output_id = entry
+        self._taken[output_id] = satoshis
+        return output_id, satoshis
+
+    def release(self, output_id: int) -> None:
+        """Put a previously allocated candidate back."""
+        satoshis = self._taken.pop(output_id, None)
+        if satoshis is not None:
+            _insert_entry(self._free, (satoshis, output_id))
+
+
+def load_funding_window(
+    session: Session,
+    *,
+    user_id: int,
+    basket_id: int,
+    exclude_sending: bool,
+    limit: int = FUNDING_WINDOW_SIZE,
+) -> FundingWindow:
+    """Load up to ``limit`` fundable candidates of a basket in one query.
+
+    When the basket holds more, the largest outputs are kept so large
+    payments can still be covered with few inputs.
+    """
+    q = (
+        select(Output.satoshis, Output.output_id)
+        .where(*funding_conditions(user_id, basket_id, exclude_sending))
+        .order_by(Output.satoshis.desc(), Output.output_id.asc())
+        .limit(limit + 1)
+    )
+    rows = [(int(sats), int(oid)) for sats, oid in session.execute(q)]
+    return FundingWindow(rows[:limit], truncated=len(rows) > limit)
+
+
+def claim_funding_outputs(
+    session: Session,
+    *,
+    user_id: int,
+    basket_id: int,
+    exclude_sending: bool,
+    transaction_id: int,
+    output_ids: list[int],
+) -> bool:
+    """Claim all of ``output_ids`` for ``transaction_id`` or none of them.
+
+    Issues one guarded UPDATE per IN chunk. If any output is no longer
+    fundable (claimed concurrently), returns False and the caller must roll
+    back the session.
+    """
+    if not output_ids:
+        return True
+    guard = funding_conditions(user_id, basket_id, exclude_sending)
+    before = sum_balances(session, output_ids=output_ids, assume_unspent=True)
+    claimed = 0
+    for chunk in chunked(sorted(set(output_ids))):
+        stmt = (
+            update(Output)
+            .where(Output.output_id.in_(chunk), *guard)
+            .values(**_claim_values(transaction_id))
+            .execution_options(synchronize_session=False)
+        )
+        claimed += session.execute(stmt).rowcount or 0
+    if claimed != len(set(output_ids)):
+        return False
+    apply_balance_deltas(session, before, {})
+    return True
+
+
+@dataclass
+class _Candidates:
+    entries: list[tuple[int, int]] = field(default_factory=list)
+    loaded_at: float = 0.0
+
+
+class UtxoFreeList:
+    """In-process per-basket funding candidates sorted by satoshis.
+
+    Args:
+        max_age_seconds: Reload a basket's candidates after this many seconds,
+            picking up outputs made spendable by other processes.
+    """
+
+    def __init__(self, max_age_seconds: float = 30.0) -> None:
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        self._baskets: dict[FreeListKey, _Candidates] = {}
+
+    def take(
+        self,
+        key: FreeListKey,
+        target_satoshis: int,
+        exact_satoshis: int | None,
+        load: Callable[[], list[tuple[int, int]]],
+    ) -> tuple[int, int] | None:
+        """Pop the best (satoshis, outputId) candidate for the target.
+
+        ``load`` is called (outside the mutex) when the basket is not cached
+        or its candidates are older than ``max_age_seconds``.
+        """
+        with self._lock:
+            cached = self._baskets.get(key)
+            fresh = cached is not None and time.monotonic() - cached.loaded_at < self.max_age_seconds
+        if not fresh:
+            loaded = _Candidates(sorted(load()), time.monotonic())
+            with self._lock:
+                self._baskets[key] = loaded
+
+        with self._lock:
+            cached = self._baskets.get(key)
+            if cached is None:
+                return None
+            return _pop_best(cached.entries, target_satoshis, exact_satoshis)
+
+    def put(self, user_id: int, basket_id: int, output_id: int, satoshis: int) -> None:
+        """Return a released output to the cached lists of its basket."""
+        with self._lock:
+            for (uid, bid, _), cached in self._baskets.items():
+                if uid == user_id and bid == basket_id:
+                    _insert_entry(cached.entries, (int(satoshis), int(output_id)))
+
+    def invalidate(self, user_id: int | None = None) -> None:
+        """Drop cached candidates of ``user_id`` (or of every user)."""
+        with self._lock:
+            if user_id is None:
+                self._baskets.clear()
+            else:
+                for key in [k for k in self._baskets if k[0] == user_id]:
+                    del self._baskets[key]
@@ -0,0 +1,310 @@
+"""Maintained wallet balance aggregate (specOpWalletBalance).
+
+The wallet balance is the sum of satoshis over outputs that are spendable,
+unspent, wallet-managed change (P2PKH) and owned by a transaction in one of
+``WALLET_BALANCE_TX_STATUSES``. Recomputing that on every ``listOutputs``
+call scans every UTXO of the user, so the totals are kept per (user, basket)
+in ``output_basket_balances`` and adjusted by the writers that can change
+them.
+
+Writers bracket their mutation with a :class:`BalanceSnapshot`: the snapshot
+records the contribution of the outputs about to be touched, and ``apply``
+re-sums the same outputs after the mutation and adds the difference to the
+aggregate rows, all inside the caller's session. Because only deltas are
+applied, an aggregate row that does not exist yet is simply left alone and
+materialized from a SQL SUM by the next reader.
+
+Reference:
+    toolbox/ts-wallet-toolbox/src/storage/methods/ListOutputsSpecOp.ts
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from .db import chunked
+from .models import Output, OutputBasket, OutputBasketBalance
+from .models import Transaction as TransactionModel
+
+# Transaction statuses whose outputs count towards the wallet balance (listOutputsKnex.ts)
+WALLET_BALANCE_TX_STATUSES: tuple[str, ...] = ("completed", "unproven", "nosend", "sending")
+
+BalanceKey = tuple[int, int]
+BalanceTotals = dict[BalanceKey, tuple[int, int]]
+
+
+def balance_conditions(*, assume_unspent: bool = False) -> list[Any]:
+    """Return the WHERE conditions selecting outputs that contribute to the balance.
+
+    The caller must join ``transactions`` on ``outputs.transactionId``. With
+    ``assume_unspent`` the spendable/spentBy conditions are dropped, giving the
+    contribution the outputs had before being claimed.
+    """
+    spent_state = [] if assume_unspent else [Output.spendable.is_(True), Output.spent_by.is_(None)]
+    return [
+        *spent_state,
+        Output.change.is_(True),
+        Output.type == "P2PKH",
+        Output.basket_id.is_not(None),
+        TransactionModel.status.in_(WALLET_BALANCE_TX_STATUSES),
+    ]
+
+
+def sum_balances(
+    session: Session,
+    *,
+    user_id: int | None = None,
+    basket_id: int | None = None,
+    output_ids: Iterable[int] | None = None,
+    assume_unspent: bool = False,
+) -> BalanceTotals:
+    """Compute balance totals with SQL SUM, grouped by (userId, basketId).
+
+    Args:
+        session: Active session.
+        user_id: Optional user filter.
+        basket_id: Optional basket filter.
+        output_ids: Optional restriction to these outputs (empty -> no rows).
+        assume_unspent: Sum as if the outputs were still spendable and unspent.
+
+    Returns:
+        Mapping of (userId, basketId) to (satoshis, outputCount); groups with
+        no contributing outputs are absent.
+    """
+    base = (
+        select(
+            Output.user_id,
+            Output.basket_id,
+            func.coalesce(func.sum(Output.satoshis), 0),
+            func.count(Output.output_id),
+        )
+        .join(TransactionModel, Output.transaction_id == TransactionModel.transaction_id)
+        .where(*balance_conditions(assume_unspent=assume_unspent))
+        .group_by(Output.user_id, Output.basket_id)
+    )
+    if user_id is not None:
+        base = base.where(Output.user_id == user_id)
+    if basket_id is not None:
+        base = base.where(Output.basket_id == basket_id)
+
+    if output_ids is None:
+        statements = [base]
+    else:
+        ids = sorted(set(output_ids))
+        statements = [base.where(Output.output_id.in_(chunk)) for chunk in chunked(ids)]
+
+    totals: BalanceTotals = {}
+    for stmt in statements:
+        for uid, bid, sats, count in session.execute(stmt):
+            prev_sats, prev_count = totals.get((uid, bid), (0, 0))
+            totals[(uid, bid)] = (prev_sats + int(sats or 0), prev_count + int(count or 0))
+    return totals
+
+
+def _output_ids_where(session: Session, column: Any, values: Sequence[int]) -> set[int]:
+    ids: set[int] = set()
+    for chunk in chunked(list(values)):
+        ids.update(session.execute(select(Output.output_id).where(column.in_(chunk))).scalars())
+    return ids
+
+
+def apply_balance_deltas(session: Session, before: BalanceTotals, after: BalanceTotals) -> None:
+    """Add ``after - before`` to the materialized aggregate rows.
+
+    Rows that have not been materialized yet are skipped; the next reader
+    computes them from the outputs table.
+    """
+    for key in before.keys() | after.keys():
+        before_sats, before_count = before.get(key, (0, 0))
+        after_sats, after_count = after.get(key, (0, 0))
+        delta_sats = after_sats - before_sats
+        delta_count = after_count - before_count
+        if not delta_sats and not delta_count:
+            continue
+        user_id, basket_id = key
+        session.execute(
+            update(OutputBasketBalance)
+            .where(OutputBasketBalance.user_id == user_id, OutputBasketBalance.basket_id == basket_id)
+            .values(
+                satoshis=OutputBasketBalance.satoshis + delta_sats,
+                output_count=OutputBasketBalance.output_count + delta_count,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+
+@dataclass
+class BalanceSnapshot:
+    """Contribution of a set of outputs captured before a mutation.
+
+    Outputs are selected by id, by owning transaction and by spending
+    transaction. Outputs of ``transaction_ids`` are re-resolved after the
+    mutation so rows inserted for those transactions are picked up; spent_by
+    is only resolved up front because releasing an output clears it.
+    """
+
+    output_ids: set[int] = field(default_factory=set)
+    transaction_ids: tuple[int, ...] = ()
+    before: BalanceTotals = field(default_factory=dict)
+
+    @classmethod
+    def take(
+        cls,
+        session: Session,
+        *,
+        output_ids: Iterable[int] = (),
+        transaction_ids: Iterable[int] = (),
+        spent_by_ids: Iterable[int] = (),
+    ) -> BalanceSnapshot:
+        ids = {int(i) for i in output_ids if i is not None}
+        tx_ids = tuple(dict.fromkeys(int(t) for t in transaction_ids if t is not None))
+        spent_by = [int(t) for t in dict.fromkeys(spent_by_ids) if t is not None]
+        ids.update(_output_ids_where(session, Output.transaction_id, tx_ids))
+        ids.update(_output_ids_where(session, Output.spent_by, spent_by))
+        before = sum_balances(session, output_ids=ids) if ids else {}
+        return cls(output_ids=ids, transaction_ids=tx_ids, before=before)
+
+    def add_new_outputs(self, output_ids: Iterable[int]) -> None:
+        """Track outputs created after the snapshot (they contributed nothing before)."""
+        self.output_ids.update(int(i) for i in output_ids if i is not None)
+
+    def apply(self, session: Session) -> None:
+        """Flush pending changes and apply the balance delta in ``session``."""
+        session.flush()
+        ids = set(self.output_ids)
+        ids.update(_output_ids_where(session, Output.transaction_id, self.transaction_ids))
+        after = sum_balances(session, output_ids=ids) if ids else {}
+        apply_balance_deltas(session, self.before, after)
+
+
+def _insert_ignore(session: Session, rows: list[dict[str, Any]]) -> None:
+    """Insert aggregate rows (column-keyed), leaving rows created concurrently untouched."""
+    if not rows:
+        return
+    table = OutputBasketBalance.__table__
+    dialect = session.get_bind().dialect.name
+    if dialect == "sqlite":
+        session.execute(sqlite.insert(table).values(rows).on_conflict_do_nothing())
+    elif dialect == "postgresql":
+        session.execute(postgresql.insert(table).values(rows).on_conflict_do_nothing())
+    elif dialect in ("mysql", "mariadb"):
+        session.execute(mysql.insert(table).values(rows).prefix_with("IGNORE"))
+    else:
+        existing = {
+            tuple(r) for r in session.execute(select(OutputBasketBalance.user_id, OutputBasketBalance.basket_id))
+        }
+        rows = [r for r in rows if (r["userId"], r["basketId"]) not in existing]
+        if rows:
+            session.execute(table.insert(), rows)
+
+
+def _to_columns(row: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "userId": row["user_id"],
+        "basketId": row["basket_id"],
+        "satoshis": row["satoshis"],
+        "outputCount": row["output_count"],
+    }
+
+
+def read_basket_balance(session: Session, user_id: int, basket_id: int) -> int:
+    """Return the wallet balance of one basket, materializing the aggregate if needed.
+
+    Args:
+        session: Active session; the materialized row is written through it.
+        user_id: Owning user.
+        basket_id: Basket to read.
+
+    Returns:
+        Sum of satoshis over contributing outputs.
+    """
+    row = session.execute(
+        select(OutputBasketBalance.satoshis).where(
+            OutputBasketBalance.user_id == user_id, OutputBasketBalance.basket_id == basket_id
+        )
+    ).first()
+    if row is not None:
+        return int(row[0])
+
+    sats, count = sum_balances(session, user_id=user_id, basket_id=basket_id).get((user_id, basket_id), (0, 0))
+    _insert_ignore(
+        session,
+        [_to_columns({"user_id": user_id, "basket_id": basket_id, "satoshis": sats, "output_count": count})],
+    )
+    return sats
+
+
+def rebuild_balances(session: Session, user_id: int | None = None) -> int:
+    """Recompute aggregate rows from the outputs table.
+
+    Every basket (of ``user_id``, or of all users) gets a row, including
+    baskets with a zero balance.
+
+    Returns:
+        Number of aggregate rows written.
+    """
+    totals = sum_balances(session, user_id=user_id)
+    basket_q = select(OutputBasket.user_id, OutputBasket.basket_id)
+    if user_id is not None:
+        basket_q = basket_q.where(OutputBasket.user_id == user_id)
+    keys = {tuple(r) for r in session.execute(basket_q)} | totals.keys()
+
+    existing_q = select(OutputBasketBalance.user_id, OutputBasketBalance.basket_id)
+    if user_id is not None:
+        existing_q = existing_q.where(OutputBasketBalance.user_id == user_id)
+    existing = {tuple(r) for r in session.execute(existing_q)}
+
+    for uid, bid in keys & existing:
+        sats, count = totals.get((uid, bid), (0, 0))
+        session.execute(
+            update(OutputBasketBalance)
+            .where(OutputBasketBalance.user_id == uid, OutputBasketBalance.basket_id == bid)
+            .values(satoshis=sats, output_count=count)
+            .execution_options(synchronize_session=False)
+        )
+    missing = [
+        _to_columns({"user_id": uid, "basket_id": bid, "satoshis": s, "output_count": c})
+        for (uid, bid) in sorted(keys - existing)
+        for s, c in [totals.get((uid, bid), (0, 0))]
+    ]
+    _insert_ignore(session, missing)
+    return len(keys)
+
+
+def check_balances(session: Session, user_id: int | None = None) -> list[dict[str, Any]]:
+    """Compare materialized aggregate rows with a fresh SQL SUM.
+
+    Returns:
+        One dict per mismatching row with the stored and expected values.
+    """
+    totals = sum_balances(session, user_id=user_id)
+    q = select(
+        OutputBasketBalance.user_id,
+        OutputBasketBalance.basket_id,
+        OutputBasketBalance.satoshis,
+        OutputBasketBalance.output_count,
+    )
+    if user_id is not None:
+        q = q.where(OutputBasketBalance.user_id == user_id)
+
+    mismatches: list[dict[str, Any]] = []
+    for uid, bid, sats, count in session.execute(q):
+        expected_sats, expected_count = totals.get((uid, bid), (0, 0))
+        if int(sats) != expected_sats or int(count) != expected_count:
+            mismatches.append(
+                {
+                    "userId": uid,
+                    "basketId": bid,
+                    "satoshis": int(sats),
+                    "expectedSatoshis": expected_sats,
+                    "outputCount": int(count),
+                    "expectedOutputCount": expected_count,
+                }
+            )
+    return mismatches
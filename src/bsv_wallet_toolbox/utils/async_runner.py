@@ -0,0 +1,182 @@
+"""Shared background event loop for running coroutines from synchronous code.
+
+The synchronous wallet and services APIs drive their async implementations
+(WhatsOnChain, ``Services.*_async``, ``Transaction.verify``) on one persistent
+event loop running in a daemon thread, instead of creating a loop per call
+with ``asyncio.run``. Keeping one loop alive lets connection pools, in-flight
+request coalescing and caches bound to that loop be reused across calls.
+
+Synchronous providers called from the loop run on its default executor, a
+thread pool of ``EXECUTOR_MAX_WORKERS`` threads.
+
+The runner is created lazily on first use and reset in forked children.
+
+Example:
+    >>> from bsv_wallet_toolbox.utils.async_runner import run_sync
+    >>> height = run_sync(whatsonchain.current_height())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+from collections.abc import Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+EXECUTOR_MAX_WORKERS: int = 32  # threads for synchronous provider calls made from the loop
+
+
+class AsyncRunner:
+    """Background event loop runner for executing coroutines synchronously."""
+
+    def __init__(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._loop.set_default_executor(
+            ThreadPoolExecutor(max_workers=EXECUTOR_MAX_WORKERS, thread_name_prefix="asyncRunnerExecutor")
+        )
+        self._loop_thread = threading.Thread(target=self._run_loop, name="asyncRunner", daemon=True)
+        self._loop_thread.start()
+        self._shutdown_event = threading.Event()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The event loop coroutines are run on."""
+        return self._loop
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_forever()
+        finally:
+            # Cleanup when loop stops
+            try:
+                _cancel_all_tasks(self._loop)
+                self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+                self._loop.run_until_complete(self._loop.shutdown_default_executor())
+            except Exception as e:
+                logger.debug(f"Non-fatal error during async runner cleanup: {e}")
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run ``coro`` on the background loop and block until it completes.
+
+        Raises:
+            RuntimeError: If the runner was shut down, or if called from the
+                loop thread itself (which would deadlock; await the coroutine instead).
+        """
+        if self._shutdown_event.is_set():
+            coro.close()
+            raise RuntimeError("AsyncRunner has been shut down")
+        if threading.current_thread() is self._loop_thread:
+            coro.close()
+            raise RuntimeError("AsyncRunner.run called from its own event loop; await the coroutine instead")
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        return future.result()
+
+    def shutdown(self) -> None:
+        """Shutdown the background event loop and thread.
+
+        This method should be called when the application is shutting down
+        to ensure proper cleanup of the background thread and event loop.
+        """
+        if self._shutdown_event.is_set():
+            return  # Already shut down
+
+        self._shutdown_event.set()
+
+        # Stop the event loop
+        if self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+
+        # Wait for thread to finish
+        if self._loop_thread.is_alive():
+            self._loop_thread.join(timeout=5.0)
+
+        # Final cleanup
+        try:
+            if not self._loop.is_closed():
+                self._loop.close()
+        except Exception:
+            pass  # Best effort cleanup
+
+
+def _cancel_all_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    """Cancel all pending tasks in the event loop."""
+    try:
+        pending_tasks = [t for t in asyncio.all_tasks(loop) if not t.done()]
+        for task in pending_tasks:
+            task.cancel()
+        if pending_tasks:
+            loop.run_until_complete(asyncio.gather(*pending_tasks, return_exceptions=True))
+    except Exception:
+        pass  # Best effort cleanup
+
+
+# Global async runner with lazy initialization (thread-safe)
+_async_runner_lock = threading.Lock()
+_async_runner: AsyncRunner | None = None
+_parent_pid = os.getpid()
+
+
+def _reset_async_runner_after_fork() -> None:
+    """Reset async runner in child process after fork."""
+    global _async_runner, _parent_pid
+    current_pid = os.getpid()
+    if current_pid != _parent_pid:
+        if _async_runner is not None:
+            try:
+                _async_runner.shutdown()
+            except Exception:
+                pass
+        _async_runner = None
+        _parent_pid = current_pid
+
+
+# Register fork handler if available (Python 3.7+)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_async_runner_after_fork)
+
+
+def get_async_runner() -> AsyncRunner:
+    """Get or create the global async runner (lazy initialization).
+
+    Thread-safe singleton pattern. The runner is created on first access,
+    avoiding issues with process forking since it won't exist at import time.
+    """
+    global _async_runner
+    if _async_runner is None:
+        with _async_runner_lock:
+            # Double-check pattern for thread safety
+            if _async_runner is None:
+                _async_runner = AsyncRunner()
+    return _async_runner
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run ``coro`` on the shared background loop and return its result.
+
+    Safe to call whether or not the calling thread has a running event loop
+    (the caller's loop is blocked until the coroutine completes).
+    """
+    return get_async_runner().run(coro)
+
+
+def shutdown_async_runner() -> None:
+    """Shutdown the global async runner.
+
+    This function should be called when the application is shutting down
+    to ensure proper cleanup of the background thread and event loop.
+
+    The async runner is created lazily on first use, so this function is safe
+    to call even if the runner hasn't been created yet.
+    """
+    global _async_runner
+    if _async_runner is not None:
+        _async_runner.shutdown()
+        _async_runner = None
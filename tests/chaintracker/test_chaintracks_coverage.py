@@ -51,7 +51,7 @@ class TestChaintracksServiceClient:
         except (ImportError, TypeError):
             pass
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_client_get_header(self, mock_get) -> None:
         """Test getting header from chaintracks client."""
         try:
@@ -0,0 +1,63 @@
+"""Unit tests for the bulk block header codec."""
+
+import pytest
+
+from bsv_wallet_toolbox.services.chaintracker.chaintracks.chain_work import ChainWork
+from bsv_wallet_toolbox.services.chaintracker.chaintracks.util import (
+    block_hash,
+    block_hashes,
+    decode_block_headers,
+    deserialize_base_block_header,
+    deserialize_base_block_headers,
+    deserialize_block_headers,
+    genesis_buffer,
+    validate_block_headers,
+)
+from tests.testabilities.testservices import EASY_BITS, mine_header_chain
+
+
+class TestBulkHeaderCodec:
+    """Test bulk decoding, hashing and validation against the per-header functions."""
+
+    def test_decode_matches_per_header_functions(self) -> None:
+        data = mine_header_chain(50)
+
+        headers = decode_block_headers(data, first_height=100)
+
+        for i, header in enumerate(headers):
+            raw = data[i * 80 : (i + 1) * 80]
+            assert header == {**deserialize_base_block_header(raw), "height": 100 + i, "hash": block_hash(raw)}
+        assert [h[::-1].hex() for h in block_hashes(data)] == [h["hash"] for h in headers]
+        assert deserialize_base_block_headers(data, 80, 3) == [
+            {k: v for k, v in h.items() if k not in ("height", "hash")} for h in headers[1:4]
+        ]
+        assert deserialize_block_headers(7, data[:160] + b"\x00" * 10)[1]["hash"] == headers[1]["hash"]
+
+    def test_validate_accumulates_chain_work(self) -> None:
+        data = mine_header_chain(20)
+        genesis_work = ChainWork.from_bits(486604799)
+
+        info = validate_block_headers(data[80:], first_height=1, previous_hash=block_hash(genesis_buffer("main")))
+
+        assert info.count == 19 and info.last_hash == block_hash(data[-80:])
+        assert info.chain_work == ChainWork(19 * ChainWork.from_bits(EASY_BITS).value)
+        whole = validate_block_headers(data, prev_chain_work=ChainWork(5))
+        assert whole.chain_work.value == 5 + genesis_work.value + info.chain_work.value
+
+    def test_validate_reports_the_first_bad_header(self) -> None:
+        data = bytearray(mine_header_chain(10))
+
+        with pytest.raises(ValueError, match="height 1 does not link"):
+            validate_block_headers(data[80:], first_height=1, previous_hash="00" * 32)
+
+        data[5 * 80 + 4] ^= 1  # break header 5's previous hash
+        with pytest.raises(ValueError, match="height 5 does not link"):
+            validate_block_headers(data)
+
+        unmined = bytearray(genesis_buffer("main"))
+        unmined[76:80] = b"\x00\x00\x00\x00"
+        with pytest.raises(ValueError, match="height 0 does not meet"):
+            validate_block_headers(unmined)
+        assert validate_block_headers(unmined, check_pow=False).count == 1
+        with pytest.raises(ValueError, match="multiple of 80"):
+            validate_block_headers(b"\x00" * 81)
@@ -0,0 +1,134 @@
+"""Unit tests for the memory-mapped bulk header store."""
+
+import pytest
+
+from bsv_wallet_toolbox.services.chaintracker.chaintracks import BulkHeaderStore, Chaintracks
+from bsv_wallet_toolbox.services.chaintracker.chaintracks.bulk_manager import BulkManager
+from bsv_wallet_toolbox.services.chaintracker.chaintracks.options import create_default_no_db_chaintracks_options
+from bsv_wallet_toolbox.services.chaintracker.chaintracks.util.block_header_utilities import (
+    block_hash,
+    deserialize_base_block_headers,
+)
+from tests.testabilities.testservices import mine_header_chain
+
+
+class TestBulkHeaderStore:
+    """Test offset lookups, index lookups and persistence of the bulk header store."""
+
+    def test_get_and_get_range_across_files(self, tmp_path) -> None:
+        data = mine_header_chain(25)
+        store = BulkHeaderStore(str(tmp_path), "main", headers_per_file=10)
+
+        store.append(0, data)
+
+        assert (store.min_height, store.max_height, store.count()) == (0, 24, 25)
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "mainNet_0.headers",
+            "mainNet_1.headers",
+            "mainNet_2.headers",
+        ]
+        view = store.get(13)
+        assert isinstance(view, memoryview) and bytes(view) == data[13 * 80 : 14 * 80]
+        assert store.get(25) is None and store.get(-1) is None
+        views = store.get_range(8, 21)
+        assert [len(v) // 80 for v in views] == [2, 10, 2]
+        assert b"".join(views) == data[8 * 80 : 22 * 80]
+        assert store.read_headers(20, 100) == data[20 * 80 :]
+        header = store.get_header(7)
+        assert header["height"] == 7 and header["hash"] == block_hash(data[7 * 80 : 8 * 80])
+        assert header["previousHash"] == block_hash(data[6 * 80 : 7 * 80])
+
+    def test_hash_and_merkle_root_lookups(self, tmp_path) -> None:
+        data = mine_header_chain(30)
+        store = BulkHeaderStore(str(tmp_path), "main", headers_per_file=10)
+        store.append(0, data[: 12 * 80])
+        headers = deserialize_base_block_headers(data)
+
+        assert store.find_height_for_hash(block_hash(data[5 * 80 : 6 * 80])) == 5
+        store.append(12, data[12 * 80 :])  # indexes extend to appended headers
+
+        assert store.find_height_for_hash(block_hash(data[29 * 80 :])) == 29
+        assert store.find_header_for_merkle_root(headers[17]["merkleRoot"])["height"] == 17
+        assert store.find_height_for_hash("ab" * 32) is None
+        assert store.find_height_for_merkle_root("cd" * 32) is None
+
+    def test_reopen_maps_existing_files(self, tmp_path) -> None:
+        data = mine_header_chain(15)
+        BulkHeaderStore(str(tmp_path), "main", headers_per_file=10).append(0, data)
+
+        store = BulkHeaderStore(str(tmp_path), "main", headers_per_file=10)
+        store.append(15, mine_header_chain(5, data[-80:]))
+
+        assert store.max_height == 19
+        assert store.read_headers(0, 15) == data
+        assert store.find_height_for_hash(block_hash(data[-80:])) == 14
+
+    def test_remap_publishes_mapping_before_count(self, tmp_path) -> None:
+        data = mine_header_chain(8)
+        store = BulkHeaderStore(str(tmp_path), "main", headers_per_file=10)
+        store.append(0, data[: 4 * 80])
+        file = store._files[0]
+        published = []
+
+        class _Spy(type(file)):
+            __slots__ = ()
+
+            def __setattr__(self, name, value) -> None:
+                published.append((name, value if name == "count" else len(value)))
+                super().__setattr__(name, value)
+
+        file.__class__ = _Spy
+
+        store.append(4, data[4 * 80 :])  # readers check count, then slice mm
+
+        assert published == [("mm", 8 * 80), ("count", 8)]
+        assert bytes(store.get(7)) == data[7 * 80 :]
+
+    def test_append_rejects_gaps_and_broken_links(self, tmp_path) -> None:
+        data = mine_header_chain(12)
+        store = BulkHeaderStore(str(tmp_path), "main", headers_per_file=10)
+
+        with pytest.raises(ValueError):
+            store.append(3, data[:80])
+        store.append(0, data[: 10 * 80])
+        with pytest.raises(ValueError):
+            store.append(11, data[11 * 80 :])
+        with pytest.raises(ValueError):
+            store.append(10, mine_header_chain(1))
+        with pytest.raises(ValueError):
+            store.append(10, data[10 * 80 : 10 * 80 + 40])
+        assert store.max_height == 9
+
+
+class TestBulkHeaderStoreConsumers:
+    """Test BulkManager and Chaintracks serving headers from the store."""
+
+    async def test_bulk_manager_uses_the_store(self, tmp_path) -> None:
+        data = mine_header_chain(20)
+        store = BulkHeaderStore(str(tmp_path), "main", headers_per_file=10)
+        store.append(0, data)
+        manager = BulkManager("main", [], store)
+
+        header = await manager.find_header_for_height(12)
+
+        assert header["hash"] == block_hash(data[12 * 80 : 13 * 80])
+        assert await manager.find_header_for_height(20) is None
+        assert (await manager.find_header_for_block_hash(header["hash"]))["height"] == 12
+        assert manager.get_height_range().max_height == 19
+        assert manager.last_header()[0]["height"] == 19
+        assert [f["count"] for f in manager.files_info()["files"]] == [10, 10]
+        assert await BulkManager("main", []).find_header_for_height(12) is None
+
+    async def test_chaintracks_get_headers_reads_bulk_files(self, tmp_path) -> None:
+        data = mine_header_chain(30)
+        BulkHeaderStore(str(tmp_path), "main", headers_per_file=10).append(0, data)
+        options = create_default_no_db_chaintracks_options("main")
+        options["bulkHeadersFolder"] = str(tmp_path)
+        options["bulkHeadersPerFile"] = 10
+        chaintracks = Chaintracks(options)
+        chaintracks.make_available()
+
+        assert await chaintracks.get_headers(8, 4) == data[8 * 80 : 12 * 80].hex()
+        assert (await chaintracks.get_info())["heightBulk"] == 29
+        assert (await chaintracks.find_header_for_height(21))["hash"] == block_hash(data[21 * 80 : 22 * 80])
+        chaintracks.destroy()
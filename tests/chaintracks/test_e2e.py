@@ -2,10 +2,6 @@
 
 Tests full integration of live ingestors, bulk managers, and storage.
 
-Note: The subscription tests (test_header_subscription, test_reorg_subscription)
-are currently skipped due to issues with background worker cancellation in test
-environments. These tests verify the pub/sub event system functionality.
-
 Reference: wallet-toolbox/src/services/chaintracker/__tests__/e2e.test.ts
 """
 
@@ -84,7 +80,6 @@ class TestChaintracksE2E:
         # Cleanup
         service.destroy()
 
-    @pytest.mark.skip(reason="Event subscription tests are causing hangs in background worker")
     @pytest.mark.asyncio
     async def test_header_subscription(self) -> None:
         """Test header event subscription system."""
@@ -99,7 +94,7 @@ class TestChaintracksE2E:
             received_events.append(event)
 
         # When
-        send_callback, unsubscribe = service.subscribe_headers()
+        send_callback, unsubscribe = service.subscribe_headers(event_handler)
 
         # Send a test event
         test_header = {"hash": "test_hash", "height": 100, "merkleRoot": "test_root"}
@@ -121,7 +116,6 @@ class TestChaintracksE2E:
         # Cleanup
         service.destroy()
 
-    @pytest.mark.skip(reason="Event subscription tests are causing hangs in background worker")
     @pytest.mark.asyncio
     async def test_reorg_subscription(self) -> None:
         """Test reorg event subscription system."""
@@ -136,7 +130,7 @@ class TestChaintracksE2E:
             received_events.append(event)
 
         # When
-        send_callback, _unsubscribe = service.subscribe_reorgs()
+        send_callback, _unsubscribe = service.subscribe_reorgs(event_handler)
 
         # Send a test event
         test_reorg = {"oldTip": "old_hash", "newTip": "new_hash"}
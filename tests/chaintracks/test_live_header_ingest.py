@@ -0,0 +1,83 @@
+"""Unit tests for batched live header ingestion and chain tip selection."""
+
+import random
+
+import pytest
+
+from bsv_wallet_toolbox.services.chaintracker.chaintracks.chain_work import ChainWork
+from bsv_wallet_toolbox.services.chaintracker.chaintracks.core_service import (
+    ChaintracksCoreService,
+    ChaintracksServiceConfig,
+)
+from bsv_wallet_toolbox.services.chaintracker.chaintracks.util import decode_block_headers
+from tests.testabilities.testservices import EASY_BITS, mine_header_chain
+
+
+@pytest.fixture
+def service() -> ChaintracksCoreService:
+    service = ChaintracksCoreService(ChaintracksServiceConfig(chain="main", live_ingest_batch_size=8))
+    service.storage.make_available()
+    return service
+
+
+def _active_hashes(service: ChaintracksCoreService, max_height: int) -> list[str]:
+    queries = service.storage.query()
+    return [queries.get_live_header_by_height(height)[0].hash for height in range(max_height + 1)]
+
+
+class TestLiveHeaderIngest:
+    """Test the live headers queue drained in batches into the live table."""
+
+    async def test_drains_queue_in_batches_and_selects_tip(self, service) -> None:
+        headers = decode_block_headers(mine_header_chain(30))
+        rng = random.Random(7)
+        for i in range(0, len(headers), 8):  # out of order within each batch
+            for header in rng.sample(headers[i : i + 8], len(headers[i : i + 8])):
+                service.live_headers_chan.put_nowait(header)
+
+        await service._shift_live_headers()
+
+        tip, _ = service.storage.query().get_active_tip_live_header()
+        assert tip.hash == headers[29]["hash"]
+        assert ChainWork.from_hex(tip.chain_work) == ChainWork(
+            ChainWork.from_bits(486604799).value + 29 * ChainWork.from_bits(EASY_BITS).value
+        )
+        assert _active_hashes(service, 29) == [h["hash"] for h in headers]
+        assert service.storage.query().count_live_headers() == (30, None)
+        assert (await service.find_chain_tip_hash()) == headers[29]["hash"]
+
+    async def test_fork_with_more_work_becomes_active(self, service) -> None:
+        data = mine_header_chain(21)
+        main = decode_block_headers(data)
+        fork = decode_block_headers(mine_header_chain(7, data[15 * 80 : 16 * 80], spacing=601), first_height=16)
+        await service._add_live_headers(main)
+
+        await service._add_live_headers(fork[:3])  # less work: stored inactive
+
+        assert (await service.find_chain_tip_hash()) == main[20]["hash"]
+        assert _active_hashes(service, 20) == [h["hash"] for h in main]
+
+        service._reset_live_header_cache()  # stored fork headers are flipped through storage
+        await service._add_live_headers(fork[3:])
+
+        assert (await service.find_chain_tip_hash()) == fork[6]["hash"]
+        assert _active_hashes(service, 22) == [h["hash"] for h in main[:16] + fork]
+        queries = service.storage.query()
+        assert not queries.get_live_header_by_hash(main[20]["hash"])[0].is_chain_tip
+        assert [queries.get_live_header_by_hash(h["hash"])[0].is_active for h in main[16:]] == [False] * 5
+
+    async def test_skips_known_and_orphan_headers(self) -> None:
+        service = ChaintracksCoreService(ChaintracksServiceConfig(chain="main", live_header_cache_size=2))
+        service.storage.make_available()
+        headers = decode_block_headers(mine_header_chain(12))
+        await service._add_live_headers(headers[:8])
+
+        added = await service._add_live_headers(headers[5:10] + headers[11:])
+
+        assert [h.height for h in added] == [8, 9]
+        assert (
+            added[0].previous_header_id
+            == service.storage.query().get_live_header_by_hash(headers[7]["hash"])[0].header_id
+        )
+        assert service.storage.query().count_live_headers() == (10, None)
+        assert (await service.find_chain_tip_hash()) == headers[9]["hash"]
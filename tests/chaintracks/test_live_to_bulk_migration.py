@@ -0,0 +1,84 @@
+"""Unit tests for migrating reorg-safe live headers into the bulk header store."""
+
+import logging
+
+from bsv_wallet_toolbox.services.chaintracker.chaintracks.core_service import (
+    ChaintracksCoreService,
+    ChaintracksServiceConfig,
+)
+from bsv_wallet_toolbox.services.chaintracker.chaintracks.models import LiveBlockHeader
+from bsv_wallet_toolbox.services.chaintracker.chaintracks.util import decode_block_headers
+from tests.testabilities.testservices import mine_header_chain
+
+
+async def _service_with_live_headers(
+    tmp_path, count: int, first_live_height: int = 0, **config
+) -> tuple[ChaintracksCoreService, list[dict]]:
+    service = ChaintracksCoreService(
+        ChaintracksServiceConfig(chain="main", bulk_headers_folder=str(tmp_path), **config)
+    )
+    service.storage.make_available()
+    headers = decode_block_headers(mine_header_chain(count))
+    for header in headers[first_live_height:]:
+        await service._add_live_header(header)
+    return service, headers
+
+
+class TestLiveToBulkMigration:
+    """Test the live table compaction done by the shift live headers worker."""
+
+    async def test_migrates_reorg_safe_headers_in_batches(self, tmp_path) -> None:
+        service, headers = await _service_with_live_headers(
+            tmp_path, 40, live_height_threshold=10, bulk_migration_chunk_size=7
+        )
+        queries = service.storage.query()
+        queries.begin()
+        queries.insert_new_live_header(
+            LiveBlockHeader({**headers[3], "hash": "ab" * 32}, chain_work="00" * 32, is_active=False)
+        )
+        queries.commit()
+
+        ranges = await service.get_available_height_ranges()
+        assert await service._migrate_live_to_bulk(ranges.live) == 30
+
+        ranges = await service.get_available_height_ranges()
+        assert (ranges.bulk.min_height, ranges.bulk.max_height) == (0, 29)
+        assert (ranges.live.min_height, ranges.live.max_height) == (30, 39)
+        assert service.storage.query().count_live_headers() == (10, None)
+        assert (await service.find_header_for_height(12))["hash"] == headers[12]["hash"]
+        assert (await service.find_header_for_height(35))["hash"] == headers[35]["hash"]
+        assert await service.find_header_for_height(40) is None
+
+    async def test_waits_for_a_full_batch(self, tmp_path) -> None:
+        service, _ = await _service_with_live_headers(
+            tmp_path, 20, live_height_threshold=10, bulk_migration_chunk_size=11
+        )
+
+        await service._shift_live_headers()
+
+        assert service.storage.query().count_live_headers() == (20, None)
+        assert service.bulk_mgr.get_height_range() is None
+        assert await service._migrate_live_to_bulk((await service.get_available_height_ranges()).live) == 0
+
+    async def test_waits_until_bulk_reaches_unaligned_live_start(self, tmp_path, caplog) -> None:
+        service, headers = await _service_with_live_headers(
+            tmp_path, 80, first_live_height=37, live_height_threshold=10, bulk_migration_chunk_size=7
+        )
+        live = (await service.get_available_height_ranges()).live
+
+        with caplog.at_level(logging.INFO):
+            assert await service._migrate_live_to_bulk(live) == 0
+            assert await service._migrate_live_to_bulk(live) == 0
+
+        assert [r.message for r in caplog.records if "waits for bulk" in r.message] == [
+            "Live to bulk migration waits for bulk headers 0..36: live headers start at 37"
+        ]
+        assert service.storage.query().count_live_headers() == (43, None)
+        assert service.bulk_mgr.get_height_range() is None
+
+        service.bulk_mgr.store.append(0, mine_header_chain(37))  # bulk sync caught up below the live headers
+
+        assert await service._migrate_live_to_bulk(live) == 33
+        ranges = await service.get_available_height_ranges()
+        assert (ranges.bulk.max_height, ranges.live.min_height) == (69, 70)
+        assert (await service.find_header_for_height(50))["hash"] == headers[50]["hash"]
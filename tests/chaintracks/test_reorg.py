@@ -0,0 +1,130 @@
+"""Unit tests for reorg detection and chain tip switching between live header branches."""
+
+from unittest.mock import MagicMock
+
+from bsv_wallet_toolbox.monitor.monitor import Monitor, MonitorOptions
+from bsv_wallet_toolbox.services.chaintracker.chaintracks.chain_work import ChainWork
+from bsv_wallet_toolbox.services.chaintracker.chaintracks.core_service import (
+    ChaintracksCoreService,
+    ChaintracksServiceConfig,
+)
+from bsv_wallet_toolbox.services.chaintracker.chaintracks.reorg import find_chain_tip_switch
+from bsv_wallet_toolbox.services.chaintracker.chaintracks.util import decode_block_headers
+from bsv_wallet_toolbox.services.chaintracker.chaintracks_storage import ChaintracksStorageMemory
+from tests.testabilities.testservices import mine_header_chain
+
+
+def _branches(main_length: int, fork_height: int, fork_length: int) -> tuple[list[dict], list[dict]]:
+    data = mine_header_chain(main_length)
+    fork = mine_header_chain(fork_length, data[fork_height * 80 : (fork_height + 1) * 80], spacing=601)
+    return decode_block_headers(data), decode_block_headers(fork, first_height=fork_height + 1)
+
+
+def _insert(storage: ChaintracksStorageMemory, headers: list[dict], chain_work: ChainWork):
+    switch = None
+    for header in headers:
+        chain_work = chain_work.add_chain_work(ChainWork.from_bits(header["bits"]))
+        switch = (
+            storage.insert_header(
+                header["height"],
+                header["hash"],
+                chain_work.to_64_pad_hex(),
+                version=header["version"],
+                merkle_root=header["merkleRoot"],
+                time=header["time"],
+                bits=header["bits"],
+                nonce=header["nonce"],
+                previous_hash=header["previousHash"],
+            )
+            or switch
+        )
+    return switch
+
+
+class _CountingQueries:
+    """Records the height windows the reorg engine reads."""
+
+    def __init__(self, queries) -> None:
+        self.queries = queries
+        self.windows: list[tuple[int, int]] = []
+
+    def __getattr__(self, name):
+        return getattr(self.queries, name)
+
+    def find_live_headers_for_height_range(self, min_height: int, max_height: int):
+        self.windows.append((min_height, max_height))
+        return self.queries.find_live_headers_for_height_range(min_height, max_height)
+
+
+class TestChaintracksStorageReorg:
+    """Test branch tracking in ChaintracksStorage.insert_header."""
+
+    def test_fork_overtaking_the_active_chain_switches_only_its_segment(self) -> None:
+        storage = ChaintracksStorageMemory(ChaintracksStorageMemory.create_memory_storage_options("main"))
+        storage.make_available()
+        main, fork = _branches(60, 40, 22)
+        assert _insert(storage, main, ChainWork(0)) is None
+        storage.update_sync_state(59, main[59]["hash"])
+        assert storage.get_sync_state()["reorgDetected"] is False
+
+        fork_work = ChainWork.from_hex(storage.query().get_live_header_by_hash(main[40]["hash"])[0].chain_work)
+        switch = _insert(storage, fork, fork_work)
+
+        assert (switch.depth, switch.fork_point.height) == (19, 40)
+        assert switch.old_tip.hash == main[59]["hash"] and switch.new_tip.hash == fork[19]["hash"]  # first to overtake
+        assert [h["hash"] for h in switch.deactivated_headers] == [h["hash"] for h in reversed(main[41:])]
+        assert storage.get_header_for_height(50)["hash"] == fork[9]["hash"]
+        assert storage.get_header_for_height(20)["hash"] == main[20]["hash"]
+        assert storage.find_headers_for_heights([45, 61])[45]["hash"] == fork[4]["hash"]
+        assert storage.query().get_active_tip_live_header()[0].hash == fork[-1]["hash"]
+        assert storage.get_sync_state() == {
+            "lastSyncedHeight": 59,
+            "lastSyncedHash": main[59]["hash"],
+            "reorgDetected": True,
+            "forkHeight": 40,
+        }
+
+    def test_deep_reorg_reads_only_the_heights_it_spans(self) -> None:
+        storage = ChaintracksStorageMemory(ChaintracksStorageMemory.create_memory_storage_options("main"))
+        storage.make_available()
+        main, fork = _branches(300, 230, 60)
+        _insert(storage, main, ChainWork(0))
+        fork_work = ChainWork.from_hex(storage.query().get_live_header_by_hash(main[230]["hash"])[0].chain_work)
+        assert _insert(storage, fork, fork_work) is None  # less work: stored as an inactive branch
+        queries = _CountingQueries(storage.query())
+        old_tip = queries.get_active_tip_live_header()[0]
+        new_tip = queries.get_live_header_by_hash(fork[-1]["hash"])[0]
+
+        switch = find_chain_tip_switch(queries, old_tip, new_tip)
+
+        assert old_tip.hash == main[-1]["hash"] and not new_tip.is_active
+        assert (switch.depth, len(switch.activated), switch.fork_point.hash) == (69, 60, main[230]["hash"])
+        assert min(low for low, _ in queries.windows) > 150
+
+
+class TestChaintracksServiceReorg:
+    """Test reorg events published by ChaintracksCoreService."""
+
+    async def test_reorg_listeners_and_monitor_receive_the_switch(self) -> None:
+        service = ChaintracksCoreService(ChaintracksServiceConfig(chain="main"))
+        service.storage.make_available()
+        monitor = Monitor(MonitorOptions("main", storage=MagicMock(), services=MagicMock()))
+        events: list[tuple] = []
+        service.subscribe_reorgs(lambda *event: events.append(event))
+        send, unsubscribe = service.subscribe_reorgs(monitor.process_reorg)
+        main, fork = _branches(21, 15, 7)
+        await service._add_live_headers(main)
+
+        await service._add_live_headers(fork)
+
+        [(depth, old_tip, new_tip, deactivated)] = events
+        assert (depth, old_tip["hash"], new_tip["hash"]) == (5, main[20]["hash"], fork[-1]["hash"])
+        assert [h["height"] for h in deactivated] == [20, 19, 18, 17, 16]
+        assert [d["header"]["hash"] for d in monitor.deactivated_headers] == [h["hash"] for h in deactivated]
+        monitor.services.invalidate_header_cache.assert_called_once_with(16)
+        assert (await service.find_header_for_height(18))["hash"] == fork[2]["hash"]
+        assert (await service.find_chain_tip_hash()) == fork[-1]["hash"]
+
+        unsubscribe()
+        send(1, new_tip, old_tip, [new_tip])
+        assert len(events) == 2 and len(monitor.deactivated_headers) == 5
@@ -4,6 +4,7 @@ These tests verify the logic of individual monitor tasks in isolation,
 mocking the Monitor dependency to focus on task behavior.
 """
 
+import json
 import time
 from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock, patch
@@ -295,7 +296,7 @@ class TestTaskCheckForProofs:
     def test_task_check_for_proofs_run_task(self) -> None:
         """Test TaskCheckForProofs run_task basic execution."""
         mock_monitor = MagicMock()
-        mock_monitor.storage.find_proven_tx_reqs.return_value = []
+        mock_monitor.storage.iter_proven_tx_reqs.return_value = iter([])
         mock_monitor.services.get_merkle_path_for_transaction = MagicMock()
 
         task = TaskCheckForProofs(mock_monitor)
@@ -303,7 +304,90 @@ class TestTaskCheckForProofs:
 
         # Should return empty string when no proven tx reqs
         assert result == ""
-        mock_monitor.storage.find_proven_tx_reqs.assert_called()
+        mock_monitor.storage.iter_proven_tx_reqs.assert_called_once_with(
+            {"status": ["callback", "unmined", "sending", "unknown", "unconfirmed"]}, batch_size=100
+        )
+
+    def test_task_check_for_proofs_run_task_batches(self) -> None:
+        """Test TaskCheckForProofs processes streamed reqs in batches, flushing attempts per batch."""
+        mock_monitor = MagicMock()
+        mock_monitor.last_new_header = {"height": 1000}
+        mock_monitor.storage.iter_proven_tx_reqs.return_value = iter(
+            [{"provenTxReqId": i, "txid": f"tx{i}"} for i in range(1, 251)]
+        )
+
+        task = TaskCheckForProofs(mock_monitor)
+        task.concurrency = 1  # serial path
+
+        def not_ready(req, _height, _log_lines):
+            task._increment_attempts(req["provenTxReqId"], 0)
+
+        with patch.object(task, "_process_req", side_effect=not_ready) as mock_process_req:
+            result = task.run_task()
+
+        assert mock_process_req.call_count == 250
+        assert "Processing 100 reqs (offset 0)..." in result
+        assert "Processing 50 reqs (offset 200)..." in result
+        assert mock_monitor.storage.update_many.call_count == 3
+        mock_monitor.storage.find_proven_tx_reqs.assert_not_called()
+
+    def test_task_check_for_proofs_pipelined(self) -> None:
+        """Test TaskCheckForProofs fetches concurrently, writes proofs in batches and logs metrics."""
+        mock_monitor = MagicMock()
+        mock_monitor.chain = "test"
+        mock_monitor.last_new_header = {"height": 1000}
+        mock_monitor.options.unproven_attempts_limit_test = 10
+        mock_monitor.options.proof_fetch_concurrency = 4
+        mock_monitor.options.proof_write_batch_size = 3
+        mock_monitor.options.msecs_wait_per_merkle_proof_service_req = 0
+        mock_monitor.storage.iter_proven_tx_reqs.return_value = iter(
+            [{"provenTxReqId": i, "txid": f"tx{i}"} for i in range(1, 11)]
+        )
+
+        def get_merkle_path(txid):
+            if txid == "tx10":
+                raise RuntimeError("service down")
+            if txid == "tx9":
+                return {}  # not mined yet
+            return {
+                "merklePath": {"blockHeight": 900},
+                "header": {"height": 900, "hash": "aa" * 32, "merkleRoot": "bb" * 32},
+            }
+
+        mock_monitor.services.get_merkle_path_for_transaction.side_effect = get_merkle_path
+        mock_monitor.storage.update_proven_tx_reqs_with_new_proven_txs.side_effect = lambda updates: [
+            {"provenTxReqId": u["provenTxReqId"], "status": "completed"} for u in updates
+        ]
+
+        task = TaskCheckForProofs(mock_monitor)
+        result = task.run_task()
+
+        assert task.concurrency == 4
+        written = [
+            u["txid"]
+            for call in mock_monitor.storage.update_proven_tx_reqs_with_new_proven_txs.call_args_list
+            for u in call.args[0]
+        ]
+        assert sorted(written) == sorted(f"tx{i}" for i in range(1, 9))
+        assert all(
+            len(call.args[0]) <= 3
+            for call in mock_monitor.storage.update_proven_tx_reqs_with_new_proven_txs.call_args_list
+        )
+        assert "Proven tx1 at height 900 (status: completed)" in result
+        assert "Error getting proof for tx10: service down" in result
+        assert mock_monitor.call_on_proven_transaction.call_count == 8
+        attempts = [u for call in mock_monitor.storage.update_many.call_args_list for u in call.args[1]]
+        assert sorted(attempts) == [(9, {"attempts": 1}), (10, {"attempts": 1})]
+
+        event, details = mock_monitor.log_event.call_args.args
+        metrics = json.loads(details)
+        assert event == "CheckForProofsMetrics"
+        assert metrics["reqs"] == 10
+        assert metrics["fetched"] == 9
+        assert metrics["fetchErrors"] == 1
+        assert metrics["proven"] == 8
+        assert metrics["writeBatches"] >= 3
+        assert metrics["concurrency"] == 4
 
 
 class TestTaskReviewStatus:
@@ -354,6 +438,23 @@ class TestTaskPurge:
 
         assert isinstance(result, str)
 
+    def test_task_purge_run_task_resumes_paused_purge(self) -> None:
+        """Test TaskPurge schedules another run when purge_data stopped at its time budget."""
+        mock_monitor = MagicMock()
+        mock_monitor.storage.purge_data.return_value = {
+            "count": 500,
+            "log": "500 failed transactions deleted",
+            "rowsPerSecond": 2500.0,
+            "cursor": {"phase": "failedTransactions", "after": 1200},
+        }
+
+        task = TaskPurge(mock_monitor, {"purgeFailed": True, "maxMsecs": 1000})
+        result = task.run_task()
+
+        assert "500 records updated or deleted (2500 rows/s)." in result
+        assert "Purge paused in failedTransactions after id 1200." in result
+        assert task.check_now is True
+
 
 class TestTaskFailAbandoned:
     """Test TaskFailAbandoned functionality."""
@@ -1018,22 +1119,25 @@ class TestTaskCheckNoSends:
     def test_task_check_no_sends_run_task_no_reqs(self) -> None:
         """Test TaskCheckNoSends run_task when no nosend reqs exist."""
         mock_monitor = MagicMock()
-        mock_monitor.storage.find_proven_tx_reqs.return_value = []
+        mock_monitor.storage.iter_proven_tx_reqs.return_value = iter([])
 
         task = TaskCheckNoSends(mock_monitor)
         result = task.run_task()
 
         # Should return empty string when no reqs
         assert result == ""
-        mock_monitor.storage.find_proven_tx_reqs.assert_called_with({"status": ["nosend"]})
+        mock_monitor.storage.iter_proven_tx_reqs.assert_called_with({"status": ["nosend"]}, batch_size=100)
 
     def test_task_check_no_sends_run_task_with_reqs(self) -> None:
         """Test TaskCheckNoSends run_task when nosend reqs exist."""
         mock_monitor = MagicMock()
         mock_monitor.services.find_chain_tip_header.return_value = {"height": 1000}
-        mock_monitor.storage.find_proven_tx_reqs.return_value = [{"id": 1, "txid": "tx1"}, {"id": 2, "txid": "tx2"}]
+        mock_monitor.storage.iter_proven_tx_reqs.return_value = iter(
+            [{"id": 1, "txid": "tx1"}, {"id": 2, "txid": "tx2"}]
+        )
 
         task = TaskCheckNoSends(mock_monitor)
+        task.concurrency = 1  # serial path
 
         # Mock the inherited _process_req method
         with patch.object(task, "_process_req") as mock_process_req:
@@ -1041,7 +1145,7 @@ class TestTaskCheckNoSends:
 
             # Should process the reqs
             assert mock_process_req.call_count == 2
-            assert "Processing 2 nosend reqs..." in result
+            assert "Processing 2 reqs (offset 0)..." in result
 
     def test_task_check_no_sends_run_task_chain_tip_error(self) -> None:
         """Test TaskCheckNoSends run_task when chain tip retrieval fails."""
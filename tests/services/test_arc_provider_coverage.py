@@ -44,7 +44,7 @@ class TestArcProviderMethods:
         except TypeError:
             pytest.skip("Cannot initialize ARC")
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_post_beef_success(self, mock_post, mock_arc_provider) -> None:
         """Test posting BEEF to Arc."""
         mock_response = Mock()
@@ -58,7 +58,7 @@ class TestArcProviderMethods:
         except (AttributeError, Exception):
             pass
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_post_beef_error(self, mock_post, mock_arc_provider) -> None:
         """Test posting BEEF with error response."""
         mock_response = Mock()
@@ -74,7 +74,7 @@ class TestArcProviderMethods:
             # Expected for error cases
             pass
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_transaction_status(self, mock_get, mock_arc_provider) -> None:
         """Test getting transaction status from Arc."""
         mock_response = Mock()
@@ -98,7 +98,7 @@ class TestArcProviderErrorHandling:
         try:
             provider = ARC(url="https://invalid.example.com")
 
-            with patch("requests.post", side_effect=Exception("Network error")):
+            with patch("requests.Session.post", side_effect=Exception("Network error")):
                 try:
                     provider.post_beef(b"beef_data", ["txid1"])
                 except Exception:
@@ -112,7 +112,7 @@ class TestArcProviderErrorHandling:
         try:
             provider = ARC(url="https://slow.example.com")
 
-            with patch("requests.post", side_effect=TimeoutError("Request timeout")):
+            with patch("requests.Session.post", side_effect=TimeoutError("Request timeout")):
                 try:
                     provider.post_beef(b"beef_data", ["txid1"])
                 except (TimeoutError, Exception):
@@ -483,6 +483,7 @@ class TestArcServices:
             Mock(status="success", txid="tx3"),  # Third call succeeds
         ]
         services.arc_taal.post_raw_tx = Mock(side_effect=mock_results)
+        services.post_beef_batch_size = 0  # post each element with post_beef
 
         # Use valid BEEF data (not the mock strings)
         mixed_input = [valid_beef_data, valid_beef_data, valid_beef_data]
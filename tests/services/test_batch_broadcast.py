@@ -0,0 +1,171 @@
+"""Tests for batched, dependency-ordered post_beef_array broadcasting.
+
+The ARC provider talks HTTP to tests.testabilities.testservices.LocalARCServer,
+which rejects children that arrive before their parents.
+"""
+
+import pytest
+from bsv.script import Script
+from bsv.transaction import Transaction
+from bsv.transaction_input import TransactionInput
+from bsv.transaction_output import TransactionOutput
+
+from bsv_wallet_toolbox.services import Services
+from bsv_wallet_toolbox.services.batch_broadcast import dependency_levels
+from tests.testabilities.testservices import LocalARCServer
+
+MINED_TXID = "aa" * 32
+
+
+def _tx(parent_txid: str, tag: int) -> Transaction:
+    return Transaction(
+        [TransactionInput(source_txid=parent_txid, source_output_index=0, unlocking_script=Script("51"))],
+        [TransactionOutput(Script(f"76a914{tag:040x}88ac"), 1000)],
+    )
+
+
+def _chains(count: int, depth: int) -> list[Transaction]:
+    """``count`` chains of ``depth`` transactions, each spending the previous one."""
+    txs = []
+    for chain in range(count):
+        parent = MINED_TXID
+        for level in range(depth):
+            tx = _tx(parent, chain * depth + level)
+            txs.append(tx)
+            parent = tx.txid()
+    return txs
+
+
+@pytest.fixture
+def arc_server():
+    with LocalARCServer(check_parents=True).mark_mined(MINED_TXID) as server:
+        yield server
+
+
+def _services(arc_server: LocalARCServer, **options) -> Services:
+    opts = Services.create_default_options("test")
+    opts["arcUrl"] = arc_server.url
+    opts["arcGorillaPoolUrl"] = None
+    opts.update(options)
+    services = Services(opts)
+    services.bitails = None
+    return services
+
+
+def test_dependency_levels_put_parents_first() -> None:
+    txs = _chains(2, 3)
+    by_txid = {tx.txid(): tx for tx in reversed(txs)}  # children listed before parents
+
+    levels = dependency_levels(by_txid)
+
+    assert [len(level) for level in levels] == [2, 2, 2]
+    assert set(levels[0]) == {txs[0].txid(), txs[3].txid()}
+    assert set(levels[2]) == {txs[2].txid(), txs[5].txid()}
+
+
+def test_dependency_levels_deep_chain_in_reverse_order() -> None:
+    txs = _chains(1, 5000)
+    by_txid = {tx.txid(): tx for tx in reversed(txs)}  # deeper than the recursion limit, children first
+
+    levels = dependency_levels(by_txid)
+
+    assert levels == [[tx.txid()] for tx in txs]
+
+
+def test_post_beef_array_batches_in_dependency_order(arc_server) -> None:
+    txs = _chains(60, 2)
+    beefs = [tx.hex() for tx in reversed(txs)]  # every child before its parent
+    services = _services(arc_server, postBeefBatchSize=25, postBeefConcurrency=3)
+
+    results = services.post_beef_array(beefs)
+
+    assert all(r["accepted"] for r in results), results
+    assert [r["txid"] for r in results] == [tx.txid() for tx in reversed(txs)]
+    # 60 parents then 60 children, 25 per request; no per-transaction requests
+    counts = [count for _path, count in arc_server.requests]
+    assert sorted(counts[:3]) == sorted(counts[3:]) == [10, 25, 25]
+    assert {path for path, _count in arc_server.requests} == {"/v1/txs"}
+    assert set(arc_server.accepted) == {tx.txid() for tx in txs}
+
+
+def test_post_beef_array_submits_requests_of_a_level_concurrently() -> None:
+    with LocalARCServer(latency_msecs=50) as server:
+        services = _services(server, postBeefBatchSize=10, postBeefConcurrency=4)
+
+        results = services.post_beef_array([tx.hex() for tx in _chains(80, 1)])
+
+    assert all(r["accepted"] for r in results)
+    assert len(server.requests) == 8
+    assert server.max_in_flight > 1
+
+
+def test_post_beef_array_skips_children_of_rejected_parents(arc_server) -> None:
+    parent, child = _chains(1, 2)
+    other = _tx(MINED_TXID, 99)
+    arc_server.reject(parent.txid(), 465, "fee too low")
+    services = _services(arc_server)
+
+    results = services.post_beef_array([child.hex(), parent.hex(), other.hex(), "00"])
+
+    assert results[1] == {"accepted": False, "txid": parent.txid(), "message": "ARC: HTTP 465 - fee too low"}
+    assert results[0]["accepted"] is False
+    assert f"parent transaction {parent.txid()} was not accepted" in results[0]["message"]
+    assert results[2]["accepted"] is True
+    assert results[3]["accepted"] is False and results[3]["txid"] is None
+    assert arc_server.accepted == [other.txid()]
+
+
+def test_post_beef_array_falls_back_to_post_beef_when_batch_request_fails(arc_server) -> None:
+    txs = _chains(1, 2)
+    arc_server.fail_requests(503)
+    services = _services(arc_server)
+
+    results = services.post_beef_array([tx.hex() for tx in reversed(txs)])
+
+    assert [r["accepted"] for r in results] == [False, False]
+    # One batch request, then the failover path per transaction, parent first
+    assert [path for path, _count in arc_server.requests] == ["/v1/txs", "/v1/tx", "/v1/tx"]
+
+
+def test_post_beef_array_batch_size_zero_posts_one_by_one(arc_server) -> None:
+    services = _services(arc_server, postBeefBatchSize=0)
+
+    results = services.post_beef_array([tx.hex() for tx in _chains(3, 1)])
+
+    assert all(r["accepted"] for r in results)
+    assert [path for path, _count in arc_server.requests] == ["/v1/tx"] * 3
+
+
+def test_send_waiting_transactions_broadcasts_in_one_batch(arc_server) -> None:
+    from bsv_wallet_toolbox.storage.db import create_engine_from_url
+    from bsv_wallet_toolbox.storage.models import Base
+    from bsv_wallet_toolbox.storage.provider import StorageProvider
+
+    engine = create_engine_from_url("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    storage = StorageProvider(engine=engine, chain="test", storage_identity_key="K" * 64)
+    storage.make_available()
+    storage.set_services(_services(arc_server))
+    user_id = storage.insert_user({"identityKey": "02" + "b" * 64, "activeStorage": "test"})
+    txs = _chains(2, 2)
+    arc_server.reject(txs[3].txid())
+    for i, tx in enumerate(reversed(txs)):
+        storage.insert_transaction(
+            {
+                "userId": user_id,
+                "reference": f"waiting-{i}",
+                "txid": tx.txid(),
+                "rawTx": bytes.fromhex(tx.hex()),
+                "status": "waiting",
+                "satoshis": 0,
+            }
+        )
+
+    result = storage.send_waiting_transactions()
+
+    assert result["sent"] == 3
+    assert result["failed"] == 1
+    assert result["errors"] == [f"Failed to broadcast {txs[3].txid()}: ARC: HTTP 465 - rejected"]
+    assert [count for _path, count in arc_server.requests] == [2, 2]  # parents, then children
+    sent = {row["txid"] for row in storage.find_transactions({"partial": {"status": "sent"}})}
+    assert sent == {tx.txid() for tx in txs[:3]}
@@ -0,0 +1,242 @@
+"""Tests for the batched Services lookups and the WhatsOnChain bulk endpoints."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from bsv.http_client import HttpResponse
+from bsv.script import Script
+from bsv.transaction import Transaction
+from bsv.transaction_output import TransactionOutput
+
+from bsv_wallet_toolbox.errors import InvalidParameterError
+from bsv_wallet_toolbox.services import ServiceCollection, Services
+from bsv_wallet_toolbox.services.providers.whatsonchain import WhatsOnChain
+
+
+def _tx(tag: int) -> Transaction:
+    return Transaction(tx_outputs=[TransactionOutput(Script(f"76a914{tag:040x}88ac"), 1)])
+
+
+def _services(**collections) -> Services:
+    services = Services("test")
+    for attr, providers in collections.items():
+        collection = ServiceCollection(attr)
+        for name, provider in providers:
+            collection.add({"name": name, "service": provider})
+        setattr(services, attr, collection)
+    return services
+
+
+def _woc(payload, status: int = 200) -> WhatsOnChain:
+    client = Mock()
+    client.fetch = AsyncMock(return_value=HttpResponse(ok=200 <= status < 300, status_code=status, json_data=payload))
+    return WhatsOnChain(network="main", http_client=client)
+
+
+class TestGetRawTxs:
+    """Test Services.get_raw_txs."""
+
+    def test_chunks_to_bulk_requests(self) -> None:
+        txs = {tx.txid(): tx for tx in (_tx(i) for i in range(45))}
+        chunks = []
+
+        async def bulk(txids):
+            chunks.append(len(txids))
+            return {txid: txs[txid].hex() for txid in txids}
+
+        async def single(txid):
+            raise AssertionError("per-item lookup not expected")
+
+        services = _services(get_raw_txs_services=[("bulk", bulk)], get_raw_tx_services=[("single", single)])
+
+        result = services.get_raw_txs(list(txs))
+
+        assert result == {txid: tx.hex() for txid, tx in txs.items()}
+        assert sorted(chunks) == [5, 20, 20]
+        assert services.get_raw_tx(next(iter(txs))) == next(iter(txs.values())).hex()  # cached
+
+    def test_falls_back_per_item(self) -> None:
+        good, mismatched, left_out, unknown = _tx(1), _tx(2), _tx(3), _tx(4)
+        single_calls = []
+
+        async def bulk(txids):
+            return {good.txid(): good.hex(), mismatched.txid(): _tx(99).hex(), unknown.txid(): None}
+
+        async def single(txid):
+            single_calls.append(txid)
+            return {mismatched.txid(): mismatched.hex(), left_out.txid(): left_out.hex()}[txid]
+
+        services = _services(get_raw_txs_services=[("bulk", bulk)], get_raw_tx_services=[("single", single)])
+        txids = [good.txid(), mismatched.txid(), left_out.txid(), unknown.txid()]
+
+        result = services.get_raw_txs(txids)
+
+        assert result == {
+            good.txid(): good.hex(),
+            mismatched.txid(): mismatched.hex(),
+            left_out.txid(): left_out.hex(),
+            unknown.txid(): None,
+        }
+        assert sorted(single_calls) == sorted([mismatched.txid(), left_out.txid()])
+
+    def test_failed_bulk_provider_fails_over(self) -> None:
+        tx = _tx(5)
+
+        async def down(txids):
+            raise ConnectionError("down")
+
+        def up(txids):
+            return {tx.txid(): tx.hex()}
+
+        services = _services(get_raw_txs_services=[("down", down), ("up", up)])
+
+        assert services.get_raw_txs([tx.txid()]) == {tx.txid(): tx.hex()}
+        history = services.get_services_call_history()["getRawTxs"].history_by_provider
+        assert history["down"].calls[0].success is False
+        assert history["up"].calls[0].success is True
+
+    def test_failed_chunk_falls_back_per_item(self) -> None:
+        txs = [_tx(i) for i in range(3)]
+
+        async def down(txids):
+            raise ConnectionError("down")
+
+        async def single(txid):
+            return next(tx.hex() for tx in txs if tx.txid() == txid)
+
+        services = _services(get_raw_txs_services=[("down", down)], get_raw_tx_services=[("single", single)])
+
+        assert services.get_raw_txs([tx.txid() for tx in txs]) == {tx.txid(): tx.hex() for tx in txs}
+
+    def test_invalid_txid_raises(self) -> None:
+        with pytest.raises(InvalidParameterError):
+            Services("test").get_raw_txs(["00"])
+
+
+class TestGetTransactionStatuses:
+    """Test Services.get_transaction_statuses."""
+
+    async def test_statuses_are_cached(self) -> None:
+        txids = [_tx(i).txid() for i in range(3)]
+        calls = []
+
+        async def bulk(chunk):
+            calls.append(chunk)
+            return {txid: {"name": "bulk", "status": "confirmed", "txid": txid} for txid in chunk}
+
+        services = _services(get_transaction_statuses_services=[("bulk", bulk)])
+
+        result = await services.get_transaction_statuses_async(txids + txids[:1])
+
+        assert list(result) == txids
+        assert all(r["status"] == "confirmed" for r in result.values())
+        assert len(calls) == 1 and calls[0] == txids
+        assert services.get_transaction_status(txids[0])["name"] == "bulk"
+        assert await services.get_transaction_statuses_async(txids) == result
+        assert len(calls) == 1
+
+
+class TestGetUtxoStatuses:
+    """Test Services.get_utxo_statuses and is_utxos."""
+
+    def test_is_utxos_checks_outpoints_with_one_bulk_lookup(self) -> None:
+        services = Services("test")
+        scripts = [f"76a914{i:040x}88ac" for i in range(3)]
+        hashes = [services.hash_output_script(script) for script in scripts]
+        calls = []
+
+        async def bulk(script_hashes, output_format):
+            calls.append((script_hashes, output_format))
+            return {
+                hashes[0]: {"status": "success", "isUtxo": True, "details": [{"outpoint": "aa.0", "spent": False}]},
+                hashes[1]: {"status": "success", "isUtxo": False, "details": []},
+                hashes[2]: {"status": "success", "isUtxo": True, "details": [{"outpoint": "cc.0", "spent": False}]},
+            }
+
+        services.get_utxo_statuses_services = ServiceCollection("getUtxoStatuses").add({"name": "b", "service": bulk})
+        outputs = [
+            {"txid": "aa", "vout": 0, "lockingScript": scripts[0]},
+            {"txid": "bb", "vout": 0, "lockingScript": scripts[1]},
+            {"txid": "cc", "vout": 1, "lockingScript": scripts[2]},
+            {"txid": "dd", "vout": 0, "lockingScript": ""},
+        ]
+
+        assert services.is_utxos(outputs) == [True, False, False, False]
+        assert calls == [(hashes, "hashLE")]
+
+    def test_invalid_output_format_raises(self) -> None:
+        with pytest.raises(InvalidParameterError):
+            Services("test").get_utxo_statuses(["ab" * 32], "script")
+
+
+class TestWhatsOnChainBulkEndpoints:
+    """Test the WhatsOnChain bulk provider methods."""
+
+    async def test_get_raw_txs(self) -> None:
+        tx = _tx(1)
+        missing, failed = "11" * 32, "22" * 32
+        woc = _woc(
+            {
+                "data": [
+                    {"txid": tx.txid(), "hex": tx.hex(), "error": ""},
+                    {"txid": missing, "hex": "", "error": "unknown"},
+                    {"txid": failed, "hex": "", "error": "internal"},
+                ]
+            }
+        )
+
+        result = await woc.get_raw_txs([tx.txid(), missing, failed])
+
+        assert result == {tx.txid(): tx.hex(), missing: None}
+        url, options = woc.http_client.fetch.call_args[0]
+        assert url == "https://api.whatsonchain.com/v1/bsv/main/txs/hex"
+        assert options["method"] == "POST" and options["data"] == {"txids": [tx.txid(), missing, failed]}
+
+    async def test_get_transaction_statuses(self) -> None:
+        mined, pending, unknown = "aa" * 32, "bb" * 32, "cc" * 32
+        woc = _woc(
+            {
+                "data": [
+                    {"txid": mined, "blockhash": "00" * 32, "blockheight": 100, "confirmations": 6},
+                    {"txid": pending, "confirmations": 0},
+                    {"txid": unknown, "error": "unknown"},
+                ]
+            }
+        )
+
+        result = await woc.get_transaction_statuses([mined, pending, unknown])
+
+        assert result[mined]["status"] == "confirmed" and result[mined]["blockHeight"] == 100
+        assert result[pending]["status"] == "unconfirmed"
+        assert result[unknown]["status"] == "not_found"
+
+    async def test_get_utxo_statuses_uses_big_endian_hashes(self) -> None:
+        hash_le = bytes(range(32)).hex()
+        hash_be = bytes(range(32))[::-1].hex()
+        woc = _woc(
+            {
+                "data": [
+                    {
+                        "script": hash_be,
+                        "result": [{"tx_hash": "aa" * 32, "tx_pos": 1, "value": 500, "height": 10}],
+                        "error": "",
+                    }
+                ]
+            }
+        )
+
+        result = await woc.get_utxo_statuses([hash_le])
+
+        assert woc.http_client.fetch.call_args[0][1]["data"] == {"scripts": [hash_be]}
+        assert result[hash_le]["isUtxo"] is True
+        assert result[hash_le]["details"][0]["outpoint"] == f"{'aa' * 32}.1"
+
+    async def test_failed_request_raises(self) -> None:
+        woc = _woc({"data": "rate limited"}, status=429)
+
+        with pytest.raises(RuntimeError):
+            await woc.get_raw_txs(["aa" * 32])
+
+    async def test_too_many_items_raise(self) -> None:
+        with pytest.raises(ValueError):
+            await _woc({"data": []}).get_transaction_statuses(["aa" * 32] * 21)
@@ -44,7 +44,7 @@ class TestBitailsProviderMethods:
         except TypeError:
             pytest.skip("Cannot initialize Bitails")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_script_history(self, mock_get, mock_provider) -> None:
         """Test getting script history."""
         mock_response = Mock()
@@ -59,7 +59,7 @@ class TestBitailsProviderMethods:
         except AttributeError:
             pass
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_utxo_status(self, mock_get, mock_provider) -> None:
         """Test getting UTXO status."""
         mock_response = Mock()
@@ -74,7 +74,7 @@ class TestBitailsProviderMethods:
         except AttributeError:
             pass
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_post_beef(self, mock_post, mock_provider) -> None:
         """Test posting BEEF to Bitails."""
         mock_response = Mock()
@@ -98,7 +98,7 @@ class TestBitailsErrorHandling:
         try:
             provider = Bitails(chain="main")
 
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.get") as mock_get:
                 mock_response = Mock()
                 mock_response.status_code = 500
                 mock_response.json.side_effect = ValueError("Invalid JSON")
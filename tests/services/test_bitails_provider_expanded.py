@@ -108,7 +108,7 @@ class TestBitailsPostBeef:
         mock_response.status_code = 200
         mock_response.json.return_value = {"success": True, "txids": ["txid1", "txid2"]}
 
-        with patch("requests.post", return_value=mock_response) as mock_post:
+        with patch("requests.Session.post", return_value=mock_response) as mock_post:
             result = bitails.post_beef(mock_beef, txids)
 
             assert isinstance(result, PostBeefResult)
@@ -131,7 +131,7 @@ class TestBitailsPostBeef:
         mock_response.text = "Bad Request"
         mock_response.raise_for_status.side_effect = requests.HTTPError("400 Bad Request")
 
-        with patch("requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             result = bitails.post_beef(mock_beef, txids)
 
             assert isinstance(result, PostBeefResult)
@@ -143,7 +143,7 @@ class TestBitailsPostBeef:
         mock_beef = {"format": "BEEF"}
         txids = ["txid1"]
 
-        with patch("requests.post", side_effect=requests.ConnectionError("Network error")):
+        with patch("requests.Session.post", side_effect=requests.ConnectionError("Network error")):
             result = bitails.post_beef(mock_beef, txids)
 
             assert isinstance(result, PostBeefResult)
@@ -155,7 +155,7 @@ class TestBitailsPostBeef:
         mock_beef = {"format": "BEEF"}
         txids = ["txid1"]
 
-        with patch("requests.post", side_effect=requests.Timeout("Request timeout")):
+        with patch("requests.Session.post", side_effect=requests.Timeout("Request timeout")):
             result = bitails.post_beef(mock_beef, txids)
 
             assert isinstance(result, PostBeefResult)
@@ -171,7 +171,7 @@ class TestBitailsPostBeef:
         mock_response.status_code = 200
         mock_response.json.side_effect = ValueError("Invalid JSON")
 
-        with patch("requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             result = bitails.post_beef(mock_beef, txids)
 
             assert isinstance(result, PostBeefResult)
@@ -187,7 +187,7 @@ class TestBitailsPostBeef:
         mock_response.status_code = 200
         mock_response.json.return_value = {"success": True, "txids": []}
 
-        with patch("requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             result = bitails.post_beef(mock_beef, txids)
 
             assert isinstance(result, PostBeefResult)
@@ -212,7 +212,7 @@ class TestBitailsPostRaws:
         mock_response.status_code = 200
         mock_response.json.return_value = [{"txid": "txid1", "success": True}, {"txid": "txid2", "success": True}]
 
-        with patch("requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             results = bitails.post_raws(raws, txids)
 
             assert len(results) == 2
@@ -233,7 +233,7 @@ class TestBitailsPostRaws:
             {"error": "Invalid transaction", "success": False},
         ]
 
-        with patch("requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             results = bitails.post_raws(raws, txids)
 
             assert len(results) == 2
@@ -249,7 +249,7 @@ class TestBitailsPostRaws:
         mock_response.status_code = 200
         mock_response.json.return_value = [{"txid": "inferred_txid", "success": True}]
 
-        with patch("requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             results = bitails.post_raws(raws)
 
             assert len(results) == 1
@@ -265,7 +265,7 @@ class TestBitailsPostRaws:
         mock_response.status_code = 200
         mock_response.json.return_value = [{"success": True}]
 
-        with patch("requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             results = bitails.post_raws(raws, txids)
 
             # Should still work but txids might not match up properly
@@ -280,7 +280,7 @@ class TestBitailsPostRaws:
         mock_response.status_code = 200
         mock_response.json.return_value = []
 
-        with patch("requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             results = bitails.post_raws(raws, txids)
 
             assert len(results) == 0
@@ -295,7 +295,7 @@ class TestBitailsPostRaws:
         mock_response.text = "Internal Server Error"
         mock_response.raise_for_status.side_effect = requests.HTTPError("500 Internal Server Error")
 
-        with patch("requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             results = bitails.post_raws(raws, txids)
 
             assert len(results) == 1
@@ -307,7 +307,7 @@ class TestBitailsPostRaws:
         raws = ["deadbeef"]
         txids = ["txid1"]
 
-        with patch("requests.post", side_effect=requests.ConnectionError("Network down")):
+        with patch("requests.Session.post", side_effect=requests.ConnectionError("Network down")):
             results = bitails.post_raws(raws, txids)
 
             assert len(results) == 1
@@ -332,7 +332,7 @@ class TestBitailsGetMerklePath:
         mock_response.status_code = 200
         mock_response.json.return_value = {"merklePath": {"some": "path_data"}, "header": {"hash": "block_hash"}}
 
-        with patch("requests.get", return_value=mock_response):
+        with patch("requests.Session.get", return_value=mock_response):
             result = bitails.get_merkle_path(txid, mock_services)
 
             assert isinstance(result, GetMerklePathResult)
@@ -349,7 +349,7 @@ class TestBitailsGetMerklePath:
         mock_response.status_code = 404
         mock_response.text = "Transaction not found"
 
-        with patch("requests.get", return_value=mock_response):
+        with patch("requests.Session.get", return_value=mock_response):
             result = bitails.get_merkle_path(txid, mock_services)
 
             assert isinstance(result, GetMerklePathResult)
@@ -362,7 +362,7 @@ class TestBitailsGetMerklePath:
         txid = "test_txid"
         mock_services = Mock()
 
-        with patch("requests.get", side_effect=requests.HTTPError("403 Forbidden")):
+        with patch("requests.Session.get", side_effect=requests.HTTPError("403 Forbidden")):
             result = bitails.get_merkle_path(txid, mock_services)
 
             assert isinstance(result, GetMerklePathResult)
@@ -374,7 +374,7 @@ class TestBitailsGetMerklePath:
         txid = "test_txid"
         mock_services = Mock()
 
-        with patch("requests.get", side_effect=requests.ConnectionError("Network timeout")):
+        with patch("requests.Session.get", side_effect=requests.ConnectionError("Network timeout")):
             result = bitails.get_merkle_path(txid, mock_services)
 
             assert isinstance(result, GetMerklePathResult)
@@ -390,7 +390,7 @@ class TestBitailsGetMerklePath:
         mock_response.status_code = 200
         mock_response.json.side_effect = ValueError("Invalid JSON")
 
-        with patch("requests.get", return_value=mock_response):
+        with patch("requests.Session.get", return_value=mock_response):
             result = bitails.get_merkle_path(txid, mock_services)
 
             assert isinstance(result, GetMerklePathResult)
@@ -414,7 +414,7 @@ class TestBitailsGetTransactionStatus:
         mock_response.status_code = 200
         mock_response.json.return_value = {"txid": "test_txid", "confirmations": 6, "blockHeight": 800000}
 
-        with patch("requests.get", return_value=mock_response):
+        with patch("requests.Session.get", return_value=mock_response):
             result = bitails.get_transaction_status(txid)
 
             assert isinstance(result, dict)
@@ -430,7 +430,7 @@ class TestBitailsGetTransactionStatus:
         mock_response.status_code = 404
         mock_response.json.return_value = {"error": "Transaction not found"}
 
-        with patch("requests.get", return_value=mock_response):
+        with patch("requests.Session.get", return_value=mock_response):
             result = bitails.get_transaction_status(txid)
 
             assert isinstance(result, dict)
@@ -441,7 +441,7 @@ class TestBitailsGetTransactionStatus:
         """Test get_transaction_status with HTTP error."""
         txid = "test_txid"
 
-        with patch("requests.get", side_effect=requests.HTTPError("500 Internal Server Error")):
+        with patch("requests.Session.get", side_effect=requests.HTTPError("500 Internal Server Error")):
             result = bitails.get_transaction_status(txid)
 
             assert isinstance(result, dict)
@@ -452,7 +452,7 @@ class TestBitailsGetTransactionStatus:
         """Test get_transaction_status with connection error."""
         txid = "test_txid"
 
-        with patch("requests.get", side_effect=requests.ConnectionError("Network error")):
+        with patch("requests.Session.get", side_effect=requests.ConnectionError("Network error")):
             result = bitails.get_transaction_status(txid)
 
             assert isinstance(result, dict)
@@ -467,7 +467,7 @@ class TestBitailsGetTransactionStatus:
         mock_response.status_code = 200
         mock_response.json.side_effect = ValueError("Invalid JSON")
 
-        with patch("requests.get", return_value=mock_response):
+        with patch("requests.Session.get", return_value=mock_response):
             result = bitails.get_transaction_status(txid)
 
             assert isinstance(result, dict)
@@ -482,7 +482,7 @@ class TestBitailsGetTransactionStatus:
         mock_response.status_code = 200
         mock_response.json.return_value = {"confirmations": 0}
 
-        with patch("requests.get", return_value=mock_response) as mock_get:
+        with patch("requests.Session.get", return_value=mock_response) as mock_get:
             result = bitails.get_transaction_status(txid, use_next=True)
 
             assert isinstance(result, dict)
@@ -4,11 +4,17 @@ This module tests the TTL-based caching functionality to ensure full coverage
 of cache operations including expiration, clearing, and edge cases.
 """
 
+import threading
 import time
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 import pytest
+from bsv.script import Script
+from bsv.transaction import Transaction
+from bsv.transaction_output import TransactionOutput
 
+from bsv_wallet_toolbox.services import ServiceCollection, Services
 from bsv_wallet_toolbox.services.cache_manager import CacheEntry, CacheManager
 
 
@@ -253,3 +259,108 @@ class TestCacheManager:
 
         # With 0 TTL, it should expire immediately
         assert result is None
+
+
+class TestCacheBounds:
+    """Test LRU/size bounds, sweeping and counters."""
+
+    def test_evicts_least_recently_used_entry(self) -> None:
+        cache: CacheManager[str] = CacheManager(max_entries=2)
+        cache.set("a", "1", 5000)
+        cache.set("b", "2", 5000)
+        assert cache.get("a") == "1"  # "b" is now least recently used
+
+        cache.set("c", "3", 5000)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+        assert cache.stats()["evictions"] == 1
+
+    def test_max_bytes_bound(self) -> None:
+        cache: CacheManager[str] = CacheManager(max_bytes=100, sizeof=len)
+        cache.set("a", "x" * 60, 5000)
+        cache.set("b", "y" * 30, 5000)
+        cache.set("c", "z" * 30, 5000)
+
+        assert cache.get("a") is None
+        assert cache.stats()["bytes"] == 60
+        cache.set("huge", "w" * 101, 5000)
+        assert cache.get("huge") is None
+        assert len(cache) == 2
+
+    def test_sweep_removes_expired_entries_that_are_never_read(self) -> None:
+        cache: CacheManager[str] = CacheManager(sweep_interval_msecs=0)
+        for i in range(50):
+            cache.set(f"k{i}", "v", 1)
+        time.sleep(0.005)
+
+        cache.set("fresh", "v", 5000)
+
+        assert len(cache) == 1
+        assert cache.stats()["expirations"] == 50
+
+    def test_counters(self) -> None:
+        cache: CacheManager[str] = CacheManager()
+        cache.set("a", "1", 5000)
+        cache.get("a")
+        cache.get("a")
+        cache.get("missing")
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 1, 1)
+
+    def test_concurrent_access_keeps_bound(self) -> None:
+        cache: CacheManager[int] = CacheManager(max_entries=100)
+
+        def worker(offset: int) -> None:
+            for i in range(1000):
+                cache.set(f"k{offset}x{i}", i, 5000)
+                cache.get(f"k{offset}x{i // 2}")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(cache) == 100
+        assert cache.stats()["evictions"] == 8 * 1000 - 100
+
+
+class TestServicesCaches:
+    """Test Services lookups served from the bounded caches."""
+
+    def test_raw_tx_is_cached_after_first_valid_response(self) -> None:
+        tx = Transaction(tx_outputs=[TransactionOutput(Script(b"\x51"), 1)])
+        calls = []
+
+        def provider(txid: str) -> str:
+            calls.append(txid)
+            return tx.hex()
+
+        with patch("bsv_wallet_toolbox.services.services.Services._get_http_client"):
+            services = Services({"chain": "test", "cacheTtlMsecs": {"rawTx": 60_000}})
+        services.get_raw_tx_services = ServiceCollection("getRawTx").add({"name": "fake", "service": provider})
+
+        assert services.get_raw_tx(tx.txid()) == tx.hex()
+        assert services.get_raw_tx(tx.txid()) == tx.hex()
+
+        assert len(calls) == 1
+        assert services.get_cache_stats()["rawTx"]["hits"] == 1
+        assert services.cache_ttl_msecs["rawTx"] == 60_000
+        assert services.cache_ttl_msecs["merklePath"] == 120_000
+
+    def test_invalidate_header_cache_drops_heights_above_the_fork(self) -> None:
+        with patch("bsv_wallet_toolbox.services.services.Services._get_http_client"):
+            services = Services({"chain": "test"})
+        for height in (99, 100, 101):
+            services.header_cache.set(f"headerHeight:{height}", {"height": height}, 60_000)
+            services.header_cache.set(f"headerBytes:{height}", b"\x00" * 80, 60_000)
+        services.header_cache.set("headerHash:00ff", {"height": 101}, 60_000)
+
+        assert services.invalidate_header_cache(100) == 4
+
+        assert services.header_cache.has("headerHeight:99") and services.header_cache.has("headerBytes:99")
+        assert not services.header_cache.has("headerHeight:100") and not services.header_cache.has("headerBytes:101")
+        assert services.header_cache.has("headerHash:00ff")
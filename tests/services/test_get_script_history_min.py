@@ -19,6 +19,9 @@ def mock_services():
     with patch("bsv_wallet_toolbox.services.services.ServiceCollection") as mock_service_collection:
         mock_instance = Mock()
         mock_service_collection.return_value = mock_instance
+        # Per-request provider snapshot of ServiceCollection, one entry per mocked provider
+        mock_instance.ranked_services.side_effect = lambda use_next=False: [{}] * mock_instance.count
+        mock_instance.service_to_call_for.side_effect = lambda entry: mock_instance.service_to_call
 
         with patch("bsv_wallet_toolbox.services.services.Services._get_http_client", return_value=Mock()):
             services = Services(Services.create_default_options("main"))
@@ -0,0 +1,117 @@
+"""Tests for hedged provider calls in Services."""
+
+import threading
+import time
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import pytest
+from bsv.script import Script
+from bsv.transaction import Transaction
+from bsv.transaction_output import TransactionOutput
+
+from bsv_wallet_toolbox.errors import InvalidParameterError
+from bsv_wallet_toolbox.services import ServiceCollection, Services
+from bsv_wallet_toolbox.services.service_collection import (
+    HEDGE_DELAY_DEFAULT_MSECS,
+    HEDGE_DELAY_MAX_MSECS,
+    HEDGE_DELAY_MIN_MSECS,
+    ServiceCall,
+)
+
+
+def _record(collection: ServiceCollection, provider_name: str, msecs: int, success: bool = True) -> None:
+    call = ServiceCall(when=datetime.now(UTC), msecs=msecs, success=success)
+    collection._add_service_call(provider_name, call)
+
+
+def _services(modes: dict[str, str]) -> Services:
+    with patch("bsv_wallet_toolbox.services.services.Services._get_http_client"):
+        return Services({"chain": "test", "serviceCallModes": modes})
+
+
+class TestHedgeDelay:
+    """Test latency budgets derived from call history."""
+
+    def test_default_without_history(self) -> None:
+        collection = ServiceCollection("getRawTx")
+
+        assert collection.hedge_delay_msecs("WhatsOnChain") == HEDGE_DELAY_DEFAULT_MSECS
+
+    def test_uses_high_percentile_of_successful_calls(self) -> None:
+        collection = ServiceCollection("getRawTx")
+        for msecs in range(100, 1100, 100):
+            _record(collection, "WhatsOnChain", msecs)
+        _record(collection, "WhatsOnChain", 4000, success=False)
+
+        assert collection.hedge_delay_msecs("WhatsOnChain") == 1000
+
+    def test_clamped(self) -> None:
+        collection = ServiceCollection("getRawTx")
+        _record(collection, "fast", 1)
+        _record(collection, "slow", 60_000)
+
+        assert collection.hedge_delay_msecs("fast") == HEDGE_DELAY_MIN_MSECS
+        assert collection.hedge_delay_msecs("slow") == HEDGE_DELAY_MAX_MSECS
+
+
+class TestHedgedServices:
+    """Test Services methods configured with the hedged call mode."""
+
+    def test_slow_preferred_provider_is_hedged(self) -> None:
+        tx = Transaction(tx_outputs=[TransactionOutput(Script(b"\x51"), 1)])
+        release = threading.Event()
+
+        def slow(txid: str) -> str:
+            release.wait(5)
+            return tx.hex()
+
+        def fast(txid: str) -> str:
+            return tx.hex()
+
+        services = _services({"getRawTx": "hedged"})
+        collection = ServiceCollection("getRawTx").add({"name": "slow", "service": slow})
+        collection.add({"name": "fast", "service": fast})
+        _record(collection, "slow", 60)
+        services.get_raw_tx_services = collection
+
+        started = time.monotonic()
+        try:
+            assert services.get_raw_tx(tx.txid()) == tx.hex()
+        finally:
+            release.set()
+
+        assert time.monotonic() - started < 2
+        history = services.get_services_call_history()["getRawTx"].history_by_provider
+        assert history["fast"].calls[0].success
+
+    def test_invalid_answer_starts_next_provider(self) -> None:
+        tx = Transaction(tx_outputs=[TransactionOutput(Script(b"\x51"), 1)])
+        other = Transaction(tx_outputs=[TransactionOutput(Script(b"\x52"), 1)])
+
+        services = _services({"getRawTx": "hedged"})
+        services.get_raw_tx_services = (
+            ServiceCollection("getRawTx")
+            .add({"name": "wrong", "service": lambda txid: other.hex()})
+            .add({"name": "right", "service": lambda txid: tx.hex()})
+        )
+
+        assert services.get_raw_tx(tx.txid()) == tx.hex()
+        history = services.get_services_call_history()["getRawTx"].history_by_provider
+        assert not history["wrong"].calls[0].success
+        assert "TXID_MISMATCH" in history["wrong"].calls[0].error["message"]
+
+    def test_no_valid_result(self) -> None:
+        services = _services({"getMerklePath": "hedged"})
+        services.get_merkle_path_services = ServiceCollection("getMerklePath").add(
+            {"name": "empty", "service": lambda txid, s: {"name": "empty", "notes": [{"what": "notFound"}]}}
+        )
+
+        result = services.get_merkle_path_for_transaction("a" * 64)
+
+        assert "merklePath" not in result
+        assert result["notes"] == [{"what": "notFound"}]
+
+    def test_invalid_mode_rejected(self) -> None:
+        with pytest.raises(InvalidParameterError):
+            _services({"getRawTx": "parallel"})
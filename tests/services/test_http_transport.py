@@ -0,0 +1,141 @@
+"""Tests for the pooled HTTP transport shared by the service providers.
+
+Providers talk HTTP to tests.testabilities.testservices.LocalARCServer, which
+keeps connections alive like ARC.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from bsv.script import Script
+from bsv.transaction import Transaction
+from bsv.transaction_output import TransactionOutput
+
+from bsv_wallet_toolbox.services import Services
+from bsv_wallet_toolbox.services.chaintracker.chaintracks.util.chaintracks_fetch import ChaintracksFetch
+from bsv_wallet_toolbox.services.http_transport import HttpTransport, default_http_transport, host_key
+from bsv_wallet_toolbox.services.providers.arc import ARC
+from bsv_wallet_toolbox.services.providers.bitails import Bitails
+from tests.testabilities.testservices import LocalARCServer
+
+UNKNOWN_TXID = "00" * 32
+
+
+def _tx(tag: int) -> Transaction:
+    return Transaction(tx_outputs=[TransactionOutput(Script(f"76a914{tag:040x}88ac"), 1)])
+
+
+class TestHttpTransport:
+    """Test connection reuse, per-host limits and metrics."""
+
+    def test_sync_requests_reuse_one_connection(self) -> None:
+        transport = HttpTransport()
+        with LocalARCServer() as server:
+            arc = ARC(server.url, transport=transport)
+            for _ in range(5):
+                assert arc.get_tx_data(UNKNOWN_TXID) is None
+
+            stats = transport.stats()[host_key(server.url)]
+
+        assert stats == {"requests": 5, "errors": 0, "opened": 1, "reused": 4, "throttled": 0}
+
+    def test_providers_share_pools_but_keep_their_headers(self) -> None:
+        transport = HttpTransport()
+        with LocalARCServer() as server:
+            arc = ARC(server.url, config="arc-key", transport=transport)
+            fetch = ChaintracksFetch(transport=transport)
+            fetch.session.headers["X-Client"] = "fetch"
+
+            assert arc.get_tx_data(UNKNOWN_TXID) is None
+            response = fetch.session.get(f"{server.url}/v1/tx/{UNKNOWN_TXID}", timeout=5)
+
+            assert response.status_code == 404
+            assert "Authorization" not in response.request.headers
+            assert response.request.headers["X-Client"] == "fetch"
+            assert "X-Client" not in arc.session.headers
+            assert transport.stats()[host_key(server.url)]["opened"] == 1
+
+    def test_concurrent_requests_per_host_are_limited(self) -> None:
+        transport = HttpTransport(max_per_host=2)
+        with LocalARCServer(latency_msecs=30) as server:
+            arc = ARC(server.url, transport=transport)
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(lambda i: arc.post_raw_tx(_tx(i).hex()), range(8)))
+
+            stats = transport.stats()[host_key(server.url)]
+
+            assert all(r.status == "success" for r in results)
+            assert server.max_in_flight == 2
+            assert stats["requests"] == 8 and stats["throttled"] >= 6
+            assert stats["opened"] <= 2
+
+    def test_connection_errors_are_counted(self) -> None:
+        transport = HttpTransport()
+        with LocalARCServer() as server:
+            url = server.url
+        arc = ARC(url, transport=transport)
+
+        result = arc.post_raw_tx(_tx(1).hex())
+
+        assert result.status == "error"
+        assert transport.stats()[host_key(url)]["errors"] == 1
+
+    def test_async_client_reuses_connections(self) -> None:
+        transport = HttpTransport(timeout=5)
+        client = transport.async_client
+        with LocalARCServer() as server:
+
+            async def fetch_three() -> list[int]:
+                try:
+                    return [
+                        (await client.fetch(f"{server.url}/v1/tx/{UNKNOWN_TXID}", {})).status_code for _ in range(3)
+                    ]
+                finally:
+                    await client.close()
+
+            assert asyncio.run(fetch_three()) == [404, 404, 404]
+
+        assert transport.stats()[host_key(server.url)] == {
+            "requests": 3,
+            "errors": 0,
+            "opened": 1,
+            "reused": 2,
+            "throttled": 0,
+        }
+        assert client.limit_per_host == transport.max_per_host
+
+    def test_providers_default_to_the_process_wide_transport(self) -> None:
+        assert ARC("https://arc.example.com").transport is default_http_transport()
+        assert Bitails("main").transport is default_http_transport()
+
+
+class TestServicesHttpTransport:
+    """Test how Services configures and shares its transport."""
+
+    def test_options_configure_the_transport(self) -> None:
+        options = Services.create_default_options("test")
+        options["httpPoolMaxSize"] = 4
+        options["httpMaxPerHost"] = 3
+        options["httpTimeoutSecs"] = 7
+        services = Services(options)
+
+        transport = services.http_transport
+        assert (transport.pool_maxsize, transport.max_per_host, transport.timeout) == (4, 3, 7)
+        assert services.arc_taal.transport is transport
+        assert services.bitails.transport is transport
+        assert services.whatsonchain.http_client is transport.async_client
+
+    def test_injected_transport_is_used_and_measured(self) -> None:
+        transport = HttpTransport()
+        with LocalARCServer() as server:
+            options = Services.create_default_options("test")
+            options["arcUrl"] = server.url
+            options["arcGorillaPoolUrl"] = None
+            options["httpTransport"] = transport
+            services = Services(options)
+
+            results = [services.post_beef(_tx(i).hex()) for i in range(3)]
+
+            assert [r["accepted"] for r in results] == [True, True, True]
+            assert services.get_http_stats()[host_key(server.url)]["reused"] == 2
+            services.close()
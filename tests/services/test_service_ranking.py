@@ -0,0 +1,131 @@
+"""Tests for adaptive provider ranking in ServiceCollection."""
+
+from unittest.mock import patch
+
+import pytest
+
+from bsv_wallet_toolbox.services import Services
+from bsv_wallet_toolbox.services.service_collection import (
+    BREAKER_COOLDOWN_SECS,
+    BREAKER_ERROR_THRESHOLD,
+    REPROBE_INTERVAL_SECS,
+    ServiceCollection,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    clock = _Clock()
+    with patch("bsv_wallet_toolbox.services.service_collection.time.monotonic", clock):
+        yield clock
+
+
+def _collection(*names: str) -> ServiceCollection:
+    collection = ServiceCollection("getRawTx", adaptive=True)
+    for name in names:
+        collection.add({"name": name, "service": lambda txid: None})
+    return collection
+
+
+def _call(collection: ServiceCollection, name: str, msecs: int, error: bool = False) -> None:
+    stc = collection.get_service_to_call([s["name"] for s in collection.services].index(name))
+    with patch.object(collection, "get_duration", return_value=msecs):
+        if error:
+            collection.add_service_call_error(stc, Exception("boom"))
+        else:
+            collection.add_service_call_success(stc)
+
+
+class TestAdaptiveRanking:
+    """Test EWMA ranking, circuit breaker and re-probes."""
+
+    def test_order_preserved_without_history(self, clock) -> None:
+        collection = _collection("a", "b", "c")
+
+        assert [s["name"] for s in collection.ranked_services()] == ["a", "b", "c"]
+
+    def test_fastest_provider_first(self, clock) -> None:
+        collection = _collection("slow", "fast")
+        _call(collection, "slow", 900)
+        _call(collection, "fast", 100)
+
+        assert [s["name"] for s in collection.ranked_services()] == ["fast", "slow"]
+        assert [s["name"] for s in collection.ranked_services(use_next=True)] == ["slow", "fast"]
+        assert collection.ranked_provider_names() == ["fast", "slow"]
+        assert [s["name"] for s in collection.services] == ["slow", "fast"]  # shared list not reordered
+
+    def test_errors_penalize_rank(self, clock) -> None:
+        collection = _collection("flaky", "steady")
+        _call(collection, "flaky", 100)
+        _call(collection, "flaky", 100, error=True)
+        _call(collection, "steady", 200)
+
+        assert collection.ranked_provider_names() == ["steady", "flaky"]
+
+    def test_breaker_opens_and_reprobes_after_cooldown(self, clock) -> None:
+        collection = _collection("a", "b")
+        _call(collection, "b", 500)
+        for _ in range(BREAKER_ERROR_THRESHOLD):
+            _call(collection, "a", 10, error=True)
+
+        assert collection.health("a").state(clock.now) == "open"
+        assert collection.ranked_provider_names() == ["b", "a"]
+
+        clock.now += BREAKER_COOLDOWN_SECS + 1
+        assert collection.ranked_provider_names()[0] == "a"
+
+        _call(collection, "a", 10, error=True)
+        assert collection.health("a").state(clock.now) == "open"
+        assert collection.health("a").cooldown_secs == BREAKER_COOLDOWN_SECS * 2
+
+        clock.now += BREAKER_COOLDOWN_SECS * 2 + 1
+        _call(collection, "a", 10)
+        assert collection.health("a").state(clock.now) == "closed"
+
+    def test_idle_provider_is_reprobed(self, clock) -> None:
+        collection = _collection("slow", "fast")
+        _call(collection, "slow", 900)
+        _call(collection, "fast", 100)
+
+        clock.now += REPROBE_INTERVAL_SECS / 2
+        _call(collection, "fast", 100)
+        clock.now += REPROBE_INTERVAL_SECS / 2 + 1
+
+        assert collection.ranked_provider_names() == ["slow", "fast"]
+
+    def test_non_adaptive_collection_keeps_order(self, clock) -> None:
+        collection = ServiceCollection("getRawTx")
+        collection.add({"name": "slow", "service": None}).add({"name": "fast", "service": None})
+        _call(collection, "slow", 900)
+        _call(collection, "fast", 100)
+
+        assert [s["name"] for s in collection.ranked_services()] == ["slow", "fast"]
+        assert [s["name"] for s in collection.ranked_services(use_next=True)] == ["fast", "slow"]
+        assert collection.index == 1
+        assert collection.get_service_call_history().ranking == []
+
+    def test_ranking_in_call_history(self, clock) -> None:
+        collection = _collection("slow", "fast")
+        _call(collection, "slow", 900)
+        _call(collection, "fast", 100)
+
+        ranking = collection.get_service_call_history().ranking
+
+        assert [(r.provider_name, r.rank, r.state) for r in ranking] == [("fast", 0, "closed"), ("slow", 1, "closed")]
+        assert ranking[0].ewma_msecs == 100
+
+    def test_services_rank_only_when_opted_in(self) -> None:
+        with patch("bsv_wallet_toolbox.services.services.Services._get_http_client"):
+            default = Services({"chain": "test"})
+            adaptive = Services({"chain": "test", "adaptiveServiceRanking": True})
+
+        assert not default.get_raw_tx_services.adaptive
+        assert adaptive.get_raw_tx_services.adaptive
@@ -0,0 +1,194 @@
+"""Tests for the async Services API and the shared event loop behind the sync API."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from bsv.script import Script
+from bsv.transaction import Transaction
+from bsv.transaction_output import TransactionOutput
+
+from bsv_wallet_toolbox.errors import InvalidParameterError
+from bsv_wallet_toolbox.services import ServiceCollection, Services
+from bsv_wallet_toolbox.services.http_client import ToolboxHttpClient
+from bsv_wallet_toolbox.utils.async_runner import get_async_runner, run_sync
+from tests.testabilities.testservices import LocalARCServer
+
+
+def _tx(tag: int) -> Transaction:
+    return Transaction(tx_outputs=[TransactionOutput(Script(f"76a914{tag:040x}88ac"), 1)])
+
+
+def _services_with_raw_tx_provider(provider) -> Services:
+    services = Services("test")
+    services.get_raw_tx_services = ServiceCollection("getRawTx").add({"name": "fake", "service": provider})
+    return services
+
+
+class TestServicesAsyncApi:
+    """Test the *_async methods."""
+
+    async def test_get_raw_tx_async_fans_out_on_callers_loop(self) -> None:
+        txs = {tx.txid(): tx for tx in (_tx(i) for i in range(50))}
+        caller_loop = asyncio.get_running_loop()
+        loops = set()
+
+        async def provider(txid: str) -> str:
+            loops.add(asyncio.get_running_loop())
+            await asyncio.sleep(0.1)
+            return txs[txid].hex()
+
+        services = _services_with_raw_tx_provider(provider)
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(services.get_raw_tx_async(txid) for txid in txs))
+
+        assert results == [tx.hex() for tx in txs.values()]
+        assert time.perf_counter() - start < 2  # 50 x 100ms run concurrently
+        assert loops == {caller_loop}
+
+    async def test_sync_providers_do_not_block_the_loop(self) -> None:
+        tx = _tx(1)
+        ticks = []
+
+        def provider(txid: str) -> str:
+            time.sleep(0.2)
+            return tx.hex()
+
+        async def ticker() -> None:
+            for _ in range(5):
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.02)
+
+        services = _services_with_raw_tx_provider(provider)
+        raw_tx, _ = await asyncio.gather(services.get_raw_tx_async(tx.txid()), ticker())
+
+        assert raw_tx == tx.hex()
+        assert ticks[-1] - ticks[0] < 0.2
+
+    async def test_results_are_cached(self) -> None:
+        tx = _tx(2)
+        calls = []
+
+        async def provider(txid: str) -> str:
+            calls.append(txid)
+            return tx.hex()
+
+        services = _services_with_raw_tx_provider(provider)
+
+        assert await services.get_raw_tx_async(tx.txid()) == tx.hex()
+        assert services.get_raw_tx(tx.txid()) == tx.hex()
+        assert len(calls) == 1
+
+    async def test_invalid_txid_raises(self) -> None:
+        services = Services("test")
+
+        with pytest.raises(InvalidParameterError):
+            await services.get_merkle_path_async("00")
+        with pytest.raises(InvalidParameterError):
+            await services.get_transaction_status_async("zz" * 32)
+
+    async def test_get_utxo_status_async_fails_over(self) -> None:
+        async def down(*_args):
+            raise ConnectionError("down")
+
+        def up(output, output_format, outpoint):
+            return {"name": "up", "status": "success", "isUtxo": True, "details": []}
+
+        services = Services("test")
+        services.get_utxo_status_services = (
+            ServiceCollection("getUtxoStatus").add({"name": "down", "service": down}).add({"name": "up", "service": up})
+        )
+
+        r = await services.get_utxo_status_async("ab" * 32)
+
+        assert r["name"] == "up" and r["isUtxo"] is True
+
+    async def test_post_beef_async(self) -> None:
+        tx = _tx(3)
+        with LocalARCServer() as server:
+            options = Services.create_default_options("test")
+            options["arcUrl"] = server.url
+            options["arcGorillaPoolUrl"] = None
+            services = Services(options)
+
+            result = await services.post_beef_async(tx.hex())
+            results = await services.post_beef_array_async([_tx(4).hex(), _tx(5).hex()])
+
+        assert result == {"accepted": True, "txid": tx.txid(), "message": "Broadcast successful"}
+        assert [r["accepted"] for r in results] == [True, True]
+
+
+class TestSharedEventLoop:
+    """Test the shared loop used by the sync API."""
+
+    def test_sync_api_runs_on_the_shared_loop(self) -> None:
+        tx = _tx(6)
+        loops = set()
+
+        async def provider(txid: str) -> str:
+            loops.add(asyncio.get_running_loop())
+            return tx.hex()
+
+        services = _services_with_raw_tx_provider(provider)
+
+        assert services.get_raw_tx(tx.txid()) == tx.hex()
+        assert loops == {get_async_runner().loop}
+
+    async def test_sync_api_usable_inside_a_running_loop(self) -> None:
+        tx = _tx(7)
+
+        async def provider(txid: str) -> str:
+            return tx.hex()
+
+        services = _services_with_raw_tx_provider(provider)
+
+        assert services.get_raw_tx(tx.txid()) == tx.hex()
+
+    def test_run_sync_from_the_loop_thread_raises(self) -> None:
+        async def nested() -> None:
+            run_sync(asyncio.sleep(0))
+
+        with pytest.raises(RuntimeError, match="await the coroutine instead"):
+            run_sync(nested())
+
+
+class TestToolboxHttpClient:
+    """Test connection reuse of the shared HTTP client."""
+
+    def test_one_session_per_loop(self) -> None:
+        client = ToolboxHttpClient(default_timeout=5)
+        with LocalARCServer() as server:
+
+            async def fetch_twice() -> tuple[int, int]:
+                first = await client.fetch(f"{server.url}/v1/tx/{'00' * 32}", {})
+                second = await client.fetch(f"{server.url}/v1/tx/{'00' * 32}", {})
+                return first.status_code, second.status_code
+
+            assert run_sync(fetch_twice()) == (404, 404)
+            session = client._sessions[get_async_runner().loop]
+            run_sync(fetch_twice())
+            assert client._sessions[get_async_runner().loop] is session
+
+            async def fetch_and_close() -> tuple[int, int]:
+                try:
+                    return await fetch_twice()
+                finally:
+                    await client.close()
+
+            statuses = []
+            thread = threading.Thread(target=lambda: statuses.append(asyncio.run(fetch_and_close())))
+            thread.start()
+            thread.join()
+            assert statuses == [(404, 404)]
+            assert len(client._sessions) == 1
+            run_sync(client.close())
+
+        assert session.closed
+
+    def test_services_share_one_client(self) -> None:
+        services = Services("test")
+
+        assert services._get_http_client() is services._get_http_client()
+        assert services.whatsonchain.http_client is services._get_http_client()
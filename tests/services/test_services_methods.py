@@ -20,6 +20,10 @@ def mock_services():
         patch("bsv_wallet_toolbox.services.providers.arc.ARC", return_value=None),
     ):
         services = Services("main")
+        collection = services.get_raw_tx_services  # one mock shared by all collections
+        # Per-request provider snapshot of ServiceCollection, one entry per mocked provider
+        collection.ranked_services.side_effect = lambda use_next=False: [{}] * collection.count
+        collection.service_to_call_for.side_effect = lambda entry: collection.service_to_call
         # Set up mock chain tracker for tests that need it
         services._chain_tracker = MagicMock()
         return services
@@ -0,0 +1,98 @@
+"""Tests for request coalescing (single-flight)."""
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+import pytest
+from bsv.script import Script
+from bsv.transaction import Transaction
+from bsv.transaction_output import TransactionOutput
+
+from bsv_wallet_toolbox.services import ServiceCollection, Services
+from bsv_wallet_toolbox.services.single_flight import SingleFlight
+
+
+def _run_concurrently(n: int, target) -> list:
+    results: list = [None] * n
+    start = threading.Barrier(n)
+
+    def worker(i: int) -> None:
+        start.wait()
+        try:
+            results[i] = target()
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+class TestSingleFlight:
+    """Test SingleFlight.do_async."""
+
+    @pytest.mark.asyncio
+    async def test_do_async_coalesces_coroutines(self) -> None:
+        flight = SingleFlight()
+        calls = []
+
+        async def fetch() -> bytes:
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return b"header"
+
+        results = await asyncio.gather(*(flight.do_async("h", fetch) for _ in range(5)))
+
+        assert results == [b"header"] * 5
+        assert len(calls) == 1
+        assert flight.stats() == {"executions": 1, "shared": 4}
+        assert flight.in_flight() == 0
+
+    @pytest.mark.asyncio
+    async def test_error_is_shared_and_key_released(self) -> None:
+        flight = SingleFlight()
+
+        async def failing() -> str:
+            await asyncio.sleep(0.05)
+            raise RuntimeError("provider down")
+
+        results = await asyncio.gather(*(flight.do_async("key", failing) for _ in range(4)), return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert await flight.do_async("key", lambda: asyncio.sleep(0, "retry")) == "retry"
+
+    @pytest.mark.asyncio
+    async def test_distinct_keys_run_separately(self) -> None:
+        flight = SingleFlight()
+
+        assert await flight.do_async("a", lambda: asyncio.sleep(0, 1)) == 1
+        assert await flight.do_async("b", lambda: asyncio.sleep(0, 2)) == 2
+        assert flight.stats()["executions"] == 2
+
+
+class TestServicesSingleFlight:
+    """Test that Services coalesces identical concurrent provider requests."""
+
+    def test_concurrent_get_raw_tx_calls_provider_once(self) -> None:
+        tx = Transaction(tx_outputs=[TransactionOutput(Script(b"\x51"), 1)])
+        release = threading.Event()
+        calls = []
+
+        def provider(txid: str) -> str:
+            calls.append(txid)
+            release.wait(2)
+            return tx.hex()
+
+        with patch("bsv_wallet_toolbox.services.services.Services._get_http_client"):
+            services = Services("test")
+        services.get_raw_tx_services = ServiceCollection("getRawTx").add({"name": "fake", "service": provider})
+
+        threading.Timer(0.1, release.set).start()
+        results = _run_concurrently(6, lambda: services.get_raw_tx(tx.txid()))
+
+        assert results == [tx.hex()] * 6
+        assert len(calls) == 1
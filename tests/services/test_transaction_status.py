@@ -31,6 +31,9 @@ def mock_services(valid_services_config):
         mock_instance = Mock()
         mock_instance.count = 1  # Set count to avoid early return
         mock_service_collection.return_value = mock_instance
+        # Per-request provider snapshot of ServiceCollection, one entry per mocked provider
+        mock_instance.ranked_services.side_effect = lambda use_next=False: [{}] * mock_instance.count
+        mock_instance.service_to_call_for.side_effect = lambda entry: mock_instance.service_to_call
 
         with patch("bsv_wallet_toolbox.services.services.Services._get_http_client", return_value=Mock()):
             services = Services(valid_services_config)
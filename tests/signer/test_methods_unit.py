@@ -472,6 +472,33 @@ class TestSignerHelperFunctions:
             # If verification fails, that's acceptable for this test
             pass
 
+    async def test_verify_unlock_scripts_inside_running_event_loop(self):
+        """Scripts are verified when called from a coroutine, not silently skipped."""
+        from types import SimpleNamespace
+
+        from bsv.script import Script
+        from bsv.transaction_input import TransactionInput
+        from bsv.transaction_output import TransactionOutput
+
+        from bsv_wallet_toolbox.errors import WalletError
+        from bsv_wallet_toolbox.signer.methods import _verify_unlock_scripts
+
+        source = Transaction([], [TransactionOutput(Script("87"), 1000)])  # OP_EQUAL
+
+        def spend(unlocking_script: str) -> tuple[str, SimpleNamespace]:
+            tx_input = TransactionInput(
+                source_transaction=source,
+                source_txid=source.txid(),
+                source_output_index=0,
+                unlocking_script=Script(unlocking_script),
+            )
+            tx = Transaction([tx_input], [TransactionOutput(Script("51"), 900)])
+            return tx.txid(), SimpleNamespace(txs={tx.txid(): SimpleNamespace(tx_obj=tx)})
+
+        _verify_unlock_scripts(*spend("5151"))  # 1 1 OP_EQUAL
+        with pytest.raises(WalletError, match="script verification failed"):
+            _verify_unlock_scripts(*spend("5152"))  # 1 2 OP_EQUAL
+
     def test_merge_prior_options(self):
         """Test _merge_prior_options function."""
         from bsv_wallet_toolbox.signer.methods import _merge_prior_options
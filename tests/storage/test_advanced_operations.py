@@ -18,15 +18,15 @@ class TestAdvancedStorageOperations:
         provider.find_transactions = Mock(return_value=[{"txid": "abc123", "transactionId": 1, "status": "pending"}])
 
         # Mock service response
-        provider._services.get_transaction_status = Mock(return_value={"status": "confirmed"})
+        provider._services.get_transaction_statuses = Mock(return_value={"abc123": {"status": "confirmed"}})
 
         # Import and call the actual method
 
         StorageProvider.synchronize_transaction_statuses(provider)
 
         # Should have checked status and updated transaction
-        provider._services.get_transaction_status.assert_called_once_with("abc123")
-        provider.update_transaction.assert_called_once_with(1, {"status": "confirmed"})
+        provider._services.get_transaction_statuses.assert_called_once_with(["abc123"])
+        provider.update_many.assert_called_once_with("transaction", [(1, {"status": "confirmed"})])
 
     def test_send_waiting_transactions(self):
         """Test send_waiting_transactions with age filtering."""
@@ -45,7 +45,7 @@ class TestAdvancedStorageOperations:
         provider.get_raw_tx_of_known_valid_transaction = Mock(return_value="raw_tx_hex")
 
         # Mock successful broadcast
-        provider._services.post_beef = Mock(return_value={"success": True})
+        provider._services.post_beef_array = Mock(return_value=[{"accepted": True}])
 
         # Import and call the actual method
 
@@ -53,7 +53,9 @@ class TestAdvancedStorageOperations:
 
         assert result["sent"] == 1
         assert result["failed"] == 0
-        provider.update_transaction.assert_called_once_with(1, {"status": "sent"})
+        provider.get_raw_tx_of_known_valid_transaction.assert_called_once_with("abc123", None, None)
+        provider._services.post_beef_array.assert_called_once_with(["raw_tx_hex"])
+        provider.update_transactions_status.assert_called_once_with([1], "sent")
 
     def test_abort_abandoned(self):
         """Test abort_abandoned marks old transactions as failed."""
@@ -72,7 +74,7 @@ class TestAdvancedStorageOperations:
         result = StorageProvider.abort_abandoned(provider, min_age_seconds=0)
 
         assert result["abandoned"] == 1
-        provider.update_transaction.assert_called_once_with(1, {"status": "failed"})
+        provider.update_transactions_status.assert_called_once_with([1], "failed")
 
     def test_un_fail_success(self):
         """Test un_fail restores failed transactions that are now confirmed."""
@@ -83,14 +85,34 @@ class TestAdvancedStorageOperations:
         provider.find_transactions = Mock(return_value=[{"txid": "abc123", "transactionId": 1, "status": "failed"}])
 
         # Mock service showing transaction is now confirmed
-        provider._services.get_transaction_status = Mock(return_value={"status": "confirmed"})
+        provider._services.get_transaction_statuses = Mock(return_value={"abc123": {"status": "confirmed"}})
 
         # Import and call the actual method
 
         result = StorageProvider.un_fail(provider)
 
         assert result["unfail"] == 1
-        provider.update_transaction.assert_called_once_with(1, {"status": "confirmed"})
+        provider.update_many.assert_called_once_with("transaction", [(1, {"status": "confirmed"})])
+
+    def test_un_fail_falls_back_to_per_txid_lookups(self):
+        """Test un_fail checks each txid when the batched lookup fails."""
+        provider = Mock()
+        provider._services = Mock()
+        provider.find_transactions = Mock(
+            return_value=[
+                {"txid": "abc123", "transactionId": 1, "status": "failed"},
+                {"txid": "def456", "transactionId": 2, "status": "failed"},
+            ]
+        )
+        provider._services.get_transaction_statuses = Mock(side_effect=RuntimeError("bulk endpoint down"))
+        provider._services.get_transaction_status = Mock(
+            side_effect=[{"status": "confirmed"}, RuntimeError("provider down")]
+        )
+
+        result = StorageProvider.un_fail(provider)
+
+        assert result["unfail"] == 1
+        provider.update_many.assert_called_once_with("transaction", [(1, {"status": "confirmed"})])
 
     def test_configure_basket(self):
         """Test basket configuration."""
@@ -0,0 +1,144 @@
+"""Tests for batched (prefetched window, claim-at-once) funding in fund_new_transaction_sdk."""
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import event
+
+from bsv_wallet_toolbox.storage.db import create_engine_from_url, session_scope
+from bsv_wallet_toolbox.storage.methods.generate_change import InsufficientFundsError, StorageFeeModel
+from bsv_wallet_toolbox.storage.models import Base
+from bsv_wallet_toolbox.storage.provider import StorageProvider
+from bsv_wallet_toolbox.storage.utxo_allocator import FundingWindow, claim_funding_outputs
+
+P2PKH_SCRIPT = b"\x76\xa9\x14" + bytes(20) + b"\x88\xac"
+
+
+@pytest.fixture
+def sp():
+    engine = create_engine_from_url("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    storage_provider = StorageProvider(engine=engine, chain="test", storage_identity_key="K" * 64)
+    storage_provider.make_available()
+    return storage_provider
+
+
+def _seed(sp, amounts: list[int]) -> dict:
+    user_id = sp.insert_user({"identityKey": "02" + "b" * 64, "activeStorage": "test"})
+    basket_id = sp.insert_output_basket(
+        {"userId": user_id, "name": "default", "numberOfDesiredUTXOs": 5, "minimumDesiredUTXOValue": 1000}
+    )
+    tx_id = sp.insert_transaction(
+        {"userId": user_id, "reference": "funding", "txid": "e" * 64, "status": "completed", "satoshis": 0}
+    )
+    for vout, sats in enumerate(amounts):
+        sp.insert_output(
+            {
+                "userId": user_id,
+                "basketId": basket_id,
+                "transactionId": tx_id,
+                "vout": vout,
+                "satoshis": sats,
+                "spendable": True,
+                "change": True,
+                "type": "P2PKH",
+                "txid": "e" * 64,
+                "lockingScript": P2PKH_SCRIPT,
+            }
+        )
+    return {"userId": user_id, "basketId": basket_id, "count": len(amounts)}
+
+
+def _fund(sp, w, pay: int, reference: str):
+    spender = sp.insert_transaction(
+        {"userId": w["userId"], "reference": reference, "status": "unsigned", "isOutgoing": True, "satoshis": 0}
+    )
+    ctx = {
+        "xinputs": [],
+        "xoutputs": [SimpleNamespace(satoshis=pay, locking_script=P2PKH_SCRIPT)],
+        "changeBasket": {"basketId": w["basketId"], "minimumDesiredUTXOValue": 1000, "numberOfDesiredUTXOs": 5},
+        "availableFundingCount": sp.count_funding_inputs(w["userId"], w["basketId"], True),
+        "feeModel": StorageFeeModel(model="sat/kb", value=1),
+        "transactionId": spender,
+    }
+    vargs = SimpleNamespace(is_delayed=False, random_vals=[0.5])
+    return sp.fund_new_transaction_sdk(w["userId"], vargs, ctx)
+
+
+def _counted(sp, fn):
+    count = 0
+
+    def _on_execute(*_args):
+        nonlocal count
+        count += 1
+
+    event.listen(sp.engine, "before_cursor_execute", _on_execute)
+    try:
+        return fn(), count
+    finally:
+        event.remove(sp.engine, "before_cursor_execute", _on_execute)
+
+
+def _summary(result):
+    return (
+        sorted(o["satoshis"] for o in result["allocatedChange"]),
+        [c.satoshis for c in result["changeOutputs"]],
+        result["fee"],
+    )
+
+
+def test_batch_and_per_input_select_the_same_inputs():
+    results = {}
+    for batch in (True, False):
+        engine = create_engine_from_url("sqlite:///:memory:")
+        Base.metadata.create_all(bind=engine)
+        sp = StorageProvider(engine=engine, chain="test", storage_identity_key="K" * 64)
+        sp.make_available()
+        sp.batch_funding = batch
+        w = _seed(sp, [1000 + 10 * i for i in range(60)])
+        results[batch] = _summary(_fund(sp, w, 40_000, "pay"))
+        assert sp.count_funding_inputs(w["userId"], w["basketId"], True) == w["count"] - len(results[batch][0])
+        assert sp.check_wallet_balances()["mismatches"] == []
+
+    assert results[True] == results[False]
+
+
+def test_batch_statement_count_does_not_grow_with_inputs(sp):
+    w = _seed(sp, [1000] * 80)
+    small, small_count = _counted(sp, lambda: _fund(sp, w, 2_000, "small"))
+    large, large_count = _counted(sp, lambda: _fund(sp, w, 50_000, "large"))
+
+    assert len(small["allocatedChange"]) < 5
+    assert len(large["allocatedChange"]) > 50
+    assert large_count == small_count
+
+
+def test_batch_insufficient_funds_claims_nothing(sp):
+    w = _seed(sp, [1000, 2000])
+    with pytest.raises(InsufficientFundsError):
+        _fund(sp, w, 50_000, "too-much")
+    assert sp.count_funding_inputs(w["userId"], w["basketId"], True) == 2
+
+
+def test_claim_is_all_or_nothing(sp):
+    w = _seed(sp, [1000, 2000, 3000])
+    ids = [o["outputId"] for o in sp.find_outputs({"partial": {"userId": w["userId"]}})]
+    spender = sp.insert_transaction(
+        {"userId": w["userId"], "reference": "s", "status": "unsigned", "isOutgoing": True, "satoshis": 0}
+    )
+    sp.update_output(ids[0], {"spendable": False, "spentBy": spender})
+
+    with session_scope(sp.SessionLocal) as s:
+        kwargs = {"user_id": w["userId"], "basket_id": w["basketId"], "exclude_sending": True}
+        assert claim_funding_outputs(s, transaction_id=spender, output_ids=ids, **kwargs) is False
+        s.rollback()
+    assert sp.count_funding_inputs(w["userId"], w["basketId"], True) == 2
+
+
+def test_funding_window_allocate_and_release():
+    window = FundingWindow([(5000, 3), (1000, 1), (3000, 2)])
+    assert window.allocate(2000) == (2, 3000)
+    assert window.allocate(9000) == (3, 5000)
+    window.release(2)
+    assert window.allocate(100, exact_satoshis=3000) == (2, 3000)
+    assert len(window) == 1
@@ -0,0 +1,156 @@
+"""Tests for the BUMP-encoded BEEF builder used by includeTransactions and getValidBeefForTxid."""
+
+import pytest
+from bsv.merkle_path import MerklePath
+from bsv.script import Script
+from bsv.transaction import Transaction
+from bsv.transaction.beef import Beef, new_beef_from_bytes
+from bsv.transaction_input import TransactionInput
+from bsv.transaction_output import TransactionOutput
+from sqlalchemy import event
+
+from bsv_wallet_toolbox.storage.db import create_engine_from_url
+from bsv_wallet_toolbox.storage.models import Base
+from bsv_wallet_toolbox.storage.provider import StorageProvider
+
+P2PKH_SCRIPT = b"\x76\xa9\x14" + bytes(20) + b"\x88\xac"
+HEIGHT = 800_000
+
+
+@pytest.fixture
+def sp():
+    engine = create_engine_from_url("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    storage_provider = StorageProvider(engine=engine, chain="test", storage_identity_key="K" * 64)
+    storage_provider.make_available()
+    return storage_provider
+
+
+def _tx(parents: list[str], tag: int) -> Transaction:
+    inputs = [
+        TransactionInput(source_txid=p, source_output_index=0, unlocking_script=Script(bytes([tag]))) for p in parents
+    ]
+    return Transaction(tx_inputs=inputs, tx_outputs=[TransactionOutput(Script(P2PKH_SCRIPT), 1000 + tag)])
+
+
+def _block_paths(txids: list[str]) -> list[MerklePath]:
+    """Return one single-leaf MerklePath per txid for a two-transaction block."""
+    return [
+        MerklePath(
+            HEIGHT,
+            [
+                [
+                    {"offset": i, "hash_str": txid, "txid": True} if i == own else {"offset": i, "hash_str": txid}
+                    for i, txid in enumerate(txids)
+                ]
+            ],
+        )
+        for own in range(len(txids))
+    ]
+
+
+def _insert_proven(sp, tx: Transaction, path: MerklePath, index: int) -> None:
+    sp.find_or_insert_proven_tx(
+        {
+            "txid": tx.txid(),
+            "height": HEIGHT,
+            "index": index,
+            "merklePath": path.to_binary(),
+            "rawTx": tx.serialize(),
+            "blockHash": "22" * 32,
+            "merkleRoot": path.compute_root(),
+        }
+    )
+
+
+def _insert_req(sp, tx: Transaction) -> None:
+    sp.insert_proven_tx_req({"txid": tx.txid(), "rawTx": tx.serialize(), "status": "unmined"})
+
+
+@pytest.fixture
+def chain(sp):
+    """grandparents (proven, same block) <- parent (unproven) <- child (unproven)."""
+    grandparents = [_tx([f"{i + 1:064x}"], i) for i in range(2)]
+    paths = _block_paths([g.txid() for g in grandparents])
+    for index, (g, path) in enumerate(zip(grandparents, paths, strict=True)):
+        _insert_proven(sp, g, path, index)
+    parent = _tx([g.txid() for g in grandparents], 10)
+    child = _tx([parent.txid()], 11)
+    _insert_req(sp, parent)
+    _insert_req(sp, child)
+    return {"grandparents": grandparents, "parent": parent, "child": child}
+
+
+def _parse(data: bytes) -> Beef:
+    beef = new_beef_from_bytes(data)
+    assert beef.is_valid()
+    return beef
+
+
+def test_builds_valid_beef_with_merged_bump(sp, chain):
+    beef = _parse(sp.get_valid_beef_for_txid(chain["child"].txid()))
+
+    grandparent_ids = [g.txid() for g in chain["grandparents"]]
+    assert set(beef.txs) == {chain["child"].txid(), chain["parent"].txid(), *grandparent_ids}
+    # both grandparents are proven in the same block: their BUMPs are combined into one
+    assert len(beef.bumps) == 1
+    assert all(beef.find_transaction(t).bump_index == 0 for t in grandparent_ids)
+    assert beef.find_transaction(chain["child"].txid()).bump_index is None
+
+
+def test_known_ancestors_are_txid_only(sp, chain):
+    parent_id = chain["parent"].txid()
+    beef = new_beef_from_bytes(sp.get_valid_beef_for_txid(chain["child"].txid(), known_txids=[parent_id]))
+
+    assert set(beef.txs) == {chain["child"].txid(), parent_id}
+    assert beef.find_transaction(parent_id).data_format == 2
+    assert beef.bumps == []
+
+
+def test_one_bulk_lookup_per_ancestry_level(sp, chain):
+    count = 0
+
+    def _on_execute(*_args):
+        nonlocal count
+        count += 1
+
+    event.listen(sp.engine, "before_cursor_execute", _on_execute)
+    try:
+        sp._build_beef_for_txids([chain["child"].txid(), chain["parent"].txid()])
+    finally:
+        event.remove(sp.engine, "before_cursor_execute", _on_execute)
+
+    # levels: {child, parent} -> {grandparents}; proven_txs + proven_tx_reqs per level,
+    # and the grandparent level is fully answered by proven_txs
+    assert count == 3
+
+
+def test_list_outputs_include_transactions_emits_one_beef(sp, chain):
+    user_id = sp.insert_user({"identityKey": "02" + "f" * 64, "activeStorage": "test"})
+    basket_id = sp.insert_output_basket(
+        {"userId": user_id, "name": "default", "numberOfDesiredUTXOs": 5, "minimumDesiredUTXOValue": 1000}
+    )
+    for tx in (chain["child"], chain["parent"]):
+        tx_id = sp.insert_transaction(
+            {"userId": user_id, "reference": tx.txid()[:8], "txid": tx.txid(), "status": "unproven", "satoshis": 1}
+        )
+        sp.insert_output(
+            {
+                "userId": user_id,
+                "basketId": basket_id,
+                "transactionId": tx_id,
+                "vout": 0,
+                "satoshis": 1000,
+                "spendable": True,
+                "change": True,
+                "type": "P2PKH",
+                "txid": tx.txid(),
+                "lockingScript": P2PKH_SCRIPT,
+            }
+        )
+
+    result = sp.list_outputs({"userId": user_id}, {"includeTransactions": True})
+
+    beef = _parse(result["BEEF"])
+    assert len(beef.txs) == 4
+    assert len(beef.bumps) == 1
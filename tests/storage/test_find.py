@@ -1,5 +1,10 @@
 from datetime import UTC, datetime, timedelta
 
+import pytest
+from sqlalchemy import event
+
+from bsv_wallet_toolbox.errors import InvalidParameterError
+
 
 def test_find_proventx(storage_seeded) -> None:
     storage, seed = storage_seeded
@@ -95,6 +100,72 @@ def test_find_outputs(storage_seeded) -> None:
     assert len(user2_outputs) == 1
 
 
+def test_find_outputs_column_projection(storage_seeded) -> None:
+    storage, seed = storage_seeded
+    full = storage.find_outputs({"partial": {"userId": seed["user1"]["userId"]}})
+    projected = storage.find_outputs(
+        {"partial": {"userId": seed["user1"]["userId"]}, "columns": ["outputId", "satoshis", "spent_by"]}
+    )
+
+    assert projected == [{"outputId": o["outputId"], "satoshis": o["satoshis"], "spentBy": o["spentBy"]} for o in full]
+
+    with pytest.raises(InvalidParameterError):
+        storage.find_outputs({"columns": ["notAColumn"]})
+
+
+def test_iter_outputs_keyset_pages(storage_seeded) -> None:
+    storage, _seed = storage_seeded
+    expected = sorted(storage.find_outputs({"partial": {}}), key=lambda o: o["outputId"])
+    statements: list[str] = []
+    event.listen(storage.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    streamed = list(storage.iter_outputs(batch_size=2))
+
+    assert streamed == expected
+    assert len(statements) == 3  # 5 rows in pages of 2
+    assert all('outputs."outputId" > ?' in sql for sql in statements[1:])
+    assert list(storage.iter_outputs({"partial": {}}, batch_size=2, descending=True)) == expected[::-1]
+
+
+def test_iter_filters_projection_and_composite_keys(storage_seeded) -> None:
+    storage, seed = storage_seeded
+    user_id = seed["user1"]["userId"]
+    full = storage.find_outputs({"partial": {"userId": user_id}})
+    projected = storage.iter_outputs({"partial": {"userId": user_id}, "columns": ["satoshis"]}, batch_size=3)
+    assert list(projected) == [{"satoshis": o["satoshis"]} for o in sorted(full, key=lambda o: o["outputId"])]
+
+    tag_maps = list(storage.iter_output_tag_maps(batch_size=1))
+    assert len(tag_maps) == 3
+    assert sorted(tag_maps, key=lambda m: (m["outputTagId"], m["outputId"])) == sorted(
+        storage.find_output_tag_maps({"partial": {}}), key=lambda m: (m["outputTagId"], m["outputId"])
+    )
+
+    with pytest.raises(InvalidParameterError):
+        next(storage.iter_outputs(batch_size=0))
+
+
+def test_iter_transactions_survives_updates_while_iterating(storage_seeded) -> None:
+    storage, seed = storage_seeded
+    user_id = seed["user1"]["userId"]
+    statuses = sorted({t["status"] for t in storage.find_transactions({"partial": {"userId": user_id}})})
+    expected = storage.count_transactions({"userId": user_id, "status": statuses})
+
+    visited = []
+    for tx in storage.iter_transactions({"userId": user_id, "status": statuses}, batch_size=1):
+        # Moves the row out of the filter; an OFFSET-paged loop would skip the next row
+        storage.update_transaction(tx["transactionId"], {"status": "unprocessed"})
+        visited.append(tx["transactionId"])
+
+    assert len(visited) == expected == 3
+
+
+def test_model_to_dict_uses_all_columns(storage_seeded) -> None:
+    storage, _seed = storage_seeded
+    basket = storage.find_output_baskets({"partial": {}})[0]
+
+    assert {"basketId", "numberOfDesiredUTXOs", "minimumDesiredUTXOValue", "isDeleted"} <= basket.keys()
+
+
 def test_find_output_tags_and_maps(storage_seeded) -> None:
     storage, seed = storage_seeded
     tags = storage.find_output_tags({"partial": {"userId": seed["user1"]["userId"]}})
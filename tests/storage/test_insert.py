@@ -7,6 +7,7 @@ from datetime import datetime
 
 import pytest
 
+from bsv_wallet_toolbox.errors import InvalidParameterError
 from bsv_wallet_toolbox.storage.db import create_engine_from_url
 from bsv_wallet_toolbox.storage.models import Base
 from bsv_wallet_toolbox.storage.provider import StorageProvider
@@ -432,3 +433,88 @@ class Testinsert:
 
         state_id = storage.insert_sync_state(state)
         assert state_id > 0
+
+
+P2PKH_SCRIPT = b"\x76\xa9\x14" + bytes(20) + b"\x88\xac"
+
+
+def _output(user_id: int, transaction_id: int, vout: int, **extra: object) -> dict:
+    return {
+        "userId": user_id,
+        "transactionId": transaction_id,
+        "vout": vout,
+        "satoshis": 1000 + vout,
+        "spendable": True,
+        "change": True,
+        "type": "P2PKH",
+        "lockingScript": P2PKH_SCRIPT,
+        **extra,
+    }
+
+
+class TestInsertMany:
+    """Test suite for the bulk insert/upsert entry points."""
+
+    def test_insert_many_outputs_returns_ids_in_order(self, storage, user) -> None:
+        tx_id = storage.insert_transaction(
+            {"userId": user, "reference": "bulk-1", "status": "completed", "satoshis": 0}
+        )
+        rows = [_output(user, tx_id, vout) for vout in range(5)]
+        rows[2]["outputDescription"] = "mixed key sets are batched separately"
+
+        ids = storage.insert_many_outputs(rows)
+
+        assert len(set(ids)) == 5
+        found = {o["outputId"]: o for o in storage.find_outputs({"partial": {"transactionId": tx_id}})}
+        assert [found[i]["vout"] for i in ids] == [0, 1, 2, 3, 4]
+        assert found[ids[2]]["outputDescription"] == "mixed key sets are batched separately"
+
+    def test_insert_many_is_atomic(self, storage, user) -> None:
+        tx_id = storage.insert_transaction(
+            {"userId": user, "reference": "bulk-2", "status": "completed", "satoshis": 0}
+        )
+
+        with pytest.raises(Exception):
+            storage.insert_many_outputs([_output(user, tx_id, 0), _output(user, tx_id, 0)])
+
+        assert storage.count_outputs({"transactionId": tx_id}) == 0
+
+    def test_upsert_many_transactions_updates_existing(self, storage, user) -> None:
+        first = storage.upsert_many_transactions(
+            [
+                {"userId": user, "reference": "up-a", "status": "unproven", "satoshis": 1},
+                {"userId": user, "reference": "up-b", "status": "unproven", "satoshis": 2},
+            ]
+        )
+        second = storage.upsert_many_transactions(
+            [
+                {"userId": user, "reference": "up-c", "status": "unproven", "satoshis": 3},
+                {"userId": user, "reference": "up-a", "status": "completed", "satoshis": 1},
+            ]
+        )
+
+        assert second[1] == first[0]
+        assert second[0] not in first
+        assert storage.find_transactions({"partial": {"transactionId": first[0]}})[0]["status"] == "completed"
+        assert storage.count_transactions({"userId": user}) == 3
+
+    def test_upsert_many_outputs_keeps_wallet_balance(self, storage, user) -> None:
+        basket_id = storage.insert_output_basket(
+            {"userId": user, "name": "default", "numberOfDesiredUTXOs": 5, "minimumDesiredUTXOValue": 1000}
+        )
+        tx_id = storage.insert_transaction(
+            {"userId": user, "reference": "bulk-3", "status": "completed", "satoshis": 0}
+        )
+        storage.insert_many_outputs([_output(user, tx_id, 0, basketId=basket_id)])
+        assert storage.get_wallet_balance(user) == 1000
+
+        storage.upsert_many_outputs(
+            [_output(user, tx_id, 0, basketId=basket_id, satoshis=5000), _output(user, tx_id, 1, basketId=basket_id)]
+        )
+
+        assert storage.get_wallet_balance(user) == 6001
+        assert storage.check_wallet_balances(user)["mismatches"] == []
+
+    def test_upsert_many_requires_unique_key(self, storage, user) -> None:
+        with pytest.raises(InvalidParameterError):
+            storage.upsert_many_transactions([{"userId": user, "status": "completed", "satoshis": 0}])
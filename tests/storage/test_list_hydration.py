@@ -0,0 +1,173 @@
+"""Tests for page-level (batched) hydration in list_outputs and list_actions."""
+
+import pytest
+from sqlalchemy import event
+
+from bsv_wallet_toolbox.storage.db import create_engine_from_url
+from bsv_wallet_toolbox.storage.models import Base
+from bsv_wallet_toolbox.storage.provider import StorageProvider
+
+
+@pytest.fixture
+def sp():
+    engine = create_engine_from_url("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    storage_provider = StorageProvider(engine=engine, chain="test", storage_identity_key="K" * 64)
+    storage_provider.make_available()
+    return storage_provider
+
+
+def _seed(sp, n_tx: int) -> int:
+    user_id = sp.insert_user({"identityKey": "02" + "e" * 64, "activeStorage": "test"})
+    basket_id = sp.insert_output_basket(
+        {"userId": user_id, "name": "default", "numberOfDesiredUTXOs": 5, "minimumDesiredUTXOValue": 1000}
+    )
+    tag_ids = [sp.insert_output_tag({"userId": user_id, "tag": f"t{i}"}) for i in range(2)]
+    label_ids = [sp.insert_tx_label({"userId": user_id, "label": f"l{i}"}) for i in range(2)]
+    prev_output = None
+    for i in range(n_tx):
+        tx_id = sp.insert_transaction(
+            {"userId": user_id, "reference": f"r{i}", "txid": f"{i:064x}", "status": "completed", "satoshis": 1}
+        )
+        sp.insert_tx_label_map({"transactionId": tx_id, "txLabelId": label_ids[i % 2]})
+        output_id = sp.insert_output(
+            {
+                "userId": user_id,
+                "basketId": basket_id,
+                "transactionId": tx_id,
+                "vout": 0,
+                "satoshis": 100 + i,
+                "spendable": True,
+                "change": True,
+                "type": "P2PKH",
+                "txid": f"{i:064x}",
+            }
+        )
+        for tag_id in tag_ids[: 1 + i % 2]:
+            sp.insert_output_tag_map({"outputId": output_id, "outputTagId": tag_id})
+        if prev_output is not None:
+            sp.update_output(prev_output, {"spentBy": tx_id})
+        prev_output = output_id
+    return user_id
+
+
+def _count_statements(sp, fn):
+    count = 0
+
+    def _on_execute(*_args):
+        nonlocal count
+        count += 1
+
+    event.listen(sp.engine, "before_cursor_execute", _on_execute)
+    try:
+        result = fn()
+    finally:
+        event.remove(sp.engine, "before_cursor_execute", _on_execute)
+    return result, count
+
+
+def test_batch_lookups_group_by_id(sp):
+    user_id = _seed(sp, 3)
+    outputs = sorted(sp.find_outputs({"partial": {"userId": user_id}}), key=lambda o: o["outputId"])
+    output_ids = [o["outputId"] for o in outputs]
+    tags = sp.get_tags_for_output_ids(output_ids)
+    assert [t["tag"] for t in tags[output_ids[0]]] == ["t0"]
+    assert [t["tag"] for t in tags[output_ids[1]]] == ["t0", "t1"]
+    assert sp.get_tags_for_output_id(output_ids[1]) == tags[output_ids[1]]
+
+    tx_ids = [o["transactionId"] for o in outputs]
+    labels = sp.get_labels_for_transaction_ids(tx_ids)
+    assert [lbl["label"] for lbl in labels[tx_ids[2]]] == ["l0"]
+    assert sp.get_labels_for_transaction_id(999) == []
+
+
+def test_list_outputs_hydrates_page_with_constant_statements(sp):
+    user_id = _seed(sp, 12)
+    args = {"includeTags": True, "includeLabels": True, "includeSpent": True}
+
+    small, small_count = _count_statements(sp, lambda: sp.list_outputs({"userId": user_id}, {**args, "limit": 2}))
+    large, large_count = _count_statements(sp, lambda: sp.list_outputs({"userId": user_id}, {**args, "limit": 12}))
+
+    assert small_count == large_count
+    assert len(large["outputs"]) == 12
+    assert large["outputs"][1]["tags"] == ["t0", "t1"]
+    assert large["outputs"][1]["labels"] == ["l1"]
+    assert small["outputs"] == large["outputs"][:2]
+
+
+def test_list_actions_hydrates_page_with_constant_statements(sp):
+    user_id = _seed(sp, 12)
+    args = {"includeLabels": True, "includeOutputs": True, "includeInputs": True}
+
+    _, small_count = _count_statements(sp, lambda: sp.list_actions({"userId": user_id}, {**args, "limit": 2}))
+    large, large_count = _count_statements(sp, lambda: sp.list_actions({"userId": user_id}, {**args, "limit": 12}))
+
+    assert small_count == large_count
+    actions = large["actions"]
+    assert len(actions) == 12
+    assert actions[3]["labels"] == ["l1"]
+    assert actions[3]["outputs"][0]["tags"] == ["t0", "t1"]
+    assert actions[3]["outputs"][0]["basket"] == "default"
+    assert actions[0]["inputs"] == []
+    assert actions[3]["inputs"][0]["sourceOutpoint"] == f"{2:064x}.0"
+
+
+class _RecordingStorage:
+    """Minimal generic find/count storage recording each find call."""
+
+    def __init__(self, tables):
+        self.tables = tables
+        self.calls = []
+
+    def find(self, table, query, limit=None, offset=0):
+        self.calls.append(table)
+        rows = self.tables.get(table, [])
+        if table in ("Transaction", "Output"):
+            return rows[offset : offset + limit] if limit else rows
+        ids = query.get("transactionId", query.get("txid"))
+        wanted = set(ids["$in"]) if isinstance(ids, dict) else {ids}
+        key = "transactionId" if "transactionId" in query else "txid"
+        return [r for r in rows if r.get(key) in wanted]
+
+    def count(self, table, query):
+        return len(self.tables.get(table, []))
+
+
+def test_methods_impl_list_actions_hydrates_in_one_find_per_table():
+    from bsv_wallet_toolbox.storage.methods_impl import ListActionsArgs, list_actions
+
+    storage = _RecordingStorage(
+        {
+            "Transaction": [{"transactionId": i, "txid": f"{i:064x}", "status": "completed"} for i in range(1, 6)],
+            "TxLabel": [{"transactionId": i, "label": f"l{i}"} for i in range(1, 6)],
+            "TransactionInput": [{"transactionId": 2, "vin": 0, "prevTxid": "aa", "prevVout": 1}],
+        }
+    )
+    args = ListActionsArgs(limit=10)
+    args.includeLabels = True
+    args.includeInputs = True
+
+    result = list_actions(storage, {"userId": 1}, args)
+
+    assert storage.calls == ["Transaction", "TxLabel", "TransactionInput"]
+    assert [a["labels"] for a in result["actions"]] == [[f"l{i}"] for i in range(1, 6)]
+    assert result["actions"][1]["inputs"][0]["vout"] == 1
+    assert result["actions"][0]["inputs"] == []
+
+
+def test_methods_impl_list_outputs_hydrates_tags_in_one_find():
+    from bsv_wallet_toolbox.storage.methods_impl import ListOutputsArgs, list_outputs
+
+    storage = _RecordingStorage(
+        {
+            "Output": [{"txid": "aa", "vout": v, "satoshis": 1} for v in range(3)],
+            "OutputTag": [{"txid": "aa", "vout": 1, "tag": "x"}, {"txid": "aa", "vout": 1, "tag": "y"}],
+        }
+    )
+    args = ListOutputsArgs(limit=10)
+    args.includeTags = True
+
+    result = list_outputs(storage, {"userId": 1}, args)
+
+    assert storage.calls == ["Output", "OutputTag"]
+    assert [o["tags"] for o in result["outputs"]] == [[], ["x", "y"], []]
@@ -147,6 +147,45 @@ def test_update_proven_tx_req_with_new_proven_tx_min_shape(sp):
     assert set(r.keys()) >= {"status", "provenTxId", "history"}
 
 
+def test_update_proven_tx_reqs_with_new_proven_txs_batch(sp):
+    req_ids = []
+    with sp.SessionLocal() as s:
+        for i in range(3):
+            req = ProvenTxReq(
+                status="unmined",
+                attempts=0,
+                notified=False,
+                txid=f"{i:02x}" * 32,
+                history="{}",
+                notify="{}",
+                raw_tx=b"\x00",
+            )
+            s.add(req)
+            s.flush()
+            req_ids.append(req.proven_tx_req_id)
+        s.commit()
+
+    proof = {"height": 5, "index": 1, "merklePath": b"\x01", "blockHash": "22" * 32, "merkleRoot": "33" * 32}
+    results = sp.update_proven_tx_reqs_with_new_proven_txs(
+        [
+            {"provenTxReqId": req_ids[0], "txid": "00" * 32, **proof},
+            {"provenTxReqId": req_ids[1], "txid": "ff" * 32, **proof},
+            {"provenTxReqId": 999, "txid": "02" * 32, **proof},
+            {"provenTxReqId": req_ids[2], "txid": "02" * 32, **proof},
+        ]
+    )
+
+    assert [r.get("error") for r in results] == [None, "txid mismatch with ProvenTxReq", "ProvenTxReq not found", None]
+    assert results[0]["status"] == "completed"
+    proven = {row["txid"]: row for row in sp.find_proven_txs({})}
+    assert set(proven) == {"00" * 32, "02" * 32}
+    assert results[3]["provenTxId"] == proven["02" * 32]["provenTxId"]
+    reqs = {row["provenTxReqId"]: row for row in sp.find_proven_tx_reqs({})}
+    assert reqs[req_ids[0]]["status"] == "completed"
+    assert reqs[req_ids[1]]["status"] == "unmined"
+    assert reqs[req_ids[2]]["provenTxId"] == results[3]["provenTxId"]
+
+
 def test_get_valid_beef_for_txid_min_bytes(sp):
     # Prepare a simple req row so rawTx exists
     with sp.SessionLocal() as s:
@@ -0,0 +1,111 @@
+"""Tests for the batched, resumable purge engine behind StorageProvider.purge_data."""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, select, update
+
+from bsv_wallet_toolbox.storage.db import create_engine_from_url, session_scope
+from bsv_wallet_toolbox.storage.models import Base, MonitorEvent
+from bsv_wallet_toolbox.storage.models import Transaction as TransactionModel
+from bsv_wallet_toolbox.storage.provider import StorageProvider
+from bsv_wallet_toolbox.storage.purge import PURGE_CURSOR_EVENT
+
+FAILED_PARAMS = {"purgeFailed": True, "purgeFailedAge": 1, "batchSize": 3, "pauseMsecs": 0}
+
+
+@pytest.fixture
+def sp():
+    engine = create_engine_from_url("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    storage_provider = StorageProvider(engine=engine, chain="test", storage_identity_key="K" * 64)
+    storage_provider.make_available()
+    return storage_provider
+
+
+@pytest.fixture
+def failed_tx_ids(sp):
+    user_id = sp.insert_user({"identityKey": "02" + "d" * 64, "activeStorage": "test"})
+    tx_ids = []
+    for i in range(7):
+        tx_id = sp.insert_transaction(
+            {"userId": user_id, "reference": f"failed-{i}", "status": "failed", "satoshis": 0}
+        )
+        sp.insert_output(
+            {
+                "userId": user_id,
+                "transactionId": tx_id,
+                "vout": 0,
+                "satoshis": 100,
+                "spendable": False,
+                "change": False,
+                "type": "P2PKH",
+                "providedBy": "storage",
+                "purpose": "",
+            }
+        )
+        tx_ids.append(tx_id)
+    with session_scope(sp.SessionLocal) as s:
+        s.execute(update(TransactionModel).values(updated_at=datetime.now() - timedelta(days=30)))
+    return tx_ids
+
+
+def _stored_cursor(sp):
+    with session_scope(sp.SessionLocal) as s:
+        details = s.execute(
+            select(MonitorEvent.details).where(MonitorEvent.event == PURGE_CURSOR_EVENT)
+        ).scalar_one_or_none()
+    return json.loads(details) if details else None
+
+
+def test_purge_deletes_in_bounded_batches(sp, failed_tx_ids) -> None:
+    statements: list[str] = []
+    event.listen(sp.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    progress = list(sp.purge_data_batches(FAILED_PARAMS))
+
+    assert [p["count"] for p in progress] == [6, 6, 2]  # 3 transactions + 3 outputs per full batch
+    assert [p["cursor"] for p in progress] == [failed_tx_ids[2], failed_tx_ids[5], failed_tx_ids[6]]
+    assert progress[-1]["total"] == 14
+    assert all(p["rowsPerSecond"] >= 0 for p in progress)
+    assert sum(sql.startswith("DELETE FROM transactions") for sql in statements) == 3
+    assert sp.find_transactions({"status": "failed"}) == []
+    assert _stored_cursor(sp) is None
+
+
+def test_purge_result_reports_log_rate_and_completion(sp, failed_tx_ids) -> None:
+    result = sp.purge_data(FAILED_PARAMS)
+
+    assert result["count"] == 14
+    assert "7 failed transactions deleted" in result["log"]
+    assert "7 failed outputs deleted" in result["log"]
+    assert result["cursor"] is None
+    assert result["rowsPerSecond"] > 0
+
+
+def test_purge_resumes_from_stored_cursor(sp, failed_tx_ids) -> None:
+    batches = sp.purge_data_batches(FAILED_PARAMS)
+    next(batches)
+    batches.close()  # interrupted after the first committed batch
+
+    assert _stored_cursor(sp) == {"phase": "failedTransactions", "after": failed_tx_ids[2]}
+    assert len(sp.find_transactions({"status": "failed"})) == 4
+
+    result = sp.purge_data(FAILED_PARAMS)
+
+    assert result["count"] == 8
+    assert result["cursor"] is None
+    assert sp.find_transactions({"status": "failed"}) == []
+    assert _stored_cursor(sp) is None
+
+
+def test_purge_stops_at_time_budget(sp, failed_tx_ids) -> None:
+    paused = sp.purge_data({**FAILED_PARAMS, "maxMsecs": 1e-6})
+
+    assert paused["count"] == 6
+    assert paused["cursor"] == {"phase": "failedTransactions", "after": failed_tx_ids[2]}
+
+    finished = sp.purge_data(FAILED_PARAMS)
+    assert finished["count"] == 8
+    assert finished["cursor"] is None
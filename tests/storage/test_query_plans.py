@@ -0,0 +1,187 @@
+"""Query-plan regression suite for the hot storage queries.
+
+Every statement a hot provider operation issues is captured and run through
+SQLite's ``EXPLAIN QUERY PLAN``; the test fails when one reads a wallet table
+with a full scan instead of an index search. Maintenance sweeps that visit
+every row by design (purge_data) are not listed.
+"""
+
+import re
+
+import pytest
+from sqlalchemy import event, inspect, text
+
+from bsv_wallet_toolbox.storage.db import create_engine_from_url
+from bsv_wallet_toolbox.storage.models import Base
+from bsv_wallet_toolbox.storage.provider import StorageProvider
+
+P2PKH_SCRIPT = b"\x76\xa9\x14" + bytes(20) + b"\x88\xac"
+IDENTITY_KEY = "02" + "c" * 64
+FULL_SCAN = re.compile(r"^SCAN (\w+)$")
+
+# (operation, tables it may scan in full): sync chunks page through the
+# global proof tables, which carry no user column.
+ALLOWED_SCANS = {
+    "get_sync_chunk": {"proven_txs", "proven_tx_reqs"},
+}
+
+
+def _provider() -> StorageProvider:
+    engine = create_engine_from_url("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    storage_provider = StorageProvider(engine=engine, chain="test", storage_identity_key="K" * 64)
+    storage_provider.make_available()
+    return storage_provider
+
+
+@pytest.fixture
+def sp():
+    return _provider()
+
+
+def _seed(sp) -> dict:
+    user_id = sp.insert_user({"identityKey": IDENTITY_KEY, "activeStorage": "test"})
+    basket_id = sp.insert_output_basket(
+        {"userId": user_id, "name": "default", "numberOfDesiredUTXOs": 5, "minimumDesiredUTXOValue": 1000}
+    )
+    label = sp.find_or_insert_tx_label(user_id, "hot")
+    tag = sp.find_or_insert_output_tag(user_id, "hot")
+    tx_ids = []
+    for i in range(20):
+        txid = f"{i:064x}"
+        tx_id = sp.insert_transaction(
+            {"userId": user_id, "reference": f"ref{i}", "txid": txid, "status": "completed", "satoshis": 1000}
+        )
+        output_id = sp.insert_output(
+            {
+                "userId": user_id,
+                "basketId": basket_id,
+                "transactionId": tx_id,
+                "vout": 0,
+                "satoshis": 1000 + i,
+                "spendable": True,
+                "change": True,
+                "type": "P2PKH",
+                "txid": txid,
+                "lockingScript": P2PKH_SCRIPT,
+            }
+        )
+        sp.insert_proven_tx_req({"txid": txid, "rawTx": b"\x00", "status": "unmined"})
+        sp.find_or_insert_tx_label_map(tx_id, label["txLabelId"])
+        sp.find_or_insert_output_tag_map(output_id, tag["outputTagId"])
+        tx_ids.append(tx_id)
+    spender = sp.insert_transaction(
+        {"userId": user_id, "reference": "spender", "status": "unsigned", "isOutgoing": True, "satoshis": 0}
+    )
+    return {"userId": user_id, "basketId": basket_id, "txIds": tx_ids, "spender": spender}
+
+
+HOT_OPERATIONS = {
+    "find_outputs_by_txid": lambda sp, w: sp.find_outputs({"partial": {"txid": f"{3:064x}"}}),
+    "find_outputs_by_spent_by": lambda sp, w: sp.find_outputs({"partial": {"spentBy": w["spender"]}}),
+    "find_outputs_by_basket": lambda sp, w: sp.find_outputs(
+        {"partial": {"userId": w["userId"], "basketId": w["basketId"], "spendable": True, "spentBy": None}}
+    ),
+    "find_transactions_by_status": lambda sp, w: sp.find_transactions(
+        {"partial": {"userId": w["userId"], "status": "completed"}}
+    ),
+    "find_transactions_by_txid": lambda sp, w: sp.find_transactions({"partial": {"txid": f"{3:064x}"}}),
+    "find_proven_tx_reqs_by_status": lambda sp, w: sp.find_proven_tx_reqs(
+        {"partial": {"status": ["unmined", "unsent", "sending"]}}
+    ),
+    "get_proven_or_req": lambda sp, w: sp.get_proven_or_req(f"{3:064x}"),
+    "list_outputs": lambda sp, w: sp.list_outputs(
+        {"userId": w["userId"]}, {"basket": "default", "includeTags": True, "includeLabels": True}
+    ),
+    "list_outputs_by_tag": lambda sp, w: sp.list_outputs(
+        {"userId": w["userId"]}, {"basket": "default", "tags": ["hot"]}
+    ),
+    "list_actions": lambda sp, w: sp.list_actions(
+        {"userId": w["userId"]}, {"includeLabels": True, "includeInputs": True, "includeOutputs": True}
+    ),
+    "list_actions_by_label": lambda sp, w: sp.list_actions({"userId": w["userId"]}, {"labels": ["hot"]}),
+    "count_funding_inputs": lambda sp, w: sp.count_funding_inputs(w["userId"], w["basketId"], True),
+    "allocate_funding_input": lambda sp, w: sp.allocate_funding_input(
+        w["userId"], w["basketId"], 1005, None, True, w["spender"]
+    ),
+    "get_wallet_balance": lambda sp, w: sp.get_wallet_balance(w["userId"]),
+    "update_transaction_status": lambda sp, w: sp.update_transaction_status("unproven", w["txIds"][0]),
+    "review_status": lambda sp, w: sp.review_status({}),
+    "get_sync_chunk": lambda sp, w: sp.get_sync_chunk(
+        {
+            "identityKey": IDENTITY_KEY,
+            "fromStorageIdentityKey": "K" * 64,
+            "toStorageIdentityKey": "K" * 64,
+            "maxRoughSize": 100_000,
+            "maxItems": 1000,
+            "offsets": [],
+        }
+    ),
+}
+
+
+def _full_scans(sp, operation) -> list[tuple[str, str]]:
+    """Run ``operation`` and return (table, statement) for every full table scan in its plans."""
+    statements: list[tuple[str, object]] = []
+
+    def _capture(_conn, _cursor, statement, parameters, _context, executemany):
+        if not executemany and statement.lstrip().split(None, 1)[0].upper() in {"SELECT", "UPDATE", "DELETE", "WITH"}:
+            statements.append((statement, parameters))
+
+    event.listen(sp.engine, "before_cursor_execute", _capture)
+    try:
+        operation()
+    finally:
+        event.remove(sp.engine, "before_cursor_execute", _capture)
+
+    scans = []
+    with sp.engine.connect() as conn:
+        for statement, parameters in statements:
+            for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters):
+                match = FULL_SCAN.match(str(row[-1]))
+                if match and match.group(1) in Base.metadata.tables:
+                    scans.append((match.group(1), " ".join(statement.split())))
+    return scans
+
+
+@pytest.mark.parametrize("name", sorted(HOT_OPERATIONS))
+def test_hot_query_uses_an_index(sp, name):
+    w = _seed(sp)
+    scans = _full_scans(sp, lambda: HOT_OPERATIONS[name](sp, w))
+
+    unexpected = [(table, sql) for table, sql in scans if table not in ALLOWED_SCANS.get(name, set())]
+    assert unexpected == []
+
+
+def test_dropped_index_is_reported_as_full_scan(sp):
+    w = _seed(sp)
+    with sp.engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_outputs_txid"))
+
+    scans = _full_scans(sp, lambda: HOT_OPERATIONS["find_outputs_by_txid"](sp, w))
+
+    assert [table for table, _ in scans] == ["outputs"]
+
+
+def test_migrate_brings_existing_database_indexes_up_to_date(tmp_path):
+    url = f"sqlite:///{tmp_path / 'old.db'}"
+    engine = create_engine_from_url(url)
+    Base.metadata.create_all(bind=engine)
+    # shape of a database created before the current index set
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_outputs_txid"))
+        conn.execute(text("DROP INDEX ix_proven_tx_reqs_status_updated"))
+        conn.execute(text('CREATE INDEX ix_proven_tx_reqs_status ON proven_tx_reqs ("status")'))
+        conn.execute(text("DROP INDEX ix_outputs_funding"))
+        conn.execute(text('CREATE INDEX ix_outputs_funding ON outputs ("userId", "basketId", "spendable", "satoshis")'))
+
+    sp = StorageProvider(engine=engine, chain="test", storage_identity_key="K" * 64)
+    sp.migrate()
+
+    inspector = inspect(engine)
+    outputs = {ix["name"]: ix["column_names"] for ix in inspector.get_indexes("outputs")}
+    reqs = {ix["name"] for ix in inspector.get_indexes("proven_tx_reqs")}
+    assert outputs["ix_outputs_txid"] == ["txid"]
+    assert outputs["ix_outputs_funding"] == ["userId", "basketId", "spendable", "spentBy", "satoshis"]
+    assert "ix_proven_tx_reqs_status_updated" in reqs
+    assert "ix_proven_tx_reqs_status" not in reqs
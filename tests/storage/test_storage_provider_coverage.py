@@ -817,9 +817,9 @@ class TestKeyConversions:
 class TestBeefOperations:
     """Test BEEF-related operations."""
 
-    def test_build_minimal_beef_for_txids_empty(self, storage_provider) -> None:
+    def test_build_beef_for_txids_empty(self, storage_provider) -> None:
         """Test building BEEF with empty txid list."""
-        result = storage_provider._build_minimal_beef_for_txids([])
+        result = storage_provider._build_beef_for_txids([])
 
         assert isinstance(result, bytes)
 
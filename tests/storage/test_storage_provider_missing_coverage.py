@@ -324,18 +324,18 @@ class TestInternalizeActionContext:
 class TestBEEFOperations:
     """Test BEEF-related operations."""
 
-    def test_build_minimal_beef_for_txids_empty(self, storage_provider):
-        """Test building minimal BEEF with empty txid list."""
-        result = storage_provider._build_minimal_beef_for_txids([])
+    def test_build_beef_for_txids_empty(self, storage_provider):
+        """Test building BEEF with empty txid list."""
+        result = storage_provider._build_beef_for_txids([])
 
         assert isinstance(result, bytes)
         # Empty BEEF is valid - returns empty bytes
 
-    def test_build_minimal_beef_for_txids_with_data(self, storage_provider):
-        """Test building minimal BEEF with txids."""
+    def test_build_beef_for_txids_with_data(self, storage_provider):
+        """Test building BEEF with txids."""
         txids = ["a" * 64, "b" * 64]
 
-        result = storage_provider._build_minimal_beef_for_txids(txids)
+        result = storage_provider._build_beef_for_txids(txids)
 
         assert isinstance(result, bytes)
         # Method may return empty bytes for non-existent txids
@@ -61,7 +61,7 @@ class TestSyncChunkProcessor:
     def test_transaction_processing(self):
         """Test transaction processing in sync chunks."""
         provider = Mock()
-        provider.insert_transaction = Mock()
+        provider.upsert_many_transactions = Mock(return_value=[11, 12])
         provider.get_or_create_user_id = Mock(return_value=1)
 
         chunk = {
@@ -77,7 +77,9 @@ class TestSyncChunkProcessor:
 
         assert result["processed"] is True
         assert result["updated"] == 2  # 2 transactions
-        assert provider.insert_transaction.call_count == 2
+        provider.upsert_many_transactions.assert_called_once()
+        rows = provider.upsert_many_transactions.call_args.args[0]
+        assert [row["txid"] for row in rows] == ["abc123", "def456"]
 
     def test_basket_processing(self):
         """Test output basket processing."""
@@ -103,7 +105,7 @@ class TestSyncChunkProcessor:
     def test_error_handling(self):
         """Test error handling during processing."""
         provider = Mock()
-        provider.insert_transaction = Mock(side_effect=Exception("DB error"))
+        provider.upsert_many_transactions = Mock(side_effect=Exception("DB error"))
         provider.get_or_create_user_id = Mock(return_value=1)
 
         chunk = {
@@ -125,8 +127,8 @@ class TestSyncChunkProcessor:
         """Test processing multiple entity types."""
         provider = Mock()
         provider.configure_basket = Mock()
-        provider.insert_transaction = Mock()
-        provider.insert_output = Mock()
+        provider.upsert_many_transactions = Mock(return_value=[7])
+        provider.upsert_many_outputs = Mock()
         provider.get_or_create_user_id = Mock(return_value=1)
 
         chunk = {
@@ -145,5 +147,76 @@ class TestSyncChunkProcessor:
         assert result["processed"] is True
         assert result["updated"] == 3  # basket + transaction + output
         provider.configure_basket.assert_called_once()
-        provider.insert_transaction.assert_called_once()
-        provider.insert_output.assert_called_once()
+        provider.upsert_many_transactions.assert_called_once()
+        provider.upsert_many_outputs.assert_called_once()
+        assert provider.upsert_many_outputs.call_args.args[0][0]["transactionId"] == 7
+
+    def test_output_transaction_id_mapping(self):
+        """Test outputs are linked to local transaction ids."""
+        provider = Mock()
+        provider.upsert_many_transactions = Mock(return_value=[101])
+        provider.upsert_many_outputs = Mock()
+        provider.find_transactions = Mock(return_value=[{"transactionId": 55}])
+        provider.get_or_create_user_id = Mock(return_value=1)
+
+        chunk = {
+            "fromStorageIdentityKey": "remote_key",
+            "toStorageIdentityKey": "local_key",
+            "userIdentityKey": "user123",
+            "transactions": [{"transactionId": 3, "txid": "tx1", "reference": "r1"}],
+            "outputs": [
+                {"transactionId": 3, "txid": "tx1", "vout": 0},
+                {"transactionId": 4, "txid": "tx-earlier", "vout": 1},
+            ],
+        }
+        args = {"fromStorageIdentityKey": "remote_key", "identityKey": "user123"}
+
+        processor = SyncChunkProcessor(provider, chunk, args)
+        result = processor.process_chunk()
+
+        assert result["inserts"] == 3
+        rows = provider.upsert_many_outputs.call_args.args[0]
+        assert [row["transactionId"] for row in rows] == [101, 55]
+        provider.find_transactions.assert_called_once_with({"partial": {"userId": 1, "txid": "tx-earlier"}})
+
+    def test_failed_batch_falls_back_to_per_row_upserts(self):
+        """Test one bad row only loses itself, not the chunk."""
+
+        def upsert_transactions(rows):
+            if len(rows) > 1:
+                raise Exception("batch failed")
+            if rows[0]["txid"] == "bad":
+                raise Exception("bad row")
+            return [{"tx1": 1, "tx2": 2}[rows[0]["txid"]]]
+
+        provider = Mock()
+        provider.upsert_many_transactions = Mock(side_effect=upsert_transactions)
+        provider.upsert_many_outputs = Mock(return_value=[5, 6])
+        provider.find_transactions = Mock(return_value=[])
+        provider.get_or_create_user_id = Mock(return_value=1)
+
+        chunk = {
+            "fromStorageIdentityKey": "remote_key",
+            "toStorageIdentityKey": "local_key",
+            "userIdentityKey": "user123",
+            "transactions": [
+                {"transactionId": 1, "txid": "tx1"},
+                {"transactionId": 2, "txid": "bad"},
+                {"transactionId": 3, "txid": "tx2"},
+            ],
+            "outputs": [
+                {"transactionId": 1, "txid": "tx1", "vout": 0},
+                {"transactionId": 2, "txid": "bad", "vout": 0},
+                {"transactionId": 3, "txid": "tx2", "vout": 0},
+            ],
+        }
+        args = {"fromStorageIdentityKey": "remote_key", "identityKey": "user123"}
+
+        processor = SyncChunkProcessor(provider, chunk, args)
+        result = processor.process_chunk()
+
+        assert result["inserts"] == 4  # 2 transactions + their 2 outputs
+        assert len(result["errors"]) == 1
+        assert "bad row" in result["errors"][0]
+        rows = provider.upsert_many_outputs.call_args.args[0]
+        assert [row["transactionId"] for row in rows] == [1, 2]
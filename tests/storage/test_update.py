@@ -2,6 +2,8 @@
 
 from datetime import datetime
 
+from sqlalchemy import event
+
 
 def _first(records):
     return records[0]
@@ -260,3 +262,46 @@ def test_update_tx_label(storage_seeded) -> None:
 
     refreshed = _first(storage.find_tx_labels({"partial": {"txLabelId": label["txLabelId"]}}))
     assert refreshed["label"] == "updated-label"
+
+
+def test_update_many_identical_patch_is_one_statement(storage_seeded) -> None:
+    storage, seed = storage_seeded
+    tx_ids = [tx["transactionId"] for tx in seed["transactions"].values()]
+    statements: list[str] = []
+
+    def _on_execute(*args):
+        statements.append(args[2])
+
+    event.listen(storage.engine, "before_cursor_execute", _on_execute)
+    try:
+        updated = storage.update_many("transaction", [(tx_id, {"status": "failed"}) for tx_id in tx_ids])
+    finally:
+        event.remove(storage.engine, "before_cursor_execute", _on_execute)
+
+    assert updated == len(tx_ids)
+    assert sum(stmt.lstrip().upper().startswith("UPDATE TRANSACTIONS") for stmt in statements) == 1
+    assert {tx["status"] for tx in storage.find_transactions({"partial": {}})} == {"failed"}
+
+
+def test_update_many_mixed_patches(storage_seeded) -> None:
+    storage, seed = storage_seeded
+    pending = seed["provenTxReqs"]["pending"]["provenTxReqId"]
+    completed = seed["provenTxReqs"]["completed"]["provenTxReqId"]
+
+    updated = storage.update_many(
+        "proven_tx_req",
+        [(pending, {"attempts": 7}), (completed, {"attempts": 3}), (999_999, {"attempts": 1})],
+    )
+
+    assert updated == 2
+    attempts = {r["provenTxReqId"]: r["attempts"] for r in storage.find_proven_tx_reqs({"partial": {}})}
+    assert attempts[pending] == 7
+    assert attempts[completed] == 3
+
+
+def test_update_missing_row_and_unknown_keys(storage_seeded) -> None:
+    storage, seed = storage_seeded
+    tx_id = seed["transactions"]["tx1"]["transactionId"]
+
+    assert storage.update_transaction(999_999, {"status": "failed"}) == 0
+    assert storage.update_transaction(tx_id, {"notAColumn": 1}) == 1
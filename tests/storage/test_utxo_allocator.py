@@ -0,0 +1,125 @@
+"""Tests for the guarded-UPDATE funding allocator and its in-process free-list."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import select, text
+
+from bsv_wallet_toolbox.storage.db import create_engine_from_url, session_scope
+from bsv_wallet_toolbox.storage.models import Base, Output
+from bsv_wallet_toolbox.storage.provider import StorageProvider
+from bsv_wallet_toolbox.storage.utxo_allocator import funding_conditions
+
+P2PKH_SCRIPT = b"\x76\xa9\x14" + bytes(20) + b"\x88\xac"
+AMOUNTS = [1000, 2000, 3000, 5000, 8000]
+
+
+def _provider(url: str) -> StorageProvider:
+    engine = create_engine_from_url(url)
+    Base.metadata.create_all(bind=engine)
+    storage_provider = StorageProvider(engine=engine, chain="test", storage_identity_key="K" * 64)
+    storage_provider.make_available()
+    return storage_provider
+
+
+@pytest.fixture
+def sp():
+    return _provider("sqlite:///:memory:")
+
+
+def _seed(sp, amounts=AMOUNTS) -> dict:
+    user_id = sp.insert_user({"identityKey": "02" + "a" * 64, "activeStorage": "test"})
+    basket_id = sp.insert_output_basket(
+        {"userId": user_id, "name": "default", "numberOfDesiredUTXOs": 5, "minimumDesiredUTXOValue": 1000}
+    )
+    tx_id = sp.insert_transaction(
+        {"userId": user_id, "reference": "funding", "txid": "f" * 64, "status": "completed", "satoshis": 0}
+    )
+    for vout, sats in enumerate(amounts):
+        sp.insert_output(
+            {
+                "userId": user_id,
+                "basketId": basket_id,
+                "transactionId": tx_id,
+                "vout": vout,
+                "satoshis": sats,
+                "spendable": True,
+                "change": True,
+                "type": "P2PKH",
+                "txid": "f" * 64,
+                "lockingScript": P2PKH_SCRIPT,
+            }
+        )
+    spender = sp.insert_transaction(
+        {"userId": user_id, "reference": "spender", "status": "unsigned", "isOutgoing": True, "satoshis": 0}
+    )
+    return {"userId": user_id, "basketId": basket_id, "spender": spender}
+
+
+def _allocate(sp, w, target, exact=None):
+    out = sp.allocate_funding_input(w["userId"], w["basketId"], target, exact, False, w["spender"])
+    return None if out is None else out.satoshis
+
+
+def test_selection_order_exact_then_best_fit_then_closest_under(sp):
+    w = _seed(sp)
+    assert _allocate(sp, w, 100, exact=3000) == 3000
+    assert _allocate(sp, w, 2500) == 5000
+    assert _allocate(sp, w, 9000) == 8000
+    assert _allocate(sp, w, 9000) == 2000
+    assert _allocate(sp, w, 9000) == 1000
+    assert _allocate(sp, w, 1) is None
+
+
+def test_claim_marks_output_spent_by_transaction(sp):
+    w = _seed(sp)
+    out = sp.allocate_funding_input(w["userId"], w["basketId"], 1500, None, False, w["spender"])
+    assert out.spendable is False
+    assert out.spent_by == w["spender"]
+    assert sp.count_funding_inputs(w["userId"], w["basketId"], False) == len(AMOUNTS) - 1
+
+
+def test_pick_uses_funding_index(sp):
+    w = _seed(sp)
+    pick = (
+        select(Output.output_id)
+        .where(*funding_conditions(w["userId"], w["basketId"], False), Output.satoshis >= 2500)
+        .order_by(Output.satoshis.asc())
+        .limit(1)
+    )
+    compiled = pick.compile(sp.engine, compile_kwargs={"literal_binds": True})
+    with sp.engine.connect() as conn:
+        plan = " ".join(str(row[-1]) for row in conn.execute(text(f"EXPLAIN QUERY PLAN {compiled}")))
+    assert "ix_outputs_funding" in plan
+
+
+def test_free_list_drops_stale_candidates_and_takes_back_releases(sp):
+    w = _seed(sp)
+    sp.enable_utxo_free_list()
+    assert _allocate(sp, w, 4000) == 5000
+
+    # spend the next best candidate behind the free-list's back
+    with session_scope(sp.SessionLocal) as s:
+        s.execute(text("UPDATE outputs SET spendable = 0 WHERE satoshis = 8000"))
+    assert _allocate(sp, w, 6000) == 3000
+
+    released = sp.find_outputs({"partial": {"satoshis": 3000}})[0]
+    sp.update_output(released["outputId"], {"spendable": True, "spentBy": None})
+    assert _allocate(sp, w, 2500) == 3000
+
+
+def test_concurrent_funders_receive_distinct_outputs(tmp_path):
+    sp = _provider(f"sqlite:///{tmp_path / 'alloc.db'}")
+    w = _seed(sp, [1000 + i for i in range(40)])
+    sp.enable_utxo_free_list()
+
+    def fund(_):
+        out = sp.allocate_funding_input(w["userId"], w["basketId"], 500, None, False, w["spender"])
+        return None if out is None else out.output_id
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        claimed = [oid for oid in pool.map(fund, range(48)) if oid is not None]
+
+    assert len(claimed) == 40
+    assert len(set(claimed)) == 40
+    assert sp.count_funding_inputs(w["userId"], w["basketId"], False) == 0
@@ -0,0 +1,155 @@
+"""Tests for the maintained wallet balance aggregate (specOpWalletBalance)."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import update
+
+from bsv_wallet_toolbox.storage.db import create_engine_from_url, session_scope
+from bsv_wallet_toolbox.storage.models import Base, OutputBasketBalance
+from bsv_wallet_toolbox.storage.provider import StorageProvider
+
+P2PKH_SCRIPT = b"\x76\xa9\x14" + bytes(20) + b"\x88\xac"
+
+
+@pytest.fixture
+def sp():
+    engine = create_engine_from_url("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    storage_provider = StorageProvider(engine=engine, chain="test", storage_identity_key="K" * 64)
+    storage_provider.make_available()
+    return storage_provider
+
+
+@pytest.fixture
+def wallet(sp):
+    user_id = sp.insert_user({"identityKey": "02" + "c" * 64, "activeStorage": "test"})
+    basket_id = sp.insert_output_basket(
+        {"userId": user_id, "name": "default", "numberOfDesiredUTXOs": 5, "minimumDesiredUTXOValue": 1000}
+    )
+    tx_id = sp.insert_transaction(
+        {"userId": user_id, "reference": "ref-funding", "txid": "a" * 64, "status": "completed", "satoshis": 6000}
+    )
+    output_ids = [
+        sp.insert_output(
+            {
+                "userId": user_id,
+                "basketId": basket_id,
+                "transactionId": tx_id,
+                "vout": i,
+                "satoshis": 1000 * (i + 1),
+                "spendable": True,
+                "change": True,
+                "type": "P2PKH",
+                "txid": "a" * 64,
+                "lockingScript": P2PKH_SCRIPT,
+            }
+        )
+        for i in range(3)
+    ]
+    return {"userId": user_id, "basketId": basket_id, "transactionId": tx_id, "outputIds": output_ids}
+
+
+def _balance(sp, user_id):
+    return sp.list_outputs({"userId": user_id}, {"basket": "specOpWalletBalance"})["totalOutputs"]
+
+
+def _stored(sp, user_id, basket_id):
+    with session_scope(sp.SessionLocal) as s:
+        row = s.get(OutputBasketBalance, (user_id, basket_id))
+        return None if row is None else row.satoshis
+
+
+def test_first_read_materializes_aggregate(sp, wallet):
+    assert _stored(sp, wallet["userId"], wallet["basketId"]) is None
+    assert _balance(sp, wallet["userId"]) == 6000
+    assert _stored(sp, wallet["userId"], wallet["basketId"]) == 6000
+    assert sp.get_wallet_balance(wallet["userId"]) == 6000
+
+
+def test_allocate_and_release_adjust_aggregate(sp, wallet):
+    user_id, basket_id = wallet["userId"], wallet["basketId"]
+    assert _balance(sp, user_id) == 6000
+
+    spender = sp.insert_transaction(
+        {"userId": user_id, "reference": "ref-spend", "status": "unsigned", "isOutgoing": True, "satoshis": 0}
+    )
+    allocated = sp.allocate_funding_input(user_id, basket_id, 2500, None, False, spender)
+    assert allocated.satoshis == 3000
+    assert _stored(sp, user_id, basket_id) == 3000
+    assert _balance(sp, user_id) == 3000
+
+    assert sp.abort_action("ref-spend") is True
+    assert _stored(sp, user_id, basket_id) == 6000
+    assert sp.check_wallet_balances()["mismatches"] == []
+
+
+def test_new_outputs_and_status_changes_adjust_aggregate(sp, wallet):
+    user_id, basket_id = wallet["userId"], wallet["basketId"]
+    assert _balance(sp, user_id) == 6000
+
+    tx_id = sp.insert_transaction(
+        {"userId": user_id, "reference": "ref-incoming", "txid": "b" * 64, "status": "unprocessed", "satoshis": 500}
+    )
+    sp.insert_output(
+        {
+            "userId": user_id,
+            "basketId": basket_id,
+            "transactionId": tx_id,
+            "vout": 0,
+            "satoshis": 500,
+            "spendable": True,
+            "change": True,
+            "type": "P2PKH",
+            "txid": "b" * 64,
+            "lockingScript": P2PKH_SCRIPT,
+        }
+    )
+    # unprocessed transactions do not count towards the balance
+    assert _stored(sp, user_id, basket_id) == 6000
+
+    sp.update_transaction_status("unproven", tx_id)
+    assert _stored(sp, user_id, basket_id) == 6500
+
+    sp.update_transactions_status([tx_id, wallet["transactionId"]], "failed")
+    assert _stored(sp, user_id, basket_id) == 0
+    assert sp.check_wallet_balances(user_id)["mismatches"] == []
+
+
+def test_purge_failed_releases_inputs_into_aggregate(sp, wallet):
+    user_id, basket_id = wallet["userId"], wallet["basketId"]
+    assert _balance(sp, user_id) == 6000
+
+    failed = sp.insert_transaction(
+        {"userId": user_id, "reference": "ref-failed", "status": "failed", "isOutgoing": True, "satoshis": 0}
+    )
+    sp.update_output(wallet["outputIds"][0], {"spendable": False, "spentBy": failed})
+    assert _stored(sp, user_id, basket_id) == 5000
+
+    sp.update_transaction(failed, {"updatedAt": datetime.now() - timedelta(days=30)})
+    sp.purge_data({"purgeFailed": True, "purgeFailedAge": 1})
+    assert _stored(sp, user_id, basket_id) == 6000
+    assert sp.check_wallet_balances()["mismatches"] == []
+
+
+def test_checker_reports_and_repairs_drift(sp, wallet):
+    user_id, basket_id = wallet["userId"], wallet["basketId"]
+    assert _balance(sp, user_id) == 6000
+
+    with session_scope(sp.SessionLocal) as s:
+        s.execute(update(OutputBasketBalance).values(satoshis=1, output_count=7))
+
+    report = sp.check_wallet_balances(repair=True)
+    assert report["mismatches"] == [
+        {
+            "userId": user_id,
+            "basketId": basket_id,
+            "satoshis": 1,
+            "expectedSatoshis": 6000,
+            "outputCount": 7,
+            "expectedOutputCount": 3,
+        }
+    ]
+    assert report["rebuilt"] == 1
+    assert _balance(sp, user_id) == 6000
+    assert sp.check_wallet_balances()["mismatches"] == []
@@ -6,6 +6,8 @@ particularly script verification in MockARC to catch signing bugs.
 Reference: go-wallet-toolbox/pkg/internal/testabilities/testservices/
 """
 
+from .arc_server import LocalARCServer
+from .header_chain import EASY_BITS, mine_header_chain
 from .mock_arc import (
     MockARC,
     MockARCQueryFixture,
@@ -24,8 +26,12 @@ from .mock_storage import (
 )
 
 __all__ = [
+    # Header chains
+    "EASY_BITS",
     "BHSMerkleRootConfirmed",
     "BHSMerkleRootNotFound",
+    # LocalARCServer
+    "LocalARCServer",
     # MockARC
     "MockARC",
     "MockARCQueryFixture",
@@ -37,4 +43,5 @@ __all__ = [
     "TestRandomizer",
     "create_in_memory_storage_provider",
     "given_storage",
+    "mine_header_chain",
 ]
@@ -0,0 +1,150 @@
+"""Local ARC stand-in served over HTTP for broadcast tests and benchmarks.
+
+Unlike MockARC, which is called in-process, LocalARCServer listens on a
+localhost port so the real ARC provider (``requests``) talks to it. It
+implements the broadcast endpoints used by the toolbox:
+
+- ``POST /v1/tx``: one ``{"rawTx": hex}``, answers one transaction status
+- ``POST /v1/txs``: a list of ``{"rawTx": hex}``, answers one status per item
+- ``GET /v1/tx/{txid}``: status of an accepted transaction
+
+Transactions are accepted in request order. With ``check_parents`` a
+transaction whose inputs spend a txid that is neither accepted nor marked
+mined is rejected with status 460, which catches children sent before their
+parents. ``latency_msecs`` delays every response to model a network round trip.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from bsv.transaction import Transaction
+
+
+class LocalARCServer:
+    """Threaded HTTP server emulating ARC's transaction endpoints."""
+
+    HTTP_STATUS_MISSING_PARENT = 460
+    HTTP_STATUS_MALFORMED = 463
+
+    def __init__(self, latency_msecs: float = 0, check_parents: bool = False):
+        self.latency_msecs = latency_msecs
+        self.check_parents = check_parents
+        self.accepted: list[str] = []  # txids in acceptance order
+        self.requests: list[tuple[str, int]] = []  # (path, number of transactions)
+        self.max_in_flight = 0
+        self._mined: set[str] = set()
+        self._rejections: dict[str, tuple[int, str]] = {}
+        self._request_status: int | None = None
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to configure as ``arcUrl``."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "LocalARCServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "LocalARCServer":
+        return self.start()
+
+    def __exit__(self, *_exc: object) -> None:
+        self.stop()
+
+    def mark_mined(self, *txids: str) -> "LocalARCServer":
+        """Treat ``txids`` as already mined parents."""
+        self._mined.update(txids)
+        return self
+
+    def reject(self, txid: str, status: int = 465, detail: str = "rejected") -> "LocalARCServer":
+        """Reject ``txid`` with a per-transaction error status."""
+        self._rejections[txid] = (status, detail)
+        return self
+
+    def fail_requests(self, status: int | None) -> "LocalARCServer":
+        """Answer every request with HTTP ``status`` (None restores normal operation)."""
+        self._request_status = status
+        return self
+
+    def _submit(self, raw_tx: str) -> dict[str, Any]:
+        try:
+            tx = Transaction.from_hex(raw_tx)
+        except Exception as e:
+            return {"status": self.HTTP_STATUS_MALFORMED, "detail": f"malformed transaction: {e}"}
+        txid = tx.txid()
+        if txid in self._rejections:
+            status, detail = self._rejections[txid]
+            return {"status": status, "txid": txid, "detail": detail}
+        with self._lock:
+            if self.check_parents:
+                known = self._mined.union(self.accepted)
+                missing = [i.source_txid for i in tx.inputs if i.source_txid not in known]
+                if missing:
+                    return {
+                        "status": self.HTTP_STATUS_MISSING_PARENT,
+                        "txid": txid,
+                        "detail": f"missing parent transaction {missing[0]}",
+                    }
+            if txid not in self.accepted:
+                self.accepted.append(txid)
+        return {"status": 200, "txid": txid, "txStatus": "SEEN_ON_NETWORK", "extraInfo": ""}
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        arc = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like ARC
+
+            def log_message(self, *_args: Any) -> None:
+                pass
+
+            def _reply(self, status: int, body: Any) -> None:
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self) -> None:
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"null")
+                items = body if self.path.endswith("/v1/txs") else [body]
+                with arc._lock:
+                    arc.requests.append((self.path, len(items)))
+                    arc._in_flight += 1
+                    arc.max_in_flight = max(arc.max_in_flight, arc._in_flight)
+                try:
+                    time.sleep(arc.latency_msecs / 1000)
+                    if arc._request_status is not None:
+                        self._reply(arc._request_status, {"status": arc._request_status, "detail": "unavailable"})
+                        return
+                    results = [arc._submit(item.get("rawTx", "")) for item in items]
+                    if self.path.endswith("/v1/txs"):
+                        self._reply(200, results)
+                    else:
+                        self._reply(results[0]["status"], results[0])
+                finally:
+                    with arc._lock:
+                        arc._in_flight -= 1
+
+            def do_GET(self) -> None:
+                txid = self.path.rsplit("/", 1)[-1]
+                if txid in arc.accepted:
+                    self._reply(200, {"txid": txid, "txStatus": "SEEN_ON_NETWORK"})
+                else:
+                    self._reply(404, {"status": 404, "detail": "transaction not found"})
+
+        return Handler
@@ -0,0 +1,46 @@
+"""Synthetic block header chains for chaintracks tests and benchmarks.
+
+Headers use the regtest difficulty (``EASY_BITS``), where about every second
+nonce meets the target, so valid linked chains of any length are cheap to mine.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import struct
+
+from bsv_wallet_toolbox.services.chaintracker.chaintracks.util.block_header_utilities import genesis_buffer
+from bsv_wallet_toolbox.services.chaintracker.chaintracks.util.bulk_header_codec import bits_to_target
+
+EASY_BITS = 0x207FFFFF
+
+
+def mine_header_chain(count: int, previous: bytes | None = None, bits: int = EASY_BITS, spacing: int = 600) -> bytes:
+    """Return ``count`` serialized headers with valid links and proof of work.
+
+    Args:
+        count: Number of headers
+        previous: Serialized header the chain continues (None: start with the mainnet genesis header)
+        bits: Compact difficulty of the mined headers
+        spacing: Seconds between header times (vary it to mine a competing branch)
+    """
+    sha256 = hashlib.sha256
+    target = bits_to_target(bits)
+    headers = [] if previous is not None else [genesis_buffer("main")]
+    tip = previous if previous is not None else headers[0]
+    previous_hash = sha256(sha256(tip).digest()).digest()
+    time = struct.unpack_from("<I", tip, 68)[0]
+    while len(headers) < count:
+        time += spacing
+        merkle_root = sha256(previous_hash).digest()
+        prefix = struct.pack("<I32s32sII", 1, previous_hash, merkle_root, time, bits)
+        nonce = 0
+        while True:
+            header = prefix + struct.pack("<I", nonce)
+            digest = sha256(sha256(header).digest()).digest()
+            if int.from_bytes(digest, "little") <= target:
+                break
+            nonce += 1
+        headers.append(header)
+        previous_hash = digest
+    return b"".join(headers)